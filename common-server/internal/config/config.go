@@ -10,6 +10,7 @@ import (
 	"os"
 	"slices"
 	"strings"
+	"time"
 
 	"github.com/go-logr/logr"
 	"github.com/pkg/errors"
@@ -81,6 +82,12 @@ type StoreOpts struct {
 	DatabaseFilepath string `json:"databaseFilepath" yaml:"databaseFilepath"`
 	// OptimizeMemoryUsage if true, the database will be optimized for memory usage.
 	OptimizeMemoryUsage bool `json:"optimizeMemoryUsage" yaml:"optimizeMemoryUsage"`
+	// DecodeCacheSize is the maximum number of decoded objects that are cached. If zero, the cache is disabled.
+	DecodeCacheSize int `json:"decodeCacheSize" yaml:"decodeCacheSize"`
+	// BatchWindow if set, informer events are buffered for this duration and written in batches.
+	BatchWindow time.Duration `json:"batchWindow" yaml:"batchWindow"`
+	// StaleReady if true, a store with a database on disk is ready at startup and serves the objects of the previous run while catching up.
+	StaleReady bool `json:"staleReady" yaml:"staleReady"`
 }
 
 type PProfConfig struct {
@@ -111,16 +118,25 @@ func (a Actions) GetAllowedList() []string {
 }
 
 type ResourceConfig struct {
-	Id           string    `json:"id"`
-	Group        string    `json:"group"`
-	Version      string    `json:"version"`
-	Resource     string    `json:"resource"`
-	AllowedSorts []string  `yaml:"allowedSorts" json:"allowedSorts"`
-	Owns         []string  `json:"owns"`
-	References   []string  `json:"references"`
-	Secrets      []string  `json:"secrets"`
-	Actions      Actions   `json:"actions"`
-	Store        StoreOpts `json:"store"`
+	Id           string           `json:"id"`
+	Group        string           `json:"group"`
+	Version      string           `json:"version"`
+	Resource     string           `json:"resource"`
+	AllowedSorts []string         `yaml:"allowedSorts" json:"allowedSorts"`
+	IndexedPaths []string         `yaml:"indexedPaths" json:"indexedPaths"`
+	Projection   ProjectionConfig `yaml:"projection" json:"projection"`
+	Owns         []string         `json:"owns"`
+	References   []string         `json:"references"`
+	Secrets      []string         `json:"secrets"`
+	Actions      Actions          `json:"actions"`
+	Store        StoreOpts        `json:"store"`
+}
+
+type ProjectionConfig struct {
+	// Include are the JSON paths that are kept of each object. If empty, all fields are kept.
+	Include []string `json:"include" yaml:"include"`
+	// Exclude are the JSON paths that are removed from each object.
+	Exclude []string `json:"exclude" yaml:"exclude"`
 }
 
 type PredefinedConfig struct {
@@ -188,9 +204,17 @@ func (c *ServerConfig) BuildServer(ctx context.Context, dynamicClient dynamic.In
 				GVR:          crd.GVR,
 				GVK:          crd.GVK,
 				AllowedSorts: resource.AllowedSorts,
+				IndexedPaths: resource.IndexedPaths,
+				Projection: inmemory.ProjectionOpts{
+					Include: resource.Projection.Include,
+					Exclude: resource.Projection.Exclude,
+				},
 				Database: inmemory.DatabaseOpts{
-					Filepath:     resource.Store.DatabaseFilepath,
-					ReduceMemory: resource.Store.OptimizeMemoryUsage,
+					Filepath:        resource.Store.DatabaseFilepath,
+					ReduceMemory:    resource.Store.OptimizeMemoryUsage,
+					DecodeCacheSize: resource.Store.DecodeCacheSize,
+					BatchWindow:     resource.Store.BatchWindow,
+					StaleReady:      resource.Store.StaleReady,
 				},
 				Informer: inmemory.InformerOpts{
 					DisableCache: resource.Store.DisableInformerCache,
@@ -15,6 +15,7 @@ import (
 	"github.com/pkg/errors"
 	"k8s.io/apimachinery/pkg/apis/meta/v1/unstructured"
 	"k8s.io/apimachinery/pkg/runtime/schema"
+	"k8s.io/apimachinery/pkg/types"
 	"k8s.io/client-go/dynamic"
 	"k8s.io/client-go/tools/cache"
 
@@ -34,6 +35,29 @@ type EventHandler interface {
 	OnDelete(ctx context.Context, obj *unstructured.Unstructured) error
 }
 
+// ListHandler is implemented by event handlers that need to know all objects
+// of a full list, e.g. to remove objects that were deleted while no watch was active.
+type ListHandler interface {
+	OnListDone(ctx context.Context, listed map[types.NamespacedName]struct{}) error
+}
+
+// Transformer is implemented by event handlers that modify objects before they
+// are cached by the informer, e.g. to remove fields that are not needed.
+type Transformer interface {
+	Transform(obj *unstructured.Unstructured)
+}
+
+// Resumable is implemented by informers that can continue watching from a
+// previously observed resourceVersion instead of listing all objects.
+type Resumable interface {
+	// Resume sets the resourceVersion to watch from. It must be called before Start.
+	Resume(resourceVersion string)
+	// Checkpoint returns the resourceVersion up to which all events were handed
+	// to the event handler. It returns false if there is no consistent resourceVersion,
+	// e.g. while listing or while events are being processed.
+	Checkpoint() (string, bool)
+}
+
 type KubeInformer struct {
 	ctx            context.Context
 	gvr            schema.GroupVersionResource
@@ -70,6 +94,7 @@ func (i *KubeInformer) Start() error {
 		return errors.Wrapf(err, "failed to add event handler for %s", i.gvr)
 	}
 
+	transformer, hasTransformer := i.eventHandler.(Transformer)
 	err = i.informer.SetTransform(func(i any) (any, error) {
 		o, ok := i.(*unstructured.Unstructured)
 		if !ok {
@@ -77,6 +102,9 @@ func (i *KubeInformer) Start() error {
 		}
 
 		SanitizeObject(o)
+		if hasTransformer {
+			transformer.Transform(o)
+		}
 		return o, nil
 	})
 	if err != nil {
@@ -92,9 +120,34 @@ func (i *KubeInformer) Start() error {
 	}
 
 	go i.informer.Run(i.ctx.Done())
+
+	if lh, ok := i.eventHandler.(ListHandler); ok {
+		go i.notifyListDone(lh)
+	}
 	return nil
 }
 
+// notifyListDone passes all objects of the initial list to the ListHandler.
+// Later relists are handled by the informer itself, which emits delete events for missing objects.
+func (i *KubeInformer) notifyListDone(lh ListHandler) {
+	if !cache.WaitForCacheSync(i.ctx.Done(), i.informer.HasSynced) {
+		return
+	}
+	keys := i.informer.GetStore().ListKeys()
+	listed := make(map[types.NamespacedName]struct{}, len(keys))
+	for _, key := range keys {
+		namespace, name, err := cache.SplitMetaNamespaceKey(key)
+		if err != nil {
+			i.log.Error(err, "invalid key", "key", key)
+			continue
+		}
+		listed[types.NamespacedName{Namespace: namespace, Name: name}] = struct{}{}
+	}
+	if err := lh.OnListDone(i.ctx, listed); err != nil {
+		i.log.Error(err, "failed to handle list")
+	}
+}
+
 func (i *KubeInformer) Ready() bool {
 	return i.informer.HasSynced()
 }
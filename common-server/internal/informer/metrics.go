@@ -62,6 +62,20 @@ var (
 		Buckets: []float64{0.001, 0.01, 0.1, 0.5, 1, 5, 10, 30},
 	}, []string{"informer"},
 	)
+
+	eventHandlingDuration = prometheus.NewHistogramVec(prometheus.HistogramOpts{
+		Name:    "informer_event_handling_duration_seconds",
+		Help:    "Time the event handler takes to handle an event",
+		Buckets: []float64{0.001, 0.01, 0.1, 0.5, 1, 5, 10, 30},
+	}, []string{"informer"},
+	)
+
+	eventLag = prometheus.NewHistogramVec(prometheus.HistogramOpts{
+		Name:    "informer_event_lag_seconds",
+		Help:    "Time from receiving an event until it was handled",
+		Buckets: []float64{0.001, 0.01, 0.1, 0.5, 1, 5, 10, 30, 60},
+	}, []string{"informer"},
+	)
 )
 
 func Register(reg prometheus.Registerer) {
@@ -74,5 +88,7 @@ func Register(reg prometheus.Registerer) {
 		reg.MustRegister(eventProcessingLatency)
 		reg.MustRegister(listOperationDuration)
 		reg.MustRegister(queueWaitTime)
+		reg.MustRegister(eventHandlingDuration)
+		reg.MustRegister(eventLag)
 	})
 }
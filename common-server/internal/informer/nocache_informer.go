@@ -7,6 +7,8 @@ package informer
 import (
 	"context"
 	"fmt"
+	"hash/fnv"
+	"math"
 	"runtime"
 	"strconv"
 	"strings"
@@ -17,17 +19,23 @@ import (
 	"github.com/go-logr/logr"
 	"github.com/pkg/errors"
 	"github.com/prometheus/client_golang/prometheus"
+	apierrors "k8s.io/apimachinery/pkg/api/errors"
 	metav1 "k8s.io/apimachinery/pkg/apis/meta/v1"
 	"k8s.io/apimachinery/pkg/apis/meta/v1/unstructured"
 	"k8s.io/apimachinery/pkg/runtime/schema"
+	"k8s.io/apimachinery/pkg/types"
 	"k8s.io/apimachinery/pkg/util/wait"
 	"k8s.io/apimachinery/pkg/watch"
 	"k8s.io/client-go/dynamic"
 )
 
-// [experimental] NoCacheInformer implements the Informer pattern without keeping a local cache.
+var _ Resumable = &NoCacheInformer{}
+
+// NoCacheInformer implements the Informer pattern without keeping a local cache.
 // It flushes events directly to the event handler, which is useful for resources
 // that are too large to store efficiently in memory.
+// Events are distributed to the workers by object key, so that all events
+// of the same object are handled in order.
 type NoCacheInformer struct {
 	ctx              context.Context
 	gvr              schema.GroupVersionResource
@@ -35,12 +43,13 @@ type NoCacheInformer struct {
 	k8sClient        dynamic.Interface
 	eventHandler     EventHandler
 	log              logr.Logger
-	bufferSize       int64        // Maximum number of items to retrieve per list call
-	queue            chan event   // Channel for event processing
-	initDone         *atomic.Bool // Tracks if initial list is complete
-	currentlyLoading *atomic.Bool // Prevents concurrent reloads
-	resourceVersion  string       // Current resource version for watch operations
-	workerCount      int          // Number of worker goroutines for event processing
+	bufferSize       int64         // Maximum number of items to retrieve per list call
+	queues           []chan event  // Channels for event processing, one per worker
+	initDone         *atomic.Bool  // Tracks if initial list is complete
+	currentlyLoading *atomic.Bool  // Prevents concurrent reloads
+	resourceVersion  string        // Current resource version for watch operations
+	rvMutex          sync.RWMutex  // Protects access to the resource version
+	inFlight         *atomic.Int64 // Number of events that were received but not yet handled
 
 	watcher       watch.Interface    // The Kubernetes watch client
 	watcherCancel context.CancelFunc // Function to cancel the watcher context
@@ -53,8 +62,11 @@ type NoCacheInformer struct {
 
 // NoCacheInformerOptions provides configurable options for the NoCacheInformer
 type NoCacheInformerOptions struct {
-	BufferSize           int64
-	QueueSize            int
+	// BufferSize is the maximum number of objects retrieved per list call
+	BufferSize int64
+	// QueueSize is the number of events that can be queued, split evenly across all workers
+	QueueSize int
+	// WorkerCount is the number of workers handling events
 	WorkerCount          int
 	ResyncPeriod         time.Duration
 	PrometheusRegisterer prometheus.Registerer
@@ -70,12 +82,12 @@ func DefaultNoCacheInformerOptions() NoCacheInformerOptions {
 	}
 }
 
-// [experimental] NewNoCache creates a new informer that does not use a local cache.
+// NewNoCache creates a new informer that does not use a local cache.
 func NewNoCache(ctx context.Context, gvr schema.GroupVersionResource, k8sClient dynamic.Interface, eventHandler EventHandler) *NoCacheInformer {
 	return NewNoCacheWithOptions(ctx, gvr, k8sClient, eventHandler, DefaultNoCacheInformerOptions())
 }
 
-// [experimental] NewNoCacheWithOptions creates a new informer that does not use a local cache with custom options.
+// NewNoCacheWithOptions creates a new informer that does not use a local cache with custom options.
 func NewNoCacheWithOptions(ctx context.Context, gvr schema.GroupVersionResource, k8sClient dynamic.Interface, eventHandler EventHandler, options NoCacheInformerOptions) *NoCacheInformer {
 	name := fmt.Sprintf("NoCacheInformer:%s/%s", strings.ToLower(gvr.Group), strings.ToLower(gvr.Resource))
 	log := logr.FromContextOrDiscard(ctx).WithName(name)
@@ -87,7 +99,13 @@ func NewNoCacheWithOptions(ctx context.Context, gvr schema.GroupVersionResource,
 		Register(prometheus.DefaultRegisterer)
 	}
 
-	log.Info("Creating new instance")
+	workerCount := max(options.WorkerCount, 1)
+	queues := make([]chan event, workerCount)
+	for w := range queues {
+		queues[w] = make(chan event, max(options.QueueSize/workerCount, 1))
+	}
+
+	log.Info("Creating new instance", "workers", workerCount)
 	return &NoCacheInformer{
 		ctx:              ctxWithCancel,
 		cancel:           cancel,
@@ -97,18 +115,39 @@ func NewNoCacheWithOptions(ctx context.Context, gvr schema.GroupVersionResource,
 		log:              log,
 		name:             name,
 		bufferSize:       options.BufferSize,
-		queue:            make(chan event, options.QueueSize),
+		queues:           queues,
 		initDone:         &atomic.Bool{},
 		currentlyLoading: &atomic.Bool{},
-		workerCount:      options.WorkerCount,
+		inFlight:         &atomic.Int64{},
 		resyncPeriod:     options.ResyncPeriod,
 		resourceVersion:  "0",
 	}
 }
 
 type event struct {
-	typ string
-	obj *unstructured.Unstructured
+	typ        string
+	obj        *unstructured.Unstructured
+	receivedAt time.Time
+}
+
+// enqueue hands the event to the worker of its object. It blocks while the queue
+// of the worker is full, which slows down the list or watch.
+func (i *NoCacheInformer) enqueue(ctx context.Context, e event) error {
+	h := fnv.New32a()
+	_, _ = h.Write([]byte(e.obj.GetNamespace()))
+	_, _ = h.Write([]byte{'/'})
+	_, _ = h.Write([]byte(e.obj.GetName()))
+	queue := i.queues[h.Sum32()%uint32(len(i.queues))]
+
+	e.receivedAt = time.Now()
+	select {
+	case queue <- e:
+		queueSize.WithLabelValues(i.name).Inc()
+		return nil
+	case <-ctx.Done():
+		i.inFlight.Add(-1)
+		return ctx.Err()
+	}
 }
 
 func (i *NoCacheInformer) handlerLoop(ctx context.Context, inChan chan event) {
@@ -116,6 +155,8 @@ func (i *NoCacheInformer) handlerLoop(ctx context.Context, inChan chan event) {
 		select {
 		case e := <-inChan:
 			start := time.Now()
+			queueSize.WithLabelValues(i.name).Dec()
+			queueWaitTime.WithLabelValues(i.name).Observe(start.Sub(e.receivedAt).Seconds())
 			var err error
 
 			switch e.typ {
@@ -136,9 +177,9 @@ func (i *NoCacheInformer) handlerLoop(ctx context.Context, inChan chan event) {
 				counter.WithLabelValues(i.name, e.typ, "0").Inc()
 			}
 
-			// Record how long the event was being processed
-			queueWaitTime.WithLabelValues(i.name).Observe(time.Since(start).Seconds())
-			queueSize.WithLabelValues(i.name).Dec()
+			eventHandlingDuration.WithLabelValues(i.name).Observe(time.Since(start).Seconds())
+			eventLag.WithLabelValues(i.name).Observe(time.Since(e.receivedAt).Seconds())
+			i.inFlight.Add(-1)
 
 		case <-ctx.Done():
 			i.log.V(2).Info("Handler loop stopped")
@@ -147,7 +188,7 @@ func (i *NoCacheInformer) handlerLoop(ctx context.Context, inChan chan event) {
 	}
 }
 
-func (i *NoCacheInformer) list(ctx context.Context, inChan chan event) error {
+func (i *NoCacheInformer) list(ctx context.Context) error {
 	var continueToken string
 
 	timeout := i.resyncPeriod * 9 / 10
@@ -156,6 +197,8 @@ func (i *NoCacheInformer) list(ctx context.Context, inChan chan event) error {
 
 	i.log.Info("Listing resources", "timeout", timeout.String())
 	start := time.Now()
+	lh, notifyListDone := i.eventHandler.(ListHandler)
+	listed := make(map[types.NamespacedName]struct{})
 
 	for {
 		if ctx.Err() != nil {
@@ -172,23 +215,16 @@ func (i *NoCacheInformer) list(ctx context.Context, inChan chan event) error {
 
 		i.log.Info("Listed resources", "count", len(list.Items))
 
-		// Process items in batches to avoid CPU spikes
-		batchSize := 100
-		for j := 0; j < len(list.Items); j += batchSize {
-			end := min(j+batchSize, len(list.Items))
-
-			// Process this batch
-			for _, item := range list.Items[j:end] {
-				inChan <- event{
-					typ: "ADDED",
-					obj: &item,
-				}
-				queueSize.WithLabelValues(i.name).Inc()
+		// The bounded worker queues slow down the list if the workers cannot keep up
+		for j := range list.Items {
+			item := &list.Items[j]
+			if notifyListDone {
+				listed[types.NamespacedName{Namespace: item.GetNamespace(), Name: item.GetName()}] = struct{}{}
 			}
-
-			// Give the system a small breather between batches
-			if end < len(list.Items) && len(list.Items) > batchSize {
-				time.Sleep(time.Millisecond * 50)
+			SanitizeObject(item)
+			i.inFlight.Add(1)
+			if err := i.enqueue(ctx, event{typ: "ADDED", obj: item}); err != nil {
+				return errors.Wrap(err, "failed to list resources")
 			}
 		}
 
@@ -201,6 +237,11 @@ func (i *NoCacheInformer) list(ctx context.Context, inChan chan event) error {
 	i.initDone.Store(true)
 	listOperationDuration.WithLabelValues(i.name).Set(time.Since(start).Seconds())
 
+	if notifyListDone {
+		if err := lh.OnListDone(ctx, listed); err != nil {
+			return errors.Wrap(err, "failed to handle list")
+		}
+	}
 	return nil
 }
 
@@ -232,7 +273,7 @@ func (i *NoCacheInformer) watchLoop(ctx context.Context, watcher watch.Interface
 				}
 				counter.WithLabelValues(i.name, "ERROR", strconv.Itoa(int(status.Code))).Inc()
 				if status.Code == int32(410) { // gone
-					i.log.Info("Resource version expired, restarting watcher", "resourceVersion", i.resourceVersion)
+					i.log.Info("Resource version expired, restarting watcher", "resourceVersion", i.getResourceVersion())
 					// Reset resource version to force a full relist
 					i.setResourceVersion("0")
 					// Schedule reload in a separate goroutine to avoid blocking the watch loop
@@ -268,21 +309,19 @@ func (i *NoCacheInformer) watchLoop(ctx context.Context, watcher watch.Interface
 				i.log.Info("Failed to cast object", "type", fmt.Sprintf("%T", e.Object))
 				continue
 			}
-			i.setResourceVersion(obj.GetResourceVersion())
-
 			SanitizeObject(obj)
 
-			timeout := time.After(5 * time.Second)
-			select {
-			case i.queue <- event{
-				typ: string(e.Type),
-				obj: obj,
-			}:
-				queueSize.WithLabelValues(i.name).Inc()
-			case <-timeout:
-				i.log.Error(nil, "Failed to enqueue event: queue full or blocked",
-					"type", e.Type, "name", obj.GetName())
+			// Count the event before advancing the resource version, so that
+			// Checkpoint never returns a resource version of an unhandled event.
+			// The resource version is only advanced once the event is queued,
+			// so that a restarted watch does not skip it.
+			i.inFlight.Add(1)
+			if err := i.enqueue(ctx, event{typ: string(e.Type), obj: obj}); err != nil {
+				i.log.V(1).Info("Watcher stopped")
+				watcher.Stop()
+				return
 			}
+			i.setResourceVersion(obj.GetResourceVersion())
 
 			// Record event processing latency
 			eventProcessingLatency.WithLabelValues(i.name).Observe(time.Since(start).Seconds())
@@ -326,10 +365,10 @@ func (i *NoCacheInformer) Start() error {
 	}
 
 	// Start worker goroutines for event processing
-	for range i.workerCount {
+	for _, queue := range i.queues {
 		activeWorkers.WithLabelValues(i.name).Inc()
 		go func() {
-			i.handlerLoop(i.ctx, i.queue)
+			i.handlerLoop(i.ctx, queue)
 			activeWorkers.WithLabelValues(i.name).Dec()
 		}()
 	}
@@ -358,7 +397,7 @@ func (i *NoCacheInformer) stopWatcher() {
 	}
 }
 
-func (i *NoCacheInformer) startWatcher() (err error) {
+func (i *NoCacheInformer) startWatcher() error {
 	i.mutex.Lock()
 	defer i.mutex.Unlock()
 
@@ -368,35 +407,70 @@ func (i *NoCacheInformer) startWatcher() (err error) {
 	}
 	defer i.currentlyLoading.Store(false)
 
-	// Perform an initial list if we don't have a valid resource version
-	// (i.e. at startup or after a forced reload)
-	if len(i.resourceVersion) < 2 {
-		err := i.list(i.ctx, i.queue)
+	for {
+		// Perform an initial list if we don't have a valid resource version
+		// (i.e. at startup or after the resource version expired)
+		if len(i.getResourceVersion()) < 2 {
+			err := i.list(i.ctx)
+			if err != nil {
+				return errors.Wrap(err, "failed to start watcher")
+			}
+		} else if !i.initDone.Load() {
+			i.log.Info("Resuming watch", "resourceVersion", i.getResourceVersion())
+		}
+
+		watchCtx, cancel := context.WithCancel(i.ctx)
+		watcher, err := i.watch(watchCtx)
+		if apierrors.IsResourceExpired(err) || apierrors.IsGone(err) {
+			cancel()
+			i.log.Info("Resource version expired, relisting", "resourceVersion", i.getResourceVersion())
+			i.setResourceVersion("0")
+			continue
+		}
 		if err != nil {
+			cancel()
 			return errors.Wrap(err, "failed to start watcher")
 		}
-	}
-
-	watchCtx, cancel := context.WithCancel(i.ctx)
-	i.watcherCancel = cancel
-
-	// TODO: this should be wrapped in a backoff loop to handle transient errors
-	// see wait.Backoff
 
-	i.watcher, err = i.k8sClient.Resource(i.gvr).Watch(watchCtx, metav1.ListOptions{
-		Watch:               true,
-		ResourceVersion:     i.resourceVersion,
-		AllowWatchBookmarks: true,
-	})
+		i.watcher = watcher
+		i.watcherCancel = cancel
+		go i.watchLoop(watchCtx, watcher)
+		// When resuming, the informer is ready as soon as the watch is established.
+		// An expired resource version is reported by the watch and causes a relist.
+		i.initDone.Store(true)
 
-	if err != nil {
-		i.setResourceVersion("0")
-		return errors.Wrap(err, "failed to start watcher")
+		return nil
 	}
+}
 
-	go i.watchLoop(watchCtx, i.watcher)
-
-	return nil
+// watch starts watching from the current resource version, which is the last
+// received event or bookmark. Transient errors are retried with a backoff.
+func (i *NoCacheInformer) watch(ctx context.Context) (watcher watch.Interface, err error) {
+	backoff := wait.Backoff{
+		Duration: time.Second,
+		Factor:   2,
+		Jitter:   0.1,
+		Steps:    math.MaxInt32,
+		Cap:      time.Minute,
+	}
+	err = wait.ExponentialBackoffWithContext(ctx, backoff, func(ctx context.Context) (bool, error) {
+		var watchErr error
+		watcher, watchErr = i.k8sClient.Resource(i.gvr).Watch(ctx, metav1.ListOptions{
+			Watch:               true,
+			ResourceVersion:     i.getResourceVersion(),
+			AllowWatchBookmarks: true,
+		})
+		if watchErr == nil {
+			return true, nil
+		}
+		if apierrors.IsResourceExpired(watchErr) || apierrors.IsGone(watchErr) {
+			return false, watchErr
+		}
+		counter.WithLabelValues(i.name, "ERROR", "1").Inc()
+		i.log.Error(watchErr, "Failed to start watch, retrying")
+		return false, nil
+	})
+	return watcher, err
 }
 
 func (i *NoCacheInformer) Ready() bool {
@@ -422,13 +496,41 @@ func (i *NoCacheInformer) Reload() error {
 }
 
 func (i *NoCacheInformer) Stop() {
-	i.stopWatcher()
+	// Cancel first to abort a watch that is being retried
 	i.cancel()
+	i.stopWatcher()
+}
+
+// Resume sets the resource version to watch from, so that the initial list is skipped.
+// It must be called before Start.
+func (i *NoCacheInformer) Resume(resourceVersion string) {
+	i.setResourceVersion(resourceVersion)
+}
+
+// Checkpoint returns the current resource version if all events up to it were handled.
+func (i *NoCacheInformer) Checkpoint() (string, bool) {
+	if !i.initDone.Load() || i.currentlyLoading.Load() || i.inFlight.Load() > 0 {
+		return "", false
+	}
+	rv := i.getResourceVersion()
+	// An event may have been received after the first check
+	if len(rv) < 2 || i.inFlight.Load() > 0 {
+		return "", false
+	}
+	return rv, true
 }
 
 func (i *NoCacheInformer) setResourceVersion(rv string) {
 	if rv == "" {
 		return
 	}
+	i.rvMutex.Lock()
+	defer i.rvMutex.Unlock()
 	i.resourceVersion = rv
 }
+
+func (i *NoCacheInformer) getResourceVersion() string {
+	i.rvMutex.RLock()
+	defer i.rvMutex.RUnlock()
+	return i.resourceVersion
+}
@@ -6,6 +6,8 @@ package informer_test
 
 import (
 	"context"
+	"fmt"
+	"strconv"
 
 	"github.com/go-logr/logr"
 	. "github.com/onsi/ginkgo/v2"
@@ -13,8 +15,10 @@ import (
 	"github.com/pkg/errors"
 	"github.com/telekom/controlplane/common-server/internal/informer"
 	metav1 "k8s.io/apimachinery/pkg/apis/meta/v1"
+	"k8s.io/apimachinery/pkg/apis/meta/v1/unstructured"
 	"k8s.io/apimachinery/pkg/runtime"
 	"k8s.io/apimachinery/pkg/runtime/schema"
+	"k8s.io/apimachinery/pkg/types"
 	dynamic "k8s.io/client-go/dynamic/fake"
 )
 
@@ -133,6 +137,81 @@ var _ = Describe("NoCacheInformer", func() {
 
 		})
 
+		It("should handle the events of an object in order", func() {
+			resourceClient := mockClient.Resource(gvr).Namespace("default")
+			options := informer.DefaultNoCacheInformerOptions()
+			options.WorkerCount = 4
+			inf := informer.NewNoCacheWithOptions(ctx, gvr, mockClient, eventHandler, options)
+			Expect(inf.Start()).To(Succeed())
+			Eventually(inf.Ready, timeout, interval).Should(BeTrue())
+
+			objs := make([]*unstructured.Unstructured, 4)
+			for n := range objs {
+				obj, err := resourceClient.Create(ctx, NewUnstructured(fmt.Sprintf("test-%d", n)), metav1.CreateOptions{})
+				Expect(err).ToNot(HaveOccurred())
+				objs[n] = obj
+			}
+			for seq := range 10 {
+				for n, obj := range objs {
+					obj.SetLabels(map[string]string{"seq": strconv.Itoa(seq)})
+					updated, err := resourceClient.Update(ctx, obj, metav1.UpdateOptions{})
+					Expect(err).ToNot(HaveOccurred())
+					objs[n] = updated
+				}
+			}
+
+			Eventually(func(g Gomega) {
+				g.Expect(eventHandler.Events()).To(HaveLen(len(objs) * 11))
+			}, timeout, interval).Should(Succeed())
+
+			seqByName := map[string]int{}
+			for _, e := range eventHandler.Events() {
+				if e.Action != "update" {
+					continue
+				}
+				seq, err := strconv.Atoi(e.Object.GetLabels()["seq"])
+				Expect(err).ToNot(HaveOccurred())
+				Expect(seq).To(Equal(seqByName[e.Object.GetName()]), "events of %s out of order", e.Object.GetName())
+				seqByName[e.Object.GetName()] = seq + 1
+			}
+		})
+
+		It("should pass the listed objects to a list handler", func() {
+			listHandler := &mockListHandler{}
+			resourceClient := mockClient.Resource(gvr).Namespace("default")
+			_, err := resourceClient.Create(ctx, NewUnstructured("test"), metav1.CreateOptions{})
+			Expect(err).ToNot(HaveOccurred())
+
+			inf := informer.NewNoCache(ctx, gvr, mockClient, listHandler)
+			Expect(inf.Start()).To(Succeed())
+
+			Eventually(func(g Gomega) {
+				g.Expect(listHandler.Listed()).To(HaveKey(types.NamespacedName{Namespace: "default", Name: "test"}))
+			}, timeout, interval).Should(Succeed())
+		})
+
+		It("should resume from a resource version without listing", func() {
+			resourceClient := mockClient.Resource(gvr).Namespace("default")
+			_, err := resourceClient.Create(ctx, NewUnstructured("test"), metav1.CreateOptions{})
+			Expect(err).ToNot(HaveOccurred())
+
+			inf := informer.NewNoCache(ctx, gvr, mockClient, eventHandler)
+			_, ok := inf.Checkpoint()
+			Expect(ok).To(BeFalse())
+
+			inf.Resume("100")
+			Expect(inf.Start()).To(Succeed())
+
+			Eventually(func(g Gomega) {
+				g.Expect(inf.Ready()).To(BeTrue())
+			}, timeout, interval).Should(Succeed())
+			Expect(eventHandler.Events()).To(BeEmpty())
+
+			rv, ok := inf.Checkpoint()
+			Expect(ok).To(BeTrue())
+			Expect(rv).To(Equal("100"))
+		})
+
 		It("should stop gracefully", func() {
 			inf := informer.NewNoCache(ctx, gvr, mockClient, eventHandler)
 			Expect(inf).NotTo(BeNil())
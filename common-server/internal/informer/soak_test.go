@@ -0,0 +1,136 @@
+// Copyright 2025 Deutsche Telekom IT GmbH
+//
+// SPDX-License-Identifier: Apache-2.0
+
+package informer_test
+
+import (
+	"context"
+	"fmt"
+	"runtime"
+	"slices"
+	"strconv"
+	"sync"
+	"sync/atomic"
+	"testing"
+	"time"
+
+	"github.com/telekom/controlplane/common-server/internal/informer"
+	metav1 "k8s.io/apimachinery/pkg/apis/meta/v1"
+	"k8s.io/apimachinery/pkg/apis/meta/v1/unstructured"
+	k8sruntime "k8s.io/apimachinery/pkg/runtime"
+	"k8s.io/apimachinery/pkg/runtime/schema"
+	dynamicfake "k8s.io/client-go/dynamic/fake"
+)
+
+const (
+	soakObjects = 100_000
+	soakUpdates = 1_000
+	sentAtLabel = "sent-at"
+
+	// soakTimeout bounds the wait for the events, so that a lost event fails the benchmark
+	soakTimeout = 5 * time.Minute
+)
+
+// soakHandler counts events and records the latency of updates.
+type soakHandler struct {
+	received  atomic.Int64
+	mutex     sync.Mutex
+	latencies []time.Duration
+}
+
+func (h *soakHandler) OnCreate(ctx context.Context, obj *unstructured.Unstructured) error {
+	h.received.Add(1)
+	return nil
+}
+
+func (h *soakHandler) OnUpdate(ctx context.Context, obj *unstructured.Unstructured) error {
+	if sentAt, err := strconv.ParseInt(obj.GetLabels()[sentAtLabel], 10, 64); err == nil {
+		h.mutex.Lock()
+		h.latencies = append(h.latencies, time.Since(time.Unix(0, sentAt)))
+		h.mutex.Unlock()
+	}
+	h.received.Add(1)
+	return nil
+}
+
+func (h *soakHandler) OnDelete(ctx context.Context, obj *unstructured.Unstructured) error {
+	h.received.Add(1)
+	return nil
+}
+
+func (h *soakHandler) waitFor(tb testing.TB, n int64) {
+	deadline := time.Now().Add(soakTimeout)
+	for h.received.Load() < n {
+		if time.Now().After(deadline) {
+			tb.Fatalf("received %d of %d events within %s", h.received.Load(), n, soakTimeout)
+		}
+		time.Sleep(10 * time.Millisecond)
+	}
+}
+
+func heapInuse() uint64 {
+	runtime.GC()
+	var stats runtime.MemStats
+	runtime.ReadMemStats(&stats)
+	return stats.HeapInuse
+}
+
+// BenchmarkInformerSoak compares the memory usage and event latency of both informers
+// with many objects. The reported heap includes the objects of the fake API server.
+func BenchmarkInformerSoak(b *testing.B) {
+	gvr := schema.GroupVersionResource{Group: "testgroup", Version: "v1", Resource: "testobjects"}
+
+	informers := []struct {
+		name string
+		new  func(ctx context.Context, client *dynamicfake.FakeDynamicClient, handler informer.EventHandler) informer.Informer
+	}{
+		{"NoCacheInformer", func(ctx context.Context, client *dynamicfake.FakeDynamicClient, handler informer.EventHandler) informer.Informer {
+			return informer.NewNoCache(ctx, gvr, client, handler)
+		}},
+		{"KubeInformer", func(ctx context.Context, client *dynamicfake.FakeDynamicClient, handler informer.EventHandler) informer.Informer {
+			return informer.New(ctx, gvr, client, handler)
+		}},
+	}
+
+	for _, tc := range informers {
+		b.Run(fmt.Sprintf("%s/objects=%d", tc.name, soakObjects), func(b *testing.B) {
+			for range b.N {
+				b.StopTimer()
+				objs := make([]k8sruntime.Object, soakObjects)
+				for n := range objs {
+					objs[n] = NewUnstructured(fmt.Sprintf("test-%d", n))
+				}
+				client := dynamicfake.NewSimpleDynamicClientWithCustomListKinds(k8sruntime.NewScheme(), map[schema.GroupVersionResource]string{
+					gvr: "TestObjectList",
+				}, objs...)
+				ctx, cancel := context.WithCancel(context.Background())
+				handler := &soakHandler{}
+				before := heapInuse()
+				b.StartTimer()
+
+				inf := tc.new(ctx, client, handler)
+				if err := inf.Start(); err != nil {
+					b.Fatal(err)
+				}
+				handler.waitFor(b, soakObjects)
+				b.ReportMetric(float64(int64(heapInuse())-int64(before))/(1<<20), "heap-MB") // #nosec G115 -- heap sizes fit into int64
+
+				resourceClient := client.Resource(gvr).Namespace("default")
+				for n := range soakUpdates {
+					obj := NewUnstructured(fmt.Sprintf("test-%d", n))
+					obj.SetLabels(map[string]string{sentAtLabel: strconv.FormatInt(time.Now().UnixNano(), 10)})
+					if _, err := resourceClient.Update(ctx, obj, metav1.UpdateOptions{}); err != nil {
+						b.Fatal(err)
+					}
+				}
+				handler.waitFor(b, soakObjects+soakUpdates)
+
+				slices.Sort(handler.latencies)
+				b.ReportMetric(float64(handler.latencies[len(handler.latencies)/2].Microseconds()), "p50-us")
+				b.ReportMetric(float64(handler.latencies[len(handler.latencies)*99/100].Microseconds()), "p99-us")
+				cancel()
+			}
+		})
+	}
+}
@@ -11,6 +11,7 @@ import (
 	"github.com/telekom/controlplane/common-server/internal/informer"
 	"k8s.io/apimachinery/pkg/apis/meta/v1/unstructured"
 	"k8s.io/apimachinery/pkg/runtime/schema"
+	"k8s.io/apimachinery/pkg/types"
 )
 
 var _ informer.EventHandler = &mockEventHandler{}
@@ -60,6 +61,26 @@ func (m *mockEventHandler) Events() []ReceivedEvent {
 	return m.events
 }
 
+var _ informer.ListHandler = &mockListHandler{}
+
+type mockListHandler struct {
+	mockEventHandler
+	listed map[types.NamespacedName]struct{}
+}
+
+func (m *mockListHandler) OnListDone(ctx context.Context, listed map[types.NamespacedName]struct{}) error {
+	m.lock.Lock()
+	defer m.lock.Unlock()
+	m.listed = listed
+	return nil
+}
+
+func (m *mockListHandler) Listed() map[types.NamespacedName]struct{} {
+	m.lock.Lock()
+	defer m.lock.Unlock()
+	return m.listed
+}
+
 func NewUnstructured(name string) *unstructured.Unstructured {
 	u := &unstructured.Unstructured{
 		Object: map[string]any{
@@ -114,6 +114,15 @@ func Conflict(detail string) Problem {
 		Build()
 }
 
+func Gone(detail string) Problem {
+	return Builder().
+		Status(http.StatusGone).
+		Type("Gone").
+		Title("Gone").
+		Detail(detail).
+		Build()
+}
+
 func Forbidden(title, detail string) Problem {
 	return Builder().
 		Status(http.StatusForbidden).
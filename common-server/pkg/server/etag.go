@@ -0,0 +1,47 @@
+// Copyright 2026 Deutsche Telekom IT GmbH
+//
+// SPDX-License-Identifier: Apache-2.0
+
+package server
+
+import (
+	"fmt"
+	"hash/fnv"
+	"strings"
+
+	"github.com/gofiber/fiber/v2"
+	"github.com/telekom/controlplane/common-server/pkg/store"
+)
+
+// objectETag returns the entity tag of an object with the given version.
+// It is weak, as the JSON of an unchanged object is not guaranteed to be byte-identical.
+func objectETag(version string) string {
+	return `W/"` + version + `"`
+}
+
+// listETag returns the entity tag of a page of a list with the given revision.
+// The page depends on the list options, which may differ from the query if a
+// prefix is enforced.
+func listETag(revision string, opts store.ListOpts) string {
+	h := fnv.New64a()
+	_, _ = h.Write([]byte(opts.UrlEncoded()))
+	return fmt.Sprintf(`W/"%s-%x"`, revision, h.Sum64())
+}
+
+// notModified sets the ETag of the response and returns true if it matches
+// If-None-Match of the request, using the weak comparison.
+func notModified(c *fiber.Ctx, etag string) bool {
+	c.Set(fiber.HeaderETag, etag)
+
+	ifNoneMatch := c.Get(fiber.HeaderIfNoneMatch)
+	if ifNoneMatch == "" {
+		return false
+	}
+	for _, tag := range strings.Split(ifNoneMatch, ",") {
+		tag = strings.TrimSpace(tag)
+		if tag == "*" || strings.TrimPrefix(tag, "W/") == strings.TrimPrefix(etag, "W/") {
+			return true
+		}
+	}
+	return false
+}
@@ -91,6 +91,17 @@ func (r *ResourceController) Read(c *fiber.Ctx) error {
 	ctx := c.UserContext()
 	r.log.Info("Read", "namespace", namespace, "name", name)
 
+	if versioned, ok := r.Store.(store.VersionedObjectStore); ok {
+		if version, ok := versioned.Version(namespace, name); ok && notModified(c, objectETag(version)) {
+			r.SetXInfoHeaders(c)
+			return c.SendStatus(fiber.StatusNotModified)
+		}
+	}
+
+	if raw, ok := r.Store.(store.RawObjectStore); ok {
+		return r.readRaw(c, raw, namespace, name)
+	}
+
 	obj, err := r.Store.Get(ctx, namespace, name)
 	if err != nil {
 		return ReturnWithError(c, err)
@@ -99,6 +110,20 @@ func (r *ResourceController) Read(c *fiber.Ctx) error {
 	return Return(c, 200, obj)
 }
 
+// readRaw writes the stored JSON of the object into the response without decoding it.
+func (r *ResourceController) readRaw(c *fiber.Ctx, raw store.RawObjectStore, namespace, name string) error {
+	err := raw.GetRaw(c.UserContext(), namespace, name, func(obj []byte) error {
+		c.Response().SetBody(obj)
+		return nil
+	})
+	if err != nil {
+		return ReturnWithError(c, err)
+	}
+	r.SetXInfoHeaders(c)
+	c.Set(fiber.HeaderContentType, fiber.MIMEApplicationJSON)
+	return c.SendStatus(200)
+}
+
 func (r *ResourceController) Patch(c *fiber.Ctx) error {
 	namespace := c.Params("namespace")
 	name := c.Params("name")
@@ -148,24 +173,86 @@ func (r *ResourceController) List(c *fiber.Ctx) error {
 
 	store.EnforcePrefix(c.Locals("prefix"), &opts)
 
+	if c.QueryBool("watch") {
+		return r.watch(c, opts)
+	}
+
+	// The revisions are read before the page, so that changes while reading it invalidate the ETag
+	// and are sent to watches.
+	if versioned, ok := r.Store.(store.VersionedObjectStore); ok {
+		// Clients watch the changes after the page from the revision of the whole store.
+		// The revision of a quiet namespace may be too old to resume from.
+		if revision := versioned.Revision(""); revision != "" {
+			c.Set("X-Revision", revision)
+		}
+		if revision := versioned.Revision(opts.Prefix); revision != "" && notModified(c, listETag(revision, opts)) {
+			r.SetXInfoHeaders(c)
+			return c.SendStatus(fiber.StatusNotModified)
+		}
+	}
+
+	if raw, ok := r.Store.(store.RawObjectStore); ok {
+		return r.listRaw(c, raw, opts)
+	}
+
 	list, err := r.Store.List(ctx, opts)
 	if err != nil {
 		return ReturnWithError(c, err)
 	}
-	opts.Cursor = list.Links.Self
+	r.setListHeaders(c, opts, &list.Links, len(list.Items))
+	return Return(c, 200, list)
+}
+
+// listRaw writes the stored JSON of the objects of the page into the response
+// without decoding them. The links follow the items, as they are only known
+// once the page was read.
+func (r *ResourceController) listRaw(c *fiber.Ctx, raw store.RawObjectStore, opts store.ListOpts) error {
+	res := c.Response()
+	res.AppendBodyString(`{"items":[`)
+	count := 0
+	links, err := raw.ListRaw(c.UserContext(), opts, func(obj []byte) error {
+		if count > 0 {
+			res.AppendBodyString(",")
+		}
+		res.AppendBody(obj)
+		count++
+		return nil
+	})
+	if err != nil {
+		res.ResetBody()
+		return ReturnWithError(c, err)
+	}
 
-	c.Set("X-Cursor-Self", list.Links.Self)
-	c.Set("X-Cursor-Next", list.Links.Next)
+	r.setListHeaders(c, opts, &links, count)
+	encodedLinks, err := sonic.Marshal(links)
+	if err != nil {
+		res.ResetBody()
+		return ReturnWithError(c, err)
+	}
+	res.AppendBodyString(`],"_links":`)
+	res.AppendBody(encodedLinks)
+	res.AppendBodyString("}")
 
-	list.Links.Self = r.ApiPrefix + "?" + opts.UrlEncoded()
-	if list.Links.Next != "" {
-		opts.Cursor = list.Links.Next
-		list.Links.Next = r.ApiPrefix + "?" + opts.UrlEncoded()
+	c.Set(fiber.HeaderContentType, fiber.MIMEApplicationJSON)
+	return c.SendStatus(200)
+}
+
+// setListHeaders sets the cursor and info headers of a page and replaces the
+// cursors of the links with the URLs of the pages.
+func (r *ResourceController) setListHeaders(c *fiber.Ctx, opts store.ListOpts, links *store.ListResponseLinks, count int) {
+	opts.Cursor = links.Self
+
+	c.Set("X-Cursor-Self", links.Self)
+	c.Set("X-Cursor-Next", links.Next)
+
+	links.Self = r.ApiPrefix + "?" + opts.UrlEncoded()
+	if links.Next != "" {
+		opts.Cursor = links.Next
+		links.Next = r.ApiPrefix + "?" + opts.UrlEncoded()
 	}
 
-	c.Set("X-Result-Count", fmt.Sprintf("%d", len(list.Items)))
+	c.Set("X-Result-Count", fmt.Sprintf("%d", count))
 	r.SetXInfoHeaders(c)
-	return Return(c, 200, list)
 }
 
 func QueryParser(c *fiber.Ctx, opts *store.ListOpts) (err error) {
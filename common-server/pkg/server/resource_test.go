@@ -5,15 +5,24 @@
 package server_test
 
 import (
+	"bufio"
 	"bytes"
+	"context"
+	"encoding/json"
 	"errors"
+	"fmt"
+	"io"
+	"net"
 	"net/http"
 	"net/http/httptest"
+	"strings"
+	"time"
 
 	"github.com/gofiber/fiber/v2"
 	. "github.com/onsi/ginkgo/v2"
 	. "github.com/onsi/gomega"
 	"github.com/stretchr/testify/mock"
+	"github.com/telekom/controlplane/common-server/pkg/problems"
 	"github.com/telekom/controlplane/common-server/pkg/server"
 	"github.com/telekom/controlplane/common-server/pkg/server/middleware/security"
 	securitymock "github.com/telekom/controlplane/common-server/pkg/server/middleware/security/mock"
@@ -280,3 +289,437 @@ var _ = Describe("ResourceController", func() {
 		})
 	})
 })
+
+// rawStore serves the given objects as raw JSON.
+type rawStore struct {
+	*mocks.MockObjectStore[*unstructured.Unstructured]
+	objects [][]byte
+	err     error
+}
+
+func (s *rawStore) GetRaw(_ context.Context, _, _ string, fn func(obj []byte) error) error {
+	if s.err != nil {
+		return s.err
+	}
+	return fn(s.objects[0])
+}
+
+func (s *rawStore) ListRaw(_ context.Context, _ store.ListOpts, fn func(obj []byte) error) (store.ListResponseLinks, error) {
+	for _, obj := range s.objects {
+		if err := fn(obj); err != nil {
+			return store.ListResponseLinks{}, err
+		}
+	}
+	return store.ListResponseLinks{Self: "default/a/", Next: "default/c/"}, s.err
+}
+
+var _ = Describe("ResourceController with a raw store", func() {
+	var (
+		rs  *rawStore
+		app *fiber.App
+	)
+
+	BeforeEach(func() {
+		mockStore := mocks.NewMockObjectStore[*unstructured.Unstructured](GinkgoT())
+		mockStore.EXPECT().Info().Return(
+			schema.GroupVersionResource{Group: "test.group", Version: "v1", Resource: "tests"},
+			schema.GroupVersionKind{Group: "test.group", Version: "v1", Kind: "Test"},
+		)
+		rs = &rawStore{
+			MockObjectStore: mockStore,
+			objects: [][]byte{
+				[]byte(`{"apiVersion":"test.group/v1","kind":"Test","metadata":{"name":"a","namespace":"default"}}`),
+				[]byte(`{"apiVersion":"test.group/v1","kind":"Test","metadata":{"name":"b","namespace":"default"}}`),
+			},
+		}
+
+		resourceCtrl := server.NewResourceController(rs, GinkgoLogr)
+		app = fiber.New()
+		resourceCtrl.Register(app.Group("/tests"), server.ControllerOpts{
+			Prefix: "/tests",
+			Security: security.SecurityOpts{
+				Mode:            security.ModeMock,
+				CheckAccessOpts: permissiveCheckAccessOpts,
+			},
+		})
+	})
+
+	get := func(path string) *http.Response {
+		req := httptest.NewRequest(http.MethodGet, path, nil)
+		req.Header.Set("Authorization", adminBearerToken)
+		resp, err := app.Test(req)
+		Expect(err).ToNot(HaveOccurred())
+		return resp
+	}
+
+	It("should read the stored JSON", func() {
+		resp := get("/tests/default/a")
+		Expect(resp.StatusCode).To(Equal(http.StatusOK))
+		Expect(resp.Header.Get("Content-Type")).To(Equal(fiber.MIMEApplicationJSON))
+
+		body, err := io.ReadAll(resp.Body)
+		Expect(err).ToNot(HaveOccurred())
+		Expect(body).To(Equal(rs.objects[0]))
+	})
+
+	It("should list the stored JSON", func() {
+		resp := get("/tests?limit=2")
+		Expect(resp.StatusCode).To(Equal(http.StatusOK))
+		Expect(resp.Header.Get("X-Result-Count")).To(Equal("2"))
+		Expect(resp.Header.Get("X-Cursor-Next")).To(Equal("default/c/"))
+
+		list := store.ListResponse[*unstructured.Unstructured]{}
+		Expect(json.NewDecoder(resp.Body).Decode(&list)).To(Succeed())
+		Expect(list.Items).To(HaveLen(2))
+		Expect(list.Items[1].GetName()).To(Equal("b"))
+		Expect(list.Links.Self).To(HavePrefix("/tests?"))
+		Expect(list.Links.Next).To(ContainSubstring("cursor=default/c/"))
+	})
+
+	It("should not return a partial list on error", func() {
+		rs.err = errors.New("list error")
+
+		resp := get("/tests")
+		Expect(resp.StatusCode).To(Equal(http.StatusInternalServerError))
+		body, err := io.ReadAll(resp.Body)
+		Expect(err).ToNot(HaveOccurred())
+		Expect(string(body)).ToNot(ContainSubstring(`"items"`))
+	})
+})
+
+// versionedStore serves the given objects with fixed versions.
+type versionedStore struct {
+	*rawStore
+	version  string
+	revision string
+	// prefixRevision is the revision of prefixes, if set
+	prefixRevision string
+}
+
+func (s *versionedStore) Version(_, _ string) (string, bool) {
+	return s.version, s.version != ""
+}
+
+func (s *versionedStore) Revision(prefix string) string {
+	if prefix != "" && s.prefixRevision != "" {
+		return s.prefixRevision
+	}
+	return s.revision
+}
+
+var _ = Describe("ResourceController with a versioned store", func() {
+	var (
+		vs  *versionedStore
+		app *fiber.App
+	)
+
+	BeforeEach(func() {
+		mockStore := mocks.NewMockObjectStore[*unstructured.Unstructured](GinkgoT())
+		mockStore.EXPECT().Info().Return(
+			schema.GroupVersionResource{Group: "test.group", Version: "v1", Resource: "tests"},
+			schema.GroupVersionKind{Group: "test.group", Version: "v1", Kind: "Test"},
+		)
+		vs = &versionedStore{
+			rawStore: &rawStore{
+				MockObjectStore: mockStore,
+				objects: [][]byte{
+					[]byte(`{"apiVersion":"test.group/v1","kind":"Test","metadata":{"name":"a","namespace":"default"}}`),
+				},
+			},
+			version:  "42",
+			revision: "epoch-7",
+		}
+
+		resourceCtrl := server.NewResourceController(vs, GinkgoLogr)
+		app = fiber.New()
+		resourceCtrl.Register(app.Group("/tests"), server.ControllerOpts{
+			Prefix: "/tests",
+			Security: security.SecurityOpts{
+				Mode:            security.ModeMock,
+				CheckAccessOpts: permissiveCheckAccessOpts,
+			},
+		})
+	})
+
+	get := func(path, ifNoneMatch string) *http.Response {
+		req := httptest.NewRequest(http.MethodGet, path, nil)
+		req.Header.Set("Authorization", adminBearerToken)
+		if ifNoneMatch != "" {
+			req.Header.Set("If-None-Match", ifNoneMatch)
+		}
+		resp, err := app.Test(req)
+		Expect(err).ToNot(HaveOccurred())
+		return resp
+	}
+
+	It("should set the ETag of an object", func() {
+		resp := get("/tests/default/a", "")
+		Expect(resp.StatusCode).To(Equal(http.StatusOK))
+		Expect(resp.Header.Get("ETag")).To(Equal(`W/"42"`))
+	})
+
+	It("should return not modified for an unchanged object", func() {
+		resp := get("/tests/default/a", `"41", W/"42"`)
+		Expect(resp.StatusCode).To(Equal(http.StatusNotModified))
+		Expect(resp.Header.Get("ETag")).To(Equal(`W/"42"`))
+
+		body, err := io.ReadAll(resp.Body)
+		Expect(err).ToNot(HaveOccurred())
+		Expect(body).To(BeEmpty())
+	})
+
+	It("should return a changed object", func() {
+		resp := get("/tests/default/a", `W/"41"`)
+		Expect(resp.StatusCode).To(Equal(http.StatusOK))
+		Expect(resp.Header.Get("ETag")).To(Equal(`W/"42"`))
+	})
+
+	It("should not set an ETag for an unknown object", func() {
+		vs.version = ""
+		vs.err = errors.New("not found")
+
+		resp := get("/tests/default/a", "*")
+		Expect(resp.StatusCode).To(Equal(http.StatusInternalServerError))
+		Expect(resp.Header.Get("ETag")).To(BeEmpty())
+	})
+
+	It("should return not modified for an unchanged list", func() {
+		resp := get("/tests?limit=10", "")
+		Expect(resp.StatusCode).To(Equal(http.StatusOK))
+		etag := resp.Header.Get("ETag")
+		Expect(etag).To(HavePrefix(`W/"epoch-7-`))
+
+		resp = get("/tests?limit=10", etag)
+		Expect(resp.StatusCode).To(Equal(http.StatusNotModified))
+		Expect(resp.Header.Get("ETag")).To(Equal(etag))
+	})
+
+	It("should return a list once it changed", func() {
+		etag := get("/tests?limit=10", "").Header.Get("ETag")
+		vs.revision = "epoch-8"
+
+		resp := get("/tests?limit=10", etag)
+		Expect(resp.StatusCode).To(Equal(http.StatusOK))
+		Expect(resp.Header.Get("ETag")).ToNot(Equal(etag))
+	})
+
+	It("should return the revision of the whole store", func() {
+		vs.prefixRevision = "epoch-3"
+
+		resp := get("/tests?prefix=default/", "")
+		Expect(resp.StatusCode).To(Equal(http.StatusOK))
+		Expect(resp.Header.Get("X-Revision")).To(Equal("epoch-7"))
+		Expect(resp.Header.Get("ETag")).To(HavePrefix(`W/"epoch-3-`))
+	})
+
+	It("should use a different ETag for another page", func() {
+		first := get("/tests?limit=10", "").Header.Get("ETag")
+		second := get("/tests?limit=20", "").Header.Get("ETag")
+		Expect(first).ToNot(Equal(second))
+
+		resp := get("/tests?limit=20", first)
+		Expect(resp.StatusCode).To(Equal(http.StatusOK))
+	})
+})
+
+// watchableStore publishes the given events and closes the watch.
+type watchableStore struct {
+	*mocks.MockObjectStore[*unstructured.Unstructured]
+	events   []store.Event
+	err      error
+	opts     store.ListOpts
+	revision string
+}
+
+func (s *watchableStore) Watch(_ context.Context, opts store.ListOpts, revision string) (<-chan store.Event, error) {
+	s.opts, s.revision = opts, revision
+	if s.err != nil {
+		return nil, s.err
+	}
+	events := make(chan store.Event, len(s.events))
+	for _, event := range s.events {
+		events <- event
+	}
+	close(events)
+	return events, nil
+}
+
+var _ = Describe("ResourceController with a watchable store", func() {
+	var (
+		ws  *watchableStore
+		app *fiber.App
+	)
+
+	BeforeEach(func() {
+		mockStore := mocks.NewMockObjectStore[*unstructured.Unstructured](GinkgoT())
+		mockStore.EXPECT().Info().Return(
+			schema.GroupVersionResource{Group: "test.group", Version: "v1", Resource: "tests"},
+			schema.GroupVersionKind{Group: "test.group", Version: "v1", Kind: "Test"},
+		)
+		ws = &watchableStore{
+			MockObjectStore: mockStore,
+			events: []store.Event{
+				{Type: store.EventTypeAdded, Revision: "epoch-1", Object: []byte(`{"metadata":{"name":"a","namespace":"default"}}`)},
+				{Type: store.EventTypeDeleted, Revision: "epoch-2", Object: []byte(`{"metadata":{"name":"b","namespace":"default"}}`)},
+			},
+		}
+
+		resourceCtrl := server.NewResourceController(ws, GinkgoLogr)
+		app = fiber.New()
+		resourceCtrl.Register(app.Group("/tests"), server.ControllerOpts{
+			Prefix: "/tests",
+			Security: security.SecurityOpts{
+				Mode:            security.ModeMock,
+				CheckAccessOpts: permissiveCheckAccessOpts,
+			},
+		})
+	})
+
+	watch := func(path string, header map[string]string) *http.Response {
+		req := httptest.NewRequest(http.MethodGet, path, nil)
+		req.Header.Set("Authorization", adminBearerToken)
+		for key, value := range header {
+			req.Header.Set(key, value)
+		}
+		resp, err := app.Test(req)
+		Expect(err).ToNot(HaveOccurred())
+		return resp
+	}
+
+	It("should stream the events", func() {
+		resp := watch("/tests?watch=true&prefix=default/&filter=spec.team==a", nil)
+		Expect(resp.StatusCode).To(Equal(http.StatusOK))
+		Expect(resp.Header.Get("Content-Type")).To(Equal("text/event-stream"))
+
+		body, err := io.ReadAll(resp.Body)
+		Expect(err).ToNot(HaveOccurred())
+		Expect(string(body)).To(Equal(
+			"id: epoch-1\n" +
+				`data: {"type":"ADDED","object":{"metadata":{"name":"a","namespace":"default"}}}` + "\n\n" +
+				"id: epoch-2\n" +
+				`data: {"type":"DELETED","object":{"metadata":{"name":"b","namespace":"default"}}}` + "\n\n",
+		))
+
+		Expect(ws.opts.Prefix).To(Equal("default/"))
+		Expect(ws.opts.Filters).To(HaveLen(1))
+		Expect(ws.revision).To(BeEmpty())
+	})
+
+	It("should resume from the revision", func() {
+		resp := watch("/tests?watch=true&revision=epoch-7", nil)
+		Expect(resp.StatusCode).To(Equal(http.StatusOK))
+		Expect(ws.revision).To(Equal("epoch-7"))
+
+		resp = watch("/tests?watch=true", map[string]string{"Last-Event-ID": "epoch-8"})
+		Expect(resp.StatusCode).To(Equal(http.StatusOK))
+		Expect(ws.revision).To(Equal("epoch-8"))
+	})
+
+	It("should return the error of the store", func() {
+		ws.err = problems.Gone("too old")
+
+		resp := watch("/tests?watch=true&revision=epoch-1", nil)
+		Expect(resp.StatusCode).To(Equal(http.StatusGone))
+	})
+})
+
+// tickingStore publishes an event at every interval until the watch is cancelled.
+type tickingStore struct {
+	*mocks.MockObjectStore[*unstructured.Unstructured]
+	interval time.Duration
+}
+
+func (s *tickingStore) Watch(ctx context.Context, _ store.ListOpts, _ string) (<-chan store.Event, error) {
+	events := make(chan store.Event)
+	go func() {
+		defer close(events)
+		ticker := time.NewTicker(s.interval)
+		defer ticker.Stop()
+		for i := 1; ; i++ {
+			select {
+			case <-ticker.C:
+			case <-ctx.Done():
+				return
+			}
+			event := store.Event{Type: store.EventTypeModified, Revision: fmt.Sprintf("epoch-%d", i), Object: []byte(`{}`)}
+			select {
+			case events <- event:
+			case <-ctx.Done():
+				return
+			}
+		}
+	}()
+	return events, nil
+}
+
+var _ = Describe("ResourceController watches on a listener", func() {
+	It("should keep streaming longer than the write timeout", func() {
+		mockStore := mocks.NewMockObjectStore[*unstructured.Unstructured](GinkgoT())
+		mockStore.EXPECT().Info().Return(
+			schema.GroupVersionResource{Group: "test.group", Version: "v1", Resource: "tests"},
+			schema.GroupVersionKind{Group: "test.group", Version: "v1", Kind: "Test"},
+		)
+		cfg := server.NewAppConfig()
+		cfg.WriteTimeout = 300 * time.Millisecond
+		cfg.EnableLogging = false
+		cfg.EnableMetrics = false
+		app := server.NewAppWithConfig(cfg)
+		server.NewResourceController(&tickingStore{MockObjectStore: mockStore, interval: 20 * time.Millisecond}, GinkgoLogr).
+			Register(app.Group("/tests"), server.ControllerOpts{
+				Prefix: "/tests",
+				Security: security.SecurityOpts{
+					Mode:            security.ModeMock,
+					CheckAccessOpts: permissiveCheckAccessOpts,
+				},
+			})
+
+		ln, err := net.Listen("tcp4", "127.0.0.1:0")
+		Expect(err).ToNot(HaveOccurred())
+		go func() { _ = app.Listener(ln) }()
+		DeferCleanup(app.ShutdownWithTimeout, time.Second)
+
+		req, err := http.NewRequest(http.MethodGet, "http://"+ln.Addr().String()+"/tests?watch=true", nil)
+		Expect(err).ToNot(HaveOccurred())
+		req.Header.Set("Authorization", adminBearerToken)
+		resp, err := http.DefaultClient.Do(req)
+		Expect(err).ToNot(HaveOccurred())
+		defer resp.Body.Close() //nolint:errcheck
+		Expect(resp.StatusCode).To(Equal(http.StatusOK))
+
+		reader := bufio.NewReader(resp.Body)
+		received := 0
+		for end := time.Now().Add(3 * cfg.WriteTimeout); time.Now().Before(end); {
+			line, err := reader.ReadString('\n')
+			Expect(err).ToNot(HaveOccurred())
+			if strings.HasPrefix(line, "id: ") {
+				received++
+			}
+		}
+		Expect(received).To(BeNumerically(">", 20))
+	})
+})
+
+var _ = Describe("ResourceController without a watchable store", func() {
+	It("should reject watches", func() {
+		mockStore := mocks.NewMockObjectStore[*unstructured.Unstructured](GinkgoT())
+		mockStore.EXPECT().Info().Return(
+			schema.GroupVersionResource{Group: "test.group", Version: "v1", Resource: "tests"},
+			schema.GroupVersionKind{Group: "test.group", Version: "v1", Kind: "Test"},
+		)
+		resourceCtrl := server.NewResourceController(mockStore, GinkgoLogr)
+		app := fiber.New()
+		resourceCtrl.Register(app.Group("/tests"), server.ControllerOpts{
+			Prefix: "/tests",
+			Security: security.SecurityOpts{
+				Mode:            security.ModeMock,
+				CheckAccessOpts: permissiveCheckAccessOpts,
+			},
+		})
+
+		req := httptest.NewRequest(http.MethodGet, "/tests?watch=true", nil)
+		req.Header.Set("Authorization", adminBearerToken)
+		resp, err := app.Test(req)
+		Expect(err).ToNot(HaveOccurred())
+		Expect(resp.StatusCode).To(Equal(http.StatusBadRequest))
+	})
+})
@@ -0,0 +1,95 @@
+// Copyright 2026 Deutsche Telekom IT GmbH
+//
+// SPDX-License-Identifier: Apache-2.0
+
+package server
+
+import (
+	"bufio"
+	"context"
+	"time"
+
+	"github.com/gofiber/fiber/v2"
+	"github.com/telekom/controlplane/common-server/pkg/problems"
+	"github.com/telekom/controlplane/common-server/pkg/store"
+)
+
+// watchHeartbeatInterval is the interval of the comments that keep idle watches
+// open and detect closed connections.
+var watchHeartbeatInterval = 30 * time.Second
+
+// watch streams the changes of the objects as server-sent events:
+//
+//	id: <revision>
+//	data: {"type":"MODIFIED","object":{...}}
+//
+// A closed watch is resumed with the revision of the last event as query parameter
+// `revision` or as header Last-Event-ID, which browsers send when reconnecting.
+func (r *ResourceController) watch(c *fiber.Ctx, opts store.ListOpts) error {
+	watchable, ok := r.Store.(store.WatchableObjectStore)
+	if !ok {
+		return ReturnWithError(c, problems.BadRequest("watch is not supported"))
+	}
+	revision := c.Query("revision", c.Get("Last-Event-ID"))
+	r.log.Info("Watch", "prefix", opts.Prefix, "revision", revision)
+
+	// The stream outlives the handler. It ends when the stream writer returns,
+	// or when the server shuts down before the stream writer ran.
+	ctx, cancel := context.WithCancel(context.Background())
+	stop := context.AfterFunc(c.Context(), cancel)
+	events, err := watchable.Watch(ctx, opts, revision)
+	if err != nil {
+		stop()
+		cancel()
+		return ReturnWithError(c, err)
+	}
+
+	// The write timeout of the server applies to the whole response, so it is
+	// renewed before every write to keep the stream open.
+	conn := c.Context().Conn()
+	writeTimeout := c.App().Config().WriteTimeout
+
+	r.SetXInfoHeaders(c)
+	c.Set(fiber.HeaderContentType, "text/event-stream")
+	c.Set(fiber.HeaderCacheControl, "no-cache")
+	c.Set("X-Accel-Buffering", "no")
+	c.Context().SetBodyStreamWriter(func(w *bufio.Writer) {
+		defer cancel()
+		defer stop()
+		ticker := time.NewTicker(watchHeartbeatInterval)
+		defer ticker.Stop()
+
+		for {
+			select {
+			case event, ok := <-events:
+				if !ok {
+					return
+				}
+				writeEvent(w, event)
+			case <-ticker.C:
+				_, _ = w.WriteString(": heartbeat\n\n")
+			case <-ctx.Done():
+				return
+			}
+			if writeTimeout > 0 && conn != nil {
+				_ = conn.SetWriteDeadline(time.Now().Add(writeTimeout))
+			}
+			if err := w.Flush(); err != nil {
+				return
+			}
+		}
+	})
+	return nil
+}
+
+// writeEvent writes the event as server-sent event. The JSON of the object
+// is compact, so it fits into a single data line.
+func writeEvent(w *bufio.Writer, event store.Event) {
+	_, _ = w.WriteString("id: ")
+	_, _ = w.WriteString(event.Revision)
+	_, _ = w.WriteString("\ndata: {\"type\":\"")
+	_, _ = w.WriteString(string(event.Type))
+	_, _ = w.WriteString("\",\"object\":")
+	_, _ = w.Write(event.Object)
+	_, _ = w.WriteString("}\n\n")
+}
@@ -0,0 +1,130 @@
+// Copyright 2025 Deutsche Telekom IT GmbH
+//
+// SPDX-License-Identifier: Apache-2.0
+
+package inmemory
+
+import (
+	"container/list"
+	"sync"
+
+	"github.com/telekom/controlplane/common-server/pkg/store"
+)
+
+type decodeCacheEntry[T store.Object] struct {
+	key             string
+	resourceVersion string
+	obj             T
+}
+
+// decodeCache is a bounded LRU cache of decoded objects.
+// It is used to avoid decoding the same unchanged object on every Get and List.
+// Cached objects are never handed out directly, callers always receive a deep copy.
+type decodeCache[T store.Object] struct {
+	name     string
+	maxItems int
+
+	// versions are the resourceVersions of the stored objects. They are used to
+	// prevent objects that were decoded before a change from being cached.
+	versions *versionTracker
+
+	mutex   sync.Mutex
+	entries map[string]*list.Element
+	lru     *list.List
+}
+
+func newDecodeCache[T store.Object](name string, maxItems int, versions *versionTracker) *decodeCache[T] {
+	if maxItems <= 0 {
+		return nil
+	}
+	return &decodeCache[T]{
+		name:     name,
+		maxItems: maxItems,
+		versions: versions,
+		entries:  make(map[string]*list.Element, maxItems),
+		lru:      list.New(),
+	}
+}
+
+// Get returns a deep copy of the cached object for the given key.
+func (c *decodeCache[T]) Get(key string) (obj T, ok bool) {
+	if c == nil {
+		return obj, false
+	}
+	c.mutex.Lock()
+	elem, ok := c.entries[key]
+	if ok {
+		c.lru.MoveToFront(elem)
+		obj = elem.Value.(*decodeCacheEntry[T]).obj
+	}
+	c.mutex.Unlock()
+
+	if !ok {
+		decodeCacheRequests.WithLabelValues(c.name, "miss").Inc()
+		return obj, false
+	}
+	decodeCacheRequests.WithLabelValues(c.name, "hit").Inc()
+	return obj.DeepCopyObject().(T), true
+}
+
+// Put stores a deep copy of the given object if it has the resourceVersion that
+// is currently stored. The resourceVersion is set before the object is invalidated,
+// so an object that was decoded before a change is either rejected here or
+// removed by the following invalidation.
+func (c *decodeCache[T]) Put(key string, obj T) {
+	if c == nil {
+		return
+	}
+	resourceVersion := obj.GetResourceVersion()
+	if resourceVersion == "" {
+		return
+	}
+	entry := &decodeCacheEntry[T]{
+		key:             key,
+		resourceVersion: resourceVersion,
+		obj:             obj.DeepCopyObject().(T),
+	}
+
+	c.mutex.Lock()
+	defer c.mutex.Unlock()
+
+	if current, ok := c.versions.Get(key); !ok || current != resourceVersion {
+		return
+	}
+	if elem, ok := c.entries[key]; ok {
+		elem.Value = entry
+		c.lru.MoveToFront(elem)
+		return
+	}
+	c.entries[key] = c.lru.PushFront(entry)
+	for c.lru.Len() > c.maxItems {
+		c.removeElement(c.lru.Back())
+		decodeCacheEvictions.WithLabelValues(c.name).Inc()
+	}
+	decodeCacheSize.WithLabelValues(c.name).Set(float64(c.lru.Len()))
+}
+
+// Invalidate removes the cached object for the given key unless it already
+// has the given resourceVersion. An empty resourceVersion always invalidates.
+func (c *decodeCache[T]) Invalidate(key, resourceVersion string) {
+	if c == nil {
+		return
+	}
+	c.mutex.Lock()
+	defer c.mutex.Unlock()
+
+	elem, ok := c.entries[key]
+	if ok && resourceVersion != "" && elem.Value.(*decodeCacheEntry[T]).resourceVersion == resourceVersion {
+		return
+	}
+	if !ok {
+		return
+	}
+	c.removeElement(elem)
+	decodeCacheSize.WithLabelValues(c.name).Set(float64(c.lru.Len()))
+}
+
+func (c *decodeCache[T]) removeElement(elem *list.Element) {
+	c.lru.Remove(elem)
+	delete(c.entries, elem.Value.(*decodeCacheEntry[T]).key)
+}
@@ -0,0 +1,185 @@
+// Copyright 2025 Deutsche Telekom IT GmbH
+//
+// SPDX-License-Identifier: Apache-2.0
+
+package inmemory
+
+import (
+	"context"
+	"fmt"
+	"testing"
+
+	"github.com/go-logr/logr"
+	. "github.com/onsi/ginkgo/v2"
+	. "github.com/onsi/gomega"
+	"github.com/prometheus/client_golang/prometheus"
+	prometheusdto "github.com/prometheus/client_model/go"
+	"github.com/telekom/controlplane/common-server/pkg/store"
+	"k8s.io/apimachinery/pkg/apis/meta/v1/unstructured"
+)
+
+func newCachedTestStore(size int) *InmemoryObjectStore[*unstructured.Unstructured] {
+	versions := newVersionTracker()
+	return &InmemoryObjectStore[*unstructured.Unstructured]{
+		ctx:         context.Background(),
+		db:          newDbOrDie(StoreOpts{}, logr.Discard()),
+		log:         logr.Discard(),
+		versions:    versions,
+		decodeCache: newDecodeCache[*unstructured.Unstructured]("test", size, versions),
+	}
+}
+
+// newTestDecodeCache returns a cache for which the given keys are stored
+// with the resourceVersion of NewUnstructured.
+func newTestDecodeCache(size int, keys ...string) *decodeCache[*unstructured.Unstructured] {
+	versions := newVersionTracker()
+	for _, key := range keys {
+		versions.Set(key, "476170914")
+	}
+	return newDecodeCache[*unstructured.Unstructured]("test", size, versions)
+}
+
+func counterValue(c prometheus.Counter) float64 {
+	m := &prometheusdto.Metric{}
+	_ = c.Write(m)
+	return m.GetCounter().GetValue()
+}
+
+var _ = Describe("Decode Cache", func() {
+
+	ctx := context.Background()
+
+	Context("Cache", func() {
+
+		It("should be disabled without a size", func() {
+			Expect(newDecodeCache[*unstructured.Unstructured]("test", 0, newVersionTracker())).To(BeNil())
+		})
+
+		It("should hand out copies", func() {
+			cache := newTestDecodeCache(10, "default/foo/")
+			cache.Put("default/foo/", NewUnstructured("foo"))
+
+			obj, ok := cache.Get("default/foo/")
+			Expect(ok).To(BeTrue())
+			obj.SetName("bar")
+
+			obj, ok = cache.Get("default/foo/")
+			Expect(ok).To(BeTrue())
+			Expect(obj.GetName()).To(Equal("foo"))
+		})
+
+		It("should evict the least recently used objects", func() {
+			cache := newTestDecodeCache(2, "default/a/", "default/b/", "default/c/")
+			cache.Put("default/a/", NewUnstructured("a"))
+			cache.Put("default/b/", NewUnstructured("b"))
+			_, _ = cache.Get("default/a/")
+			cache.Put("default/c/", NewUnstructured("c"))
+
+			_, ok := cache.Get("default/b/")
+			Expect(ok).To(BeFalse())
+			_, ok = cache.Get("default/a/")
+			Expect(ok).To(BeTrue())
+			_, ok = cache.Get("default/c/")
+			Expect(ok).To(BeTrue())
+		})
+
+		It("should only invalidate changed resource versions", func() {
+			cache := newTestDecodeCache(10, "default/foo/")
+			cache.Put("default/foo/", NewUnstructured("foo"))
+
+			cache.Invalidate("default/foo/", "476170914")
+			_, ok := cache.Get("default/foo/")
+			Expect(ok).To(BeTrue())
+
+			cache.Invalidate("default/foo/", "476170915")
+			_, ok = cache.Get("default/foo/")
+			Expect(ok).To(BeFalse())
+		})
+
+		It("should not cache objects decoded before a change", func() {
+			cache := newTestDecodeCache(10)
+			cache.versions.Set("default/foo/", "476170915")
+			cache.Put("default/foo/", NewUnstructured("foo"))
+			_, ok := cache.Get("default/foo/")
+			Expect(ok).To(BeFalse())
+
+			cache.versions.Delete("default/foo/")
+			cache.Put("default/foo/", NewUnstructured("foo"))
+			_, ok = cache.Get("default/foo/")
+			Expect(ok).To(BeFalse())
+		})
+
+		It("should cache objects while other objects change", func() {
+			cache := newTestDecodeCache(10, "default/foo/", "default/bar/")
+			cache.Invalidate("default/bar/", "")
+			cache.Put("default/foo/", NewUnstructured("foo"))
+
+			_, ok := cache.Get("default/foo/")
+			Expect(ok).To(BeTrue())
+		})
+	})
+
+	Context("Store", func() {
+
+		It("should serve Get and List from the cache", func() {
+			objStore := newCachedTestStore(100)
+			for _, u := range GenerateUnstructured(10) {
+				Expect(objStore.OnUpdate(ctx, u)).To(Succeed())
+			}
+
+			hits := counterValue(decodeCacheRequests.WithLabelValues("test", "hit"))
+
+			list, err := objStore.List(ctx, store.NewListOpts())
+			Expect(err).ToNot(HaveOccurred())
+			Expect(list.Items).To(HaveLen(10))
+
+			obj, err := objStore.Get(ctx, "default", "foo1")
+			Expect(err).ToNot(HaveOccurred())
+			Expect(obj.GetName()).To(Equal("foo1"))
+			Expect(counterValue(decodeCacheRequests.WithLabelValues("test", "hit"))).To(Equal(hits + 1))
+
+			list, err = objStore.List(ctx, store.NewListOpts())
+			Expect(err).ToNot(HaveOccurred())
+			Expect(list.Items).To(HaveLen(10))
+			Expect(counterValue(decodeCacheRequests.WithLabelValues("test", "hit"))).To(Equal(hits + 11))
+		})
+
+		It("should return the latest version after an update", func() {
+			objStore := newCachedTestStore(100)
+			u := NewUnstructured("foo")
+			Expect(objStore.OnUpdate(ctx, u)).To(Succeed())
+			_, err := objStore.Get(ctx, "default", "foo")
+			Expect(err).ToNot(HaveOccurred())
+
+			u.SetResourceVersion("476170915")
+			u.SetLabels(map[string]string{"app": "updated"})
+			Expect(objStore.OnUpdate(ctx, u)).To(Succeed())
+
+			obj, err := objStore.Get(ctx, "default", "foo")
+			Expect(err).ToNot(HaveOccurred())
+			Expect(obj.GetLabels()).To(HaveKeyWithValue("app", "updated"))
+
+			Expect(objStore.OnDelete(ctx, u)).To(Succeed())
+			_, err = objStore.Get(ctx, "default", "foo")
+			Expect(err).To(HaveOccurred())
+		})
+	})
+})
+
+func BenchmarkDecodeCache(b *testing.B) {
+	ctx := context.Background()
+
+	for _, size := range []int{0, 1000} {
+		s := newCachedTestStore(size)
+		for i := range 1000 {
+			_ = s.OnUpdate(ctx, NewUnstructured(fmt.Sprintf("item-%d", i)))
+		}
+
+		b.Run(fmt.Sprintf("cacheSize=%d", size), func(b *testing.B) {
+			b.ReportAllocs()
+			for i := 0; i < b.N; i++ {
+				_, _ = s.List(ctx, store.NewListOpts())
+			}
+		})
+	}
+}
@@ -0,0 +1,217 @@
+// Copyright 2026 Deutsche Telekom IT GmbH
+//
+// SPDX-License-Identifier: Apache-2.0
+
+package inmemory
+
+import (
+	"cmp"
+	"context"
+	"fmt"
+	"slices"
+	"strings"
+	"sync"
+
+	"github.com/bytedance/sonic"
+	"github.com/go-logr/logr"
+	"github.com/telekom/controlplane/common-server/pkg/problems"
+	"github.com/telekom/controlplane/common-server/pkg/store"
+	"github.com/telekom/controlplane/common-server/pkg/store/inmemory/filter"
+)
+
+const (
+	defaultWatchHistorySize = 1000
+	defaultWatchBufferSize  = 100
+)
+
+// change is a change of an object with its revision.
+type change struct {
+	revision uint64
+	key      string
+	event    store.Event
+}
+
+// watch receives the changes of the objects that match its prefix and filter.
+type watch struct {
+	prefix string
+	filter filter.FilterFunc
+	events chan store.Event
+}
+
+func (w *watch) matches(c change) bool {
+	if !strings.HasPrefix(c.key, w.prefix) {
+		return false
+	}
+	// deleted objects only have their namespace and name, the filter cannot be evaluated
+	return c.event.Type == store.EventTypeDeleted || w.filter(c.event.Object)
+}
+
+// changeFeed publishes the changes of the stored objects to watches.
+// It keeps the last changes, so that watches can resume from an earlier revision.
+// A watch that cannot keep up with the changes is closed and has to resume.
+type changeFeed struct {
+	ctx         context.Context
+	name        string
+	log         logr.Logger
+	revisions   *revisionTracker
+	historySize int
+	bufferSize  int
+
+	mutex   sync.Mutex
+	history []change // oldest first
+	watches map[*watch]struct{}
+}
+
+func newChangeFeed(ctx context.Context, name string, log logr.Logger, revisions *revisionTracker, opts WatchOpts) *changeFeed {
+	f := &changeFeed{
+		ctx:         ctx,
+		name:        name,
+		log:         log.WithName("feed"),
+		revisions:   revisions,
+		historySize: opts.HistorySize,
+		bufferSize:  opts.BufferSize,
+		watches:     make(map[*watch]struct{}),
+	}
+	if f.historySize <= 0 {
+		f.historySize = defaultWatchHistorySize
+	}
+	if f.bufferSize <= 0 {
+		f.bufferSize = defaultWatchBufferSize
+	}
+	return f
+}
+
+// Publish assigns the next revision to the change of the object with the given key
+// and sends it to all matching watches. data is not modified after it was published.
+func (f *changeFeed) Publish(eventType store.EventType, key string, data []byte) {
+	if f == nil {
+		return
+	}
+	if eventType == store.EventTypeDeleted {
+		data = deletedObject(key)
+	}
+
+	f.mutex.Lock()
+	defer f.mutex.Unlock()
+
+	revision := f.revisions.Next(key)
+	c := change{
+		revision: revision,
+		key:      key,
+		event: store.Event{
+			Type:     eventType,
+			Revision: f.revisions.format(revision),
+			Object:   data,
+		},
+	}
+
+	if len(f.history) >= f.historySize {
+		f.history[0] = change{}
+		f.history = f.history[1:]
+	}
+	f.history = append(f.history, c)
+
+	for w := range f.watches {
+		if !w.matches(c) {
+			continue
+		}
+		select {
+		case w.events <- c.event:
+		default:
+			f.log.V(1).Info("closing watch that is too slow", "prefix", w.prefix, "buffer", f.bufferSize)
+			watchesDropped.WithLabelValues(f.name).Inc()
+			f.close(w)
+		}
+	}
+}
+
+// Watch returns the changes of the objects that match the prefix and filters of
+// opts, starting after the given revision.
+func (f *changeFeed) Watch(ctx context.Context, opts store.ListOpts, revision string) (<-chan store.Event, error) {
+	w := &watch{
+		prefix: opts.Prefix,
+		filter: filter.NopFilter,
+	}
+	if len(opts.Filters) > 0 {
+		w.filter = filter.NewFilterFuncs(opts.Filters)
+	}
+
+	f.mutex.Lock()
+	replay, err := f.since(revision)
+	if err != nil {
+		f.mutex.Unlock()
+		return nil, err
+	}
+	// the replayed changes must not close the watch right away
+	w.events = make(chan store.Event, f.bufferSize+len(replay))
+	for _, c := range replay {
+		if w.matches(c) {
+			w.events <- c.event
+		}
+	}
+	f.watches[w] = struct{}{}
+	watchesActive.WithLabelValues(f.name).Inc()
+	f.mutex.Unlock()
+
+	go func() {
+		select {
+		case <-ctx.Done():
+		case <-f.ctx.Done():
+		}
+		f.mutex.Lock()
+		defer f.mutex.Unlock()
+		f.close(w)
+	}()
+
+	return w.events, nil
+}
+
+// since returns the changes after the given revision.
+// It fails if some of them are not kept anymore.
+func (f *changeFeed) since(token string) ([]change, error) {
+	if token == "" {
+		return nil, nil
+	}
+	revision, sameEpoch, err := f.revisions.parse(token)
+	if err != nil {
+		return nil, problems.BadRequest(err.Error())
+	}
+	current := f.revisions.Get("")
+	if !sameEpoch || revision > current {
+		return nil, problems.Gone(fmt.Sprintf("Revision %s is not known, the objects must be listed again", token))
+	}
+	if revision == current {
+		return nil, nil
+	}
+	if len(f.history) == 0 || f.history[0].revision > revision+1 {
+		return nil, problems.Gone(fmt.Sprintf("Revision %s is too old, the objects must be listed again", token))
+	}
+
+	i, _ := slices.BinarySearchFunc(f.history, revision+1, func(c change, revision uint64) int {
+		return cmp.Compare(c.revision, revision)
+	})
+	return f.history[i:], nil
+}
+
+// close removes the watch and closes its channel. It must be called with the mutex held.
+func (f *changeFeed) close(w *watch) {
+	if _, ok := f.watches[w]; !ok {
+		return
+	}
+	delete(f.watches, w)
+	close(w.events)
+	watchesActive.WithLabelValues(f.name).Dec()
+}
+
+// deletedObject returns the JSON of a deleted object with the given key,
+// which only has its namespace and name.
+func deletedObject(key string) []byte {
+	namespace, name, _ := strings.Cut(strings.TrimSuffix(key, "/"), "/")
+	data, _ := sonic.Marshal(map[string]any{
+		"metadata": map[string]any{
+			"namespace": namespace,
+			"name":      name,
+		},
+	})
+	return data
+}
@@ -0,0 +1,156 @@
+// Copyright 2026 Deutsche Telekom IT GmbH
+//
+// SPDX-License-Identifier: Apache-2.0
+
+package inmemory
+
+import (
+	"context"
+	"errors"
+	"net/http"
+
+	"github.com/go-logr/logr"
+	. "github.com/onsi/ginkgo/v2"
+	. "github.com/onsi/gomega"
+	"github.com/telekom/controlplane/common-server/pkg/problems"
+	"github.com/telekom/controlplane/common-server/pkg/store"
+)
+
+func newTestFeed(ctx context.Context, opts WatchOpts) *changeFeed {
+	return newChangeFeed(ctx, "test", logr.Discard(), newRevisionTracker(), opts)
+}
+
+func problemCode(err error) int {
+	var p problems.Problem
+	Expect(errors.As(err, &p)).To(BeTrue())
+	return p.Code()
+}
+
+var _ = Describe("Change feed", func() {
+
+	var (
+		ctx    context.Context
+		cancel context.CancelFunc
+	)
+
+	BeforeEach(func() {
+		ctx, cancel = context.WithCancel(context.Background())
+		DeferCleanup(func() { cancel() })
+	})
+
+	It("should send the changes of matching objects", func() {
+		f := newTestFeed(ctx, WatchOpts{})
+		opts := store.NewListOpts()
+		opts.Prefix = "default/"
+		opts.Filters = []store.Filter{{Path: "spec.team", Op: store.OpEqual, Value: "a"}}
+
+		events, err := f.Watch(ctx, opts, "")
+		Expect(err).ToNot(HaveOccurred())
+
+		f.Publish(store.EventTypeAdded, "default/foo/", []byte(`{"spec":{"team":"a"}}`))
+		f.Publish(store.EventTypeAdded, "default/bar/", []byte(`{"spec":{"team":"b"}}`))
+		f.Publish(store.EventTypeAdded, "other/foo/", []byte(`{"spec":{"team":"a"}}`))
+		f.Publish(store.EventTypeDeleted, "default/bar/", nil)
+
+		event := <-events
+		Expect(event.Type).To(Equal(store.EventTypeAdded))
+		Expect(event.Object).To(MatchJSON(`{"spec":{"team":"a"}}`))
+		Expect(event.Revision).To(Equal(f.revisions.format(1)))
+
+		event = <-events
+		Expect(event.Type).To(Equal(store.EventTypeDeleted))
+		Expect(event.Object).To(MatchJSON(`{"metadata":{"namespace":"default","name":"bar"}}`))
+		Expect(event.Revision).To(Equal(f.revisions.format(4)))
+		Expect(events).To(BeEmpty())
+	})
+
+	It("should resume after a revision", func() {
+		f := newTestFeed(ctx, WatchOpts{})
+		f.Publish(store.EventTypeAdded, "default/foo/", []byte(`{}`))
+		revision := f.revisions.Token("")
+		f.Publish(store.EventTypeModified, "default/foo/", []byte(`{"a":1}`))
+		f.Publish(store.EventTypeModified, "default/foo/", []byte(`{"a":2}`))
+
+		events, err := f.Watch(ctx, store.NewListOpts(), revision)
+		Expect(err).ToNot(HaveOccurred())
+		Expect((<-events).Object).To(MatchJSON(`{"a":1}`))
+		Expect((<-events).Object).To(MatchJSON(`{"a":2}`))
+		Expect(events).To(BeEmpty())
+
+		events, err = f.Watch(ctx, store.NewListOpts(), f.revisions.Token(""))
+		Expect(err).ToNot(HaveOccurred())
+		Expect(events).To(BeEmpty())
+	})
+
+	It("should fail to resume after changes that are not kept", func() {
+		f := newTestFeed(ctx, WatchOpts{HistorySize: 2})
+		revision := f.revisions.Token("")
+		for range 3 {
+			f.Publish(store.EventTypeModified, "default/foo/", []byte(`{}`))
+		}
+
+		_, err := f.Watch(ctx, store.NewListOpts(), revision)
+		Expect(problemCode(err)).To(Equal(http.StatusGone))
+
+		_, err = f.Watch(ctx, store.NewListOpts(), newRevisionTracker().format(1))
+		Expect(problemCode(err)).To(Equal(http.StatusGone))
+
+		_, err = f.Watch(ctx, store.NewListOpts(), "invalid")
+		Expect(problemCode(err)).To(Equal(http.StatusBadRequest))
+	})
+
+	It("should resume a quiet namespace from the revision of the whole store", func() {
+		f := newTestFeed(ctx, WatchOpts{HistorySize: 2})
+		f.Publish(store.EventTypeAdded, "quiet/foo/", []byte(`{}`))
+		for range 3 {
+			f.Publish(store.EventTypeModified, "other/bar/", []byte(`{}`))
+		}
+		opts := store.NewListOpts()
+		opts.Prefix = "quiet/"
+
+		_, err := f.Watch(ctx, opts, f.revisions.Token(opts.Prefix))
+		Expect(problemCode(err)).To(Equal(http.StatusGone))
+
+		events, err := f.Watch(ctx, opts, f.revisions.Token(""))
+		Expect(err).ToNot(HaveOccurred())
+		Expect(events).To(BeEmpty())
+
+		f.Publish(store.EventTypeModified, "quiet/foo/", []byte(`{"a":1}`))
+		Expect((<-events).Object).To(MatchJSON(`{"a":1}`))
+	})
+
+	It("should close watches that are too slow", func() {
+		f := newTestFeed(ctx, WatchOpts{BufferSize: 2})
+		slow, err := f.Watch(ctx, store.NewListOpts(), "")
+		Expect(err).ToNot(HaveOccurred())
+
+		for range 3 {
+			f.Publish(store.EventTypeModified, "default/foo/", []byte(`{}`))
+		}
+
+		Expect(slow).To(HaveLen(2))
+		<-slow
+		<-slow
+		Expect(slow).To(BeClosed())
+		Expect(f.watches).To(BeEmpty())
+	})
+
+	It("should close the watch once the context is done", func() {
+		f := newTestFeed(ctx, WatchOpts{})
+		watchCtx, watchCancel := context.WithCancel(ctx)
+		events, err := f.Watch(watchCtx, store.NewListOpts(), "")
+		Expect(err).ToNot(HaveOccurred())
+
+		watchCancel()
+		Eventually(events).Should(BeClosed())
+	})
+
+	It("should close all watches once the store is stopped", func() {
+		f := newTestFeed(ctx, WatchOpts{})
+		events, err := f.Watch(context.Background(), store.NewListOpts(), "")
+		Expect(err).ToNot(HaveOccurred())
+
+		cancel()
+		Eventually(events).Should(BeClosed())
+	})
+})
@@ -13,12 +13,10 @@ import (
 
 type FilterFunc func([]byte) bool
 
+// NewFilterFuncs returns a filter func that matches if all filters match.
+// The filters are compiled into a Plan.
 func NewFilterFuncs(filters []store.Filter) FilterFunc {
-	funcs := make([]FilterFunc, 0, len(filters))
-	for _, filter := range filters {
-		funcs = append(funcs, NewFilterFunc(filter))
-	}
-	return And(funcs...)
+	return Compile(filters).Match
 }
 
 func NewFilterFunc(filter store.Filter) FilterFunc {
@@ -52,24 +50,48 @@ func FullTextFilter(text string) FilterFunc {
 
 func JsonPathFilterValue(path string, eq Equality) FilterFunc {
 	return func(data []byte) bool {
-		res := gjson.GetBytes(data, path)
-		if !res.Exists() {
-			return false
-		}
-		if res.IsArray() && len(res.Array()) == 0 {
+		value, ok := LookupValue(data, path)
+		if !ok {
 			return false
 		}
-		if len(res.Array()) == 1 {
-			res = res.Array()[0]
-		}
 		if eq != nil {
-			return eq.Equal(res.Value())
+			return eq.Equal(value)
 		}
 
 		return true
 	}
 }
 
+// LookupValue returns the value at the given path that a filter compares against.
+// Single-element arrays are unwrapped. It returns false if the path does not exist
+// or resolves to an empty array.
+func LookupValue(data []byte, path string) (any, bool) {
+	res, ok := lookup(data, path)
+	if !ok {
+		return nil, false
+	}
+	return res.Value(), true
+}
+
+func lookup(data []byte, path string) (gjson.Result, bool) {
+	res := gjson.GetBytes(data, path)
+	if !res.Exists() {
+		return res, false
+	}
+	if !res.IsArray() {
+		return res, true
+	}
+	arr := res.Array()
+	switch len(arr) {
+	case 0:
+		return res, false
+	case 1:
+		return arr[0], true
+	default:
+		return res, true
+	}
+}
+
 func Or(filters ...FilterFunc) FilterFunc {
 	return func(data []byte) bool {
 		for _, f := range filters {
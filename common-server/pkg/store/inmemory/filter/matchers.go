@@ -39,16 +39,11 @@ func NewRegex(pattern string) *Regex {
 	}
 }
 func (r *Regex) Equal(value any) bool {
-	switch value := value.(type) {
-	case string:
-		return r.pattern.MatchString(value)
-	default:
-		b, err := sonic.Marshal(value)
-		if err != nil {
-			return false
-		}
-		return r.pattern.Match(b)
+	s, ok := Stringify(value)
+	if !ok {
+		return false
 	}
+	return r.pattern.MatchString(s)
 }
 
 type Simple struct {
@@ -62,18 +57,30 @@ func NewSimple(value string) Equality {
 }
 
 func (s *Simple) Equal(value any) bool {
+	str, ok := Stringify(value)
+	if !ok {
+		return false
+	}
+	return s.value == str
+}
+
+// Stringify returns the string representation of a JSON value that is used
+// when comparing it against a filter value.
+// It is shared by all matchers and the secondary indexes of the store
+// so that both always agree on whether a value matches.
+func Stringify(value any) (string, bool) {
 	switch value := value.(type) {
 	case string:
-		return s.value == value
+		return value, true
 	case int:
-		return s.value == strconv.Itoa(value)
+		return strconv.Itoa(value), true
 	case float64:
-		return s.value == strconv.FormatFloat(value, 'f', -1, 64)
+		return strconv.FormatFloat(value, 'f', -1, 64), true
 	default:
 		b, err := sonic.Marshal(value)
 		if err != nil {
-			return false
+			return "", false
 		}
-		return s.value == string(b)
+		return string(b), true
 	}
 }
@@ -0,0 +1,186 @@
+// Copyright 2025 Deutsche Telekom IT GmbH
+//
+// SPDX-License-Identifier: Apache-2.0
+
+package filter
+
+import (
+	"bytes"
+	"cmp"
+	"regexp"
+	"slices"
+	"sync"
+
+	"github.com/telekom/controlplane/common-server/pkg/store"
+	"github.com/tidwall/gjson"
+)
+
+// maxCachedRegexes bounds the number of compiled patterns that are kept across requests.
+const maxCachedRegexes = 256
+
+var regexCache = struct {
+	sync.RWMutex
+	patterns map[string]*regexp.Regexp
+}{patterns: make(map[string]*regexp.Regexp)}
+
+// CompileRegex compiles the pattern or returns the pattern that was compiled by a previous request.
+func CompileRegex(pattern string) (*regexp.Regexp, error) {
+	regexCache.RLock()
+	re, ok := regexCache.patterns[pattern]
+	regexCache.RUnlock()
+	if ok {
+		return re, nil
+	}
+
+	re, err := regexp.Compile(pattern)
+	if err != nil {
+		return nil, err
+	}
+
+	regexCache.Lock()
+	defer regexCache.Unlock()
+	if len(regexCache.patterns) >= maxCachedRegexes {
+		clear(regexCache.patterns)
+	}
+	regexCache.patterns[pattern] = re
+	return re, nil
+}
+
+// predicate cost classes, cheaper predicates are evaluated first
+const (
+	costExists = iota
+	costCompare
+	costFullText
+	costRegex
+)
+
+type predicate struct {
+	op    store.FilterOp
+	slot  int
+	value string
+	text  []byte
+	regex *regexp.Regexp
+	cost  int
+}
+
+// Plan is a compiled set of filters which are all required to match.
+// Each referenced path is looked up at most once per object and predicates
+// are evaluated cheapest first, so that the lookup of the remaining paths is
+// skipped as soon as a predicate does not match.
+type Plan struct {
+	paths      []string
+	predicates []predicate
+}
+
+// Compile creates a plan for the given filters.
+// Filters with an invalid pattern never match.
+func Compile(filters []store.Filter) *Plan {
+	p := &Plan{
+		predicates: make([]predicate, 0, len(filters)),
+	}
+	for _, f := range filters {
+		pred := predicate{op: f.Op, value: f.Value}
+		switch f.Op {
+		case store.OpEqual, store.OpNotEqual:
+			pred.cost = costCompare
+		case store.OpRegex:
+			pred.cost = costRegex
+			pred.regex, _ = CompileRegex(f.Value)
+		case store.OpFullText:
+			// Full-text searches the whole document and does not need a path
+			pred.cost = costFullText
+			pred.text = []byte(f.Value)
+			p.predicates = append(p.predicates, pred)
+			continue
+		default:
+			pred.cost = costExists
+		}
+
+		pred.slot = slices.Index(p.paths, f.Path)
+		if pred.slot < 0 {
+			pred.slot = len(p.paths)
+			p.paths = append(p.paths, f.Path)
+		}
+		p.predicates = append(p.predicates, pred)
+	}
+	slices.SortStableFunc(p.predicates, func(a, b predicate) int {
+		return cmp.Compare(a.cost, b.cost)
+	})
+	return p
+}
+
+// pathValue is the lazily resolved value of a path of the plan.
+type pathValue struct {
+	resolved bool
+	exists   bool
+	str      string
+	strOk    bool
+}
+
+// Match returns true if the data matches all filters of the plan.
+func (p *Plan) Match(data []byte) bool {
+	var buf [8]pathValue
+	var values []pathValue
+	if len(p.paths) <= len(buf) {
+		values = buf[:len(p.paths)]
+	} else {
+		values = make([]pathValue, len(p.paths))
+	}
+
+	for i := range p.predicates {
+		pred := &p.predicates[i]
+		if pred.op == store.OpFullText {
+			if !bytes.Contains(data, pred.text) {
+				return false
+			}
+			continue
+		}
+
+		v := &values[pred.slot]
+		if !v.resolved {
+			v.resolve(data, p.paths[pred.slot])
+		}
+		if !v.exists {
+			return false
+		}
+
+		switch pred.op {
+		case store.OpEqual:
+			if !v.strOk || v.str != pred.value {
+				return false
+			}
+		case store.OpNotEqual:
+			if v.strOk && v.str == pred.value {
+				return false
+			}
+		case store.OpRegex:
+			if pred.regex == nil || !v.strOk || !pred.regex.MatchString(v.str) {
+				return false
+			}
+		}
+	}
+	return true
+}
+
+func (v *pathValue) resolve(data []byte, path string) {
+	v.resolved = true
+	res, ok := lookup(data, path)
+	if !ok {
+		return
+	}
+	v.exists = true
+	v.str, v.strOk = stringifyResult(res)
+}
+
+// stringifyResult returns the same string as Stringify for the value of the result,
+// without decoding strings and numbers.
+func stringifyResult(res gjson.Result) (string, bool) {
+	switch res.Type {
+	case gjson.String:
+		return res.Str, true
+	case gjson.Number:
+		return Stringify(res.Num)
+	default:
+		return Stringify(res.Value())
+	}
+}
@@ -0,0 +1,108 @@
+// Copyright 2025 Deutsche Telekom IT GmbH
+//
+// SPDX-License-Identifier: Apache-2.0
+
+package filter_test
+
+import (
+	"fmt"
+	"testing"
+
+	. "github.com/onsi/ginkgo/v2"
+	. "github.com/onsi/gomega"
+	"github.com/telekom/controlplane/common-server/pkg/store"
+	"github.com/telekom/controlplane/common-server/pkg/store/inmemory/filter"
+)
+
+var benchmarkDocument = []byte(`{
+	"metadata": {"name": "my-app", "namespace": "team-a", "labels": {"env": "prod", "team": "team-a"}},
+	"spec": {"replicas": 3, "team": "team-a", "zones": ["zone-a"], "description": "The Hello World application"},
+	"status": {"phase": "Ready", "conditions": [{"type": "Ready", "status": "True"}, {"type": "Processing", "status": "False"}]}
+}`)
+
+var benchmarkFilters = []store.Filter{
+	{Path: "metadata.namespace", Op: store.OpEqual, Value: "team-a"},
+	{Path: "spec.replicas", Op: store.OpNotEqual, Value: "0"},
+	{Path: "metadata.name", Op: store.OpRegex, Value: `^my-\w+$`},
+	{Path: "spec.description", Op: store.OpFullText, Value: "Hello"},
+	{Path: "spec.zones", Op: store.OpEqual, Value: "zone-a"},
+}
+
+// legacyFilterFuncs evaluates every filter on its own, like before filters were compiled.
+func legacyFilterFuncs(filters []store.Filter) filter.FilterFunc {
+	funcs := make([]filter.FilterFunc, 0, len(filters))
+	for _, f := range filters {
+		funcs = append(funcs, filter.NewFilterFunc(f))
+	}
+	return filter.And(funcs...)
+}
+
+var _ = Describe("Plan", func() {
+
+	DescribeTable("should match like the individual filters",
+		func(filters []store.Filter) {
+			plan := filter.Compile(filters)
+			Expect(plan.Match(benchmarkDocument)).To(Equal(legacyFilterFuncs(filters)(benchmarkDocument)))
+		},
+		Entry("all filters", benchmarkFilters),
+		Entry("number equality", []store.Filter{{Path: "spec.replicas", Op: store.OpEqual, Value: "3"}}),
+		Entry("unwrapped array", []store.Filter{{Path: "spec.zones", Op: store.OpEqual, Value: "zone-a"}}),
+		Entry("missing path with not equal", []store.Filter{{Path: "spec.unknown", Op: store.OpNotEqual, Value: "foo"}}),
+		Entry("object value", []store.Filter{{Path: "metadata.labels", Op: store.OpNotEqual, Value: "foo"}}),
+		Entry("array values", []store.Filter{{Path: "status.conditions.#.status", Op: store.OpRegex, Value: "True"}}),
+		Entry("not matching regex", []store.Filter{{Path: "metadata.name", Op: store.OpRegex, Value: "^other"}}),
+		Entry("not matching full-text", []store.Filter{{Op: store.OpFullText, Value: "hello"}}),
+		Entry("existence", []store.Filter{{Path: "status.phase"}}),
+	)
+
+	It("should evaluate multiple filters of the same path", func() {
+		plan := filter.Compile([]store.Filter{
+			{Path: "spec.team", Op: store.OpEqual, Value: "team-a"},
+			{Path: "spec.team", Op: store.OpRegex, Value: "^team-"},
+			{Path: "spec.team", Op: store.OpNotEqual, Value: "team-b"},
+		})
+		Expect(plan.Match(benchmarkDocument)).To(BeTrue())
+	})
+
+	It("should never match an invalid pattern", func() {
+		plan := filter.Compile([]store.Filter{{Path: "metadata.name", Op: store.OpRegex, Value: "my**"}})
+		Expect(plan.Match(benchmarkDocument)).To(BeFalse())
+	})
+
+	It("should reuse compiled patterns", func() {
+		first, err := filter.CompileRegex("^team-")
+		Expect(err).ToNot(HaveOccurred())
+		second, err := filter.CompileRegex("^team-")
+		Expect(err).ToNot(HaveOccurred())
+		Expect(second).To(BeIdenticalTo(first))
+	})
+})
+
+func BenchmarkFilters(b *testing.B) {
+	for _, n := range []int{1, 3, 5} {
+		filters := benchmarkFilters[:n]
+
+		b.Run(fmt.Sprintf("filters=%d/individual", n), func(b *testing.B) {
+			filterFunc := legacyFilterFuncs(filters)
+			b.ReportAllocs()
+			for i := 0; i < b.N; i++ {
+				filterFunc(benchmarkDocument)
+			}
+		})
+
+		b.Run(fmt.Sprintf("filters=%d/compiled", n), func(b *testing.B) {
+			plan := filter.Compile(filters)
+			b.ReportAllocs()
+			for i := 0; i < b.N; i++ {
+				plan.Match(benchmarkDocument)
+			}
+		})
+	}
+}
+
+func BenchmarkCompile(b *testing.B) {
+	b.ReportAllocs()
+	for i := 0; i < b.N; i++ {
+		filter.Compile(benchmarkFilters)
+	}
+}
@@ -0,0 +1,208 @@
+// Copyright 2025 Deutsche Telekom IT GmbH
+//
+// SPDX-License-Identifier: Apache-2.0
+
+package inmemory
+
+import (
+	"regexp"
+	"slices"
+	"sort"
+	"strings"
+	"sync"
+
+	"github.com/telekom/controlplane/common-server/pkg/store"
+	"github.com/telekom/controlplane/common-server/pkg/store/inmemory/filter"
+)
+
+// secondaryIndex maps the values found at a JSON path to the keys of the
+// objects that contain them. It is used to answer `==` and prefix-anchored `=~`
+// filters without scanning the whole database.
+// The index only narrows down the candidates, all filters are still evaluated
+// on the stored objects.
+type secondaryIndex struct {
+	path string
+
+	mutex       sync.RWMutex
+	keysByValue map[string]map[string]struct{}
+	valueByKey  map[string]string
+	// values contains all distinct values in sorted order
+	// and is used to resolve prefix lookups.
+	values []string
+}
+
+func newSecondaryIndex(path string) *secondaryIndex {
+	return &secondaryIndex{
+		path:        path,
+		keysByValue: make(map[string]map[string]struct{}),
+		valueByKey:  make(map[string]string),
+	}
+}
+
+func newSecondaryIndexes(paths []string) map[string]*secondaryIndex {
+	indexes := make(map[string]*secondaryIndex, len(paths))
+	for _, path := range paths {
+		indexes[path] = newSecondaryIndex(path)
+	}
+	return indexes
+}
+
+// Set updates the index entry of the given key using the object data.
+func (idx *secondaryIndex) Set(key string, data []byte) {
+	value, ok := indexValue(data, idx.path)
+
+	idx.mutex.Lock()
+	defer idx.mutex.Unlock()
+
+	if current, exists := idx.valueByKey[key]; exists {
+		if ok && current == value {
+			return
+		}
+		idx.remove(key, current)
+	}
+	if !ok {
+		return
+	}
+
+	keys, exists := idx.keysByValue[value]
+	if !exists {
+		keys = make(map[string]struct{})
+		idx.keysByValue[value] = keys
+		pos, _ := slices.BinarySearch(idx.values, value)
+		idx.values = slices.Insert(idx.values, pos, value)
+	}
+	keys[key] = struct{}{}
+	idx.valueByKey[key] = value
+}
+
+// Delete removes the given key from the index.
+func (idx *secondaryIndex) Delete(key string) {
+	idx.mutex.Lock()
+	defer idx.mutex.Unlock()
+
+	if current, exists := idx.valueByKey[key]; exists {
+		idx.remove(key, current)
+	}
+}
+
+func (idx *secondaryIndex) remove(key, value string) {
+	delete(idx.valueByKey, key)
+	keys := idx.keysByValue[value]
+	delete(keys, key)
+	if len(keys) > 0 {
+		return
+	}
+	delete(idx.keysByValue, value)
+	if pos, found := slices.BinarySearch(idx.values, value); found {
+		idx.values = slices.Delete(idx.values, pos, pos+1)
+	}
+}
+
+// Equal returns all keys whose value is equal to the given value.
+func (idx *secondaryIndex) Equal(value string) map[string]struct{} {
+	idx.mutex.RLock()
+	defer idx.mutex.RUnlock()
+
+	result := make(map[string]struct{}, len(idx.keysByValue[value]))
+	for key := range idx.keysByValue[value] {
+		result[key] = struct{}{}
+	}
+	return result
+}
+
+// Match returns all keys whose value starts with the given literal prefix
+// and matches the pattern.
+func (idx *secondaryIndex) Match(prefix string, pattern *regexp.Regexp) map[string]struct{} {
+	idx.mutex.RLock()
+	defer idx.mutex.RUnlock()
+
+	result := make(map[string]struct{})
+	start := sort.SearchStrings(idx.values, prefix)
+	for _, value := range idx.values[start:] {
+		if !strings.HasPrefix(value, prefix) {
+			break
+		}
+		if !pattern.MatchString(value) {
+			continue
+		}
+		for key := range idx.keysByValue[value] {
+			result[key] = struct{}{}
+		}
+	}
+	return result
+}
+
+// indexValue returns the value that is stored in the index for the given path.
+// It uses the same lookup and string conversion as the filters.
+func indexValue(data []byte, path string) (string, bool) {
+	value, ok := filter.LookupValue(data, path)
+	if !ok {
+		return "", false
+	}
+	return filter.Stringify(value)
+}
+
+// anchoredPrefix returns the literal prefix of a pattern that is anchored at
+// the start of the value. It returns false if the pattern is not anchored
+// or has no literal prefix.
+func anchoredPrefix(pattern string) (string, bool) {
+	if !strings.HasPrefix(pattern, "^") {
+		return "", false
+	}
+	re, err := regexp.Compile(pattern[1:])
+	if err != nil {
+		return "", false
+	}
+	prefix, _ := re.LiteralPrefix()
+	// Alternations like `^a|b` are only anchored in their first branch
+	if prefix == "" || strings.Contains(pattern, "|") {
+		return "", false
+	}
+	return prefix, true
+}
+
+// lookupCandidates uses the secondary indexes to determine the set of keys
+// that may match the given filters.
+// It returns false if none of the filters can be answered by an index.
+func lookupCandidates(indexes map[string]*secondaryIndex, filters []store.Filter) (map[string]struct{}, bool) {
+	var candidates map[string]struct{}
+	indexed := false
+
+	for _, f := range filters {
+		idx, ok := indexes[f.Path]
+		if !ok {
+			continue
+		}
+
+		var keys map[string]struct{}
+		switch f.Op {
+		case store.OpEqual:
+			keys = idx.Equal(f.Value)
+		case store.OpRegex:
+			prefix, ok := anchoredPrefix(f.Value)
+			if !ok {
+				continue
+			}
+			pattern, err := filter.CompileRegex(f.Value)
+			if err != nil {
+				continue
+			}
+			keys = idx.Match(prefix, pattern)
+		default:
+			continue
+		}
+
+		if !indexed {
+			candidates = keys
+			indexed = true
+			continue
+		}
+		for key := range candidates {
+			if _, ok := keys[key]; !ok {
+				delete(candidates, key)
+			}
+		}
+	}
+
+	return candidates, indexed
+}
@@ -0,0 +1,207 @@
+// Copyright 2025 Deutsche Telekom IT GmbH
+//
+// SPDX-License-Identifier: Apache-2.0
+
+package inmemory
+
+import (
+	"context"
+	"fmt"
+	"testing"
+
+	"github.com/go-logr/logr"
+	. "github.com/onsi/ginkgo/v2"
+	. "github.com/onsi/gomega"
+	"github.com/telekom/controlplane/common-server/pkg/store"
+	"k8s.io/apimachinery/pkg/apis/meta/v1/unstructured"
+)
+
+func newIndexedTestStore(paths ...string) *InmemoryObjectStore[*unstructured.Unstructured] {
+	return &InmemoryObjectStore[*unstructured.Unstructured]{
+		ctx:     context.Background(),
+		db:      newDbOrDie(StoreOpts{}, logr.Discard()),
+		log:     logr.Discard(),
+		indexes: newSecondaryIndexes(paths),
+	}
+}
+
+func newTeamUnstructured(name, team string) *unstructured.Unstructured {
+	u := NewUnstructured(name)
+	_ = unstructured.SetNestedField(u.Object, team, "spec", "team")
+	return u
+}
+
+var _ = Describe("Secondary Index", func() {
+
+	ctx := context.Background()
+
+	Context("Index maintenance", func() {
+
+		It("should track value changes and deletions", func() {
+			idx := newSecondaryIndex("spec.team")
+
+			idx.Set("default/a/", []byte(`{"spec":{"team":"foo"}}`))
+			idx.Set("default/b/", []byte(`{"spec":{"team":"foo"}}`))
+			Expect(idx.Equal("foo")).To(HaveLen(2))
+
+			idx.Set("default/a/", []byte(`{"spec":{"team":"bar"}}`))
+			Expect(idx.Equal("foo")).To(HaveKey("default/b/"))
+			Expect(idx.Equal("foo")).To(HaveLen(1))
+			Expect(idx.Equal("bar")).To(HaveKey("default/a/"))
+
+			idx.Delete("default/b/")
+			Expect(idx.Equal("foo")).To(BeEmpty())
+			Expect(idx.values).To(Equal([]string{"bar"}))
+
+			idx.Set("default/a/", []byte(`{"spec":{}}`))
+			Expect(idx.Equal("bar")).To(BeEmpty())
+			Expect(idx.values).To(BeEmpty())
+		})
+
+		It("should use the same value representation as the filters", func() {
+			idx := newSecondaryIndex("spec.replicas")
+			idx.Set("default/a/", []byte(`{"spec":{"replicas":3}}`))
+			Expect(idx.Equal("3")).To(HaveLen(1))
+		})
+
+		It("should only use anchored patterns with a literal prefix", func() {
+			prefix, ok := anchoredPrefix("^app1[0-9]$")
+			Expect(ok).To(BeTrue())
+			Expect(prefix).To(Equal("app1"))
+
+			_, ok = anchoredPrefix("app1")
+			Expect(ok).To(BeFalse())
+
+			_, ok = anchoredPrefix("^[a-z]+")
+			Expect(ok).To(BeFalse())
+
+			_, ok = anchoredPrefix("^app|foo")
+			Expect(ok).To(BeFalse())
+		})
+	})
+
+	Context("List using the index", Ordered, func() {
+
+		objStore := newIndexedTestStore("spec.team", "metadata.labels.app")
+
+		BeforeAll(func() {
+			for i, u := range GenerateUnstructured(500) {
+				Expect(unstructured.SetNestedField(u.Object, fmt.Sprintf("team%d", i%5), "spec", "team")).To(Succeed())
+				Expect(objStore.OnUpdate(ctx, u)).To(Succeed())
+			}
+		})
+
+		It("should filter by equality", func() {
+			listOpts := store.NewListOpts()
+			listOpts.Filters = []store.Filter{
+				{Path: "spec.team", Op: store.OpEqual, Value: "team1"},
+			}
+
+			list, err := objStore.List(ctx, listOpts)
+			Expect(err).ToNot(HaveOccurred())
+			Expect(list.Items).To(HaveLen(100))
+			Expect(list.Links.Next).To(BeEmpty())
+			for _, item := range list.Items {
+				Expect(item.Object["spec"].(map[string]any)["team"]).To(Equal("team1"))
+			}
+		})
+
+		It("should filter by anchored regex", func() {
+			listOpts := store.NewListOpts()
+			listOpts.Filters = []store.Filter{
+				{Path: "metadata.labels.app", Op: store.OpRegex, Value: "^app1[0-9]{1}$"},
+			}
+
+			list, err := objStore.List(ctx, listOpts)
+			Expect(err).ToNot(HaveOccurred())
+			Expect(list.Items).To(HaveLen(10))
+		})
+
+		It("should combine indexed and unindexed filters", func() {
+			listOpts := store.NewListOpts()
+			listOpts.Prefix = "default/foo1"
+			listOpts.Filters = []store.Filter{
+				{Path: "spec.team", Op: store.OpEqual, Value: "team0"},
+				{Path: "metadata.name", Op: store.OpNotEqual, Value: "foo10"},
+			}
+
+			list, err := objStore.List(ctx, listOpts)
+			Expect(err).ToNot(HaveOccurred())
+			// foo1, foo10-foo19 and foo100-foo199 are team0 every 5th item, except foo10
+			Expect(list.Items).To(HaveLen(21))
+		})
+
+		It("should return the same pages as the scan", func() {
+			unindexed := newIndexedTestStore()
+			for i := range 500 {
+				u := newTeamUnstructured(fmt.Sprintf("foo%d", i), fmt.Sprintf("team%d", i%10))
+				Expect(unindexed.OnUpdate(ctx, u)).To(Succeed())
+				Expect(objStore.OnUpdate(ctx, u)).To(Succeed())
+			}
+
+			listOpts := store.NewListOpts()
+			listOpts.Limit = 10
+			listOpts.Filters = []store.Filter{
+				{Path: "spec.team", Op: store.OpEqual, Value: "team7"},
+			}
+
+			for range 5 {
+				indexedList, err := objStore.List(ctx, listOpts)
+				Expect(err).ToNot(HaveOccurred())
+				scannedList, err := unindexed.List(ctx, listOpts)
+				Expect(err).ToNot(HaveOccurred())
+
+				Expect(indexedList.Items).To(HaveLen(10))
+				for i := range indexedList.Items {
+					Expect(indexedList.Items[i].GetName()).To(Equal(scannedList.Items[i].GetName()))
+				}
+				listOpts.Cursor = indexedList.Links.Next
+			}
+		})
+
+		It("should not return deleted objects", func() {
+			Expect(objStore.OnDelete(ctx, NewUnstructured("foo7"))).To(Succeed())
+
+			listOpts := store.NewListOpts()
+			listOpts.Filters = []store.Filter{
+				{Path: "metadata.name", Op: store.OpEqual, Value: "foo7"},
+				{Path: "spec.team", Op: store.OpEqual, Value: "team7"},
+			}
+
+			list, err := objStore.List(ctx, listOpts)
+			Expect(err).ToNot(HaveOccurred())
+			Expect(list.Items).To(BeEmpty())
+		})
+	})
+})
+
+func BenchmarkIndexedList(b *testing.B) {
+	ctx := context.Background()
+
+	for _, size := range []int{1_000, 10_000, 100_000} {
+		for _, indexed := range []bool{false, true} {
+			var paths []string
+			if indexed {
+				paths = []string{"spec.team"}
+			}
+			s := newIndexedTestStore(paths...)
+			for i := range size {
+				_ = s.OnUpdate(ctx, newTeamUnstructured(fmt.Sprintf("item-%d", i), fmt.Sprintf("team-%d", i%100)))
+			}
+
+			listOpts := store.NewListOpts()
+			listOpts.Filters = []store.Filter{
+				{Path: "spec.team", Op: store.OpEqual, Value: "team-42"},
+			}
+
+			b.Run(fmt.Sprintf("size=%d/indexed=%t", size, indexed), func(b *testing.B) {
+				b.ReportAllocs()
+				for i := 0; i < b.N; i++ {
+					_, _ = s.List(ctx, listOpts)
+				}
+			})
+
+			_ = s.db.Close()
+		}
+	}
+}
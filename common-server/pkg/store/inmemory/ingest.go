@@ -0,0 +1,219 @@
+// Copyright 2025 Deutsche Telekom IT GmbH
+//
+// SPDX-License-Identifier: Apache-2.0
+
+package inmemory
+
+import (
+	"context"
+	"sync"
+	"time"
+
+	"github.com/go-logr/logr"
+	"github.com/pkg/errors"
+)
+
+const defaultBatchSize = 1000
+
+// pendingWrite is a buffered informer event for a single key.
+type pendingWrite struct {
+	data            []byte
+	resourceVersion string
+	deleted         bool
+	queuedAt        time.Time
+}
+
+type flushFunc func(batch map[string]pendingWrite) error
+
+// ingester buffers informer events and writes them in batches.
+// Repeated events for the same key within a window are coalesced,
+// so only the latest state of each object is written.
+type ingester struct {
+	name      string
+	log       logr.Logger
+	window    time.Duration
+	batchSize int
+	flush     flushFunc
+
+	mutex   sync.Mutex
+	pending map[string]pendingWrite
+	trigger chan struct{}
+
+	// flushMutex serializes flushes and direct writes, so that a direct write
+	// is never overwritten by an older buffered event of the same key.
+	flushMutex sync.Mutex
+}
+
+func newIngester(name string, log logr.Logger, opts DatabaseOpts, flush flushFunc) *ingester {
+	if opts.BatchWindow <= 0 {
+		return nil
+	}
+	batchSize := opts.BatchSize
+	if batchSize <= 0 {
+		batchSize = defaultBatchSize
+	}
+	return &ingester{
+		name:      name,
+		log:       log.WithName("ingester"),
+		window:    opts.BatchWindow,
+		batchSize: batchSize,
+		flush:     flush,
+		pending:   make(map[string]pendingWrite, batchSize),
+		trigger:   make(chan struct{}, 1),
+	}
+}
+
+// Add buffers the write for the given key and replaces any pending write of the same key.
+func (i *ingester) Add(key string, w pendingWrite) {
+	i.mutex.Lock()
+	if existing, ok := i.pending[key]; ok {
+		w.queuedAt = existing.queuedAt
+		ingestCoalesced.WithLabelValues(i.name).Inc()
+	}
+	i.pending[key] = w
+	size := len(i.pending)
+	i.mutex.Unlock()
+
+	if size >= i.batchSize {
+		select {
+		case i.trigger <- struct{}{}:
+		default:
+		}
+	}
+}
+
+// Exclusive discards any pending write for the given key and runs fn
+// while no batch is being flushed.
+func (i *ingester) Exclusive(key string, fn func() error) error {
+	if i == nil {
+		return fn()
+	}
+	i.flushMutex.Lock()
+	defer i.flushMutex.Unlock()
+
+	i.mutex.Lock()
+	delete(i.pending, key)
+	i.mutex.Unlock()
+
+	return fn()
+}
+
+// Flush writes all pending events. If the batch cannot be written, its events are
+// queued again, unless a newer event of the same object was queued in the meantime,
+// and are retried by the next flush.
+func (i *ingester) Flush() error {
+	if i == nil {
+		return nil
+	}
+	i.flushMutex.Lock()
+	defer i.flushMutex.Unlock()
+
+	i.mutex.Lock()
+	batch := i.pending
+	if len(batch) == 0 {
+		i.mutex.Unlock()
+		return nil
+	}
+	i.pending = make(map[string]pendingWrite, i.batchSize)
+	i.mutex.Unlock()
+
+	start := time.Now()
+	if err := i.flush(batch); err != nil {
+		ingestErrors.WithLabelValues(i.name).Inc()
+		// the flush mutex is still held, so exclusive writes cannot be overwritten by the retry
+		i.mutex.Lock()
+		for key, w := range batch {
+			if _, ok := i.pending[key]; !ok {
+				i.pending[key] = w
+			}
+		}
+		i.mutex.Unlock()
+		return errors.Wrapf(err, "failed to write batch of %d events", len(batch))
+	}
+	i.log.V(1).Info("wrote batch", "size", len(batch), "duration", time.Since(start).String())
+
+	ingestBatchSize.WithLabelValues(i.name).Observe(float64(len(batch)))
+	now := time.Now()
+	for _, w := range batch {
+		ingestLag.WithLabelValues(i.name).Observe(now.Sub(w.queuedAt).Seconds())
+	}
+	return nil
+}
+
+// Run flushes the pending events whenever the window elapses or the batch is full.
+// Remaining events are flushed when the context is done.
+func (i *ingester) Run(ctx context.Context) {
+	ticker := time.NewTicker(i.window)
+	defer ticker.Stop()
+	for {
+		select {
+		case <-ticker.C:
+		case <-i.trigger:
+		case <-ctx.Done():
+			if err := i.Flush(); err != nil {
+				i.log.Error(err, "failed to flush pending events")
+			}
+			return
+		}
+		if err := i.Flush(); err != nil {
+			i.log.Error(err, "failed to flush pending events")
+		}
+	}
+}
+
+// versionTracker remembers the resourceVersion of every stored object.
+// It is used to skip writing events of objects that did not change,
+// like the events of a relist.
+type versionTracker struct {
+	mutex    sync.RWMutex
+	versions map[string]string
+}
+
+func newVersionTracker() *versionTracker {
+	return &versionTracker{
+		versions: make(map[string]string),
+	}
+}
+
+// Unchanged returns true if the object with the given key is already stored with this resourceVersion.
+func (v *versionTracker) Unchanged(key, resourceVersion string) bool {
+	if v == nil || resourceVersion == "" {
+		return false
+	}
+	v.mutex.RLock()
+	defer v.mutex.RUnlock()
+	return v.versions[key] == resourceVersion
+}
+
+// Get returns the resourceVersion of the object with the given key.
+func (v *versionTracker) Get(key string) (string, bool) {
+	if v == nil {
+		return "", false
+	}
+	v.mutex.RLock()
+	defer v.mutex.RUnlock()
+	resourceVersion, ok := v.versions[key]
+	return resourceVersion, ok
+}
+
+func (v *versionTracker) Set(key, resourceVersion string) {
+	if v == nil {
+		return
+	}
+	v.mutex.Lock()
+	defer v.mutex.Unlock()
+	if resourceVersion == "" {
+		delete(v.versions, key)
+		return
+	}
+	v.versions[key] = resourceVersion
+}
+
+func (v *versionTracker) Delete(key string) {
+	if v == nil {
+		return
+	}
+	v.mutex.Lock()
+	defer v.mutex.Unlock()
+	delete(v.versions, key)
+}
@@ -0,0 +1,213 @@
+// Copyright 2025 Deutsche Telekom IT GmbH
+//
+// SPDX-License-Identifier: Apache-2.0
+
+package inmemory
+
+import (
+	"context"
+	"errors"
+	"fmt"
+	"testing"
+	"time"
+
+	"github.com/go-logr/logr"
+	. "github.com/onsi/ginkgo/v2"
+	. "github.com/onsi/gomega"
+	"github.com/telekom/controlplane/common-server/pkg/problems"
+	"github.com/telekom/controlplane/common-server/pkg/store"
+	"k8s.io/apimachinery/pkg/apis/meta/v1/unstructured"
+)
+
+func newBatchedTestStore(window time.Duration) *InmemoryObjectStore[*unstructured.Unstructured] {
+	s := &InmemoryObjectStore[*unstructured.Unstructured]{
+		ctx:      context.Background(),
+		db:       newDbOrDie(StoreOpts{}, logr.Discard()),
+		log:      logr.Discard(),
+		versions: newVersionTracker(),
+		indexes:  newSecondaryIndexes([]string{"spec.team"}),
+	}
+	s.ingester = newIngester("test", logr.Discard(), DatabaseOpts{BatchWindow: window}, s.writeBatch)
+	return s
+}
+
+var _ = Describe("Ingestion", func() {
+
+	ctx := context.Background()
+
+	Context("Ingester", func() {
+
+		It("should be disabled without a window", func() {
+			Expect(newIngester("test", logr.Discard(), DatabaseOpts{}, nil)).To(BeNil())
+		})
+
+		It("should coalesce writes of the same key", func() {
+			var batches []map[string]pendingWrite
+			i := newIngester("test", logr.Discard(), DatabaseOpts{BatchWindow: time.Hour}, func(batch map[string]pendingWrite) error {
+				batches = append(batches, batch)
+				return nil
+			})
+
+			i.Add("default/a/", pendingWrite{data: []byte("1"), queuedAt: time.Now()})
+			i.Add("default/a/", pendingWrite{data: []byte("2"), queuedAt: time.Now()})
+			i.Add("default/b/", pendingWrite{deleted: true, queuedAt: time.Now()})
+			Expect(i.Flush()).To(Succeed())
+			Expect(i.Flush()).To(Succeed())
+
+			Expect(batches).To(HaveLen(1))
+			Expect(batches[0]).To(HaveLen(2))
+			Expect(batches[0]["default/a/"].data).To(Equal([]byte("2")))
+			Expect(batches[0]["default/b/"].deleted).To(BeTrue())
+		})
+
+		It("should discard pending writes before an exclusive write", func() {
+			var batches []map[string]pendingWrite
+			i := newIngester("test", logr.Discard(), DatabaseOpts{BatchWindow: time.Hour}, func(batch map[string]pendingWrite) error {
+				batches = append(batches, batch)
+				return nil
+			})
+
+			i.Add("default/a/", pendingWrite{data: []byte("1"), queuedAt: time.Now()})
+			Expect(i.Exclusive("default/a/", func() error { return nil })).To(Succeed())
+			Expect(i.Flush()).To(Succeed())
+
+			Expect(batches).To(BeEmpty())
+		})
+
+		It("should retry a batch that could not be written", func() {
+			var (
+				i       *ingester
+				batches []map[string]pendingWrite
+				fail    = true
+			)
+			i = newIngester("test", logr.Discard(), DatabaseOpts{BatchWindow: time.Hour}, func(batch map[string]pendingWrite) error {
+				if fail {
+					// a newer event arrives while the batch is written
+					i.Add("default/a/", pendingWrite{data: []byte("2"), queuedAt: time.Now()})
+					return errors.New("disk full")
+				}
+				batches = append(batches, batch)
+				return nil
+			})
+
+			i.Add("default/a/", pendingWrite{data: []byte("1"), queuedAt: time.Now()})
+			i.Add("default/b/", pendingWrite{data: []byte("1"), queuedAt: time.Now()})
+			Expect(i.Flush()).ToNot(Succeed())
+			Expect(i.pending).To(HaveLen(2))
+
+			fail = false
+			Expect(i.Flush()).To(Succeed())
+
+			Expect(batches).To(HaveLen(1))
+			Expect(batches[0]).To(HaveLen(2))
+			Expect(batches[0]["default/a/"].data).To(Equal([]byte("2")))
+			Expect(batches[0]["default/b/"].data).To(Equal([]byte("1")))
+			Expect(i.pending).To(BeEmpty())
+		})
+
+		It("should flush when the batch is full", func() {
+			flushed := make(chan int, 1)
+			i := newIngester("test", logr.Discard(), DatabaseOpts{BatchWindow: time.Hour, BatchSize: 10}, func(batch map[string]pendingWrite) error {
+				flushed <- len(batch)
+				return nil
+			})
+			runCtx, cancel := context.WithCancel(ctx)
+			defer cancel()
+			go i.Run(runCtx)
+
+			for n := range 10 {
+				i.Add(fmt.Sprintf("default/%d/", n), pendingWrite{queuedAt: time.Now()})
+			}
+			Eventually(flushed).Should(Receive(Equal(10)))
+		})
+	})
+
+	Context("Store", func() {
+
+		It("should write buffered events on flush", func() {
+			objStore := newBatchedTestStore(time.Hour)
+			u := newTeamUnstructured("foo", "team1")
+			Expect(objStore.OnUpdate(ctx, u)).To(Succeed())
+
+			_, err := objStore.Get(ctx, "default", "foo")
+			Expect(problems.IsNotFound(err)).To(BeTrue())
+
+			Expect(objStore.ingester.Flush()).To(Succeed())
+
+			obj, err := objStore.Get(ctx, "default", "foo")
+			Expect(err).ToNot(HaveOccurred())
+			Expect(obj.GetName()).To(Equal("foo"))
+
+			listOpts := store.NewListOpts()
+			listOpts.Filters = []store.Filter{{Path: "spec.team", Op: store.OpEqual, Value: "team1"}}
+			list, err := objStore.List(ctx, listOpts)
+			Expect(err).ToNot(HaveOccurred())
+			Expect(list.Items).To(HaveLen(1))
+
+			Expect(objStore.OnDelete(ctx, u)).To(Succeed())
+			Expect(objStore.ingester.Flush()).To(Succeed())
+			_, err = objStore.Get(ctx, "default", "foo")
+			Expect(problems.IsNotFound(err)).To(BeTrue())
+			list, err = objStore.List(ctx, listOpts)
+			Expect(err).ToNot(HaveOccurred())
+			Expect(list.Items).To(BeEmpty())
+		})
+
+		It("should skip created objects with an unchanged resourceVersion", func() {
+			objStore := newBatchedTestStore(time.Hour)
+			u := newTeamUnstructured("foo", "team1")
+			Expect(objStore.OnCreate(ctx, u)).To(Succeed())
+			Expect(objStore.ingester.Flush()).To(Succeed())
+
+			u = newTeamUnstructured("foo", "team2")
+			Expect(objStore.OnCreate(ctx, u)).To(Succeed())
+			Expect(objStore.ingester.pending).To(BeEmpty())
+
+			u.SetResourceVersion("476170915")
+			Expect(objStore.OnCreate(ctx, u)).To(Succeed())
+			Expect(objStore.ingester.pending).To(HaveLen(1))
+		})
+
+		It("should skip resynced objects only once they are stored", func() {
+			objStore := newBatchedTestStore(time.Hour)
+			u := newTeamUnstructured("foo", "team1")
+			Expect(objStore.OnUpdate(ctx, u)).To(Succeed())
+			// not flushed yet, the resync queues the object again
+			Expect(objStore.OnUpdate(ctx, u)).To(Succeed())
+			Expect(objStore.ingester.pending).To(HaveLen(1))
+
+			Expect(objStore.ingester.Flush()).To(Succeed())
+			Expect(objStore.OnUpdate(ctx, u)).To(Succeed())
+			Expect(objStore.ingester.pending).To(BeEmpty())
+		})
+
+		It("should write direct writes immediately", func() {
+			objStore := newBatchedTestStore(time.Hour)
+			Expect(objStore.OnUpdate(ctx, newTeamUnstructured("foo", "team1"))).To(Succeed())
+			Expect(objStore.write(newTeamUnstructured("foo", "team2"))).To(Succeed())
+			Expect(objStore.ingester.Flush()).To(Succeed())
+
+			obj, err := objStore.Get(ctx, "default", "foo")
+			Expect(err).ToNot(HaveOccurred())
+			Expect(obj.Object["spec"].(map[string]any)["team"]).To(Equal("team2"))
+		})
+	})
+})
+
+func BenchmarkIngestion(b *testing.B) {
+	ctx := context.Background()
+
+	for _, window := range []time.Duration{0, 100 * time.Millisecond} {
+		b.Run(fmt.Sprintf("window=%s", window), func(b *testing.B) {
+			s := newBatchedTestStore(window)
+			b.ReportAllocs()
+			for i := 0; i < b.N; i++ {
+				_ = s.OnUpdate(ctx, newTeamUnstructured(fmt.Sprintf("item-%d", i), "team"))
+				if s.ingester != nil && i%defaultBatchSize == 0 {
+					_ = s.ingester.Flush()
+				}
+			}
+			_ = s.ingester.Flush()
+		})
+	}
+}
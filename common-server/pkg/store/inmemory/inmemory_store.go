@@ -8,20 +8,23 @@ import (
 	"context"
 	"fmt"
 	"path/filepath"
+	"slices"
 	"strings"
 	"sync"
+	"sync/atomic"
+	"time"
 
 	"github.com/bytedance/sonic"
 	"github.com/dgraph-io/badger/v4"
 	"github.com/dgraph-io/badger/v4/options"
 	"github.com/go-logr/logr"
 	"github.com/pkg/errors"
+	"github.com/prometheus/client_golang/prometheus"
 	"github.com/telekom/controlplane/common-server/internal/informer"
 	"github.com/telekom/controlplane/common-server/pkg/problems"
 	"github.com/telekom/controlplane/common-server/pkg/store"
 	"github.com/telekom/controlplane/common-server/pkg/store/inmemory/filter"
 	"github.com/telekom/controlplane/common-server/pkg/store/inmemory/patch"
-	"github.com/tidwall/gjson"
 	metav1 "k8s.io/apimachinery/pkg/apis/meta/v1"
 	"k8s.io/apimachinery/pkg/apis/meta/v1/unstructured"
 	"k8s.io/apimachinery/pkg/runtime"
@@ -33,29 +36,81 @@ import (
 
 var _ store.ObjectStore[store.Object] = &InmemoryObjectStore[store.Object]{}
 var _ informer.EventHandler = &InmemoryObjectStore[store.Object]{}
+var _ informer.ListHandler = &InmemoryObjectStore[store.Object]{}
+var _ informer.Transformer = &InmemoryObjectStore[store.Object]{}
+var _ store.RawObjectStore = &InmemoryObjectStore[store.Object]{}
+var _ store.VersionedObjectStore = &InmemoryObjectStore[store.Object]{}
+var _ store.WatchableObjectStore = &InmemoryObjectStore[store.Object]{}
 
 type StoreOpts struct {
 	Client       dynamic.Interface
 	GVR          schema.GroupVersionResource
 	GVK          schema.GroupVersionKind
 	AllowedSorts []string
+	// IndexedPaths are JSON paths for which secondary indexes are maintained.
+	// Filters using `==` or prefix-anchored `=~` on these paths are answered
+	// using the index instead of scanning all objects.
+	IndexedPaths []string
+	// Projection removes fields that are not needed by the store before objects
+	// are cached by the informer and written to the database.
+	Projection ProjectionOpts
 
 	Database DatabaseOpts
 	Informer InformerOpts
+	Watch    WatchOpts
 
 	// DisableRetryOnConflict disables retrying on conflict errors during updates.
 	// By default, retries are enabled.
 	DisableRetryOnConflict bool
 }
 
+// ProjectionOpts configures the fields that are kept of each object.
+// Paths are dot-separated fields, e.g. `status.conditions`. Fields that are removed
+// cannot be served, filtered or sorted by the store.
+type ProjectionOpts struct {
+	// Include are the paths to keep. If empty, all fields are kept.
+	// apiVersion, kind and metadata are always kept.
+	Include []string
+	// Exclude are the paths to remove.
+	Exclude []string
+}
+
 type InformerOpts struct {
+	// DisableCache uses an informer that does not keep a copy of all objects in memory.
+	// Events of the same object are handled in order and watches are resumed from the
+	// last resourceVersion, also across restarts if the database is stored on disk.
 	DisableCache bool
 }
 
+// WatchOpts configures the change feed of the store.
+type WatchOpts struct {
+	// HistorySize is the number of changes that are kept to let watches resume
+	// from an earlier revision. Defaults to 1000.
+	HistorySize int
+	// BufferSize is the number of changes that are buffered per watch.
+	// A watch that falls further behind is closed. Defaults to 100.
+	BufferSize int
+}
+
 type DatabaseOpts struct {
 	// Filepath will store the badger database on disk at the given filepath.
 	Filepath     string
 	ReduceMemory bool
+	// DecodeCacheSize is the maximum number of decoded objects that are kept
+	// to avoid decoding unchanged objects on every Get and List.
+	// If zero, the cache is disabled.
+	DecodeCacheSize int
+	// BatchWindow enables batched ingestion of informer events. Events are buffered
+	// for up to this duration and written using a single write batch. Repeated events
+	// of the same object within the window are coalesced.
+	// If zero, every event is written in its own transaction.
+	BatchWindow time.Duration
+	// BatchSize is the maximum number of objects per batch. Defaults to 1000.
+	BatchSize int
+	// StaleReady reports the store as ready right after startup if the database
+	// on disk contains objects of a previous run, while the informer is still catching up.
+	// Requires Filepath.
+	StaleReady bool
 }
 
 type InmemoryObjectStore[T store.Object] struct {
@@ -67,8 +122,30 @@ type InmemoryObjectStore[T store.Object] struct {
 	informer        informer.Informer
 	db              *badger.DB
 	allowedSorts    []string
-	sortValueCache  sync.Map
+	sortIndexes     map[string]*sortIndex
+	indexes         map[string]*secondaryIndex
+	decodeCache     *decodeCache[T]
+	ingester        *ingester
+	versions        *versionTracker
+	revisions       *revisionTracker
+	feed            *changeFeed
+	projection      *projection
+	synced          atomic.Bool
 	retryOnConflict bool
+
+	// checkpointFile stores the resourceVersion up to which all events are stored
+	// in the database on disk. It is empty if the database is in-memory only.
+	checkpointFile string
+	// checkpointed is the last written resourceVersion
+	checkpointed string
+	// writeFailed is set if an event could not be written. No checkpoint is written
+	// until all objects were listed again, so that a restart replays the event.
+	writeFailed atomic.Bool
+	staleReady  bool
+	// restored are the keys restored from disk that were not written since.
+	// Only these objects can have been deleted while no watch was active.
+	restored      map[string]struct{}
+	restoredMutex sync.Mutex
 }
 
 func newBadgerOptsReduceMemoryUsage(filepath string) badger.Options {
@@ -107,17 +184,22 @@ func newBadgerOptsDefault(filepath string) badger.Options {
 	return opts
 }
 
-func newDbOrDie(storeOpts StoreOpts, log logr.Logger) *badger.DB {
-	useFilesystem := storeOpts.Database.Filepath != ""
-	path := ""
-	if useFilesystem {
-		dbName := fmt.Sprintf("db-%s-%s-%s",
-			strings.ToLower(storeOpts.GVR.Group),
-			strings.ToLower(storeOpts.GVR.Version),
-			strings.ToLower(storeOpts.GVR.Resource),
-		)
-		path = filepath.Join(storeOpts.Database.Filepath, dbName)
+// databasePath returns the path of the badger database or an empty string if it is in-memory only.
+func databasePath(storeOpts StoreOpts) string {
+	if storeOpts.Database.Filepath == "" {
+		return ""
 	}
+	dbName := fmt.Sprintf("db-%s-%s-%s",
+		strings.ToLower(storeOpts.GVR.Group),
+		strings.ToLower(storeOpts.GVR.Version),
+		strings.ToLower(storeOpts.GVR.Resource),
+	)
+	return filepath.Join(storeOpts.Database.Filepath, dbName)
+}
+
+func newDbOrDie(storeOpts StoreOpts, log logr.Logger) *badger.DB {
+	path := databasePath(storeOpts)
+	useFilesystem := path != ""
 
 	log.Info("initializing badger DB",
 		"inMemory", !useFilesystem,
@@ -143,6 +225,7 @@ func newDbOrDie(storeOpts StoreOpts, log logr.Logger) *badger.DB {
 }
 
 func NewOrDie[T store.Object](ctx context.Context, storeOpts StoreOpts) *InmemoryObjectStore[T] {
+	versions := newVersionTracker()
 	store := &InmemoryObjectStore[T]{
 		ctx:             ctx,
 		log:             logr.FromContextOrDiscard(ctx),
@@ -150,9 +233,31 @@ func NewOrDie[T store.Object](ctx context.Context, storeOpts StoreOpts) *Inmemor
 		gvk:             storeOpts.GVK,
 		k8sClient:       storeOpts.Client.Resource(storeOpts.GVR),
 		retryOnConflict: !storeOpts.DisableRetryOnConflict,
-	}
+		allowedSorts:    storeOpts.AllowedSorts,
+		sortIndexes:     newSortIndexes(storeOpts.AllowedSorts),
+		indexes:         newSecondaryIndexes(storeOpts.IndexedPaths),
+		decodeCache:     newDecodeCache[T](storeOpts.GVR.GroupResource().String(), storeOpts.Database.DecodeCacheSize, versions),
+		versions:        versions,
+		revisions:       newRevisionTracker(),
+	}
+	store.feed = newChangeFeed(ctx, storeOpts.GVR.GroupResource().String(), store.log, store.revisions, storeOpts.Watch)
 	var err error
+	store.projection, err = newProjection(storeOpts.GVR.GroupResource().String(), storeOpts.Projection)
+	if err != nil {
+		panic(errors.Wrap(err, "invalid projection"))
+	}
 	store.db = newDbOrDie(storeOpts, store.log)
+	Register(prometheus.DefaultRegisterer)
+
+	if store.decodeCache != nil {
+		store.log.Info("enabling decode cache", "size", storeOpts.Database.DecodeCacheSize)
+	}
+
+	store.ingester = newIngester(storeOpts.GVR.GroupResource().String(), store.log, storeOpts.Database, store.writeBatch)
+	if store.ingester != nil {
+		store.log.Info("enabling batched ingestion", "window", storeOpts.Database.BatchWindow.String())
+		go store.ingester.Run(ctx)
+	}
 
 	if storeOpts.Informer.DisableCache {
 		store.log.Info("disabling informer cache")
@@ -161,10 +266,20 @@ func NewOrDie[T store.Object](ctx context.Context, storeOpts StoreOpts) *Inmemor
 		store.informer = informer.New(ctx, store.gvr, storeOpts.Client, store)
 	}
 
+	if path := databasePath(storeOpts); path != "" {
+		if err = store.warmStart(path, storeOpts.Database.StaleReady); err != nil {
+			panic(errors.Wrap(err, "failed to warm start"))
+		}
+	}
+
 	if err = store.informer.Start(); err != nil {
 		panic(errors.Wrap(err, "failed to start informer"))
 	}
 
+	if _, ok := store.informer.(informer.Resumable); ok && store.checkpointFile != "" {
+		go store.runCheckpoints(ctx)
+	}
+
 	return store
 }
 
@@ -173,12 +288,63 @@ func (s *InmemoryObjectStore[T]) Info() (schema.GroupVersionResource, schema.Gro
 }
 
 func (s *InmemoryObjectStore[T]) Ready() bool {
-	return s.informer.Ready()
+	if !s.informer.Ready() {
+		// Serve the objects of the previous run while the informer is catching up
+		return s.staleReady
+	}
+	// Make sure the initial list is written before reporting ready
+	if !s.synced.Load() {
+		if err := s.ingester.Flush(); err != nil {
+			s.log.Error(err, "failed to write initial list")
+		}
+		s.synced.Store(true)
+	}
+	return true
 }
 
 func (s *InmemoryObjectStore[T]) Get(ctx context.Context, namespace, name string) (result T, err error) {
 	key := newKey(namespace, name)
-	err = s.db.View(func(txn *badger.Txn) error {
+	if obj, ok := s.decodeCache.Get(key); ok {
+		return obj, nil
+	}
+	err = s.view(key, func(val []byte) error {
+		result, err = s.decode(key, val)
+		return err
+	})
+
+	return result, err
+}
+
+// GetRaw calls fn with the stored JSON of the object, without decoding it.
+func (s *InmemoryObjectStore[T]) GetRaw(ctx context.Context, namespace, name string, fn func(obj []byte) error) error {
+	return s.view(newKey(namespace, name), fn)
+}
+
+// Version returns the resourceVersion of the stored object qualified with the epoch
+// of the store. The stored JSON depends on the store, e.g. on its projection.
+func (s *InmemoryObjectStore[T]) Version(namespace, name string) (string, bool) {
+	resourceVersion, ok := s.versions.Get(newKey(namespace, name))
+	if !ok {
+		return "", false
+	}
+	return s.revisions.Qualify(resourceVersion), true
+}
+
+// Revision returns the revision of the last change of an object with the given prefix.
+// It is only comparable to revisions of the same instance of the store.
+func (s *InmemoryObjectStore[T]) Revision(prefix string) string {
+	return s.revisions.Token(prefix)
+}
+
+// Watch returns the changes of the objects that match the prefix and filters of opts.
+// Changes of deleted objects are not filtered.
+func (s *InmemoryObjectStore[T]) Watch(ctx context.Context, opts store.ListOpts, revision string) (<-chan store.Event, error) {
+	return s.feed.Watch(ctx, opts, revision)
+}
+
+// view calls fn with the stored value of the given key.
+func (s *InmemoryObjectStore[T]) view(key string, fn func(val []byte) error) error {
+	return s.db.View(func(txn *badger.Txn) error {
 		item, err := txn.Get([]byte(key))
 		if err != nil {
 			if err == badger.ErrKeyNotFound {
@@ -190,104 +356,159 @@ func (s *InmemoryObjectStore[T]) Get(ctx context.Context, namespace, name string
 			return problems.NotFound(key)
 		}
 
-		return item.Value(func(val []byte) error {
-			return sonic.Unmarshal(val, &result)
-		})
+		return item.Value(fn)
 	})
-
-	return result, err
 }
 
 func (s *InmemoryObjectStore[T]) List(ctx context.Context, listOpts store.ListOpts) (result *store.ListResponse[T], err error) {
 	s.log.V(1).Info("list", "limit", listOpts.Limit, "cursor", listOpts.Cursor)
 
-	hasFilters := len(listOpts.Filters) > 0
-
 	result = &store.ListResponse[T]{
-		Items: make([]T, listOpts.Limit),
+		Items: make([]T, 0, listOpts.Limit),
 	}
+	result.Links, err = s.scan(listOpts, s.collect(&result.Items))
+	return result, err
+}
 
-	opts := badger.DefaultIteratorOptions
-	opts.Prefix = []byte(listOpts.Prefix)
-	if !hasFilters {
-		opts.PrefetchValues = true
-	} else {
-		opts.PrefetchValues = false
-	}
+// ListRaw calls fn with the stored JSON of every object of the page, without decoding them.
+func (s *InmemoryObjectStore[T]) ListRaw(ctx context.Context, listOpts store.ListOpts, fn func(obj []byte) error) (store.ListResponseLinks, error) {
+	s.log.V(1).Info("list raw", "limit", listOpts.Limit, "cursor", listOpts.Cursor)
 
-	var filterFunc filter.FilterFunc
+	return s.scan(listOpts, func(_ string, val []byte) error {
+		return fn(val)
+	})
+}
 
+// collect returns a visitor of scan that appends the decoded objects to items.
+func (s *InmemoryObjectStore[T]) collect(items *[]T) func(key string, val []byte) error {
+	return func(key string, val []byte) error {
+		obj, err := s.load(key, val)
+		if err != nil {
+			return errors.Wrap(err, "invalid object")
+		}
+		*items = append(*items, obj)
+		return nil
+	}
+}
+
+// scan calls visit with the stored value of every object of the page that
+// matches the filters, in key order starting at the cursor, and returns the
+// links of the page. The value is only valid during visit.
+// The secondary indexes are used to find the candidates if possible.
+func (s *InmemoryObjectStore[T]) scan(listOpts store.ListOpts, visit func(key string, val []byte) error) (links store.ListResponseLinks, err error) {
+	filterFunc := filter.NopFilter
+	hasFilters := len(listOpts.Filters) > 0
 	if hasFilters {
 		filterFunc = filter.NewFilterFuncs(listOpts.Filters)
-	} else {
-		filterFunc = filter.NopFilter
 	}
 
-	startCursor := []byte(listOpts.Cursor)
-	prefix := opts.Prefix
-	startKey := prefix
-	if len(startCursor) > 0 {
-		startKey = startCursor
+	count := 0
+	// add visits the item if it matches the filters and returns false once the page is full
+	add := func(key string, item *badger.Item) (bool, error) {
+		full := false
+		err := item.Value(func(val []byte) error {
+			if !filterFunc(val) {
+				return nil
+			}
+			if count >= listOpts.Limit {
+				s.log.V(1).Info("limit reached", "limit", listOpts.Limit, "cursor", key)
+				links.Next = key
+				full = true
+				return nil
+			}
+			if links.Self == "" {
+				links.Self = key
+			}
+			count++
+			return visit(key, val)
+		})
+		return !full, err
 	}
 
-	limit := listOpts.Limit
-	iterNum := 0
+	if hasFilters {
+		if candidates, ok := lookupCandidates(s.indexes, listOpts.Filters); ok {
+			keys := candidateKeys(candidates, listOpts)
+			s.log.V(1).Info("list using index", "candidates", len(keys))
+
+			err = s.db.View(func(txn *badger.Txn) error {
+				for _, key := range keys {
+					item, err := txn.Get([]byte(key))
+					if err != nil {
+						if err == badger.ErrKeyNotFound {
+							// deleted after the index lookup
+							continue
+						}
+						return errors.Wrapf(err, "failed to get item %s", key)
+					}
+					if more, err := add(key, item); err != nil || !more {
+						return err
+					}
+				}
+				return nil
+			})
+			return links, err
+		}
+	}
+
+	opts := badger.DefaultIteratorOptions
+	opts.Prefix = []byte(listOpts.Prefix)
+	// values are only prefetched if all of them are needed
+	opts.PrefetchValues = !hasFilters
+
+	startKey := opts.Prefix
+	if listOpts.Cursor != "" {
+		startKey = []byte(listOpts.Cursor)
+	}
 
 	err = s.db.View(func(txn *badger.Txn) error {
 		it := txn.NewIterator(opts)
 		defer it.Close()
 
-		for it.Seek(startKey); it.ValidForPrefix(prefix); it.Next() {
-			var err error
-			var value []byte
-			key := string(it.Item().Key())
-
-			if iterNum >= limit {
-				s.log.V(1).Info("limit reached", "limit", limit, "cursor", key)
-				result.Links.Next = key
-				return nil
-			}
-
-			if !hasFilters {
-				value, err = it.Item().ValueCopy(nil)
-				if err != nil {
-					return err
-				}
-
-			} else {
-				err = it.Item().Value(func(val []byte) error {
-					if !filterFunc(val) {
-						return nil
-					}
-					value = val
-					return nil
-				})
-				if err != nil {
-					return err
-				}
-			}
-
-			if value != nil {
-				err = sonic.Unmarshal(value, &result.Items[iterNum])
-				if err != nil {
-					return errors.Wrap(err, "invalid object")
-				}
-				if result.Links.Self == "" {
-					result.Links.Self = key
-				}
-				iterNum++
+		for it.Seek(startKey); it.ValidForPrefix(opts.Prefix); it.Next() {
+			item := it.Item()
+			if more, err := add(string(item.Key()), item); err != nil || !more {
+				return err
 			}
 		}
 		return nil
 	})
 
-	if iterNum < listOpts.Limit {
-		result.Links.Next = ""
-		// truncate the list
-		result.Items = result.Items[:iterNum]
+	return links, err
+}
+
+// candidateKeys returns the sorted candidate keys of the page, which were
+// resolved using the secondary indexes.
+func candidateKeys(candidates map[string]struct{}, listOpts store.ListOpts) []string {
+	keys := make([]string, 0, len(candidates))
+	for key := range candidates {
+		if !strings.HasPrefix(key, listOpts.Prefix) {
+			continue
+		}
+		if listOpts.Cursor != "" && key < listOpts.Cursor {
+			continue
+		}
+		keys = append(keys, key)
+	}
+	slices.Sort(keys)
+	return keys
+}
+
+// load returns the object stored under the given key. It uses the decode cache
+// if enabled and decodes the given value otherwise.
+func (s *InmemoryObjectStore[T]) load(key string, val []byte) (T, error) {
+	if obj, ok := s.decodeCache.Get(key); ok {
+		return obj, nil
 	}
+	return s.decode(key, val)
+}
 
-	return result, err
+// decode decodes the given value and adds the result to the decode cache if enabled.
+func (s *InmemoryObjectStore[T]) decode(key string, val []byte) (obj T, err error) {
+	if err = sonic.Unmarshal(val, &obj); err != nil {
+		return obj, err
+	}
+	s.decodeCache.Put(key, obj)
+	return obj, nil
 }
 
 func (s *InmemoryObjectStore[T]) Delete(ctx context.Context, namespace, name string) error {
@@ -332,7 +553,7 @@ func (s *InmemoryObjectStore[T]) CreateOrReplace(ctx context.Context, in T) erro
 		if err != nil {
 			return errors.Wrapf(mapErrorToProblem(err), "failed to create object %v/%v", in.GetNamespace(), in.GetName())
 		}
-		return s.OnCreate(ctx, obj)
+		return s.write(obj)
 	}
 
 	// Object exists, update it
@@ -342,7 +563,7 @@ func (s *InmemoryObjectStore[T]) CreateOrReplace(ctx context.Context, in T) erro
 		FieldValidation: "Strict",
 	})
 	if err == nil {
-		return s.OnUpdate(ctx, obj)
+		return s.write(obj)
 	}
 	// if not retrying on conflict or error is not conflict, return error
 	if !s.retryOnConflict || !apierrors.IsConflict(err) {
@@ -367,7 +588,7 @@ func (s *InmemoryObjectStore[T]) CreateOrReplace(ctx context.Context, in T) erro
 		return errors.Wrap(mapErrorToProblem(err), "failed to update object")
 	}
 
-	return s.OnUpdate(ctx, obj)
+	return s.write(obj)
 }
 
 func (s *InmemoryObjectStore[T]) Patch(ctx context.Context, namespace, name string, ops ...store.Patch) (obj T, err error) {
@@ -379,6 +600,10 @@ func (s *InmemoryObjectStore[T]) Patch(ctx context.Context, namespace, name stri
 	var value []byte
 	patchFunc := patch.NewPatchFuncs(ops)
 
+	if s.projection != nil {
+		return s.patchLive(ctx, namespace, name, patchFunc)
+	}
+
 	err = s.db.View(func(txn *badger.Txn) error {
 		key := newKey(namespace, name)
 		item, err := txn.Get([]byte(key))
@@ -424,55 +649,193 @@ func (s *InmemoryObjectStore[T]) Patch(ctx context.Context, namespace, name stri
 	return obj, s.CreateOrReplace(ctx, obj)
 }
 
+// patchLive patches the object of the cluster instead of the stored one.
+// The stored object lacks the fields removed by the projection, which would be
+// removed from the cluster by replacing it.
+func (s *InmemoryObjectStore[T]) patchLive(ctx context.Context, namespace, name string, patchFunc patch.PatchFunc) (obj T, err error) {
+	client := s.k8sClient.Namespace(namespace)
+	for attempt := 0; ; attempt++ {
+		current, err := client.Get(ctx, name, metav1.GetOptions{})
+		if err != nil {
+			return obj, errors.Wrap(mapErrorToProblem(err), "failed to get object")
+		}
+		value, err := current.MarshalJSON()
+		if err != nil {
+			return obj, errors.Wrap(err, "failed to marshal object")
+		}
+		value, err = patchFunc(value)
+		if err != nil {
+			return obj, errors.Wrap(err, "failed to patch object")
+		}
+		patched := &unstructured.Unstructured{}
+		if err := patched.UnmarshalJSON(value); err != nil {
+			return obj, errors.Wrap(err, "failed to unmarshal patched object")
+		}
+		patched.SetResourceVersion(current.GetResourceVersion())
+
+		patched, err = client.Update(ctx, patched, metav1.UpdateOptions{
+			FieldValidation: "Strict",
+		})
+		if err != nil {
+			// retry once with the latest version of the object
+			if s.retryOnConflict && apierrors.IsConflict(err) && attempt == 0 {
+				continue
+			}
+			return obj, errors.Wrap(mapErrorToProblem(err), "failed to update object")
+		}
+
+		value, err = patched.MarshalJSON()
+		if err != nil {
+			return obj, errors.Wrap(err, "failed to marshal object")
+		}
+		if err := sonic.Unmarshal(value, &obj); err != nil {
+			return obj, errors.Wrap(err, "failed to unmarshal patched object")
+		}
+		return obj, s.write(patched)
+	}
+}
+
+// Transform applies the projection before objects are cached by the informer.
+func (s *InmemoryObjectStore[T]) Transform(obj *unstructured.Unstructured) {
+	s.projection.Apply(obj)
+}
+
 func (s *InmemoryObjectStore[T]) OnCreate(ctx context.Context, obj *unstructured.Unstructured) error {
 	return s.OnUpdate(ctx, obj)
 }
 
 func (s *InmemoryObjectStore[T]) OnUpdate(ctx context.Context, obj *unstructured.Unstructured) error {
-	obj = obj.DeepCopy()
-	key := calculateKey(obj)
-	informer.SanitizeObject(obj)
-
-	data, err := sonic.Marshal(obj.Object)
-	if err != nil {
-		return errors.Wrap(err, "invalid object")
+	// Relists and resyncs deliver every object again, skip the ones that are already stored.
+	// Objects whose write failed or was dropped are not stored yet and are written again.
+	if s.versions.Unchanged(calculateKey(obj), obj.GetResourceVersion()) {
+		ingestSkipped.WithLabelValues(s.gvr.GroupResource().String()).Inc()
+		return nil
 	}
-	err = s.db.Update(func(txn *badger.Txn) error {
-		return txn.Set([]byte(key), data)
-	})
+	if s.ingester == nil {
+		return s.write(obj)
+	}
+
+	key, data, err := encodeObject(obj, s.projection)
 	if err != nil {
 		return err
 	}
-
-	s.sortValueCache.Range(func(k, v any) bool {
-		sp := k.(string)
-		m := v.(*sync.Map)
-		value := gjson.GetBytes(data, sp)
-		m.Store(key, value.Value())
-		s.log.V(1).Info("cached sort value", "key", key, "sortPath", sp, "value", value.Value())
-		return true
+	s.ingester.Add(key, pendingWrite{
+		data:            data,
+		resourceVersion: obj.GetResourceVersion(),
+		queuedAt:        time.Now(),
 	})
 	return nil
 }
 
 func (s *InmemoryObjectStore[T]) OnDelete(ctx context.Context, obj *unstructured.Unstructured) error {
-	key := calculateKey(obj)
+	return s.remove(calculateKey(obj))
+}
+
+// remove deletes the object with the given key.
+func (s *InmemoryObjectStore[T]) remove(key string) error {
+	if s.ingester != nil {
+		s.ingester.Add(key, pendingWrite{
+			deleted:  true,
+			queuedAt: time.Now(),
+		})
+		return nil
+	}
 
 	err := s.db.Update(func(txn *badger.Txn) error {
 		return txn.Delete([]byte(key))
 	})
 	if err != nil {
+		s.writeFailed.Store(true)
 		return err
 	}
-	s.sortValueCache.Range(func(k, v any) bool {
-		m := v.(*sync.Map)
-		m.Delete(key)
-		s.log.V(1).Info("deleted cached sort value", "key", key, "sortPath", k)
-		return true
+	s.afterDelete(key)
+	return nil
+}
+
+// write stores the object immediately, bypassing the batched ingestion.
+// Any buffered event for the same object is discarded.
+func (s *InmemoryObjectStore[T]) write(obj *unstructured.Unstructured) error {
+	key, data, err := encodeObject(obj, s.projection)
+	if err != nil {
+		return err
+	}
+	return s.ingester.Exclusive(key, func() error {
+		err := s.db.Update(func(txn *badger.Txn) error {
+			return txn.Set([]byte(key), data)
+		})
+		if err != nil {
+			s.writeFailed.Store(true)
+			return err
+		}
+		s.afterSet(key, obj.GetResourceVersion(), data)
+		return nil
 	})
+}
+
+// writeBatch writes all buffered events using a single write batch.
+func (s *InmemoryObjectStore[T]) writeBatch(batch map[string]pendingWrite) error {
+	wb := s.db.NewWriteBatch()
+	defer wb.Cancel()
+
+	for key, w := range batch {
+		var err error
+		if w.deleted {
+			err = wb.Delete([]byte(key))
+		} else {
+			err = wb.Set([]byte(key), w.data)
+		}
+		if err != nil {
+			s.writeFailed.Store(true)
+			return errors.Wrapf(err, "failed to add %s to batch", key)
+		}
+	}
+	if err := wb.Flush(); err != nil {
+		s.writeFailed.Store(true)
+		return errors.Wrap(err, "failed to flush batch")
+	}
+
+	for key, w := range batch {
+		if w.deleted {
+			s.afterDelete(key)
+		} else {
+			s.afterSet(key, w.resourceVersion, w.data)
+		}
+	}
 	return nil
 }
 
+// afterSet updates all derived state after an object was written.
+func (s *InmemoryObjectStore[T]) afterSet(key, resourceVersion string, data []byte) {
+	eventType := store.EventTypeAdded
+	if _, ok := s.versions.Get(key); ok {
+		eventType = store.EventTypeModified
+	}
+	s.versions.Set(key, resourceVersion)
+	s.forgetRestored(key)
+	s.decodeCache.Invalidate(key, resourceVersion)
+	for _, idx := range s.indexes {
+		idx.Set(key, data)
+	}
+	for _, idx := range s.sortIndexes {
+		idx.Set(key, data)
+	}
+	s.feed.Publish(eventType, key, data)
+}
+
+// afterDelete updates all derived state after an object was deleted.
+func (s *InmemoryObjectStore[T]) afterDelete(key string) {
+	s.versions.Delete(key)
+	s.forgetRestored(key)
+	s.decodeCache.Invalidate(key, "")
+	for _, idx := range s.indexes {
+		idx.Delete(key)
+	}
+	for _, idx := range s.sortIndexes {
+		idx.Delete(key)
+	}
+	s.feed.Publish(store.EventTypeDeleted, key, nil)
+}
+
 func mapErrorToProblem(err error) problems.Problem {
 	if err == nil {
 		return nil
@@ -513,6 +876,19 @@ func mapErrorToProblem(err error) problems.Problem {
 	}
 }
 
+// encodeObject returns the key and the sanitized and projected data of the given object.
+func encodeObject(obj *unstructured.Unstructured, p *projection) (string, []byte, error) {
+	obj = obj.DeepCopy()
+	informer.SanitizeObject(obj)
+	p.Apply(obj)
+
+	data, err := sonic.Marshal(obj.Object)
+	if err != nil {
+		return "", nil, errors.Wrap(err, "invalid object")
+	}
+	return calculateKey(obj), data, nil
+}
+
 func calculateKey(obj store.Object) string {
 	return newKey(obj.GetNamespace(), obj.GetName())
 }
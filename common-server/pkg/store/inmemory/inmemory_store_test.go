@@ -169,6 +169,62 @@ var _ = Describe("Inmemory ObjectStore", func() {
 			Expect(obj).To(BeNil())
 		})
 
+		It("should get the raw object", func() {
+			var raw []byte
+			err := objStore.GetRaw(ctx, "default", "foo", func(obj []byte) error {
+				raw = append(raw, obj...)
+				return nil
+			})
+			Expect(err).ToNot(HaveOccurred())
+
+			obj := &unstructured.Unstructured{}
+			Expect(obj.UnmarshalJSON(raw)).To(Succeed())
+			Expect(obj.GetName()).To(Equal("foo"))
+		})
+
+		It("should return error on get raw (not found)", func() {
+			err := objStore.GetRaw(ctx, "default", "noexist", func(obj []byte) error {
+				return nil
+			})
+			Expect(err).To(HaveOccurred())
+			Expect(problems.IsNotFound(err)).To(BeTrue())
+		})
+
+	})
+
+	Context("Projection", func() {
+
+		It("should patch the object of the cluster", func() {
+			fakeClient := fake.NewSimpleDynamicClient(scheme, NewUnstructured("foo"))
+			objStore := NewOrDie[*unstructured.Unstructured](ctx, StoreOpts{
+				Client:     fakeClient,
+				GVR:        gvr,
+				GVK:        gvk,
+				Projection: ProjectionOpts{Exclude: []string{"spec.timeout"}},
+			})
+			Eventually(func() error {
+				_, err := objStore.Get(ctx, "default", "foo")
+				return err
+			}).Should(Succeed())
+			fakeClient.ClearActions()
+
+			obj, err := objStore.Patch(ctx, "default", "foo", store.Patch{Path: "spec.replicas", Op: store.OpReplace, Value: 100})
+			Expect(err).ToNot(HaveOccurred())
+			Expect(obj.Object["spec"].(map[string]any)).To(HaveKey("timeout"))
+
+			Expect(fakeClient.Actions()).To(HaveLen(2))
+			Expect(fakeClient.Actions()[0].GetVerb()).To(Equal("get"))
+			Expect(fakeClient.Actions()[1].GetVerb()).To(Equal("update"))
+
+			live, err := fakeClient.Resource(gvr).Namespace("default").Get(ctx, "foo", metav1.GetOptions{})
+			Expect(err).ToNot(HaveOccurred())
+			Expect(live.Object["spec"].(map[string]any)).To(HaveKey("timeout"))
+			Expect(live.Object["spec"].(map[string]any)["replicas"]).To(Equal(int64(100)))
+
+			stored, err := objStore.Get(ctx, "default", "foo")
+			Expect(err).ToNot(HaveOccurred())
+			Expect(stored.Object["spec"].(map[string]any)).ToNot(HaveKey("timeout"))
+		})
 	})
 
 	Context("List", Ordered, func() {
@@ -254,6 +310,38 @@ var _ = Describe("Inmemory ObjectStore", func() {
 			Expect(list.Links.Next).To(Equal("default/foo116/"))
 		})
 
+		It("should list the same raw objects", func() {
+			listOpts := store.NewListOpts()
+			listOpts.Limit = 10
+			listOpts.Cursor = "default/foo107"
+			listOpts.Filters = []store.Filter{
+				{
+					Path:  "metadata.labels.app",
+					Op:    store.OpRegex,
+					Value: "^app1[0-9]+$",
+				},
+			}
+
+			list, err := objStore.List(ctx, listOpts)
+			Expect(err).ToNot(HaveOccurred())
+
+			var names []string
+			links, err := objStore.ListRaw(ctx, listOpts, func(raw []byte) error {
+				obj := &unstructured.Unstructured{}
+				if err := obj.UnmarshalJSON(raw); err != nil {
+					return err
+				}
+				names = append(names, obj.GetName())
+				return nil
+			})
+			Expect(err).ToNot(HaveOccurred())
+			Expect(links).To(Equal(list.Links))
+			Expect(names).To(HaveLen(len(list.Items)))
+			for i, item := range list.Items {
+				Expect(names[i]).To(Equal(item.GetName()))
+			}
+		})
+
 	})
 
 	Context("EventHandler", func() {
@@ -277,6 +365,56 @@ var _ = Describe("Inmemory ObjectStore", func() {
 			Expect(obj.GetName()).To(Equal("foo"))
 		})
 
+		It("should publish the changes to watches", func() {
+			watchCtx, cancel := context.WithCancel(ctx)
+			defer cancel()
+			listOpts := store.NewListOpts()
+			listOpts.Prefix = "default/watched"
+			events, err := objStore.Watch(watchCtx, listOpts, "")
+			Expect(err).ToNot(HaveOccurred())
+
+			obj := NewUnstructured("watched")
+			Expect(objStore.OnUpdate(ctx, obj)).To(Succeed())
+			obj.SetResourceVersion("476170915")
+			Expect(objStore.OnUpdate(ctx, obj)).To(Succeed())
+			Expect(objStore.OnUpdate(ctx, NewUnstructured("other"))).To(Succeed())
+			Expect(objStore.OnDelete(ctx, obj)).To(Succeed())
+
+			Expect((<-events).Type).To(Equal(store.EventTypeAdded))
+			event := <-events
+			Expect(event.Type).To(Equal(store.EventTypeModified))
+			Expect((<-events).Type).To(Equal(store.EventTypeDeleted))
+			Expect(events).To(BeEmpty())
+
+			resumed, err := objStore.Watch(watchCtx, listOpts, event.Revision)
+			Expect(err).ToNot(HaveOccurred())
+			Expect((<-resumed).Type).To(Equal(store.EventTypeDeleted))
+			Expect(resumed).To(BeEmpty())
+		})
+
+		It("should track versions and revisions", func() {
+			revision := objStore.Revision("default/")
+			otherRevision := objStore.Revision("other/")
+
+			obj := NewUnstructured("versioned")
+			obj.SetResourceVersion("1")
+			Expect(objStore.OnUpdate(ctx, obj)).To(Succeed())
+
+			version, ok := objStore.Version("default", "versioned")
+			Expect(ok).To(BeTrue())
+			Expect(version).To(Equal(objStore.revisions.Qualify("1")))
+			Expect(version).ToNot(Equal("1"))
+			Expect(objStore.Revision("default/")).ToNot(Equal(revision))
+			Expect(objStore.Revision("other/")).To(Equal(otherRevision))
+
+			revision = objStore.Revision("default/")
+			Expect(objStore.OnDelete(ctx, obj)).To(Succeed())
+
+			_, ok = objStore.Version("default", "versioned")
+			Expect(ok).To(BeFalse())
+			Expect(objStore.Revision("default/")).ToNot(Equal(revision))
+		})
+
 		It("should handle delete event", func() {
 			Expect(objStore.OnDelete(ctx, NewUnstructured("foo"))).To(Succeed())
 
@@ -0,0 +1,99 @@
+// Copyright 2025 Deutsche Telekom IT GmbH
+//
+// SPDX-License-Identifier: Apache-2.0
+
+package inmemory
+
+import (
+	"sync"
+
+	"github.com/prometheus/client_golang/prometheus"
+)
+
+var (
+	registerOnce sync.Once
+
+	decodeCacheRequests = prometheus.NewCounterVec(prometheus.CounterOpts{
+		Name: "store_decode_cache_requests_total",
+		Help: "Total number of decode cache lookups",
+	}, []string{"store", "result"},
+	)
+
+	decodeCacheEvictions = prometheus.NewCounterVec(prometheus.CounterOpts{
+		Name: "store_decode_cache_evictions_total",
+		Help: "Total number of objects evicted from the decode cache",
+	}, []string{"store"},
+	)
+
+	decodeCacheSize = prometheus.NewGaugeVec(prometheus.GaugeOpts{
+		Name: "store_decode_cache_size",
+		Help: "Current number of objects in the decode cache",
+	}, []string{"store"},
+	)
+
+	ingestBatchSize = prometheus.NewHistogramVec(prometheus.HistogramOpts{
+		Name:    "store_ingest_batch_size",
+		Help:    "Number of objects written per ingestion batch",
+		Buckets: []float64{1, 10, 50, 100, 250, 500, 1000, 5000},
+	}, []string{"store"},
+	)
+
+	ingestLag = prometheus.NewHistogramVec(prometheus.HistogramOpts{
+		Name:    "store_ingest_lag_seconds",
+		Help:    "Time between receiving an informer event and writing it to the database",
+		Buckets: []float64{0.001, 0.01, 0.05, 0.1, 0.5, 1, 5},
+	}, []string{"store"},
+	)
+
+	ingestCoalesced = prometheus.NewCounterVec(prometheus.CounterOpts{
+		Name: "store_ingest_coalesced_total",
+		Help: "Total number of informer events replaced by a newer event of the same object before being written",
+	}, []string{"store"},
+	)
+
+	ingestSkipped = prometheus.NewCounterVec(prometheus.CounterOpts{
+		Name: "store_ingest_skipped_total",
+		Help: "Total number of informer events skipped because the object did not change",
+	}, []string{"store"},
+	)
+
+	ingestErrors = prometheus.NewCounterVec(prometheus.CounterOpts{
+		Name: "store_ingest_errors_total",
+		Help: "Total number of ingestion batches that failed to be written",
+	}, []string{"store"},
+	)
+
+	projectionSavedBytes = prometheus.NewCounterVec(prometheus.CounterOpts{
+		Name: "store_projection_saved_bytes_total",
+		Help: "Estimated number of bytes removed from objects by the field projection, extrapolated from a sample of the objects",
+	}, []string{"store"},
+	)
+
+	watchesActive = prometheus.NewGaugeVec(prometheus.GaugeOpts{
+		Name: "store_watches_active",
+		Help: "Current number of watches of the change feed",
+	}, []string{"store"},
+	)
+
+	watchesDropped = prometheus.NewCounterVec(prometheus.CounterOpts{
+		Name: "store_watches_dropped_total",
+		Help: "Total number of watches closed because they did not receive the changes fast enough",
+	}, []string{"store"},
+	)
+)
+
+func Register(reg prometheus.Registerer) {
+	registerOnce.Do(func() {
+		reg.MustRegister(decodeCacheRequests)
+		reg.MustRegister(decodeCacheEvictions)
+		reg.MustRegister(decodeCacheSize)
+		reg.MustRegister(ingestBatchSize)
+		reg.MustRegister(ingestLag)
+		reg.MustRegister(ingestCoalesced)
+		reg.MustRegister(ingestSkipped)
+		reg.MustRegister(ingestErrors)
+		reg.MustRegister(projectionSavedBytes)
+		reg.MustRegister(watchesActive)
+		reg.MustRegister(watchesDropped)
+	})
+}
@@ -0,0 +1,146 @@
+// Copyright 2025 Deutsche Telekom IT GmbH
+//
+// SPDX-License-Identifier: Apache-2.0
+
+package inmemory
+
+import (
+	"slices"
+	"strings"
+	"sync/atomic"
+
+	"github.com/bytedance/sonic"
+	"github.com/pkg/errors"
+	"k8s.io/apimachinery/pkg/apis/meta/v1/unstructured"
+)
+
+// protectedPaths are always kept, as they are required to store and identify objects.
+var protectedPaths = []string{"apiVersion", "kind", "metadata"}
+
+// identityPaths cannot be excluded, while other metadata like annotations can.
+var identityPaths = []string{"metadata.name", "metadata.namespace", "metadata.resourceVersion"}
+
+// projectionTree is a tree of path segments. A nil subtree matches the whole field.
+type projectionTree map[string]projectionTree
+
+func newProjectionTree(paths []string) projectionTree {
+	tree := projectionTree{}
+	for _, path := range paths {
+		node := tree
+		segments := strings.Split(path, ".")
+		for i, segment := range segments {
+			child, ok := node[segment]
+			if ok && child == nil {
+				// a shorter path already matches the whole field
+				break
+			}
+			if i == len(segments)-1 {
+				node[segment] = nil
+				break
+			}
+			if !ok {
+				child = projectionTree{}
+				node[segment] = child
+			}
+			node = child
+		}
+	}
+	return tree
+}
+
+// projectionSampleRate is the number of applied projections per sample of the saved bytes.
+// Measuring the saved bytes requires encoding the object twice, so only every
+// projectionSampleRate-th object is measured and the result is extrapolated.
+const projectionSampleRate = 100
+
+// projection removes the fields of objects that are not needed by a store.
+type projection struct {
+	name    string
+	include projectionTree
+	exclude projectionTree
+	applied atomic.Uint64
+}
+
+func newProjection(name string, opts ProjectionOpts) (*projection, error) {
+	if len(opts.Include) == 0 && len(opts.Exclude) == 0 {
+		return nil, nil
+	}
+	for _, path := range opts.Exclude {
+		if slices.Contains(protectedPaths, path) || slices.Contains(identityPaths, path) {
+			return nil, errors.Errorf("path %q cannot be excluded", path)
+		}
+	}
+
+	p := &projection{name: name}
+	if len(opts.Include) > 0 {
+		p.include = newProjectionTree(slices.Concat(opts.Include, protectedPaths))
+	}
+	if len(opts.Exclude) > 0 {
+		p.exclude = newProjectionTree(opts.Exclude)
+	}
+	return p, nil
+}
+
+// Apply removes all fields of the object that are not included or that are excluded.
+func (p *projection) Apply(obj *unstructured.Unstructured) {
+	if p == nil {
+		return
+	}
+	sample := p.applied.Add(1)%projectionSampleRate == 1
+	before := 0
+	if sample {
+		before = encodedSize(obj.Object)
+	}
+	if p.include != nil {
+		keepFields(obj.Object, p.include)
+	}
+	if p.exclude != nil {
+		removeFields(obj.Object, p.exclude)
+	}
+	if !sample {
+		return
+	}
+	if saved := before - encodedSize(obj.Object); saved > 0 {
+		projectionSavedBytes.WithLabelValues(p.name).Add(float64(saved * projectionSampleRate))
+	}
+}
+
+// keepFields removes all fields that are not part of the tree.
+// Fields that are not objects are kept entirely, even if the tree contains nested paths.
+func keepFields(m map[string]any, tree projectionTree) {
+	for key, value := range m {
+		child, ok := tree[key]
+		if !ok {
+			delete(m, key)
+			continue
+		}
+		if nested, isMap := value.(map[string]any); isMap && child != nil {
+			keepFields(nested, child)
+		}
+	}
+}
+
+// removeFields removes all fields that are part of the tree.
+func removeFields(m map[string]any, tree projectionTree) {
+	for key, child := range tree {
+		value, ok := m[key]
+		if !ok {
+			continue
+		}
+		if child == nil {
+			delete(m, key)
+			continue
+		}
+		if nested, isMap := value.(map[string]any); isMap {
+			removeFields(nested, child)
+		}
+	}
+}
+
+func encodedSize(obj map[string]any) int {
+	data, err := sonic.Marshal(obj)
+	if err != nil {
+		return 0
+	}
+	return len(data)
+}
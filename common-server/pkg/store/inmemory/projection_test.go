@@ -0,0 +1,85 @@
+// Copyright 2025 Deutsche Telekom IT GmbH
+//
+// SPDX-License-Identifier: Apache-2.0
+
+package inmemory
+
+import (
+	"context"
+
+	"github.com/go-logr/logr"
+	. "github.com/onsi/ginkgo/v2"
+	. "github.com/onsi/gomega"
+	"k8s.io/apimachinery/pkg/apis/meta/v1/unstructured"
+)
+
+func newProjectedUnstructured() *unstructured.Unstructured {
+	u := NewUnstructured("foo")
+	u.Object["status"] = map[string]any{
+		"conditions": []any{map[string]any{"type": "Ready", "status": "True"}},
+		"url":        "https://example.com",
+	}
+	return u
+}
+
+var _ = Describe("Projection", func() {
+
+	It("should be disabled without paths", func() {
+		p, err := newProjection("test", ProjectionOpts{})
+		Expect(err).ToNot(HaveOccurred())
+		Expect(p).To(BeNil())
+	})
+
+	It("should reject excluding identifying fields", func() {
+		_, err := newProjection("test", ProjectionOpts{Exclude: []string{"metadata.name"}})
+		Expect(err).To(HaveOccurred())
+		_, err = newProjection("test", ProjectionOpts{Exclude: []string{"metadata"}})
+		Expect(err).To(HaveOccurred())
+	})
+
+	It("should remove excluded fields", func() {
+		p, err := newProjection("test", ProjectionOpts{Exclude: []string{"status.conditions", "spec.unknown.field"}})
+		Expect(err).ToNot(HaveOccurred())
+		saved := counterValue(projectionSavedBytes.WithLabelValues("test"))
+
+		u := newProjectedUnstructured()
+		p.Apply(u)
+
+		Expect(u.Object["status"]).To(Equal(map[string]any{"url": "https://example.com"}))
+		Expect(u.Object).To(HaveKey("spec"))
+		Expect(counterValue(projectionSavedBytes.WithLabelValues("test"))).To(BeNumerically(">", saved))
+	})
+
+	It("should only keep included fields", func() {
+		p, err := newProjection("test", ProjectionOpts{Include: []string{"status.url", "spec.replicas"}})
+		Expect(err).ToNot(HaveOccurred())
+
+		u := newProjectedUnstructured()
+		p.Apply(u)
+
+		Expect(u.GetName()).To(Equal("foo"))
+		Expect(u.GetResourceVersion()).To(Equal("476170914"))
+		Expect(u.Object["status"]).To(Equal(map[string]any{"url": "https://example.com"}))
+		Expect(u.Object["spec"]).To(HaveKey("replicas"))
+		Expect(u.Object["spec"]).ToNot(HaveKey("timeout"))
+	})
+
+	It("should store projected objects", func() {
+		p, err := newProjection("test", ProjectionOpts{Exclude: []string{"status"}})
+		Expect(err).ToNot(HaveOccurred())
+		objStore := &InmemoryObjectStore[*unstructured.Unstructured]{
+			ctx:        context.Background(),
+			db:         newDbOrDie(StoreOpts{}, logr.Discard()),
+			log:        logr.Discard(),
+			projection: p,
+		}
+
+		u := newProjectedUnstructured()
+		Expect(objStore.OnUpdate(context.Background(), u)).To(Succeed())
+		Expect(u.Object).To(HaveKey("status"))
+
+		obj, err := objStore.Get(context.Background(), "default", "foo")
+		Expect(err).ToNot(HaveOccurred())
+		Expect(obj.Object).ToNot(HaveKey("status"))
+	})
+})
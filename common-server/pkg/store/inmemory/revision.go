@@ -0,0 +1,99 @@
+// Copyright 2026 Deutsche Telekom IT GmbH
+//
+// SPDX-License-Identifier: Apache-2.0
+
+package inmemory
+
+import (
+	"strconv"
+	"strings"
+	"sync"
+	"time"
+
+	"github.com/pkg/errors"
+)
+
+// revisionTracker assigns a monotonic revision to every change of the stored
+// objects and remembers the last revision of every namespace.
+// Revisions are only meaningful within one instance of the store, which is
+// identified by its epoch.
+type revisionTracker struct {
+	epoch string
+
+	mutex      sync.RWMutex
+	current    uint64
+	namespaces map[string]uint64
+}
+
+func newRevisionTracker() *revisionTracker {
+	return &revisionTracker{
+		epoch:      strconv.FormatInt(time.Now().UnixNano(), 36),
+		namespaces: make(map[string]uint64),
+	}
+}
+
+// Next assigns the next revision to a change of the object with the given key.
+func (r *revisionTracker) Next(key string) uint64 {
+	if r == nil {
+		return 0
+	}
+	namespace, _, _ := strings.Cut(key, "/")
+
+	r.mutex.Lock()
+	defer r.mutex.Unlock()
+	r.current++
+	r.namespaces[namespace] = r.current
+	return r.current
+}
+
+// Get returns the revision of the last change of an object with the given prefix.
+// Prefixes within a namespace get the revision of the whole namespace.
+func (r *revisionTracker) Get(prefix string) uint64 {
+	if r == nil {
+		return 0
+	}
+	r.mutex.RLock()
+	defer r.mutex.RUnlock()
+	namespace, _, ok := strings.Cut(prefix, "/")
+	if !ok {
+		return r.current
+	}
+	return r.namespaces[namespace]
+}
+
+// Token returns the revision of the given prefix qualified with the epoch.
+// It returns an empty string if revisions are not tracked.
+func (r *revisionTracker) Token(prefix string) string {
+	if r == nil {
+		return ""
+	}
+	return r.format(r.Get(prefix))
+}
+
+// Qualify returns the given version of an object qualified with the epoch, so that
+// versions of another instance of the store never match.
+func (r *revisionTracker) Qualify(version string) string {
+	if r == nil {
+		return version
+	}
+	return r.epoch + "-" + version
+}
+
+// format returns the token of the given revision.
+func (r *revisionTracker) format(revision uint64) string {
+	return r.epoch + "-" + strconv.FormatUint(revision, 10)
+}
+
+// parse returns the revision of the given token. It returns false if the
+// token was issued by another instance of the store.
+func (r *revisionTracker) parse(token string) (uint64, bool, error) {
+	epoch, value, ok := strings.Cut(token, "-")
+	if !ok {
+		return 0, false, errors.Errorf("invalid revision %q", token)
+	}
+	revision, err := strconv.ParseUint(value, 10, 64)
+	if err != nil {
+		return 0, false, errors.Errorf("invalid revision %q", token)
+	}
+	return revision, epoch == r.epoch, nil
+}
@@ -0,0 +1,48 @@
+// Copyright 2026 Deutsche Telekom IT GmbH
+//
+// SPDX-License-Identifier: Apache-2.0
+
+package inmemory
+
+import (
+	. "github.com/onsi/ginkgo/v2"
+	. "github.com/onsi/gomega"
+)
+
+var _ = Describe("Revisions", func() {
+
+	It("should track the revision per namespace", func() {
+		r := newRevisionTracker()
+		Expect(r.Get("")).To(BeZero())
+
+		Expect(r.Next("default/foo/")).To(Equal(uint64(1)))
+		Expect(r.Next("other/bar/")).To(Equal(uint64(2)))
+		Expect(r.Next("default/baz/")).To(Equal(uint64(3)))
+
+		Expect(r.Get("")).To(Equal(uint64(3)))
+		Expect(r.Get("def")).To(Equal(uint64(3)))
+		Expect(r.Get("default/")).To(Equal(uint64(3)))
+		Expect(r.Get("default/foo")).To(Equal(uint64(3)))
+		Expect(r.Get("other/")).To(Equal(uint64(2)))
+		Expect(r.Get("unknown/")).To(BeZero())
+	})
+
+	It("should qualify the revision with the epoch", func() {
+		r := newRevisionTracker()
+		token := r.Token("default/")
+		r.Next("other/bar/")
+		Expect(r.Token("default/")).To(Equal(token))
+		r.Next("default/foo/")
+		Expect(r.Token("default/")).ToNot(Equal(token))
+
+		Expect(newRevisionTracker().Token("")).ToNot(Equal(r.Token("")))
+		Expect(newRevisionTracker().Qualify("42")).ToNot(Equal(r.Qualify("42")))
+	})
+
+	It("should be disabled if nil", func() {
+		var r *revisionTracker
+		Expect(r.Next("default/foo/")).To(BeZero())
+		Expect(r.Token("")).To(BeEmpty())
+		Expect(r.Qualify("42")).To(Equal("42"))
+	})
+})
@@ -0,0 +1,254 @@
+// Copyright 2025 Deutsche Telekom IT GmbH
+//
+// SPDX-License-Identifier: Apache-2.0
+
+package inmemory
+
+import (
+	"cmp"
+	"slices"
+	"strings"
+	"sync"
+
+	"github.com/tidwall/gjson"
+)
+
+type sortKind uint8
+
+// The order of the kinds defines how values of different types are sorted.
+// Missing values are always sorted first.
+const (
+	sortKindNull sortKind = iota
+	sortKindBool
+	sortKindNumber
+	sortKindString
+	sortKindJSON
+)
+
+// sortValue is the typed representation of a value at a sort path.
+type sortValue struct {
+	kind sortKind
+	num  float64
+	str  string
+}
+
+func newSortValue(res gjson.Result) sortValue {
+	switch res.Type {
+	case gjson.False:
+		return sortValue{kind: sortKindBool, num: 0}
+	case gjson.True:
+		return sortValue{kind: sortKindBool, num: 1}
+	case gjson.Number:
+		return sortValue{kind: sortKindNumber, num: res.Num}
+	case gjson.String:
+		return sortValue{kind: sortKindString, str: res.Str}
+	case gjson.JSON:
+		return sortValue{kind: sortKindJSON, str: res.Raw}
+	default:
+		return sortValue{kind: sortKindNull}
+	}
+}
+
+func (v sortValue) compare(other sortValue) int {
+	if v.kind != other.kind {
+		return cmp.Compare(v.kind, other.kind)
+	}
+	switch v.kind {
+	case sortKindBool, sortKindNumber:
+		return cmp.Compare(v.num, other.num)
+	case sortKindString, sortKindJSON:
+		return strings.Compare(v.str, other.str)
+	default:
+		return 0
+	}
+}
+
+type sortEntry struct {
+	value sortValue
+	key   string
+}
+
+// compareSortEntries orders entries by their value. Entries with equal values
+// are ordered by their key to get a stable order.
+func compareSortEntries(a, b sortEntry) int {
+	if c := a.value.compare(b.value); c != 0 {
+		return c
+	}
+	return strings.Compare(a.key, b.key)
+}
+
+// sortIndex keeps all keys of the store ordered by the value at a sort path.
+// It allows to read a sorted page by seeking to the cursor instead of
+// sorting all objects for every request.
+type sortIndex struct {
+	path string
+
+	mutex      sync.RWMutex
+	entries    []sortEntry
+	valueByKey map[string]sortValue
+}
+
+func newSortIndex(path string) *sortIndex {
+	return &sortIndex{
+		path:       path,
+		valueByKey: make(map[string]sortValue),
+	}
+}
+
+func newSortIndexes(paths []string) map[string]*sortIndex {
+	indexes := make(map[string]*sortIndex, len(paths))
+	for _, path := range paths {
+		indexes[path] = newSortIndex(path)
+	}
+	return indexes
+}
+
+// Set updates the position of the given key using the object data.
+func (idx *sortIndex) Set(key string, data []byte) {
+	value := newSortValue(gjson.GetBytes(data, idx.path))
+
+	idx.mutex.Lock()
+	defer idx.mutex.Unlock()
+
+	if current, exists := idx.valueByKey[key]; exists {
+		if current == value {
+			return
+		}
+		idx.remove(sortEntry{value: current, key: key})
+	}
+
+	entry := sortEntry{value: value, key: key}
+	pos, _ := slices.BinarySearchFunc(idx.entries, entry, compareSortEntries)
+	idx.entries = slices.Insert(idx.entries, pos, entry)
+	idx.valueByKey[key] = value
+}
+
+// Delete removes the given key from the index.
+func (idx *sortIndex) Delete(key string) {
+	idx.mutex.Lock()
+	defer idx.mutex.Unlock()
+
+	if current, exists := idx.valueByKey[key]; exists {
+		idx.remove(sortEntry{value: current, key: key})
+	}
+}
+
+func (idx *sortIndex) remove(entry sortEntry) {
+	delete(idx.valueByKey, entry.key)
+	if pos, found := slices.BinarySearchFunc(idx.entries, entry, compareSortEntries); found {
+		idx.entries = slices.Delete(idx.entries, pos, pos+1)
+	}
+}
+
+// Value returns the sort value of the given key.
+func (idx *sortIndex) Value(key string) (sortValue, bool) {
+	idx.mutex.RLock()
+	defer idx.mutex.RUnlock()
+
+	value, ok := idx.valueByKey[key]
+	return value, ok
+}
+
+// Walk calls fn for every key in ascending or descending order, starting at the
+// given cursor key. If the cursor is empty or unknown, it starts at the beginning.
+// It stops as soon as fn returns false.
+// The keys are copied in chunks and fn is called without holding the lock, so
+// changes of the index do not wait for a walk. Keys that are moved during the
+// walk may be skipped or visited again.
+func (idx *sortIndex) Walk(cursor string, desc bool, fn func(key string) bool) {
+	var last *sortEntry
+	for {
+		chunk := idx.chunk(cursor, desc, last)
+		for _, entry := range chunk {
+			if !fn(entry.key) {
+				return
+			}
+		}
+		if len(chunk) < walkChunkSize {
+			return
+		}
+		last = &chunk[len(chunk)-1]
+	}
+}
+
+// walkChunkSize is the number of keys that Walk copies at a time.
+const walkChunkSize = 256
+
+// chunk returns a copy of the next entries in walk order after the last entry.
+// If last is nil, it starts at the cursor.
+// Entries with equal values are always returned in ascending key order, so a
+// descending walk visits the groups of equal values backwards, but each group forwards.
+func (idx *sortIndex) chunk(cursor string, desc bool, last *sortEntry) []sortEntry {
+	idx.mutex.RLock()
+	defer idx.mutex.RUnlock()
+
+	var start int
+	switch {
+	case last != nil:
+		pos, found := slices.BinarySearchFunc(idx.entries, *last, compareSortEntries)
+		if found {
+			pos++
+		}
+		start = pos
+		if desc && (pos == len(idx.entries) || idx.entries[pos].value.compare(last.value) != 0) {
+			start = idx.previousGroup(last.value)
+		}
+	case desc:
+		start = -1
+		if len(idx.entries) > 0 {
+			start = idx.groupStart(idx.entries[len(idx.entries)-1].value)
+		}
+		if value, ok := idx.valueByKey[cursor]; ok {
+			start, _ = slices.BinarySearchFunc(idx.entries, sortEntry{value: value, key: cursor}, compareSortEntries)
+		}
+	default:
+		if value, ok := idx.valueByKey[cursor]; ok {
+			start, _ = slices.BinarySearchFunc(idx.entries, sortEntry{value: value, key: cursor}, compareSortEntries)
+		}
+	}
+
+	if !desc {
+		end := min(start+walkChunkSize, len(idx.entries))
+		return slices.Clone(idx.entries[start:end])
+	}
+	chunk := make([]sortEntry, 0, min(start+1, walkChunkSize))
+	for i := start; i >= 0 && len(chunk) < walkChunkSize; {
+		chunk = append(chunk, idx.entries[i])
+		if i+1 < len(idx.entries) && idx.entries[i+1].value.compare(idx.entries[i].value) == 0 {
+			i++
+		} else {
+			i = idx.previousGroup(idx.entries[i].value)
+		}
+	}
+	return chunk
+}
+
+// groupStart returns the position of the first entry with a value not less than the given value.
+func (idx *sortIndex) groupStart(value sortValue) int {
+	pos, _ := slices.BinarySearchFunc(idx.entries, value, func(entry sortEntry, value sortValue) int {
+		return entry.value.compare(value)
+	})
+	return pos
+}
+
+// previousGroup returns the position of the first entry of the group of equal values
+// that precedes the given value, or -1 if there is none.
+func (idx *sortIndex) previousGroup(value sortValue) int {
+	pos := idx.groupStart(value)
+	if pos == 0 {
+		return -1
+	}
+	return idx.groupStart(idx.entries[pos-1].value)
+}
+
+// Keys returns all keys in ascending order.
+func (idx *sortIndex) Keys() []string {
+	idx.mutex.RLock()
+	defer idx.mutex.RUnlock()
+
+	keys := make([]string, len(idx.entries))
+	for i, entry := range idx.entries {
+		keys[i] = entry.key
+	}
+	return keys
+}
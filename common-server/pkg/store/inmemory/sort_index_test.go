@@ -0,0 +1,129 @@
+// Copyright 2025 Deutsche Telekom IT GmbH
+//
+// SPDX-License-Identifier: Apache-2.0
+
+package inmemory
+
+import (
+	"fmt"
+	"slices"
+
+	. "github.com/onsi/ginkgo/v2"
+	. "github.com/onsi/gomega"
+	"github.com/tidwall/gjson"
+)
+
+var _ = Describe("Sort Index", func() {
+
+	Context("Sort values", func() {
+
+		It("should compare values of the same type", func() {
+			Expect(newSortValue(gjson.Parse(`1`)).compare(newSortValue(gjson.Parse(`2.5`)))).To(Equal(-1))
+			Expect(newSortValue(gjson.Parse(`"b"`)).compare(newSortValue(gjson.Parse(`"a"`)))).To(Equal(1))
+			Expect(newSortValue(gjson.Parse(`true`)).compare(newSortValue(gjson.Parse(`true`)))).To(Equal(0))
+		})
+
+		It("should sort missing values first", func() {
+			missing := newSortValue(gjson.Get(`{}`, "foo"))
+			Expect(missing.compare(newSortValue(gjson.Parse(`0`)))).To(Equal(-1))
+			Expect(missing.compare(newSortValue(gjson.Parse(`""`)))).To(Equal(-1))
+		})
+
+		It("should order values of different types by type", func() {
+			Expect(newSortValue(gjson.Parse(`100`)).compare(newSortValue(gjson.Parse(`"1"`)))).To(Equal(-1))
+		})
+	})
+
+	Context("Index maintenance", func() {
+
+		It("should walk the keys in order starting at the cursor", func() {
+			idx := newSortIndex("spec.replicas")
+			idx.Set("default/a/", []byte(`{"spec":{"replicas":3}}`))
+			idx.Set("default/b/", []byte(`{"spec":{"replicas":1}}`))
+			idx.Set("default/c/", []byte(`{"spec":{"replicas":2}}`))
+			idx.Set("default/d/", []byte(`{"spec":{}}`))
+
+			walk := func(cursor string, desc bool) []string {
+				keys := []string{}
+				idx.Walk(cursor, desc, func(key string) bool {
+					keys = append(keys, key)
+					return true
+				})
+				return keys
+			}
+
+			Expect(walk("", false)).To(Equal([]string{"default/d/", "default/b/", "default/c/", "default/a/"}))
+			Expect(walk("default/c/", false)).To(Equal([]string{"default/c/", "default/a/"}))
+			Expect(walk("default/c/", true)).To(Equal([]string{"default/c/", "default/b/", "default/d/"}))
+			Expect(walk("default/unknown/", true)).To(HaveLen(4))
+
+			idx.Set("default/b/", []byte(`{"spec":{"replicas":4}}`))
+			idx.Delete("default/a/")
+			Expect(walk("", false)).To(Equal([]string{"default/d/", "default/c/", "default/b/"}))
+			Expect(idx.valueByKey).To(HaveLen(3))
+		})
+
+		It("should break ties by ascending key in both directions", func() {
+			idx := newSortIndex("spec.replicas")
+			expectedAsc := []string{}
+			expectedDesc := []string{}
+			for value := range 3 {
+				group := []string{}
+				for i := range walkChunkSize + 10 {
+					key := fmt.Sprintf("default/%d-%04d/", 2-value, i)
+					idx.Set(key, []byte(fmt.Sprintf(`{"spec":{"replicas":%d}}`, value)))
+					group = append(group, key)
+				}
+				slices.Sort(group)
+				expectedAsc = append(expectedAsc, group...)
+				expectedDesc = append(group, expectedDesc...)
+			}
+
+			walk := func(cursor string, desc bool) []string {
+				keys := []string{}
+				idx.Walk(cursor, desc, func(key string) bool {
+					keys = append(keys, key)
+					return true
+				})
+				return keys
+			}
+
+			Expect(walk("", false)).To(Equal(expectedAsc))
+			Expect(walk("", true)).To(Equal(expectedDesc))
+			Expect(walk(expectedDesc[300], true)).To(Equal(expectedDesc[300:]))
+		})
+
+		It("should walk without holding the lock", func() {
+			idx := newSortIndex("spec.replicas")
+			for i := range 3 * walkChunkSize {
+				idx.Set(fmt.Sprintf("default/%04d/", i), []byte(fmt.Sprintf(`{"spec":{"replicas":%d}}`, i)))
+			}
+
+			for _, desc := range []bool{false, true} {
+				// keys that are added behind the walk are not visited
+				behind := `{"spec":{"replicas":-1}}`
+				if desc {
+					behind = `{"spec":{"replicas":1000000}}`
+				}
+				visited := map[string]int{}
+				idx.Walk("", desc, func(key string) bool {
+					visited[key]++
+					// changes of the index must not wait for the walk
+					idx.Set("default/"+key, []byte(behind))
+					return true
+				})
+				Expect(len(visited)).To(BeNumerically(">=", 3*walkChunkSize))
+				for key, n := range visited {
+					Expect(n).To(Equal(1), key)
+				}
+			}
+
+			keys := []string{}
+			idx.Walk("default/0300/", false, func(key string) bool {
+				keys = append(keys, key)
+				return len(keys) < 2
+			})
+			Expect(keys).To(Equal([]string{"default/0300/", "default/0301/"}))
+		})
+	})
+})
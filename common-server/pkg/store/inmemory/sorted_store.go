@@ -5,23 +5,21 @@
 package inmemory
 
 import (
-	"cmp"
 	"context"
 	"fmt"
 	"slices"
-	"sync"
+	"strings"
 
-	"github.com/bytedance/sonic"
 	"github.com/dgraph-io/badger/v4"
 	"github.com/pkg/errors"
 	"github.com/telekom/controlplane/common-server/internal/informer"
 	"github.com/telekom/controlplane/common-server/pkg/problems"
 	"github.com/telekom/controlplane/common-server/pkg/store"
+	"github.com/telekom/controlplane/common-server/pkg/store/inmemory/filter"
 )
 
 type SortableStore[T store.Object] struct {
 	*InmemoryObjectStore[T]
-	expectedSize int
 }
 
 var _ store.ObjectStore[store.Object] = &InmemoryObjectStore[store.Object]{}
@@ -30,13 +28,12 @@ var _ informer.EventHandler = &InmemoryObjectStore[store.Object]{}
 func Sortable[T store.Object](ios *InmemoryObjectStore[T], storeOpts StoreOpts) store.ObjectStore[T] {
 	ss := &SortableStore[T]{
 		InmemoryObjectStore: ios,
-		expectedSize:        200,
 	}
 
-	ss.allowedSorts = storeOpts.AllowedSorts
-
-	for _, sp := range ss.allowedSorts {
-		ss.sortValueCache.Store(sp, &sync.Map{})
+	// The sort indexes are usually created by NewOrDie before the informer is started
+	if ss.sortIndexes == nil {
+		ss.allowedSorts = storeOpts.AllowedSorts
+		ss.sortIndexes = newSortIndexes(storeOpts.AllowedSorts)
 	}
 
 	return ss
@@ -54,65 +51,39 @@ func (s *SortableStore[T]) List(ctx context.Context, listOpts store.ListOpts) (*
 	return s.InmemoryObjectStore.List(ctx, listOpts)
 }
 
-func (s *SortableStore[T]) getSortValue(path, key string) any {
-	if cache, ok := s.sortValueCache.Load(path); ok {
-		if m, ok := cache.(*sync.Map); ok {
-			if v, ok := m.Load(key); ok {
-				return v
-			}
-		}
-	}
-	return nil
-}
+// walkSorted calls fn for every key in the order defined by the sorters, starting at the cursor.
+// A single sorter is served directly from its sort index. Multiple sorters require sorting
+// the keys, which is still done without reading any values.
+func (s *SortableStore[T]) walkSorted(listOpts store.ListOpts, fn func(key string) bool) {
+	sorters := listOpts.Sorters
+	primary := s.sortIndexes[sorters[0].Path]
 
-func (s *SortableStore[T]) listSorted(_ context.Context, listOpts store.ListOpts) (result *store.ListResponse[T], err error) {
-	for _, sorter := range listOpts.Sorters {
-		if !slices.Contains(s.allowedSorts, sorter.Path) {
-			return nil, problems.BadRequest(fmt.Sprintf("sort path %s is not allowed", sorter.Path))
-		}
+	if len(sorters) == 1 {
+		primary.Walk(listOpts.Cursor, sorters[0].Order == store.SortOrderDesc, fn)
+		return
 	}
 
 	type sortedItem struct {
 		key        string
-		data       []byte
-		sortValues []any
+		sortValues []sortValue
 	}
 
-	opts := badger.DefaultIteratorOptions
-	opts.Prefix = []byte(listOpts.Prefix)
-	opts.PrefetchValues = true
-	items := make([]sortedItem, 0, s.expectedSize)
-
-	err = s.db.View(func(txn *badger.Txn) error {
-		it := txn.NewIterator(opts)
-		defer it.Close()
-		for it.Rewind(); it.ValidForPrefix(opts.Prefix); it.Next() {
-			key := string(it.Item().Key())
-
-			data, err := it.Item().ValueCopy(nil)
-			if err != nil {
-				return errors.Wrap(err, "failed to get value")
-			}
-
-			sortValues := make([]any, len(listOpts.Sorters))
-			for i, sorter := range listOpts.Sorters {
-				sortValues[i] = s.getSortValue(sorter.Path, key)
-			}
-			items = append(items, sortedItem{key: key, data: data, sortValues: sortValues})
+	keys := primary.Keys()
+	items := make([]sortedItem, 0, len(keys))
+	for _, key := range keys {
+		if !strings.HasPrefix(key, listOpts.Prefix) {
+			continue
 		}
-		return nil
-	})
-	if err != nil {
-		return nil, err
+		sortValues := make([]sortValue, len(sorters))
+		for i, sorter := range sorters {
+			sortValues[i], _ = s.sortIndexes[sorter.Path].Value(key)
+		}
+		items = append(items, sortedItem{key: key, sortValues: sortValues})
 	}
 
-	// Save the size of the last list to use it as a hint for the next list
-	s.expectedSize = len(items)
-
-	sorters := listOpts.Sorters
 	slices.SortStableFunc(items, func(a, b sortedItem) int {
 		for i := range sorters {
-			cmp := compareAny(a.sortValues[i], b.sortValues[i])
+			cmp := a.sortValues[i].compare(b.sortValues[i])
 			if cmp != 0 {
 				if sorters[i].Order == store.SortOrderDesc {
 					return -cmp
@@ -125,70 +96,89 @@ func (s *SortableStore[T]) listSorted(_ context.Context, listOpts store.ListOpts
 
 	start := 0
 	if listOpts.Cursor != "" {
-		for idx, item := range items {
-			if item.key == listOpts.Cursor {
-				start = idx
-				break
-			}
+		start = max(0, slices.IndexFunc(items, func(item sortedItem) bool {
+			return item.key == listOpts.Cursor
+		}))
+	}
+	for _, item := range items[start:] {
+		if !fn(item.key) {
+			return
 		}
 	}
-	end := min(start+listOpts.Limit, len(items))
+}
 
+func (s *SortableStore[T]) listSorted(_ context.Context, listOpts store.ListOpts) (result *store.ListResponse[T], err error) {
 	result = &store.ListResponse[T]{
-		Items: make([]T, end-start),
+		Items: make([]T, 0, listOpts.Limit),
 	}
-
-	s.log.V(1).Info("list sorted", "start", start, "end", end, "size", len(items))
-	for i, item := range items[start:end] {
-		err := sonic.Unmarshal(item.data, &result.Items[i])
-		if err != nil {
-			return nil, errors.Wrap(err, "invalid object")
-		}
-		if result.Links.Self == "" {
-			result.Links.Self = item.key
-		}
-	}
-	if end < len(items) {
-		result.Links.Next = items[end].key
-	} else {
-		result.Links.Next = ""
+	result.Links, err = s.scanSorted(listOpts, s.collect(&result.Items))
+	if err != nil {
+		return nil, err
 	}
+
+	s.log.V(1).Info("list sorted", "size", len(result.Items), "next", result.Links.Next)
 	return result, nil
 }
 
-func compareAny(a, b any) int {
-	if a == nil && b == nil {
-		return 0
-	}
-	if a == nil {
-		return -1
+// ListRaw calls fn with the stored JSON of every object of the page, in the order defined by the sorters.
+func (s *SortableStore[T]) ListRaw(ctx context.Context, listOpts store.ListOpts, fn func(obj []byte) error) (store.ListResponseLinks, error) {
+	if len(listOpts.Sorters) > 0 {
+		return s.scanSorted(listOpts, func(_ string, val []byte) error {
+			return fn(val)
+		})
 	}
-	if b == nil {
-		return 1
-	}
-	switch aVal := a.(type) {
-	case string:
-		bVal, ok := b.(string)
-		if !ok {
-			break
-		}
-		return cmp.Compare(aVal, bVal)
-	case int:
-		bVal, ok := b.(int)
-		if !ok {
-			break
-		}
-		return cmp.Compare(aVal, bVal)
-	case float64:
-		bVal, ok := b.(float64)
-		if !ok {
-			break
+	return s.InmemoryObjectStore.ListRaw(ctx, listOpts, fn)
+}
+
+// scanSorted is like scan, but visits the objects in the order defined by the sorters.
+func (s *SortableStore[T]) scanSorted(listOpts store.ListOpts, visit func(key string, val []byte) error) (links store.ListResponseLinks, err error) {
+	for _, sorter := range listOpts.Sorters {
+		if !slices.Contains(s.allowedSorts, sorter.Path) {
+			return links, problems.BadRequest(fmt.Sprintf("sort path %s is not allowed", sorter.Path))
 		}
-		return cmp.Compare(aVal, bVal)
 	}
 
-	// fallback
-	aStr := fmt.Sprint(a)
-	bStr := fmt.Sprint(b)
-	return cmp.Compare(aStr, bStr)
+	filterFunc := filter.NopFilter
+	if len(listOpts.Filters) > 0 {
+		filterFunc = filter.NewFilterFuncs(listOpts.Filters)
+	}
+
+	count := 0
+	err = s.db.View(func(txn *badger.Txn) error {
+		var walkErr error
+		s.walkSorted(listOpts, func(key string) bool {
+			if !strings.HasPrefix(key, listOpts.Prefix) {
+				return true
+			}
+			if count >= listOpts.Limit {
+				links.Next = key
+				return false
+			}
+
+			item, err := txn.Get([]byte(key))
+			if err != nil {
+				if err == badger.ErrKeyNotFound {
+					// deleted after the index lookup
+					return true
+				}
+				walkErr = errors.Wrapf(err, "failed to get item %s", key)
+				return false
+			}
+
+			walkErr = item.Value(func(val []byte) error {
+				if !filterFunc(val) {
+					return nil
+				}
+				if links.Self == "" {
+					links.Self = key
+				}
+				count++
+				return visit(key, val)
+			})
+			return walkErr == nil
+		})
+		return walkErr
+	})
+
+	return links, err
 }
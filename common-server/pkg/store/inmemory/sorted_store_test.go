@@ -127,6 +127,137 @@ var _ = Describe("Sorted Store", func() {
 
 		})
 
+		It("Should page through all items using the cursor", func() {
+			for _, order := range []store.SortOrder{store.SortOrderAsc, store.SortOrderDesc} {
+				listOpts := store.ListOpts{
+					Limit: 100,
+					Sorters: []store.Sorter{
+						{
+							Path:  "spec.replicas",
+							Order: order,
+						},
+					},
+				}
+
+				seen := map[string]struct{}{}
+				var prev int64 = -1
+				for page := 0; ; page++ {
+					Expect(page).To(BeNumerically("<", 11))
+					list, err := sortedStore.List(ctx, listOpts)
+					Expect(err).ToNot(HaveOccurred())
+
+					for _, item := range list.Items {
+						replicas, _, _ := unstructured.NestedInt64(item.Object, "spec", "replicas")
+						if prev >= 0 && order == store.SortOrderAsc {
+							Expect(replicas).To(BeNumerically(">=", prev))
+						}
+						if prev >= 0 && order == store.SortOrderDesc {
+							Expect(replicas).To(BeNumerically("<=", prev))
+						}
+						prev = replicas
+						Expect(seen).ToNot(HaveKey(item.GetName()))
+						seen[item.GetName()] = struct{}{}
+					}
+
+					if list.Links.Next == "" {
+						break
+					}
+					listOpts.Cursor = list.Links.Next
+				}
+				Expect(seen).To(HaveLen(1000))
+			}
+		})
+
+		It("Should apply prefix and filters", func() {
+			orderedList, err := sortedStore.List(ctx, store.ListOpts{
+				Limit:  100,
+				Prefix: "default/foo9",
+				Filters: []store.Filter{
+					{
+						Path:  "metadata.labels.app",
+						Op:    store.OpRegex,
+						Value: "^app9[0-9]{2}$",
+					},
+				},
+				Sorters: []store.Sorter{
+					{
+						Path:  "metadata.name",
+						Order: store.SortOrderDesc,
+					},
+				},
+			})
+
+			Expect(err).ToNot(HaveOccurred())
+			Expect(orderedList.Items).To(HaveLen(100))
+			Expect(orderedList.Items[0].GetName()).To(Equal("foo999"))
+			Expect(orderedList.Items[99].GetName()).To(Equal("foo900"))
+		})
+
+		It("Should order by multiple sorters", func() {
+			orderedList, err := sortedStore.List(ctx, store.ListOpts{
+				Limit: 1000,
+				Sorters: []store.Sorter{
+					{
+						Path:  "spec.replicas",
+						Order: store.SortOrderAsc,
+					},
+					{
+						Path:  "metadata.name",
+						Order: store.SortOrderDesc,
+					},
+				},
+			})
+
+			Expect(err).ToNot(HaveOccurred())
+			Expect(orderedList.Items).To(HaveLen(1000))
+
+			for i := 1; i < len(orderedList.Items); i++ {
+				prevReplicas, _, _ := unstructured.NestedInt64(orderedList.Items[i-1].Object, "spec", "replicas")
+				currReplicas, _, _ := unstructured.NestedInt64(orderedList.Items[i].Object, "spec", "replicas")
+				Expect(prevReplicas <= currReplicas).To(BeTrue())
+				if prevReplicas == currReplicas {
+					Expect(orderedList.Items[i-1].GetName() > orderedList.Items[i].GetName()).To(BeTrue())
+				}
+			}
+		})
+
+		It("Should keep the order up to date", func() {
+			u := NewUnstructured("foo1")
+			Expect(unstructured.SetNestedField(u.Object, int64(1000), "spec", "replicas")).To(Succeed())
+			Expect(sortedStore.OnUpdate(ctx, u)).To(Succeed())
+
+			listOpts := store.ListOpts{
+				Limit: 1,
+				Sorters: []store.Sorter{
+					{
+						Path:  "spec.replicas",
+						Order: store.SortOrderDesc,
+					},
+				},
+			}
+			orderedList, err := sortedStore.List(ctx, listOpts)
+			Expect(err).ToNot(HaveOccurred())
+			Expect(orderedList.Items[0].GetName()).To(Equal("foo1"))
+
+			Expect(sortedStore.OnDelete(ctx, u)).To(Succeed())
+			orderedList, err = sortedStore.List(ctx, listOpts)
+			Expect(err).ToNot(HaveOccurred())
+			Expect(orderedList.Items[0].GetName()).ToNot(Equal("foo1"))
+		})
+
+		It("Should reject unknown sort paths", func() {
+			_, err := sortedStore.List(ctx, store.ListOpts{
+				Limit: 100,
+				Sorters: []store.Sorter{
+					{
+						Path:  "spec.unknown",
+						Order: store.SortOrderAsc,
+					},
+				},
+			})
+			Expect(err).To(HaveOccurred())
+		})
+
 	})
 })
 
@@ -162,3 +293,42 @@ func BenchmarkStore(b *testing.B) {
 	}
 
 }
+
+func BenchmarkSortedDeepPage(b *testing.B) {
+	ctx := context.Background()
+
+	s := Sortable(
+		&InmemoryObjectStore[*unstructured.Unstructured]{
+			ctx: ctx,
+			db:  newDbOrDie(StoreOpts{}, logr.Discard()),
+			log: logr.Discard(),
+		},
+		StoreOpts{
+			AllowedSorts: []string{"spec.timeout"},
+		},
+	).(*SortableStore[*unstructured.Unstructured])
+
+	for i := 0; i < 10_000; i++ {
+		_ = s.OnUpdate(ctx, NewUnstructured(fmt.Sprintf("item-%d", i)))
+	}
+	keys := s.sortIndexes["spec.timeout"].Keys()
+
+	for _, position := range []int{0, 5_000, 9_900} {
+		listOpts := store.ListOpts{
+			Limit:  100,
+			Cursor: keys[position],
+			Sorters: []store.Sorter{
+				{
+					Path:  "spec.timeout",
+					Order: store.SortOrderAsc,
+				},
+			},
+		}
+		b.Run(fmt.Sprintf("position=%d", position), func(b *testing.B) {
+			b.ReportAllocs()
+			for i := 0; i < b.N; i++ {
+				_, _ = s.List(ctx, listOpts)
+			}
+		})
+	}
+}
@@ -0,0 +1,191 @@
+// Copyright 2025 Deutsche Telekom IT GmbH
+//
+// SPDX-License-Identifier: Apache-2.0
+
+package inmemory
+
+import (
+	"context"
+	"os"
+	"strings"
+	"time"
+
+	"github.com/dgraph-io/badger/v4"
+	"github.com/pkg/errors"
+	"github.com/telekom/controlplane/common-server/internal/informer"
+	"github.com/tidwall/gjson"
+	"k8s.io/apimachinery/pkg/types"
+)
+
+const checkpointInterval = 30 * time.Second
+
+// warmStart prepares the store to serve the objects of the database on disk.
+// It rebuilds the derived state and lets the informer resume watching from
+// the last checkpoint instead of listing all objects.
+func (s *InmemoryObjectStore[T]) warmStart(path string, staleReady bool) error {
+	count, err := s.restore()
+	if err != nil {
+		return err
+	}
+	s.staleReady = staleReady && count > 0
+	s.checkpointFile = path + ".rv"
+
+	resourceVersion, err := readCheckpoint(s.checkpointFile)
+	if err != nil {
+		return err
+	}
+	s.log.Info("restored objects from disk", "count", count, "resourceVersion", resourceVersion, "staleReady", s.staleReady)
+
+	if resumable, ok := s.informer.(informer.Resumable); ok && resourceVersion != "" {
+		resumable.Resume(resourceVersion)
+		s.checkpointed = resourceVersion
+	}
+	return nil
+}
+
+// restore rebuilds the derived state from the objects stored in the database.
+func (s *InmemoryObjectStore[T]) restore() (count int, err error) {
+	restored := make(map[string]struct{})
+	err = s.db.View(func(txn *badger.Txn) error {
+		it := txn.NewIterator(badger.DefaultIteratorOptions)
+		defer it.Close()
+
+		for it.Rewind(); it.Valid(); it.Next() {
+			key := string(it.Item().Key())
+			value, err := it.Item().ValueCopy(nil)
+			if err != nil {
+				return errors.Wrapf(err, "failed to read item %s", key)
+			}
+			s.afterSet(key, gjson.GetBytes(value, "metadata.resourceVersion").String(), value)
+			restored[key] = struct{}{}
+			count++
+		}
+		return nil
+	})
+
+	s.restoredMutex.Lock()
+	s.restored = restored
+	s.restoredMutex.Unlock()
+	return count, err
+}
+
+// forgetRestored marks the object with the given key as written after the restore.
+func (s *InmemoryObjectStore[T]) forgetRestored(key string) {
+	s.restoredMutex.Lock()
+	defer s.restoredMutex.Unlock()
+	delete(s.restored, key)
+}
+
+// isRestored returns true if the object with the given key was restored from disk
+// and not written since.
+func (s *InmemoryObjectStore[T]) isRestored(key string) bool {
+	s.restoredMutex.Lock()
+	defer s.restoredMutex.Unlock()
+	_, ok := s.restored[key]
+	return ok
+}
+
+// OnListDone removes all objects restored from disk that are not part of the full list.
+// These objects were deleted while no watch was active. Objects that were written
+// after the restore are kept, as they may have been added after the list was taken.
+// The full list also repairs the events that could not be written, so checkpoints
+// are written again.
+func (s *InmemoryObjectStore[T]) OnListDone(ctx context.Context, listed map[types.NamespacedName]struct{}) error {
+	keys := make(map[string]struct{}, len(listed))
+	for name := range listed {
+		keys[newKey(name.Namespace, name.Name)] = struct{}{}
+	}
+
+	s.restoredMutex.Lock()
+	candidates := make([]string, 0, len(s.restored))
+	for key := range s.restored {
+		if _, ok := keys[key]; !ok {
+			candidates = append(candidates, key)
+		}
+	}
+	s.restoredMutex.Unlock()
+
+	removed := 0
+	for _, key := range candidates {
+		if !s.isRestored(key) {
+			continue
+		}
+		if err := s.remove(key); err != nil {
+			return errors.Wrapf(err, "failed to remove %s", key)
+		}
+		removed++
+	}
+	if removed > 0 {
+		s.log.Info("removed objects that no longer exist", "count", removed)
+	}
+	s.writeFailed.Store(false)
+	return nil
+}
+
+// checkpoint persists the resourceVersion up to which all events are stored.
+// After a failed write, the last checkpoint is kept until all objects were listed again.
+func (s *InmemoryObjectStore[T]) checkpoint() error {
+	resumable, ok := s.informer.(informer.Resumable)
+	if !ok {
+		return nil
+	}
+	if s.writeFailed.Load() {
+		s.log.V(1).Info("skipping checkpoint until all objects were listed again", "checkpointed", s.checkpointed)
+		return nil
+	}
+	resourceVersion, ok := resumable.Checkpoint()
+	if !ok || resourceVersion == s.checkpointed {
+		return nil
+	}
+
+	if err := s.ingester.Flush(); err != nil {
+		return errors.Wrap(err, "failed to flush pending events")
+	}
+	if s.writeFailed.Load() {
+		return nil
+	}
+	if err := s.db.Sync(); err != nil {
+		return errors.Wrap(err, "failed to sync database")
+	}
+	if err := writeCheckpoint(s.checkpointFile, resourceVersion); err != nil {
+		return err
+	}
+	s.checkpointed = resourceVersion
+	return nil
+}
+
+// runCheckpoints periodically persists the resourceVersion until the context is done.
+func (s *InmemoryObjectStore[T]) runCheckpoints(ctx context.Context) {
+	ticker := time.NewTicker(checkpointInterval)
+	defer ticker.Stop()
+	for {
+		select {
+		case <-ticker.C:
+		case <-ctx.Done():
+			return
+		}
+		if err := s.checkpoint(); err != nil {
+			s.log.Error(err, "failed to write checkpoint")
+		}
+	}
+}
+
+func readCheckpoint(file string) (string, error) {
+	data, err := os.ReadFile(file)
+	if err != nil {
+		if os.IsNotExist(err) {
+			return "", nil
+		}
+		return "", errors.Wrap(err, "failed to read checkpoint")
+	}
+	return strings.TrimSpace(string(data)), nil
+}
+
+// writeCheckpoint atomically replaces the checkpoint file.
+func writeCheckpoint(file, resourceVersion string) error {
+	tmp := file + ".tmp"
+	if err := os.WriteFile(tmp, []byte(resourceVersion), 0o600); err != nil {
+		return errors.Wrap(err, "failed to write checkpoint")
+	}
+	return errors.Wrap(os.Rename(tmp, file), "failed to write checkpoint")
+}
@@ -0,0 +1,162 @@
+// Copyright 2025 Deutsche Telekom IT GmbH
+//
+// SPDX-License-Identifier: Apache-2.0
+
+package inmemory
+
+import (
+	"context"
+
+	"github.com/go-logr/logr"
+	. "github.com/onsi/ginkgo/v2"
+	. "github.com/onsi/gomega"
+	"github.com/telekom/controlplane/common-server/internal/informer"
+	"github.com/telekom/controlplane/common-server/pkg/store"
+	"k8s.io/apimachinery/pkg/apis/meta/v1/unstructured"
+	"k8s.io/apimachinery/pkg/runtime/schema"
+	"k8s.io/apimachinery/pkg/types"
+)
+
+var _ informer.Resumable = &fakeResumableInformer{}
+
+type fakeResumableInformer struct {
+	ready      bool
+	resumed    string
+	checkpoint string
+}
+
+func (f *fakeResumableInformer) Start() error { return nil }
+
+func (f *fakeResumableInformer) Ready() bool { return f.ready }
+
+func (f *fakeResumableInformer) Resume(resourceVersion string) { f.resumed = resourceVersion }
+
+func (f *fakeResumableInformer) Checkpoint() (string, bool) {
+	return f.checkpoint, f.checkpoint != ""
+}
+
+func newDiskTestStore(opts StoreOpts, inf informer.Informer) *InmemoryObjectStore[*unstructured.Unstructured] {
+	return &InmemoryObjectStore[*unstructured.Unstructured]{
+		ctx:      context.Background(),
+		db:       newDbOrDie(opts, logr.Discard()),
+		log:      logr.Discard(),
+		informer: inf,
+		versions: newVersionTracker(),
+		indexes:  newSecondaryIndexes([]string{"spec.team"}),
+	}
+}
+
+var _ = Describe("Warm Start", func() {
+
+	ctx := context.Background()
+	var opts StoreOpts
+
+	BeforeEach(func() {
+		opts = StoreOpts{
+			GVR:      schema.GroupVersionResource{Group: "testgroup", Version: "v1", Resource: "testobjects"},
+			Database: DatabaseOpts{Filepath: GinkgoT().TempDir()},
+		}
+	})
+
+	It("should serve the objects of the previous run", func() {
+		previous := newDiskTestStore(opts, &fakeResumableInformer{})
+		Expect(previous.OnUpdate(ctx, newTeamUnstructured("foo", "team1"))).To(Succeed())
+		Expect(previous.OnUpdate(ctx, newTeamUnstructured("bar", "team2"))).To(Succeed())
+		Expect(previous.db.Close()).To(Succeed())
+
+		objStore := newDiskTestStore(opts, &fakeResumableInformer{})
+		Expect(objStore.warmStart(databasePath(opts), true)).To(Succeed())
+		Expect(objStore.Ready()).To(BeTrue())
+
+		listOpts := store.NewListOpts()
+		listOpts.Filters = []store.Filter{{Path: "spec.team", Op: store.OpEqual, Value: "team1"}}
+		list, err := objStore.List(ctx, listOpts)
+		Expect(err).ToNot(HaveOccurred())
+		Expect(list.Items).To(HaveLen(1))
+		Expect(list.Items[0].GetName()).To(Equal("foo"))
+		Expect(objStore.versions.Unchanged("default/foo/", "476170914")).To(BeTrue())
+	})
+
+	It("should not be stale-ready without objects", func() {
+		objStore := newDiskTestStore(opts, &fakeResumableInformer{})
+		Expect(objStore.warmStart(databasePath(opts), true)).To(Succeed())
+		Expect(objStore.Ready()).To(BeFalse())
+	})
+
+	It("should resume from the last checkpoint", func() {
+		previousInformer := &fakeResumableInformer{checkpoint: "100"}
+		previous := newDiskTestStore(opts, previousInformer)
+		Expect(previous.warmStart(databasePath(opts), false)).To(Succeed())
+		Expect(previous.OnUpdate(ctx, NewUnstructured("foo"))).To(Succeed())
+		Expect(previous.checkpoint()).To(Succeed())
+		Expect(previous.db.Close()).To(Succeed())
+
+		inf := &fakeResumableInformer{}
+		objStore := newDiskTestStore(opts, inf)
+		Expect(objStore.warmStart(databasePath(opts), false)).To(Succeed())
+		Expect(inf.resumed).To(Equal("100"))
+		Expect(objStore.Ready()).To(BeFalse())
+	})
+
+	It("should not checkpoint after a failed write until all objects were listed", func() {
+		inf := &fakeResumableInformer{checkpoint: "100"}
+		objStore := newDiskTestStore(opts, inf)
+		Expect(objStore.warmStart(databasePath(opts), false)).To(Succeed())
+		Expect(objStore.checkpoint()).To(Succeed())
+
+		Expect(objStore.db.Close()).To(Succeed())
+		Expect(objStore.OnUpdate(ctx, NewUnstructured("foo"))).ToNot(Succeed())
+		objStore.db = newDbOrDie(opts, logr.Discard())
+		DeferCleanup(objStore.db.Close)
+
+		inf.checkpoint = "101"
+		Expect(objStore.checkpoint()).To(Succeed())
+		Expect(readCheckpoint(objStore.checkpointFile)).To(Equal("100"))
+
+		Expect(objStore.OnListDone(ctx, map[types.NamespacedName]struct{}{})).To(Succeed())
+		Expect(objStore.checkpoint()).To(Succeed())
+		Expect(readCheckpoint(objStore.checkpointFile)).To(Equal("101"))
+	})
+
+	It("should remove restored objects that are not listed", func() {
+		previous := newDiskTestStore(opts, &fakeResumableInformer{})
+		Expect(previous.OnUpdate(ctx, newTeamUnstructured("foo", "team1"))).To(Succeed())
+		Expect(previous.OnUpdate(ctx, newTeamUnstructured("bar", "team1"))).To(Succeed())
+		Expect(previous.db.Close()).To(Succeed())
+
+		objStore := newDiskTestStore(opts, &fakeResumableInformer{})
+		Expect(objStore.warmStart(databasePath(opts), false)).To(Succeed())
+
+		Expect(objStore.OnListDone(ctx, map[types.NamespacedName]struct{}{
+			{Namespace: "default", Name: "foo"}: {},
+		})).To(Succeed())
+
+		list, err := objStore.List(ctx, store.NewListOpts())
+		Expect(err).ToNot(HaveOccurred())
+		Expect(list.Items).To(HaveLen(1))
+		Expect(list.Items[0].GetName()).To(Equal("foo"))
+		Expect(objStore.indexes["spec.team"].Equal("team1")).To(HaveLen(1))
+	})
+
+	It("should keep objects that were written after the list", func() {
+		previous := newDiskTestStore(opts, &fakeResumableInformer{})
+		Expect(previous.OnUpdate(ctx, newTeamUnstructured("foo", "team1"))).To(Succeed())
+		Expect(previous.db.Close()).To(Succeed())
+
+		objStore := newDiskTestStore(opts, &fakeResumableInformer{})
+		Expect(objStore.warmStart(databasePath(opts), false)).To(Succeed())
+
+		// the list was taken before both objects were added again
+		listed := map[types.NamespacedName]struct{}{}
+		foo := newTeamUnstructured("foo", "team2")
+		foo.SetResourceVersion("476170915")
+		Expect(objStore.OnUpdate(ctx, foo)).To(Succeed())
+		Expect(objStore.OnUpdate(ctx, newTeamUnstructured("bar", "team1"))).To(Succeed())
+
+		Expect(objStore.OnListDone(ctx, listed)).To(Succeed())
+
+		list, err := objStore.List(ctx, store.NewListOpts())
+		Expect(err).ToNot(HaveOccurred())
+		Expect(list.Items).To(HaveLen(2))
+	})
+})
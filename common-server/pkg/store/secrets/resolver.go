@@ -8,6 +8,7 @@ import (
 	"context"
 	"encoding/json"
 	"fmt"
+	"slices"
 	"strings"
 
 	"github.com/go-logr/logr"
@@ -18,7 +19,7 @@ import (
 	"k8s.io/apimachinery/pkg/apis/meta/v1/unstructured"
 )
 
-var _ Replacer = &SecretManagerResolver{}
+var _ ScopedReplacer = &SecretManagerResolver{}
 
 type SecretManagerResolver struct {
 	M secrets.SecretsApi
@@ -37,6 +38,29 @@ func NewDefaultSecretManagerResolver() *SecretManagerResolver {
 }
 
 func (s *SecretManagerResolver) ReplaceAll(ctx context.Context, obj any, jsonPaths []string) (any, error) {
+	return s.replaceAll(ctx, obj, jsonPaths, resolveCache{})
+}
+
+// Scoped returns a Replacer that shares resolved secret values between all of its calls.
+// It must only be used for the duration of a single request, like replacing the secrets
+// of all items of a list. It is not safe for concurrent use.
+func (s *SecretManagerResolver) Scoped() Replacer {
+	return &scopedResolver{resolver: s, cache: resolveCache{}}
+}
+
+// resolveCache maps secret references to their resolved values.
+type resolveCache map[string]string
+
+type scopedResolver struct {
+	resolver *SecretManagerResolver
+	cache    resolveCache
+}
+
+func (s *scopedResolver) ReplaceAll(ctx context.Context, obj any, jsonPaths []string) (any, error) {
+	return s.resolver.replaceAll(ctx, obj, jsonPaths, s.cache)
+}
+
+func (s *SecretManagerResolver) replaceAll(ctx context.Context, obj any, jsonPaths []string, cache resolveCache) (any, error) {
 	log := logr.FromContextOrDiscard(ctx)
 	if obj == nil {
 		return nil, nil
@@ -47,11 +71,11 @@ func (s *SecretManagerResolver) ReplaceAll(ctx context.Context, obj any, jsonPat
 
 	b, ok := obj.([]byte)
 	if ok {
-		return s.ReplaceAllFromBytes(ctx, b, jsonPaths)
+		return s.replaceAllFromBytes(ctx, b, jsonPaths, cache)
 	}
 	str, ok := obj.(string)
 	if ok {
-		b, err := s.ReplaceAllFromBytes(ctx, []byte(str), jsonPaths)
+		b, err := s.replaceAllFromBytes(ctx, []byte(str), jsonPaths, cache)
 		if b != nil {
 			return string(b), err
 		}
@@ -59,12 +83,12 @@ func (s *SecretManagerResolver) ReplaceAll(ctx context.Context, obj any, jsonPat
 	}
 	m, ok := obj.(map[string]any)
 	if ok {
-		return s.ReplaceAllFromMap(ctx, m, jsonPaths)
+		return s.replaceAllFromMap(ctx, m, jsonPaths, cache)
 	}
 
 	u, ok := obj.(*unstructured.Unstructured)
 	if ok {
-		m, err := s.ReplaceAllFromMap(ctx, u.UnstructuredContent(), jsonPaths)
+		m, err := s.replaceAllFromMap(ctx, u.UnstructuredContent(), jsonPaths, cache)
 		if err != nil {
 			return nil, errors.Wrap(err, "failed to replace all from unstructured")
 		}
@@ -76,7 +100,7 @@ func (s *SecretManagerResolver) ReplaceAll(ctx context.Context, obj any, jsonPat
 	if err == nil {
 		log.V(1).Info("Replacing secrets in object", "type", fmt.Sprintf("%T", obj))
 
-		b, err = s.ReplaceAllFromBytes(ctx, b, jsonPaths)
+		b, err = s.replaceAllFromBytes(ctx, b, jsonPaths, cache)
 		if err != nil {
 			return nil, errors.Wrap(err, "failed to replace all from json")
 		}
@@ -91,7 +115,43 @@ func (s *SecretManagerResolver) ReplaceAll(ctx context.Context, obj any, jsonPat
 	return nil, fmt.Errorf("unsupported type %T", obj)
 }
 
+// placeholder is a secret reference found at a json path.
+type placeholder struct {
+	jsonPath  string
+	secretRef string
+}
+
 func (s *SecretManagerResolver) ReplaceAllFromBytes(ctx context.Context, b []byte, jsonPaths []string) ([]byte, error) {
+	return s.replaceAllFromBytes(ctx, b, jsonPaths, resolveCache{})
+}
+
+func (s *SecretManagerResolver) replaceAllFromBytes(ctx context.Context, b []byte, jsonPaths []string, cache resolveCache) ([]byte, error) {
+	log := logr.FromContextOrDiscard(ctx)
+	placeholders, err := collectFromBytes(ctx, b, jsonPaths, nil)
+	if err != nil {
+		return nil, err
+	}
+	if len(placeholders) == 0 {
+		return b, nil
+	}
+	if err := s.resolve(ctx, placeholders, cache); err != nil {
+		return nil, err
+	}
+
+	for _, p := range placeholders {
+		b, err = sjson.SetBytes(b, p.jsonPath, cache[p.secretRef])
+		if err != nil {
+			return nil, errors.Wrap(err, "failed to set secret value")
+		}
+		log.V(1).Info("Replaced secret", "jsonPath", p.jsonPath, "secretRef", p.secretRef)
+	}
+
+	return b, nil
+}
+
+// collectFromBytes appends all secret placeholders found at the given json paths.
+// Paths that select arrays are expanded to the paths of their elements.
+func collectFromBytes(ctx context.Context, b []byte, jsonPaths []string, placeholders []placeholder) ([]placeholder, error) {
 	log := logr.FromContextOrDiscard(ctx)
 	for _, jsonPath := range jsonPaths {
 		result := gjson.GetBytes(b, jsonPath)
@@ -104,8 +164,8 @@ func (s *SecretManagerResolver) ReplaceAllFromBytes(ctx context.Context, b []byt
 			if len(paths) == 0 {
 				continue
 			}
-			log.V(1).Info("Replacing secrets in array", "jsonPath", paths)
-			b, err = s.ReplaceAllFromBytes(ctx, b, paths)
+			log.V(1).Info("Collecting secrets in array", "jsonPath", paths)
+			placeholders, err = collectFromBytes(ctx, b, paths, placeholders)
 			if err != nil {
 				return nil, errors.Wrapf(err, "failed to replace all from bytes for json path %q", jsonPath)
 			}
@@ -115,57 +175,52 @@ func (s *SecretManagerResolver) ReplaceAllFromBytes(ctx context.Context, b []byt
 			return nil, errors.New("object not supported")
 		}
 
-		possibleSecret := result.String()
-		secretRef, ok := secrets.FromRef(possibleSecret)
+		secretRef, ok := secrets.FromRef(result.String())
 		if !ok {
 			log.V(1).Info("Secret is not a placeholder, skipping ...")
 			continue
 		}
-		log.V(1).Info("Replacing secret", "jsonPath", jsonPath, "secretRef", secretRef)
-		secretValue, err := s.M.Get(ctx, secretRef)
-		if err != nil {
-			return nil, errors.Wrapf(err, "failed to get secret value for reference %q", secretRef)
-		}
-
-		b, err = sjson.SetBytes(b, jsonPath, secretValue)
-		if err != nil {
-			return nil, errors.Wrap(err, "failed to set secret value")
-		}
-		log.V(1).Info("Replaced secret", "jsonPath", jsonPath, "secretValue", secretValue)
+		placeholders = append(placeholders, placeholder{jsonPath: jsonPath, secretRef: secretRef})
 	}
-
-	return b, nil
+	return placeholders, nil
 }
 
 func (s *SecretManagerResolver) ReplaceAllFromMap(ctx context.Context, m map[string]any, jsonPaths []string) (map[string]any, error) {
+	return s.replaceAllFromMap(ctx, m, jsonPaths, resolveCache{})
+}
+
+func (s *SecretManagerResolver) replaceAllFromMap(ctx context.Context, m map[string]any, jsonPaths []string, cache resolveCache) (map[string]any, error) {
 	log := logr.FromContextOrDiscard(ctx)
+	placeholders := make([]placeholder, 0, len(jsonPaths))
 	for _, jsonPath := range jsonPaths {
 		// TODO: refactor this to support arrays
 		if strings.Contains(jsonPath, "#") {
 			return nil, errors.New("arrays are not supported when using maps")
 		}
 
-		parts := strings.Split(jsonPath, ".")
-
-		result, ok, err := unstructured.NestedString(m, parts...)
+		result, ok, err := unstructured.NestedString(m, strings.Split(jsonPath, ".")...)
 		if err != nil {
 			return nil, errors.Wrap(err, "failed to get json path")
 		}
 		if !ok || result == "" {
 			continue
 		}
-		possibleSecret := result
-		secretRef, ok := secrets.FromRef(possibleSecret)
+		secretRef, ok := secrets.FromRef(result)
 		if !ok {
 			log.V(1).Info("Secret is not a placeholder, skipping ...")
 			continue
 		}
-		secretValue, err := s.M.Get(ctx, secretRef)
-		if err != nil {
-			return nil, errors.Wrap(err, "failed to get secret value")
-		}
+		placeholders = append(placeholders, placeholder{jsonPath: jsonPath, secretRef: secretRef})
+	}
+	if len(placeholders) == 0 {
+		return m, nil
+	}
+	if err := s.resolve(ctx, placeholders, cache); err != nil {
+		return nil, err
+	}
 
-		err = unstructured.SetNestedField(m, secretValue, parts...)
+	for _, p := range placeholders {
+		err := unstructured.SetNestedField(m, cache[p.secretRef], strings.Split(p.jsonPath, ".")...)
 		if err != nil {
 			return nil, errors.Wrap(err, "failed to set secret value")
 		}
@@ -173,3 +228,42 @@ func (s *SecretManagerResolver) ReplaceAllFromMap(ctx context.Context, m map[str
 
 	return m, nil
 }
+
+// resolve fetches the values of all placeholders that are not cached yet and adds them to the cache.
+// Every secret reference is only fetched once. A single reference is fetched with Get,
+// multiple references are fetched with a single GetMany.
+func (s *SecretManagerResolver) resolve(ctx context.Context, placeholders []placeholder, cache resolveCache) error {
+	var secretRefs []string
+	for _, p := range placeholders {
+		if _, ok := cache[p.secretRef]; ok || slices.Contains(secretRefs, p.secretRef) {
+			continue
+		}
+		secretRefs = append(secretRefs, p.secretRef)
+	}
+
+	switch len(secretRefs) {
+	case 0:
+		return nil
+	case 1:
+		secretValue, err := s.M.Get(ctx, secretRefs[0])
+		if err != nil {
+			return errors.Wrapf(err, "failed to get secret value for reference %q", secretRefs[0])
+		}
+		cache[secretRefs[0]] = secretValue
+		return nil
+	}
+
+	logr.FromContextOrDiscard(ctx).V(1).Info("Resolving secrets", "count", len(secretRefs))
+	secretValues, err := s.M.GetMany(ctx, secretRefs)
+	if err != nil {
+		return errors.Wrapf(err, "failed to get secret values for %d references", len(secretRefs))
+	}
+	for _, secretRef := range secretRefs {
+		secretValue, ok := secretValues[secretRef]
+		if !ok {
+			return errors.Wrapf(secrets.ErrNotFound, "failed to get secret value for reference %q", secretRef)
+		}
+		cache[secretRef] = secretValue
+	}
+	return nil
+}
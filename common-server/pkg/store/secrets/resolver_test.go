@@ -32,7 +32,7 @@ var _ = Describe("Secrets Resolver", func() {
 		b := []byte(`{"root": "$<test:::mySecret:>", "sub": {"key": "$<test:::mySecret:>"}}`)
 
 		It("should replace all secrets", func() {
-			mockedSecretManager.EXPECT().Get(ctx, "test:::mySecret:").Return("mySecretValue", nil).Times(2)
+			mockedSecretManager.EXPECT().Get(ctx, "test:::mySecret:").Return("mySecretValue", nil).Times(1)
 			result, err := resolver.ReplaceAll(ctx, b, []string{"root", "sub.key"})
 			Expect(err).ToNot(HaveOccurred())
 			b, ok := result.([]byte)
@@ -49,7 +49,7 @@ var _ = Describe("Secrets Resolver", func() {
 		})
 
 		It("should work with strings", func() {
-			mockedSecretManager.EXPECT().Get(ctx, "test:::mySecret:").Return("mySecretValue", nil).Times(2)
+			mockedSecretManager.EXPECT().Get(ctx, "test:::mySecret:").Return("mySecretValue", nil).Times(1)
 			result, err := resolver.ReplaceAll(ctx, string(b), []string{"root", "sub.key"})
 			Expect(err).ToNot(HaveOccurred())
 			str, ok := result.(string)
@@ -58,7 +58,7 @@ var _ = Describe("Secrets Resolver", func() {
 		})
 
 		It("should work with objects in arrays", func() {
-			mockedSecretManager.EXPECT().Get(ctx, "test:::mySecret:").Return("mySecretValue", nil).Times(2)
+			mockedSecretManager.EXPECT().Get(ctx, "test:::mySecret:").Return("mySecretValue", nil).Times(1)
 			b := []byte(`{"root": [{"key": "$<test:::mySecret:>"}, {"key": "$<test:::mySecret:>"}]}`)
 
 			result, err := resolver.ReplaceAll(ctx, b, []string{"root.#.key"})
@@ -70,6 +70,48 @@ var _ = Describe("Secrets Resolver", func() {
 
 	})
 
+	Context("Resolve in batches", func() {
+
+		It("should resolve different secrets with a single request", func() {
+			mockedSecretManager.EXPECT().GetMany(ctx, []string{"test:::first:", "test:::second:"}).Return(map[string]string{
+				"test:::first:":  "firstValue",
+				"test:::second:": "secondValue",
+			}, nil).Times(1)
+			b := []byte(`{"root": [{"key": "$<test:::first:>"}, {"key": "$<test:::second:>"}], "sub": {"key": "$<test:::first:>"}}`)
+
+			result, err := resolver.ReplaceAll(ctx, b, []string{"root.#.key", "sub.key"})
+			Expect(err).ToNot(HaveOccurred())
+			Expect(string(result.([]byte))).To(Equal(`{"root": [{"key": "firstValue"}, {"key": "secondValue"}], "sub": {"key": "firstValue"}}`))
+		})
+
+		It("should return an error if a secret is missing in the response", func() {
+			mockedSecretManager.EXPECT().GetMany(ctx, []string{"test:::first:", "test:::second:"}).Return(map[string]string{
+				"test:::first:": "firstValue",
+			}, nil).Times(1)
+			m := map[string]any{
+				"root": "$<test:::first:>",
+				"sub":  map[string]any{"key": "$<test:::second:>"},
+			}
+
+			result, err := resolver.ReplaceAll(ctx, m, []string{"root", "sub.key"})
+			Expect(err).To(HaveOccurred())
+			Expect(result).To(BeNil())
+			Expect(err.Error()).To(ContainSubstring(`failed to get secret value for reference "test:::second:"`))
+			Expect(m["root"]).To(Equal("$<test:::first:>"))
+		})
+
+		It("should share resolved secrets within a scope", func() {
+			mockedSecretManager.EXPECT().Get(ctx, "test:::mySecret:").Return("mySecretValue", nil).Times(1)
+			scoped := (&secrets.SecretManagerResolver{M: mockedSecretManager}).Scoped()
+
+			for range 3 {
+				result, err := scoped.ReplaceAll(ctx, map[string]any{"root": "$<test:::mySecret:>"}, []string{"root"})
+				Expect(err).ToNot(HaveOccurred())
+				Expect(result.(map[string]any)["root"]).To(Equal("mySecretValue"))
+			}
+		})
+	})
+
 	Context("Resolve from Map", func() {
 
 		It("should replace all secrets in a map", func() {
@@ -78,7 +120,7 @@ var _ = Describe("Secrets Resolver", func() {
 				"sub":  map[string]any{"key": "$<test:::mySecret:>"},
 			}
 
-			mockedSecretManager.EXPECT().Get(ctx, "test:::mySecret:").Return("mySecretValue", nil).Times(2)
+			mockedSecretManager.EXPECT().Get(ctx, "test:::mySecret:").Return("mySecretValue", nil).Times(1)
 			result, err := resolver.ReplaceAll(ctx, m, []string{"root", "sub.key"})
 			Expect(err).ToNot(HaveOccurred())
 			resMap, ok := result.(map[string]any)
@@ -113,7 +155,7 @@ var _ = Describe("Secrets Resolver", func() {
 				},
 			}
 
-			mockedSecretManager.EXPECT().Get(ctx, "test:::mySecret:").Return("mySecretValue", nil).Times(2)
+			mockedSecretManager.EXPECT().Get(ctx, "test:::mySecret:").Return("mySecretValue", nil).Times(1)
 			result, err := resolver.ReplaceAll(ctx, u, []string{"spec.root", "spec.sub.key"})
 			Expect(err).ToNot(HaveOccurred())
 			resUnstructured, ok := result.(*unstructured.Unstructured)
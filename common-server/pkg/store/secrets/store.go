@@ -18,6 +18,13 @@ type Replacer interface {
 	ReplaceAll(ctx context.Context, obj any, jsonPaths []string) (any, error)
 }
 
+// ScopedReplacer is implemented by replacers that can share state between the calls of a single request.
+type ScopedReplacer interface {
+	Replacer
+	// Scoped returns a Replacer that is only used for the duration of a single request.
+	Scoped() Replacer
+}
+
 type SecretStore[T store.Object] struct {
 	store.ObjectStore[T]
 
@@ -69,6 +76,10 @@ func (s *SecretStore[T]) List(ctx context.Context, opts store.ListOpts) (*store.
 	if security.IsObfuscated(ctx) {
 		replacer = s.obfuscator
 	}
+	// Secrets that are referenced by multiple items are only resolved once.
+	if scoped, ok := replacer.(ScopedReplacer); ok {
+		replacer = scoped.Scoped()
+	}
 
 	for i := range res.Items {
 		res.Items[i], err = s.forItem(ctx, replacer, res.Items[i])
@@ -123,7 +123,7 @@ var _ = Describe("Secrets Store", func() {
 				Items: items,
 			}, nil)
 
-			secretManager.EXPECT().Get(ctx, "my-secret-placeholder").Return("topsecret", nil).Times(2)
+			secretManager.EXPECT().Get(ctx, "my-secret-placeholder").Return("topsecret", nil).Times(1)
 
 			result, err := secretsStore.List(ctx, store.ListOpts{})
 			Expect(err).ToNot(HaveOccurred())
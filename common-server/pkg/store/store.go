@@ -193,6 +193,51 @@ type ObjectStore[T Object] interface {
 	Patch(ctx context.Context, namespace, name string, ops ...Patch) (T, error)
 }
 
+// RawObjectStore is implemented by stores that keep objects as JSON. It allows
+// serving objects without decoding and encoding them again. The JSON is the same
+// as the one of the objects returned by Get and List and only valid during fn.
+type RawObjectStore interface {
+	GetRaw(ctx context.Context, namespace, name string, fn func(obj []byte) error) error
+	ListRaw(ctx context.Context, opts ListOpts, fn func(obj []byte) error) (ListResponseLinks, error)
+}
+
+// VersionedObjectStore is implemented by stores that track the versions of their
+// objects. It allows answering conditional requests without reading the objects.
+type VersionedObjectStore interface {
+	// Version returns a token that changes whenever the object changes.
+	// It returns false if the object is not stored.
+	Version(namespace, name string) (string, bool)
+	// Revision returns a token that changes whenever an object with the given prefix
+	// is stored or deleted. It returns an empty string if it is not known.
+	Revision(prefix string) string
+}
+
+type EventType string
+
+const (
+	EventTypeAdded    EventType = "ADDED"
+	EventTypeModified EventType = "MODIFIED"
+	EventTypeDeleted  EventType = "DELETED"
+)
+
+// Event is a change of an object published by a WatchableObjectStore.
+type Event struct {
+	Type EventType
+	// Revision allows resuming a watch after this event.
+	Revision string
+	// Object is the JSON of the object. Deleted objects only have their namespace and name.
+	Object []byte
+}
+
+// WatchableObjectStore is implemented by stores that publish the changes of their objects.
+type WatchableObjectStore interface {
+	// Watch returns the changes of the objects that match the prefix and filters of opts.
+	// If revision is set, it starts with the changes after this revision, see
+	// VersionedObjectStore.Revision. Otherwise it starts with the next change.
+	// The channel is closed once ctx is done or if the changes are not received fast enough.
+	Watch(ctx context.Context, opts ListOpts, revision string) (<-chan Event, error)
+}
+
 // ParseLimit parses a string into an integer, returning DefaultPageSize if the
 // string is empty or cannot be parsed.
 func ParseLimit(s string) int {
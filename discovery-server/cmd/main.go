@@ -34,7 +34,11 @@ func main() {
 	rootCtx := logr.NewContext(context.Background(), log.Log)
 
 	stores := store.NewStores(rootCtx, kconfig.GetConfigOrDie(),
-		inmemory.DatabaseOpts{Filepath: cfg.Database.Filepath, ReduceMemory: cfg.Database.ReduceMemory},
+		inmemory.DatabaseOpts{
+			Filepath:     cfg.Database.Filepath,
+			ReduceMemory: cfg.Database.ReduceMemory,
+			StaleReady:   cfg.Database.StaleReady,
+		},
 		inmemory.InformerOpts{DisableCache: cfg.Informer.DisableCache},
 	)
 
@@ -23,6 +23,8 @@ type DatabaseConfig struct {
 	Filepath string `mapstructure:"filepath"`
 	// ReduceMemory trades memory for CPU; see common-server docs.
 	ReduceMemory bool `mapstructure:"reduceMemory"`
+	// StaleReady serves the on-disk data of the previous run at startup; requires Filepath.
+	StaleReady bool `mapstructure:"staleReady"`
 }
 
 type InformerConfig struct {
@@ -105,7 +105,7 @@ var _ = Describe("Secret Store Integration", func() {
 				}
 				listResp := &csstore.ListResponse[*apiv1.ApiSubscription]{Items: objs}
 				mockStore.EXPECT().List(ctx, mock.Anything).Return(listResp, nil)
-				secretMgr.EXPECT().Get(ctx, "test-secret-id").Return(resolvedSecret, nil).Times(2)
+				secretMgr.EXPECT().Get(ctx, "test-secret-id").Return(resolvedSecret, nil).Times(1)
 
 				result, err := wrappedStore.List(ctx, csstore.ListOpts{})
 				Expect(err).NotTo(HaveOccurred())
@@ -26,6 +26,7 @@ import (
 
 	gatewayv1 "github.com/telekom/controlplane/gateway/api/v1"
 	"github.com/telekom/controlplane/gateway/internal/controller"
+	"github.com/telekom/controlplane/gateway/pkg/kongutil"
 	secretmetrics "github.com/telekom/controlplane/secret-manager/api/metrics"
 	// +kubebuilder:scaffold:imports
 )
@@ -59,6 +60,16 @@ func main() {
 		"If set, the metrics endpoint is served securely via HTTPS. Use --metrics-secure=false to use HTTP instead.")
 	flag.BoolVar(&enableHTTP2, "enable-http2", false,
 		"If set, HTTP/2 will be enabled for the metrics and webhook servers")
+	flag.BoolVar(&kongutil.DeclarativeConfig, "kong-declarative-config", kongutil.DeclarativeConfig,
+		"If set, the complete configuration of each gateway is pushed to its /config endpoint (DB-less mode) "+
+			"instead of writing every entity with the admin API.")
+	flag.DurationVar(&kongutil.DeclarativeConfigDelay, "kong-declarative-config-delay", kongutil.DeclarativeConfigDelay,
+		"The time without changes after which the configuration of a gateway is pushed in DB-less mode.")
+	flag.DurationVar(&kongutil.DeclarativeConfigMaxDelay, "kong-declarative-config-max-delay", kongutil.DeclarativeConfigMaxDelay,
+		"The time after the first change after which the configuration of a gateway is pushed in DB-less mode in any case.")
+	flag.DurationVar(&kongutil.DeclarativeConfigRefreshInterval, "kong-declarative-config-refresh-interval", kongutil.DeclarativeConfigRefreshInterval,
+		"The interval after which the configuration of a gateway is pushed again in DB-less mode, e.g. after a restart of the gateway. "+
+			"Set to 0 to only push changes.")
 	opts := zap.Options{
 		Development: true,
 	}
@@ -177,6 +188,12 @@ func main() {
 		setupLog.Error(err, "unable to set up ready check")
 		os.Exit(1)
 	}
+	if kongutil.DeclarativeConfig {
+		if err := mgr.AddReadyzCheck("kong-declarative-config", kongutil.CheckDeclarativeConfigs); err != nil {
+			setupLog.Error(err, "unable to set up ready check")
+			os.Exit(1)
+		}
+	}
 
 	setupLog.Info("starting manager")
 	if err := mgr.Start(rootCtx); err != nil {
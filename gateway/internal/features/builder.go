@@ -273,6 +273,7 @@ func (b *Builder) Build(ctx context.Context) error {
 	}
 
 	// In case a plugin was used before but is not used anymore, we need to remove it
+	previous := b.Route.Status.Properties
 	b.Route.Status.Properties = map[string]string{}
 
 	// Ensure that the Routing and JumperConfig are set last
@@ -283,16 +284,25 @@ func (b *Builder) Build(ctx context.Context) error {
 		b.RequestTransformerPlugin().Config.Append.AddHeader(plugin.JumperConfigKey, plugin.ToBase64OrDie(b.jumperConfig))
 	}
 
-	err := b.kc.CreateOrReplaceRoute(ctx, b.Route, b.Upstream)
-	if err != nil {
-		return errors.Wrap(err, "failed to create or replace route")
-	}
-
-	for pn, p := range b.Plugins {
-		_, err = b.kc.CreateOrReplacePlugin(ctx, p)
+	// Only objects whose desired state changed since the last successful build are written
+	hashes := map[string]string{}
+	routeHash := b.routeHash(ctx)
+	if b.isUnchanged(previous, routeHashKey, routeHash) {
+		log.V(1).Info("Route is unchanged")
+		keepProperties(previous, b.Route.SetProperty, routeIdKeys)
+		KongWrites.WithLabelValues(KindRoute, WriteSkipped).Inc()
+	} else {
+		err := b.kc.CreateOrReplaceRoute(ctx, b.Route, b.Upstream)
 		if err != nil {
-			return errors.Wrapf(err, "failed to create or replace plugin %s", pn)
+			return errors.Wrap(err, "failed to create or replace route")
 		}
+		KongWrites.WithLabelValues(KindRoute, WriteApplied).Inc()
+	}
+	hashes[routeHashKey] = routeHash
+
+	err := b.applyPlugins(ctx, previous, hashes)
+	if err != nil {
+		return err
 	}
 
 	err = b.kc.CleanupPlugins(ctx, b.Route, nil, toSlice(b.Plugins))
@@ -300,6 +310,7 @@ func (b *Builder) Build(ctx context.Context) error {
 		return errors.Wrap(err, "failed to cleanup plugins")
 	}
 
+	recordHashes(b.Route.SetProperty, hashes)
 	return nil
 }
 
@@ -322,18 +333,28 @@ func (b *Builder) BuildForConsumer(ctx context.Context) error {
 	}
 
 	// In case a plugin was used before but is not used anymore, we need to remove it
+	previous := b.Consumer.Status.Properties
 	b.Consumer.Status.Properties = map[string]string{}
 
-	_, err := b.kc.CreateOrReplaceConsumer(ctx, b.Consumer)
-	if err != nil {
-		return errors.Wrap(err, "failed to create or replace consumer")
-	}
-
-	for pn, p := range b.Plugins {
-		_, err = b.kc.CreateOrReplacePlugin(ctx, p)
+	// Only objects whose desired state changed since the last successful build are written
+	hashes := map[string]string{}
+	consumerHash := b.consumerHash(ctx)
+	if b.isUnchanged(previous, consumerHashKey, consumerHash) {
+		log.V(1).Info("Consumer is unchanged")
+		keepProperties(previous, b.Consumer.SetProperty, consumerIdKeys)
+		KongWrites.WithLabelValues(KindConsumer, WriteSkipped).Inc()
+	} else {
+		_, err := b.kc.CreateOrReplaceConsumer(ctx, b.Consumer)
 		if err != nil {
-			return errors.Wrapf(err, "failed to create or replace plugin %s", pn)
+			return errors.Wrap(err, "failed to create or replace consumer")
 		}
+		KongWrites.WithLabelValues(KindConsumer, WriteApplied).Inc()
+	}
+	hashes[consumerHashKey] = consumerHash
+
+	err := b.applyPlugins(ctx, previous, hashes)
+	if err != nil {
+		return err
 	}
 
 	err = b.kc.CleanupPlugins(ctx, nil, b.Consumer, toSlice(b.Plugins))
@@ -341,6 +362,7 @@ func (b *Builder) BuildForConsumer(ctx context.Context) error {
 		return errors.Wrap(err, "failed to cleanup plugins")
 	}
 
+	recordHashes(b.Consumer.SetProperty, hashes)
 	return nil
 
 }
@@ -10,12 +10,15 @@ import (
 
 	. "github.com/onsi/ginkgo/v2"
 	. "github.com/onsi/gomega"
+	"github.com/prometheus/client_golang/prometheus/testutil"
 	"github.com/stretchr/testify/mock"
 	metav1 "k8s.io/apimachinery/pkg/apis/meta/v1"
 
+	"github.com/telekom/controlplane/common/pkg/types"
 	gatewayv1 "github.com/telekom/controlplane/gateway/api/v1"
 	"github.com/telekom/controlplane/gateway/internal/features"
 	featmock "github.com/telekom/controlplane/gateway/internal/features/mock"
+	kong "github.com/telekom/controlplane/gateway/pkg/kong/api"
 	"github.com/telekom/controlplane/gateway/pkg/kong/client"
 	clientmock "github.com/telekom/controlplane/gateway/pkg/kong/client/mock"
 	"github.com/telekom/controlplane/gateway/pkg/kong/client/plugin"
@@ -300,6 +303,30 @@ var _ = Describe("Builder", func() {
 			})
 		})
 
+		Context("when several plugins are written", func() {
+			It("writes them concurrently and returns all errors", func() {
+				started := make(chan struct{}, 2)
+				mockKC.EXPECT().CreateOrReplaceRoute(mock.Anything, mock.Anything, mock.Anything).Return(nil)
+				mockKC.EXPECT().CreateOrReplacePlugin(mock.Anything, mock.Anything).
+					Run(func(_ context.Context, _ client.CustomPlugin) {
+						defer GinkgoRecover()
+						started <- struct{}{}
+						// Both writes are in flight at the same time
+						Eventually(started).Should(HaveLen(2))
+					}).Return(nil, errors.New("kong plugin creation failed")).Twice()
+
+				builder := features.NewFeatureBuilder(mockKC, route, nil, gateway)
+				builder.SetUpstream(client.NewUpstreamOrDie(plugin.LocalhostProxyUrl))
+				builder.AclPlugin()
+				builder.JwtPlugin()
+
+				err := builder.Build(ctx)
+				Expect(err).To(HaveOccurred())
+				Expect(err.Error()).To(ContainSubstring("failed to create or replace plugin acl"))
+				Expect(err.Error()).To(ContainSubstring("failed to create or replace plugin jwt"))
+			})
+		})
+
 		Context("when CleanupPlugins fails", func() {
 			It("returns a wrapped error", func() {
 				cleanupErr := errors.New("cleanup failed")
@@ -485,6 +512,155 @@ var _ = Describe("Builder", func() {
 		})
 	})
 
+	Describe("Unchanged writes", func() {
+		// build runs a build of the route with an ACL plugin that allows the given groups
+		build := func(allow ...string) error {
+			builder := features.NewFeatureBuilder(mockKC, route, nil, gateway)
+			builder.SetUpstream(client.NewUpstreamOrDie(plugin.LocalhostProxyUrl))
+			for _, group := range allow {
+				builder.AclPlugin().Config.AddAllow(group)
+			}
+			return builder.Build(ctx)
+		}
+
+		writes := func(kind, result string) float64 {
+			return testutil.ToFloat64(features.KongWrites.WithLabelValues(kind, result))
+		}
+
+		BeforeEach(func() {
+			mockKC.EXPECT().CreateOrReplaceRoute(mock.Anything, mock.Anything, mock.Anything).
+				Run(func(_ context.Context, r client.CustomRoute, _ client.Upstream) {
+					r.SetRouteId("route-id")
+				}).Return(nil).Once()
+			mockKC.EXPECT().CreateOrReplacePlugin(mock.Anything, mock.Anything).
+				Run(func(_ context.Context, p client.CustomPlugin) {
+					p.SetId("acl-id")
+				}).Return(nil, nil).Once()
+			mockKC.EXPECT().CleanupPlugins(mock.Anything, mock.Anything, mock.Anything, mock.Anything).Return(nil)
+
+			Expect(build("a", "b")).To(Succeed())
+		})
+
+		It("does not write the route and plugins again if nothing changed", func() {
+			skippedRoutes := writes(features.KindRoute, features.WriteSkipped)
+			skippedPlugins := writes(features.KindPlugin, features.WriteSkipped)
+			id := "acl-id"
+			mockKC.EXPECT().LoadPlugin(mock.Anything, mock.Anything, false).Return(&kong.Plugin{Id: &id}, nil).Once()
+
+			// The order of the ACL groups does not matter
+			Expect(build("b", "a")).To(Succeed())
+
+			Expect(writes(features.KindRoute, features.WriteSkipped)).To(Equal(skippedRoutes + 1))
+			Expect(writes(features.KindPlugin, features.WriteSkipped)).To(Equal(skippedPlugins + 1))
+			Expect(route.GetProperty("routeId")).To(Equal("route-id"))
+			Expect(route.GetProperty("kongAclPluginId")).To(Equal("acl-id"))
+		})
+
+		It("writes unchanged plugins again if they were deleted", func() {
+			mockKC.EXPECT().LoadPlugin(mock.Anything, mock.Anything, false).Return(nil, nil).Once()
+			mockKC.EXPECT().CreateOrReplacePlugin(mock.Anything, mock.Anything).Return(nil, nil).Once()
+
+			Expect(build("a", "b")).To(Succeed())
+		})
+
+		It("writes everything again with a Kong client that pushes asynchronously", func() {
+			mockKC.EXPECT().CreateOrReplaceRoute(mock.Anything, mock.Anything, mock.Anything).Return(nil).Once()
+			mockKC.EXPECT().CreateOrReplacePlugin(mock.Anything, mock.Anything).Return(nil, nil).Once()
+
+			builder := features.NewFeatureBuilder(&asyncKongClient{MockKongClient: mockKC}, route, nil, gateway)
+			builder.SetUpstream(client.NewUpstreamOrDie(plugin.LocalhostProxyUrl))
+			builder.AclPlugin().Config.AddAllow("a")
+			builder.AclPlugin().Config.AddAllow("b")
+			Expect(builder.Build(ctx)).To(Succeed())
+		})
+
+		It("writes only the plugins that changed", func() {
+			appliedPlugins := writes(features.KindPlugin, features.WriteApplied)
+			mockKC.EXPECT().CreateOrReplacePlugin(mock.Anything, mock.Anything).Return(nil, nil).Once()
+
+			Expect(build("a", "b", "c")).To(Succeed())
+
+			Expect(writes(features.KindPlugin, features.WriteApplied)).To(Equal(appliedPlugins + 1))
+		})
+
+		It("writes everything again after a failed build", func() {
+			mockKC.EXPECT().CreateOrReplacePlugin(mock.Anything, mock.Anything).Return(nil, errors.New("failed")).Once()
+			Expect(build("a", "b", "c")).ToNot(Succeed())
+
+			mockKC.EXPECT().CreateOrReplaceRoute(mock.Anything, mock.Anything, mock.Anything).Return(nil).Once()
+			mockKC.EXPECT().CreateOrReplacePlugin(mock.Anything, mock.Anything).Return(nil, nil).Once()
+			Expect(build("a", "b")).To(Succeed())
+		})
+	})
+
+	Describe("Unchanged plugins without a stored id", func() {
+		// build runs a build of the route with the rate limit of a consume route.
+		// The consume route is new for every build, as the id is not stored in its status.
+		build := func() error {
+			builder := features.NewFeatureBuilder(mockKC, route, nil, gateway)
+			builder.SetUpstream(client.NewUpstreamOrDie(plugin.LocalhostProxyUrl))
+			builder.RateLimitPluginConsumeRoute(&gatewayv1.ConsumeRoute{
+				ObjectMeta: metav1.ObjectMeta{Name: "consume-route", Namespace: "default"},
+				Spec: gatewayv1.ConsumeRouteSpec{
+					Route:        types.ObjectRef{Name: "test-route", Namespace: "default"},
+					ConsumerName: "consumer-a",
+				},
+			}).Config.Limits.Consumer = &plugin.LimitConfig{Second: 5}
+			return builder.Build(ctx)
+		}
+
+		// keptIds returns the ids of the plugins passed to the last cleanup
+		keptIds := func() []string {
+			var ids []string
+			for _, call := range mockKC.Calls {
+				if call.Method != "CleanupPlugins" {
+					continue
+				}
+				ids = nil
+				for _, p := range call.Arguments.Get(3).([]client.CustomPlugin) {
+					ids = append(ids, p.GetId())
+				}
+			}
+			return ids
+		}
+
+		BeforeEach(func() {
+			mockKC.EXPECT().CreateOrReplaceRoute(mock.Anything, mock.Anything, mock.Anything).Return(nil).Once()
+			mockKC.EXPECT().CreateOrReplacePlugin(mock.Anything, mock.Anything).
+				Run(func(_ context.Context, p client.CustomPlugin) {
+					p.SetId("limit-id")
+				}).Return(nil, nil).Once()
+			mockKC.EXPECT().CleanupPlugins(mock.Anything, mock.Anything, mock.Anything, mock.Anything).Return(nil)
+
+			Expect(build()).To(Succeed())
+			Expect(keptIds()).To(ConsistOf("limit-id"))
+		})
+
+		It("keeps the plugin on every rebuild", func() {
+			id := "limit-id"
+			mockKC.EXPECT().LoadPlugin(mock.Anything, mock.Anything, false).
+				Run(func(_ context.Context, p client.CustomPlugin, _ bool) {
+					p.SetId("limit-id")
+				}).Return(&kong.Plugin{Id: &id}, nil).Twice()
+
+			Expect(build()).To(Succeed())
+			Expect(keptIds()).To(ConsistOf("limit-id"))
+			Expect(build()).To(Succeed())
+			Expect(keptIds()).To(ConsistOf("limit-id"))
+		})
+
+		It("writes the plugin again if it is not found", func() {
+			mockKC.EXPECT().LoadPlugin(mock.Anything, mock.Anything, false).Return(nil, nil).Once()
+			mockKC.EXPECT().CreateOrReplacePlugin(mock.Anything, mock.Anything).
+				Run(func(_ context.Context, p client.CustomPlugin) {
+					p.SetId("new-limit-id")
+				}).Return(nil, nil).Once()
+
+			Expect(build()).To(Succeed())
+			Expect(keptIds()).To(ConsistOf("new-limit-id"))
+		})
+	})
+
 	Describe("Feature ordering", func() {
 		It("applies features in ascending priority order (lowest first)", func() {
 			var appliedOrder []int
@@ -849,3 +1025,10 @@ var _ = Describe("Builder", func() {
 		})
 	})
 })
+
+// asyncKongClient is a Kong client that pushes its configuration asynchronously.
+type asyncKongClient struct {
+	*clientmock.MockKongClient
+}
+
+func (c *asyncKongClient) PushError() error { return nil }
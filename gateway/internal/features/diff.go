@@ -0,0 +1,260 @@
+// Copyright 2026 Deutsche Telekom IT GmbH
+//
+// SPDX-License-Identifier: Apache-2.0
+
+package features
+
+import (
+	"cmp"
+	"context"
+	"encoding/json"
+	stderrors "errors"
+	"hash/fnv"
+	"slices"
+	"strconv"
+	"sync"
+
+	"github.com/go-logr/logr"
+	"github.com/pkg/errors"
+	"github.com/telekom/controlplane/common/pkg/util/contextutil"
+
+	"github.com/telekom/controlplane/gateway/pkg/kong/client"
+)
+
+// SkipUnchangedWrites enables skipping the Kong writes of objects whose
+// desired state did not change since the last successful build.
+var SkipUnchangedWrites = true
+
+// Properties that store the hash of the last applied desired state of an
+// object in the status of the route or consumer that owns it.
+const (
+	routeHashKey        = "kongRouteHash"
+	consumerHashKey     = "kongConsumerHash"
+	pluginHashKeyPrefix = "kongPluginHash--"
+)
+
+// Properties that hold the ids of Kong objects and must be kept when their
+// write is skipped.
+var (
+	routeIdKeys    = []string{"routeId", "serviceId"}
+	consumerIdKeys = []string{"kongConsumerId"}
+)
+
+type routeState struct {
+	Target            string   `json:"target"`
+	Name              string   `json:"name"`
+	Hostnames         []string `json:"hostnames"`
+	Paths             []string `json:"paths"`
+	RequestBuffering  bool     `json:"requestBuffering"`
+	ResponseBuffering bool     `json:"responseBuffering"`
+	UpstreamScheme    string   `json:"upstreamScheme"`
+	UpstreamHost      string   `json:"upstreamHost"`
+	UpstreamPort      int      `json:"upstreamPort"`
+	UpstreamPath      string   `json:"upstreamPath"`
+}
+
+type consumerState struct {
+	Target string `json:"target"`
+	Name   string `json:"name"`
+}
+
+type pluginState struct {
+	Target   string         `json:"target"`
+	Name     string         `json:"name"`
+	Route    *string        `json:"route"`
+	Consumer *string        `json:"consumer"`
+	Config   map[string]any `json:"config"`
+}
+
+// target identifies the Kong instance and environment an object is written
+// to. It is part of every hash, so that moving a route to another gateway
+// writes it again.
+func (b *Builder) target(ctx context.Context) string {
+	env, _ := contextutil.EnvFromContext(ctx)
+	if b.Gateway == nil {
+		return env
+	}
+	return b.Gateway.AdminUrl() + "|" + env
+}
+
+func (b *Builder) routeHash(ctx context.Context) string {
+	return desiredHash(routeState{
+		Target:            b.target(ctx),
+		Name:              b.Route.GetName(),
+		Hostnames:         b.Route.GetHostnames(),
+		Paths:             b.Route.GetPaths(),
+		RequestBuffering:  b.Route.GetRequestBuffering(),
+		ResponseBuffering: b.Route.GetResponseBuffering(),
+		UpstreamScheme:    b.Upstream.GetScheme(),
+		UpstreamHost:      b.Upstream.GetHostname(),
+		UpstreamPort:      b.Upstream.GetPort(),
+		UpstreamPath:      b.Upstream.GetPath(),
+	})
+}
+
+func (b *Builder) consumerHash(ctx context.Context) string {
+	return desiredHash(consumerState{
+		Target: b.target(ctx),
+		Name:   b.Consumer.GetConsumerName(),
+	})
+}
+
+func (b *Builder) pluginHash(ctx context.Context, p client.CustomPlugin) string {
+	return desiredHash(pluginState{
+		Target:   b.target(ctx),
+		Name:     p.GetName(),
+		Route:    p.GetRoute(),
+		Consumer: p.GetConsumer(),
+		Config:   p.GetConfig(),
+	})
+}
+
+// isUnchanged reports whether hash matches the hash of the last applied
+// state stored under key in the previous properties.
+// Writes of Kong clients that push their configuration asynchronously are
+// never skipped: they only change the configuration in memory, which is
+// rebuilt from Kong on start and lacks the objects that Kong lost.
+func (b *Builder) isUnchanged(previous map[string]string, key, hash string) bool {
+	if _, async := b.kc.(client.PushStatus); async {
+		return false
+	}
+	return SkipUnchangedWrites && hash != "" && previous[key] == hash
+}
+
+// applyPlugins writes all plugins of the builder that changed since the last
+// successful build and records the hashes of all of them in hashes.
+// Unchanged plugins are looked up, which is served by the plugin mirror if
+// enabled, so that plugins deleted in Kong are written again. Their id is set
+// again, as the properties were reset, and plugins that do not store their id,
+// e.g. the rate limits of consume routes, get it from Kong, so that the cleanup
+// keeps them.
+// The changed plugins are written concurrently. The Kong client bounds the
+// number of writes per admin API, and all failed writes are returned.
+func (b *Builder) applyPlugins(ctx context.Context, previous, hashes map[string]string) error {
+	changed := map[string]client.CustomPlugin{}
+	for pn, p := range b.Plugins {
+		key := pluginHashKeyPrefix + pn
+		hash := b.pluginHash(ctx, p)
+		hashes[key] = hash
+		if !b.isUnchanged(previous, key, hash) || !b.resolvePluginId(ctx, p) {
+			changed[pn] = p
+			continue
+		}
+		p.SetId(p.GetId())
+		KongWrites.WithLabelValues(KindPlugin, WriteSkipped).Inc()
+	}
+
+	var (
+		wg    sync.WaitGroup
+		mutex sync.Mutex
+		errs  []error
+	)
+	for pn, p := range changed {
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			_, err := b.kc.CreateOrReplacePlugin(ctx, &syncedPlugin{CustomPlugin: p, mutex: &mutex})
+			mutex.Lock()
+			defer mutex.Unlock()
+			if err != nil {
+				errs = append(errs, errors.Wrapf(err, "failed to create or replace plugin %s", pn))
+				return
+			}
+			KongWrites.WithLabelValues(KindPlugin, WriteApplied).Inc()
+		}()
+	}
+	wg.Wait()
+	return stderrors.Join(errs...)
+}
+
+// resolvePluginId loads the plugin from the plugin mirror or the admin API
+// and sets its id. It returns false if the plugin was not found.
+func (b *Builder) resolvePluginId(ctx context.Context, p client.CustomPlugin) bool {
+	kongPlugin, err := b.kc.LoadPlugin(ctx, p, false)
+	if err != nil {
+		logr.FromContextOrDiscard(ctx).V(1).Info("failed to load plugin, writing it again", "plugin", p.GetName(), "error", err.Error())
+		return false
+	}
+	return kongPlugin != nil && p.GetId() != ""
+}
+
+// syncedPlugin serializes SetId, since the plugins store their ids in the
+// status of the route or consumer they share.
+type syncedPlugin struct {
+	client.CustomPlugin
+	mutex *sync.Mutex
+}
+
+func (p *syncedPlugin) SetId(id string) {
+	p.mutex.Lock()
+	defer p.mutex.Unlock()
+	p.CustomPlugin.SetId(id)
+}
+
+// keepProperties copies the given keys from the previous properties.
+func keepProperties(previous map[string]string, set func(key, val string), keys []string) {
+	for _, key := range keys {
+		if val, ok := previous[key]; ok {
+			set(key, val)
+		}
+	}
+}
+
+// recordHashes stores the hashes of the applied state. It must only be called
+// once all writes succeeded, so that a failed build writes everything again.
+func recordHashes(set func(key, val string), hashes map[string]string) {
+	for key, hash := range hashes {
+		if hash != "" {
+			set(key, hash)
+		}
+	}
+}
+
+// desiredHash returns a canonical hash of the JSON representation of v, or ""
+// if v cannot be encoded.
+// Lists of strings are sorted, since the plugin configs encode sets with a
+// random order and Kong treats all of them as sets.
+func desiredHash(v any) string {
+	raw, err := json.Marshal(v)
+	if err != nil {
+		return ""
+	}
+	var data any
+	if err := json.Unmarshal(raw, &data); err != nil {
+		return ""
+	}
+	// encoding/json sorts the keys of maps.
+	canonical, err := json.Marshal(canonicalize(data))
+	if err != nil {
+		return ""
+	}
+	h := fnv.New64a()
+	_, _ = h.Write(canonical)
+	return strconv.FormatUint(h.Sum64(), 16)
+}
+
+func canonicalize(v any) any {
+	switch v := v.(type) {
+	case map[string]any:
+		for key, val := range v {
+			v[key] = canonicalize(val)
+		}
+		return v
+	case []any:
+		allStrings := true
+		for i, val := range v {
+			v[i] = canonicalize(val)
+			if _, ok := v[i].(string); !ok {
+				allStrings = false
+			}
+		}
+		if allStrings {
+			slices.SortFunc(v, func(a, b any) int {
+				return cmp.Compare(a.(string), b.(string))
+			})
+		}
+		return v
+	default:
+		return v
+	}
+}
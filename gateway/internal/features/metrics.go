@@ -0,0 +1,34 @@
+// Copyright 2026 Deutsche Telekom IT GmbH
+//
+// SPDX-License-Identifier: Apache-2.0
+
+package features
+
+import (
+	"github.com/prometheus/client_golang/prometheus"
+	"sigs.k8s.io/controller-runtime/pkg/metrics"
+)
+
+// Kinds of Kong objects written by the Builder, used as the "kind" label.
+const (
+	KindRoute    = "route"
+	KindConsumer = "consumer"
+	KindPlugin   = "plugin"
+)
+
+// Results of a Kong write, used as the "result" label.
+const (
+	WriteApplied = "applied" // written to Kong
+	WriteSkipped = "skipped" // unchanged since the last successful build
+)
+
+// KongWrites counts the Kong objects the Builder wrote or skipped because
+// their desired state did not change.
+var KongWrites = prometheus.NewCounterVec(prometheus.CounterOpts{
+	Name: "controlplane_gateway_kong_writes_total",
+	Help: "Kong objects written by the features builder, labelled by whether the write was applied or skipped as unchanged.",
+}, []string{"kind", "result"})
+
+func init() {
+	metrics.Registry.MustRegister(KongWrites)
+}
@@ -13,6 +13,8 @@ import (
 	"net/http"
 	"slices"
 	"strings"
+	"sync"
+	"time"
 
 	"github.com/go-logr/logr"
 	"github.com/google/uuid"
@@ -42,6 +44,13 @@ type KongClient interface {
 	GetKongAdminApi() KongAdminApi
 }
 
+// PushStatus is implemented by KongClients that apply their writes asynchronously.
+type PushStatus interface {
+	// PushError returns the error of the last push of the configuration, or nil
+	// if it succeeded.
+	PushError() error
+}
+
 type KongAdminApi interface {
 	GetPluginWithResponse(ctx context.Context, pluginId string, reqEditors ...kong.RequestEditorFn) (*kong.GetPluginResponse, error)
 	DeletePluginWithResponse(ctx context.Context, pluginId string, reqEditors ...kong.RequestEditorFn) (*kong.DeletePluginResponse, error)
@@ -71,8 +80,19 @@ type kongClient struct {
 	//client     kong.ClientWithResponsesInterface
 	client     KongAdminApi
 	commonTags []string
+
+	// plugins is nil if plugins are looked up with the Kong admin API.
+	plugins *pluginMirror
+
+	// writes bounds the number of plugin writes that are sent to the admin
+	// API at once by all reconciles using this client.
+	writes chan struct{}
 }
 
+// MaxConcurrentWrites is the number of plugin upserts and deletes a
+// KongClient sends to its admin API at once.
+var MaxConcurrentWrites = 8
+
 func (c *kongClient) GetKongAdminApi() KongAdminApi {
 	return c.client
 }
@@ -81,6 +101,33 @@ var NewKongClient = func(client KongAdminApi, commonTags ...string) KongClient {
 	return &kongClient{
 		client:     client,
 		commonTags: commonTags,
+		writes:     make(chan struct{}, max(MaxConcurrentWrites, 1)),
+	}
+}
+
+// NewMirroredKongClient creates a KongClient that looks up plugins in an
+// in-process mirror of all plugins of the Kong instance instead of listing
+// them by tags for every lookup. The mirror is reloaded after refreshInterval.
+var NewMirroredKongClient = func(client KongAdminApi, refreshInterval time.Duration, commonTags ...string) KongClient {
+	return &kongClient{
+		client:     client,
+		commonTags: commonTags,
+		plugins:    newPluginMirror(client, refreshInterval),
+		writes:     make(chan struct{}, max(MaxConcurrentWrites, 1)),
+	}
+}
+
+// acquireWrite waits until a plugin write may be sent to the admin API.
+// The returned release function must be called once the write finished.
+func (c *kongClient) acquireWrite(ctx context.Context) (release func(), err error) {
+	if c.writes == nil {
+		return func() {}, nil
+	}
+	select {
+	case c.writes <- struct{}{}:
+		return func() { <-c.writes }, nil
+	case <-ctx.Done():
+		return nil, ctx.Err()
 	}
 }
 
@@ -105,6 +152,21 @@ func (c *kongClient) LoadPlugin(
 		tags = append(tags, BuildTag("consumer", "none"))
 	}
 
+	if pluginId != "" && c.plugins != nil {
+		kongPlugin, found, err := c.plugins.Get(ctx, pluginId)
+		if err != nil {
+			log.Error(err, "failed to load plugin mirror, falling back to admin API")
+		} else if found {
+			log.V(1).Info("found plugin in mirror", "id", pluginId)
+			if copyConfig {
+				if err := deepCopy(kongPlugin, plugin); err != nil {
+					return nil, fmt.Errorf("failed to copy plugin config: %w", err)
+				}
+			}
+			return kongPlugin, nil
+		}
+	}
+
 	if pluginId != "" {
 		log.V(1).Info("loading plugin by id", "id", pluginId)
 		response, err := c.client.GetPluginWithResponse(ctx, pluginId)
@@ -177,6 +239,12 @@ func (c *kongClient) CreateOrReplacePlugin(
 		tags = append(tags, BuildTag("consumer", "none"))
 	}
 
+	release, err := c.acquireWrite(ctx)
+	if err != nil {
+		return nil, err
+	}
+	defer release()
+
 	kongPlugin, err = c.LoadPlugin(ctx, plugin, false)
 	if err != nil {
 		return nil, err
@@ -274,6 +342,9 @@ func (c *kongClient) CreateOrReplacePlugin(
 	if err != nil {
 		return nil, fmt.Errorf("failed to unmarshal plugin response: %w", err)
 	}
+	if c.plugins != nil {
+		c.plugins.Put(*kongPlugin)
+	}
 
 	plugin.SetId(pluginId)
 	return kongPlugin, nil
@@ -311,6 +382,12 @@ func (c *kongClient) DeletePlugin(ctx context.Context, plugin CustomPlugin) (err
 		pluginId = *kongPlugin.Id
 	}
 
+	release, err := c.acquireWrite(ctx)
+	if err != nil {
+		return err
+	}
+	defer release()
+
 	response, err := c.client.DeletePluginWithResponse(ctx, pluginId)
 	if err != nil {
 		return HandleClientError(err)
@@ -318,6 +395,9 @@ func (c *kongClient) DeletePlugin(ctx context.Context, plugin CustomPlugin) (err
 	if err := CheckStatusCode(response, 200, 204); err != nil {
 		return fmt.Errorf("failed to delete plugin (%d): %s: %w", response.StatusCode(), string(response.Body), err)
 	}
+	if c.plugins != nil {
+		c.plugins.Remove(pluginId)
+	}
 	return nil
 }
 
@@ -355,45 +435,62 @@ func (c *kongClient) CleanupPlugins(ctx context.Context, route CustomRoute, cons
 		"need_cleanup", len(kongPlugins) != len(pluginIds),
 	)
 
+	// The deletes are sent concurrently, bounded by the write slots of this client.
+	var (
+		wg    sync.WaitGroup
+		mutex sync.Mutex
+		errs  []error
+	)
 	for _, kongPlugin := range kongPlugins {
-		if !slices.Contains(pluginIds, *kongPlugin.Id) {
-			log.V(1).Info("deleting plugin", "name", *kongPlugin.Name, "id", *kongPlugin.Id)
-			_, err := c.client.DeletePluginWithResponse(ctx, *kongPlugin.Id)
-			if err != nil {
-				return fmt.Errorf("failed to delete plugin: %w", HandleClientError(err))
-			}
+		if slices.Contains(pluginIds, *kongPlugin.Id) {
+			continue
 		}
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			if err := c.cleanupPlugin(ctx, kongPlugin); err != nil {
+				mutex.Lock()
+				errs = append(errs, err)
+				mutex.Unlock()
+			}
+		}()
 	}
+	wg.Wait()
 
-	return nil
+	return errors.Join(errs...)
 }
 
-func (c *kongClient) getPluginsMatchingTags(
-	ctx context.Context, tags []string) ([]kong.Plugin, error) {
+func (c *kongClient) cleanupPlugin(ctx context.Context, kongPlugin kong.Plugin) error {
+	release, err := c.acquireWrite(ctx)
+	if err != nil {
+		return err
+	}
+	defer release()
 
-	// ListPluginsForRouteWithResponse does not work correctly with tags
-	response, err := c.client.ListPluginWithResponse(ctx, &kong.ListPluginParams{
-		Tags: encodeTags(tags),
-	})
+	logr.FromContextOrDiscard(ctx).V(1).Info("deleting plugin", "name", *kongPlugin.Name, "id", *kongPlugin.Id)
+	_, err = c.client.DeletePluginWithResponse(ctx, *kongPlugin.Id)
 	if err != nil {
-		return nil, HandleClientError(err)
+		return fmt.Errorf("failed to delete plugin %s: %w", *kongPlugin.Id, HandleClientError(err))
 	}
-	if err := CheckStatusCode(response, 200); err != nil {
-		return nil, fmt.Errorf("failed to list plugins (%d): %s: %w", response.StatusCode(), string(response.Body), err)
+	if c.plugins != nil {
+		c.plugins.Remove(*kongPlugin.Id)
 	}
+	return nil
+}
 
-	// ListPluginWithResponse does not return an array of plugins
-	type ResponseBody struct {
-		Data []kong.Plugin `json:"data"`
-	}
-	var responseBody ResponseBody
+func (c *kongClient) getPluginsMatchingTags(
+	ctx context.Context, tags []string) ([]kong.Plugin, error) {
 
-	err = json.Unmarshal(response.Body, &responseBody)
-	if err != nil {
-		return nil, err
+	if c.plugins != nil {
+		plugins, err := c.plugins.Matching(ctx, tags)
+		if err == nil {
+			return plugins, nil
+		}
+		logr.FromContextOrDiscard(ctx).Error(err, "failed to load plugin mirror, falling back to admin API")
 	}
 
-	return responseBody.Data, nil
+	// ListPluginsForRouteWithResponse does not work correctly with tags
+	return listPlugins(ctx, c.client, encodeTags(tags))
 }
 
 func (c *kongClient) getPluginMatchingTags(
@@ -493,6 +590,11 @@ func (c *kongClient) DeleteRoute(ctx context.Context, route CustomRoute) error {
 		return fmt.Errorf("failed to delete route (%d): %s: %w", routeResponse.StatusCode(), string(routeResponse.Body), err)
 	}
 
+	if c.plugins != nil {
+		// Kong deletes the plugins of a route together with it.
+		c.plugins.RemoveTagged(BuildTag("route", routeName))
+	}
+
 	serviceResponse, err := c.client.DeleteServiceWithResponse(ctx, routeName)
 	if err != nil {
 		return fmt.Errorf("failed to delete service: %w", HandleClientError(err))
@@ -557,6 +659,10 @@ func (c *kongClient) DeleteConsumer(ctx context.Context, consumer CustomConsumer
 	if err := CheckStatusCode(response, 200, 204, 404); err != nil {
 		return fmt.Errorf("failed to delete consumer (%d): %s: %w", response.StatusCode(), string(response.Body), err)
 	}
+	if c.plugins != nil {
+		// Kong deletes the plugins of a consumer together with it.
+		c.plugins.RemoveTagged(BuildTag("consumer", consumer.GetConsumerName()))
+	}
 	return nil
 }
 
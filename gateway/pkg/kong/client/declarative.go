@@ -0,0 +1,384 @@
+// Copyright 2026 Deutsche Telekom IT GmbH
+//
+// SPDX-License-Identifier: Apache-2.0
+
+package client
+
+import (
+	"context"
+	"fmt"
+	"slices"
+	"strings"
+	"time"
+
+	"github.com/google/uuid"
+	"github.com/telekom/controlplane/common/pkg/util/contextutil"
+
+	kong "github.com/telekom/controlplane/gateway/pkg/kong/api"
+)
+
+var _ KongClient = &declarativeClient{}
+var _ PushStatus = &declarativeClient{}
+
+// declarativeClient is a KongClient for Kong instances that run without a
+// database (DB-less). Instead of writing each entity with the admin API, it
+// changes an in-memory copy of the complete configuration and pushes it with
+// a single request to the /config endpoint once the changes settled.
+//
+// The writes return once the configuration was changed in memory. Failed
+// pushes are retried and reported by PushError. The configuration is pushed
+// again periodically, which Kong skips if it did not change.
+type declarativeClient struct {
+	// admin is only used to read from the admin API.
+	admin  KongAdminApi
+	config *declarativeConfig
+}
+
+// NewDeclarativeKongClient creates a KongClient for a Kong instance without
+// a database. The configuration is pushed with doer to the /config endpoint
+// of server, delay after the last change and at the latest maxDelay after the
+// first change that was not pushed yet. Once pushed, it is pushed again every
+// refresh, unless refresh is 0.
+var NewDeclarativeKongClient = func(admin KongAdminApi, doer kong.HttpRequestDoer, server string, delay, maxDelay, refresh time.Duration) KongClient {
+	return &declarativeClient{
+		admin:  admin,
+		config: newDeclarativeConfig(doer, strings.TrimSuffix(server, "/"), delay, maxDelay, refresh),
+	}
+}
+
+// PushError returns the error of the last push of the configuration, or nil
+// if it succeeded.
+func (c *declarativeClient) PushError() error {
+	return c.config.pushError()
+}
+
+func (c *declarativeClient) GetKongAdminApi() KongAdminApi {
+	return &declarativeAdminApi{KongAdminApi: c.admin, config: c.config}
+}
+
+func (c *declarativeClient) CreateOrReplaceRoute(ctx context.Context, route CustomRoute, upstream Upstream) error {
+	if upstream == nil {
+		return fmt.Errorf("upstream is required")
+	}
+
+	routeName := route.GetName()
+	tags := []string{
+		BuildTag("env", contextutil.EnvFromContextOrDie(ctx)),
+		BuildTag("route", routeName),
+	}
+
+	service := entity{
+		"name":     routeName,
+		"enabled":  true,
+		"host":     upstream.GetHostname(),
+		"port":     upstream.GetPort(),
+		"protocol": upstream.GetScheme(),
+		"tags":     tags,
+	}
+	if path := upstream.GetPath(); path != "" {
+		service["path"] = path
+	}
+	kongRoute := entity{
+		"name":                       routeName,
+		"protocols":                  []string{"http", "https"},
+		"request_buffering":          route.GetRequestBuffering(),
+		"response_buffering":         route.GetResponseBuffering(),
+		"https_redirect_status_code": 426,
+		"tags":                       tags,
+	}
+	if paths := route.GetPaths(); len(paths) > 0 {
+		kongRoute["paths"] = paths
+	}
+	if hosts := route.GetHostnames(); len(hosts) > 0 {
+		kongRoute["hosts"] = hosts
+	}
+
+	return c.config.update(ctx, func() error {
+		serviceId := c.config.put(kindServices, routeName, service)
+		kongRoute["service"] = ref(serviceId)
+		routeId := c.config.put(kindRoutes, routeName, kongRoute)
+
+		route.SetServiceId(serviceId)
+		route.SetRouteId(routeId)
+		return nil
+	})
+}
+
+func (c *declarativeClient) DeleteRoute(ctx context.Context, route CustomRoute) error {
+	routeName := route.GetName()
+	return c.config.update(ctx, func() error {
+		// Kong deletes the plugins of a route together with it.
+		if kongRoute, ok := c.config.get(kindRoutes, routeName); ok {
+			c.config.removeWhere(kindPlugins, referencing("route", kongRoute["id"]))
+			c.config.remove(kindRoutes, routeName)
+		}
+		if service, ok := c.config.get(kindServices, routeName); ok {
+			c.config.removeWhere(kindPlugins, referencing("service", service["id"]))
+			c.config.removeWhere(kindRoutes, referencing("service", service["id"]))
+			c.config.remove(kindServices, routeName)
+		}
+		c.removeUpstream(routeName)
+		return nil
+	})
+}
+
+func (c *declarativeClient) DeleteUpstream(ctx context.Context, route CustomRoute) error {
+	return c.config.update(ctx, func() error {
+		c.removeUpstream(route.GetName())
+		return nil
+	})
+}
+
+// removeUpstream removes the upstream with the given name and its targets.
+// Must be called with c.config.mutex held.
+func (c *declarativeClient) removeUpstream(name string) {
+	upstream, ok := c.config.get(kindUpstreams, name)
+	if !ok {
+		return
+	}
+	c.config.removeWhere(kindTargets, referencing("upstream", upstream["id"]))
+	c.config.remove(kindUpstreams, name)
+}
+
+func (c *declarativeClient) CreateOrReplaceConsumer(ctx context.Context, consumer CustomConsumer) (kongConsumer *kong.Consumer, err error) {
+	consumerName := consumer.GetConsumerName()
+	tags := []string{
+		BuildTag("env", contextutil.EnvFromContextOrDie(ctx)),
+		BuildTag("consumer", consumerName),
+	}
+
+	var e entity
+	err = c.config.update(ctx, func() error {
+		e = entity{
+			"username":  consumerName,
+			"custom_id": consumerName,
+			"tags":      tags,
+		}
+		consumerId := c.config.put(kindConsumers, consumerName, e)
+
+		// Every consumer is in the ACL group of its own name.
+		isInGroup := false
+		for _, key := range c.config.consumerAcls(consumerId) {
+			if acl, _ := c.config.get(kindAcls, key); acl["group"] == consumerName {
+				isInGroup = true
+				break
+			}
+		}
+		if !isInGroup {
+			c.config.put(kindAcls, entityId(kindAcls, consumerName), entity{
+				"id":       entityId(kindAcls, consumerName),
+				"consumer": ref(consumerId),
+				"group":    consumerName,
+			})
+		}
+		return nil
+	})
+	if err != nil {
+		return nil, err
+	}
+
+	kongConsumer, err = fromEntity[kong.Consumer](e)
+	if err != nil {
+		return nil, err
+	}
+	consumer.SetId(*kongConsumer.Id)
+	return kongConsumer, nil
+}
+
+func (c *declarativeClient) DeleteConsumer(ctx context.Context, consumer CustomConsumer) error {
+	consumerName := consumer.GetConsumerName()
+	return c.config.update(ctx, func() error {
+		kongConsumer, ok := c.config.get(kindConsumers, consumerName)
+		if !ok {
+			return nil
+		}
+		// Kong deletes the plugins and ACLs of a consumer together with it.
+		c.config.removeWhere(kindPlugins, referencing("consumer", kongConsumer["id"]))
+		consumerId, _ := kongConsumer["id"].(string)
+		for _, key := range c.config.consumerAcls(consumerId) {
+			c.config.remove(kindAcls, key)
+		}
+		c.config.remove(kindConsumers, consumerName)
+		return nil
+	})
+}
+
+func (c *declarativeClient) LoadPlugin(ctx context.Context, plugin CustomPlugin, copyConfig bool) (kongPlugin *kong.Plugin, err error) {
+	var e entity
+	err = c.config.read(ctx, func() {
+		e = c.findPlugin(ctx, plugin)
+	})
+	if err != nil || e == nil {
+		return nil, err
+	}
+
+	kongPlugin, err = fromEntity[kong.Plugin](e)
+	if err != nil {
+		return nil, err
+	}
+	if copyConfig {
+		if err := deepCopy(kongPlugin, plugin); err != nil {
+			return nil, fmt.Errorf("failed to copy plugin config: %w", err)
+		}
+	}
+	plugin.SetId(*kongPlugin.Id)
+	return kongPlugin, nil
+}
+
+func (c *declarativeClient) CreateOrReplacePlugin(ctx context.Context, plugin CustomPlugin) (kongPlugin *kong.Plugin, err error) {
+	config, err := toEntity(plugin.GetConfig())
+	if err != nil {
+		return nil, fmt.Errorf("failed to encode plugin config: %w", err)
+	}
+
+	var e entity
+	err = c.config.update(ctx, func() error {
+		var pluginId string
+		if existing := c.findPlugin(ctx, plugin); existing != nil {
+			pluginId, _ = existing["id"].(string)
+		} else {
+			pluginId = uuid.NewString()
+		}
+
+		e = entity{
+			"id":        pluginId,
+			"name":      plugin.GetName(),
+			"enabled":   true,
+			"config":    config,
+			"protocols": []string{"http"},
+			"tags":      pluginTags(ctx, plugin, true),
+		}
+		if plugin.GetConsumer() != nil {
+			consumer, ok := c.config.get(kindConsumers, *plugin.GetConsumer())
+			if !ok {
+				return fmt.Errorf("failed to create plugin: consumer %q does not exist", *plugin.GetConsumer())
+			}
+			e["consumer"] = ref(consumer["id"].(string))
+		}
+		if plugin.GetRoute() != nil {
+			route, ok := c.config.get(kindRoutes, *plugin.GetRoute())
+			if !ok {
+				return fmt.Errorf("failed to create plugin: route %q does not exist", *plugin.GetRoute())
+			}
+			e["route"] = ref(route["id"].(string))
+		}
+		c.config.put(kindPlugins, pluginId, e)
+		return nil
+	})
+	if err != nil {
+		return nil, err
+	}
+
+	kongPlugin, err = fromEntity[kong.Plugin](e)
+	if err != nil {
+		return nil, err
+	}
+	plugin.SetId(*kongPlugin.Id)
+	return kongPlugin, nil
+}
+
+func (c *declarativeClient) DeletePlugin(ctx context.Context, plugin CustomPlugin) error {
+	if plugin.GetRoute() == nil && plugin.GetConsumer() == nil {
+		return fmt.Errorf("either route or consumer must be provided for deletion")
+	}
+	return c.config.update(ctx, func() error {
+		if e := c.findPlugin(ctx, plugin); e != nil {
+			c.config.remove(kindPlugins, e["id"].(string))
+		}
+		return nil
+	})
+}
+
+func (c *declarativeClient) CleanupPlugins(ctx context.Context, route CustomRoute, consumer CustomConsumer, plugins []CustomPlugin) error {
+	tags := []string{
+		BuildTag("env", contextutil.EnvFromContextOrDie(ctx)),
+	}
+	if route == nil && consumer == nil {
+		return fmt.Errorf("either route or consumer must be provided for cleanup")
+	}
+	if route != nil {
+		tags = append(tags, BuildTag("route", route.GetName()))
+	}
+	if consumer != nil {
+		tags = append(tags, BuildTag("consumer", consumer.GetConsumerName()))
+	}
+
+	pluginIds := make(map[string]struct{}, len(plugins))
+	for _, plugin := range plugins {
+		pluginIds[plugin.GetId()] = struct{}{}
+	}
+
+	return c.config.update(ctx, func() error {
+		for _, key := range c.config.pluginsWithTags(tags) {
+			if _, ok := pluginIds[key]; !ok {
+				c.config.remove(kindPlugins, key)
+			}
+		}
+		return nil
+	})
+}
+
+// findPlugin returns the plugin with the id of plugin, or with its tags if
+// it has no id yet, like the lookup of the imperative client.
+// Must be called with c.config.mutex held.
+func (c *declarativeClient) findPlugin(ctx context.Context, plugin CustomPlugin) entity {
+	if id := plugin.GetId(); id != "" {
+		if e, ok := c.config.get(kindPlugins, id); ok {
+			return e
+		}
+	}
+	tags := pluginTags(ctx, plugin, plugin.GetConsumer() == nil)
+	if keys := c.config.pluginsWithTags(tags); len(keys) > 0 {
+		e, _ := c.config.get(kindPlugins, keys[0])
+		return e
+	}
+	return nil
+}
+
+// pluginTags returns the tags of a plugin. The tag of a plugin without
+// consumer is only added if withoutConsumer is set.
+func pluginTags(ctx context.Context, plugin CustomPlugin, withoutConsumer bool) []string {
+	tags := []string{
+		BuildTag("env", contextutil.EnvFromContextOrDie(ctx)),
+		BuildTag("plugin", plugin.GetName()),
+	}
+	if plugin.GetRoute() != nil {
+		tags = append(tags, BuildTag("route", *plugin.GetRoute()))
+	}
+	if plugin.GetConsumer() != nil {
+		tags = append(tags, BuildTag("consumer", *plugin.GetConsumer()))
+	} else if withoutConsumer {
+		tags = append(tags, BuildTag("consumer", "none"))
+	}
+	return tags
+}
+
+// referencing returns a filter for the entities that reference the entity
+// with the given id in field.
+func referencing(field string, id any) func(entity) bool {
+	return func(e entity) bool {
+		return refId(e[field]) == id
+	}
+}
+
+// entityTags returns the tags of an entity.
+func entityTags(e entity) []string {
+	entityTags, _ := e["tags"].([]any)
+	tags := make([]string, 0, len(entityTags))
+	for _, tag := range entityTags {
+		if tag, ok := tag.(string); ok {
+			tags = append(tags, tag)
+		}
+	}
+	return tags
+}
+
+func hasAllEntityTags(e entity, tags []string) bool {
+	entityTags, _ := e["tags"].([]any)
+	for _, tag := range tags {
+		if !slices.Contains(entityTags, any(tag)) {
+			return false
+		}
+	}
+	return true
+}
@@ -0,0 +1,144 @@
+// Copyright 2026 Deutsche Telekom IT GmbH
+//
+// SPDX-License-Identifier: Apache-2.0
+
+package client
+
+import (
+	"context"
+	"fmt"
+	"net/http"
+
+	kong "github.com/telekom/controlplane/gateway/pkg/kong/api"
+)
+
+var _ KongAdminApi = &declarativeAdminApi{}
+
+// declarativeAdminApi is the KongAdminApi of the declarativeClient. The writes
+// of upstreams and targets, which features use directly, change the
+// declarative configuration and return a response like the admin API would.
+// All other calls are sent to the admin API.
+type declarativeAdminApi struct {
+	KongAdminApi
+	config *declarativeConfig
+}
+
+func (a *declarativeAdminApi) UpsertUpstreamWithResponse(ctx context.Context, upstreamIdOrName string, body kong.UpsertUpstreamJSONRequestBody, _ ...kong.RequestEditorFn) (*kong.UpsertUpstreamResponse, error) {
+	e, err := toEntity(body)
+	if err != nil {
+		return nil, fmt.Errorf("failed to encode upstream: %w", err)
+	}
+
+	err = a.config.update(ctx, func() error {
+		if existing := a.findUpstream(upstreamIdOrName); existing != nil {
+			e["id"] = existing["id"]
+			a.config.remove(kindUpstreams, entityKey(kindUpstreams, existing))
+		}
+		a.config.put(kindUpstreams, entityKey(kindUpstreams, e), e)
+		return nil
+	})
+	if err != nil {
+		return nil, err
+	}
+
+	upstream, err := fromEntity[kong.Upstream](e)
+	if err != nil {
+		return nil, err
+	}
+	return &kong.UpsertUpstreamResponse{
+		HTTPResponse: &http.Response{StatusCode: http.StatusOK},
+		JSON200:      upstream,
+	}, nil
+}
+
+func (a *declarativeAdminApi) CreateTargetForUpstreamWithResponse(ctx context.Context, upstreamIdOrName string, body kong.CreateTargetForUpstreamJSONRequestBody, _ ...kong.RequestEditorFn) (*kong.CreateTargetForUpstreamResponse, error) {
+	e, err := toEntity(body)
+	if err != nil {
+		return nil, fmt.Errorf("failed to encode target: %w", err)
+	}
+
+	err = a.config.update(ctx, func() error {
+		upstream := a.findUpstream(upstreamIdOrName)
+		if upstream == nil {
+			return fmt.Errorf("failed to create target: upstream %q does not exist", upstreamIdOrName)
+		}
+		upstreamId, _ := upstream["id"].(string)
+		e["upstream"] = ref(upstreamId)
+
+		// An upstream has every target at most once, so an existing one is replaced.
+		target, _ := e["target"].(string)
+		key := entityId(kindTargets, upstreamId+"/"+target)
+		for existingKey, existing := range a.config.entities[kindTargets] {
+			if refId(existing["upstream"]) == upstreamId && existing["target"] == target {
+				key = existingKey
+				e["id"] = existing["id"]
+			}
+		}
+		a.config.put(kindTargets, key, e)
+		return nil
+	})
+	if err != nil {
+		return nil, err
+	}
+
+	target, err := fromEntity[kong.Target](e)
+	if err != nil {
+		return nil, err
+	}
+	return &kong.CreateTargetForUpstreamResponse{
+		HTTPResponse: &http.Response{StatusCode: http.StatusCreated},
+		JSON200:      target,
+	}, nil
+}
+
+func (a *declarativeAdminApi) DeleteUpstreamWithResponse(ctx context.Context, upstreamIdOrName string, _ ...kong.RequestEditorFn) (*kong.DeleteUpstreamResponse, error) {
+	err := a.config.update(ctx, func() error {
+		upstream := a.findUpstream(upstreamIdOrName)
+		if upstream == nil {
+			return nil
+		}
+		a.config.removeWhere(kindTargets, referencing("upstream", upstream["id"]))
+		a.config.remove(kindUpstreams, entityKey(kindUpstreams, upstream))
+		return nil
+	})
+	if err != nil {
+		return nil, err
+	}
+	return &kong.DeleteUpstreamResponse{
+		HTTPResponse: &http.Response{StatusCode: http.StatusNoContent},
+	}, nil
+}
+
+func (a *declarativeAdminApi) DeleteUpstreamTargetWithResponse(ctx context.Context, upstreamIdOrName string, targetIdOrTarget string, _ ...kong.RequestEditorFn) (*kong.DeleteUpstreamTargetResponse, error) {
+	err := a.config.update(ctx, func() error {
+		upstream := a.findUpstream(upstreamIdOrName)
+		if upstream == nil {
+			return nil
+		}
+		a.config.removeWhere(kindTargets, func(e entity) bool {
+			return refId(e["upstream"]) == upstream["id"] &&
+				(e["id"] == targetIdOrTarget || e["target"] == targetIdOrTarget)
+		})
+		return nil
+	})
+	if err != nil {
+		return nil, err
+	}
+	return &kong.DeleteUpstreamTargetResponse{
+		HTTPResponse: &http.Response{StatusCode: http.StatusNoContent},
+	}, nil
+}
+
+// findUpstream returns the upstream with the given name or id.
+// Must be called with a.config.mutex held.
+func (a *declarativeAdminApi) findUpstream(idOrName string) entity {
+	if e, ok := a.config.get(kindUpstreams, idOrName); ok {
+		return e
+	}
+	for _, e := range a.config.entities[kindUpstreams] {
+		if e["id"] == idOrName {
+			return e
+		}
+	}
+	return nil
+}
@@ -0,0 +1,73 @@
+// Copyright 2026 Deutsche Telekom IT GmbH
+//
+// SPDX-License-Identifier: Apache-2.0
+
+package client
+
+import (
+	"context"
+	"fmt"
+	"net/http"
+	"testing"
+	"time"
+
+	"github.com/telekom/controlplane/common/pkg/util/contextutil"
+
+	kong "github.com/telekom/controlplane/gateway/pkg/kong/api"
+)
+
+// BenchmarkConvergence measures the time until the routes and plugins of a
+// gateway are applied, with every admin API request taking a millisecond.
+func BenchmarkConvergence(b *testing.B) {
+	const routes = 50
+	plugins := []string{"acl", "rate-limiting", "request-transformer"}
+
+	ctx := contextutil.WithEnv(context.Background(), "bench")
+	upstream := &CustomUpstream{Scheme: "http", Host: "upstream.local", Port: 8080, Path: "/api"}
+
+	apply := func(b *testing.B, kc KongClient) {
+		for i := range routes {
+			route := fmt.Sprintf("route-%d", i)
+			if err := kc.CreateOrReplaceRoute(ctx, &testRoute{Name: route}, upstream); err != nil {
+				b.Fatal(err)
+			}
+			for _, plugin := range plugins {
+				if _, err := kc.CreateOrReplacePlugin(ctx, &testPlugin{Name: plugin, Route: &route}); err != nil {
+					b.Fatal(err)
+				}
+			}
+		}
+	}
+
+	newAdmin := func(b *testing.B) (*fakeAdmin, *kong.ClientWithResponses) {
+		admin := newFakeAdmin()
+		admin.delay = time.Millisecond
+		b.Cleanup(admin.Close)
+		api, err := kong.NewClientWithResponses(admin.URL)
+		if err != nil {
+			b.Fatal(err)
+		}
+		return admin, api
+	}
+
+	b.Run("imperative", func(b *testing.B) {
+		admin, api := newAdmin(b)
+		for range b.N {
+			apply(b, NewKongClient(api))
+		}
+		b.ReportMetric(float64(admin.WriteCalls())/float64(b.N), "writes/op")
+	})
+
+	b.Run("declarative", func(b *testing.B) {
+		admin, api := newAdmin(b)
+		for range b.N {
+			pushCalls := admin.PushCalls()
+			apply(b, NewDeclarativeKongClient(api, http.DefaultClient, admin.URL, 10*time.Millisecond, 100*time.Millisecond, 0))
+			// The configuration is applied once it was pushed.
+			for admin.PushCalls() == pushCalls {
+				time.Sleep(time.Millisecond)
+			}
+		}
+		b.ReportMetric(float64(admin.PushCalls())/float64(b.N), "pushes/op")
+	})
+}
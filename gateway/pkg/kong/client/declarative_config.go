@@ -0,0 +1,632 @@
+// Copyright 2026 Deutsche Telekom IT GmbH
+//
+// SPDX-License-Identifier: Apache-2.0
+
+package client
+
+import (
+	"bytes"
+	"context"
+	"encoding/json"
+	"fmt"
+	"io"
+	"maps"
+	"net/http"
+	"net/url"
+	"slices"
+	"strconv"
+	"sync"
+	"time"
+
+	"github.com/go-logr/logr"
+	"github.com/google/uuid"
+
+	kong "github.com/telekom/controlplane/gateway/pkg/kong/api"
+)
+
+// Kinds of entities of a declarative configuration, in the order in which
+// they are rendered.
+const (
+	kindServices  = "services"
+	kindRoutes    = "routes"
+	kindConsumers = "consumers"
+	kindAcls      = "acls"
+	kindUpstreams = "upstreams"
+	kindTargets   = "targets"
+	kindPlugins   = "plugins"
+)
+
+var declarativeKinds = []string{kindServices, kindRoutes, kindConsumers, kindAcls, kindUpstreams, kindTargets, kindPlugins}
+
+// preservedKinds are the kinds of entities that this client never changes,
+// mapped to the admin API path that lists them. They are loaded and pushed
+// back unchanged, as pushing a configuration deletes everything it does not
+// contain. The paths of entities of plugins that are not enabled do not exist
+// and are skipped.
+var preservedKinds = map[string]string{
+	"certificates":          "/certificates",
+	"snis":                  "/snis",
+	"ca_certificates":       "/ca_certificates",
+	"vaults":                "/vaults",
+	"key_sets":              "/key-sets",
+	"keys":                  "/keys",
+	"consumer_groups":       "/consumer_groups",
+	"jwt_secrets":           "/jwts",
+	"keyauth_credentials":   "/key-auths",
+	"basicauth_credentials": "/basic-auths",
+	"hmacauth_credentials":  "/hmac-auths",
+	"oauth2_credentials":    "/oauth2",
+}
+
+// renderedKinds are all kinds of a declarative configuration, in the order
+// in which they are rendered.
+var renderedKinds = slices.Concat(declarativeKinds, slices.Sorted(maps.Keys(preservedKinds)))
+
+// foreignKeys are the fields that reference other entities. The admin API
+// returns them as {"id": "..."}, the declarative configuration expects the id.
+var foreignKeys = []string{"service", "route", "consumer", "upstream", "certificate", "client_certificate", "set", "consumer_group"}
+
+// declarativeFormatVersion is the version of the declarative configuration format.
+const declarativeFormatVersion = "3.0"
+
+// entity is a Kong entity as returned by the admin API.
+type entity = map[string]any
+
+// declarativeConfig is the complete configuration of a Kong instance that
+// runs without a database. It is loaded from the admin API once and then only
+// changed by this client, which makes it the source of truth that is pushed
+// to the /config endpoint.
+type declarativeConfig struct {
+	doer   kong.HttpRequestDoer
+	server string
+
+	// loadMutex serializes loads, so that concurrent callers wait for the
+	// same load.
+	loadMutex sync.Mutex
+
+	mutex  sync.Mutex
+	loaded bool
+	// entities maps kind -> key -> entity. Services, routes and upstreams are
+	// keyed by name, consumers by username and all others by id.
+	entities map[string]map[string]entity
+	// pluginsByTag maps tag -> keys of the plugins with this tag and
+	// aclsByConsumer maps consumer id -> keys of its ACLs, so that they are
+	// found without scanning all entities.
+	pluginsByTag   map[string]map[string]struct{}
+	aclsByConsumer map[string]map[string]struct{}
+
+	// pushErr is the error of the last push, guarded by mutex.
+	pushErr error
+
+	// pushMutex serializes pushes, so that an older configuration can never
+	// overwrite a newer one.
+	pushMutex sync.Mutex
+	pusher    *debouncer
+}
+
+func newDeclarativeConfig(doer kong.HttpRequestDoer, server string, delay, maxDelay, refresh time.Duration) *declarativeConfig {
+	c := &declarativeConfig{
+		doer:   doer,
+		server: server,
+	}
+	c.setEntities(emptyEntities())
+	c.pusher = newDebouncer(delay, maxDelay, refresh, c.push)
+	return c
+}
+
+func emptyEntities() map[string]map[string]entity {
+	entities := make(map[string]map[string]entity, len(renderedKinds))
+	for _, kind := range renderedKinds {
+		entities[kind] = make(map[string]entity)
+	}
+	return entities
+}
+
+// update loads the configuration if necessary, applies fn to it and schedules
+// a push of the changed configuration.
+func (c *declarativeConfig) update(ctx context.Context, fn func() error) error {
+	if err := c.ensureLoaded(ctx); err != nil {
+		return err
+	}
+	c.mutex.Lock()
+	err := fn()
+	c.mutex.Unlock()
+	if err != nil {
+		return err
+	}
+	c.pusher.Schedule(logr.FromContextOrDiscard(ctx))
+	return nil
+}
+
+// read loads the configuration if necessary and applies fn to it.
+func (c *declarativeConfig) read(ctx context.Context, fn func()) error {
+	if err := c.ensureLoaded(ctx); err != nil {
+		return err
+	}
+	c.mutex.Lock()
+	defer c.mutex.Unlock()
+	fn()
+	return nil
+}
+
+// put adds or replaces the entity under key and returns its id. The id of
+// an existing entity is kept, new entities get a deterministic id.
+// Must be called with c.mutex held.
+func (c *declarativeConfig) put(kind, key string, e entity) string {
+	existing, exists := c.entities[kind][key]
+	id, _ := e["id"].(string)
+	if id == "" && exists {
+		id, _ = existing["id"].(string)
+	}
+	if id == "" {
+		id = entityId(kind, key)
+	}
+	e["id"] = id
+	// Entities are stored as decoded from JSON, like the loaded ones, so that
+	// both can be matched the same way.
+	if normalized, err := toEntity(e); err == nil {
+		e = normalized
+	}
+	if exists {
+		c.unindex(kind, key, existing)
+	}
+	c.entities[kind][key] = e
+	c.index(kind, key, e)
+	return id
+}
+
+// remove removes the entity of kind under key.
+// Must be called with c.mutex held.
+func (c *declarativeConfig) remove(kind, key string) {
+	if e, ok := c.entities[kind][key]; ok {
+		c.unindex(kind, key, e)
+		delete(c.entities[kind], key)
+	}
+}
+
+// get returns the entity of kind under key.
+// Must be called with c.mutex held.
+func (c *declarativeConfig) get(kind, key string) (entity, bool) {
+	e, ok := c.entities[kind][key]
+	return e, ok
+}
+
+// removeWhere removes all entities of kind that match.
+// Must be called with c.mutex held.
+func (c *declarativeConfig) removeWhere(kind string, match func(entity) bool) {
+	maps.DeleteFunc(c.entities[kind], func(key string, e entity) bool {
+		if !match(e) {
+			return false
+		}
+		c.unindex(kind, key, e)
+		return true
+	})
+}
+
+// pluginsWithTags returns the keys of all plugins that have all of the given
+// tags, like a list request of the Kong admin API with tags concatenated by ','.
+// Must be called with c.mutex held.
+func (c *declarativeConfig) pluginsWithTags(tags []string) []string {
+	// Only the plugins of the most selective tag need to be checked.
+	var candidates map[string]struct{}
+	for _, tag := range tags {
+		keys := c.pluginsByTag[tag]
+		if candidates == nil || len(keys) < len(candidates) {
+			candidates = keys
+		}
+	}
+
+	var keys []string
+	for key := range candidates {
+		if hasAllEntityTags(c.entities[kindPlugins][key], tags) {
+			keys = append(keys, key)
+		}
+	}
+	return keys
+}
+
+// consumerAcls returns the keys of the ACLs of the consumer with the given id.
+// Must be called with c.mutex held.
+func (c *declarativeConfig) consumerAcls(consumerId string) []string {
+	return slices.Collect(maps.Keys(c.aclsByConsumer[consumerId]))
+}
+
+// setEntities replaces all entities and rebuilds the indexes.
+// Must be called with c.mutex held.
+func (c *declarativeConfig) setEntities(entities map[string]map[string]entity) {
+	c.entities = entities
+	c.pluginsByTag = make(map[string]map[string]struct{})
+	c.aclsByConsumer = make(map[string]map[string]struct{})
+	for kind, byKey := range entities {
+		for key, e := range byKey {
+			c.index(kind, key, e)
+		}
+	}
+}
+
+// index adds the entity of kind under key to the indexes.
+// Must be called with c.mutex held.
+func (c *declarativeConfig) index(kind, key string, e entity) {
+	switch kind {
+	case kindPlugins:
+		for _, tag := range entityTags(e) {
+			addToIndex(c.pluginsByTag, tag, key)
+		}
+	case kindAcls:
+		addToIndex(c.aclsByConsumer, refId(e["consumer"]), key)
+	}
+}
+
+// unindex removes the entity of kind under key from the indexes.
+// Must be called with c.mutex held.
+func (c *declarativeConfig) unindex(kind, key string, e entity) {
+	switch kind {
+	case kindPlugins:
+		for _, tag := range entityTags(e) {
+			removeFromIndex(c.pluginsByTag, tag, key)
+		}
+	case kindAcls:
+		removeFromIndex(c.aclsByConsumer, refId(e["consumer"]), key)
+	}
+}
+
+func addToIndex(index map[string]map[string]struct{}, value, key string) {
+	keys, ok := index[value]
+	if !ok {
+		keys = make(map[string]struct{})
+		index[value] = keys
+	}
+	keys[key] = struct{}{}
+}
+
+func removeFromIndex(index map[string]map[string]struct{}, value, key string) {
+	delete(index[value], key)
+	if len(index[value]) == 0 {
+		delete(index, value)
+	}
+}
+
+func (c *declarativeConfig) ensureLoaded(ctx context.Context) error {
+	c.mutex.Lock()
+	loaded := c.loaded
+	c.mutex.Unlock()
+	if loaded {
+		return nil
+	}
+
+	c.loadMutex.Lock()
+	defer c.loadMutex.Unlock()
+	c.mutex.Lock()
+	loaded = c.loaded
+	c.mutex.Unlock()
+	if loaded {
+		return nil
+	}
+
+	entities, err := c.load(ctx)
+	if err != nil {
+		return fmt.Errorf("failed to load declarative config: %w", err)
+	}
+	c.mutex.Lock()
+	defer c.mutex.Unlock()
+	c.setEntities(entities)
+	c.loaded = true
+	return nil
+}
+
+// load lists all entities of the Kong instance. Pushing a configuration
+// replaces everything, so it must start from what is already configured.
+func (c *declarativeConfig) load(ctx context.Context) (map[string]map[string]entity, error) {
+	entities := emptyEntities()
+	for _, kind := range declarativeKinds {
+		if kind == kindTargets {
+			continue
+		}
+		list, err := c.list(ctx, "/"+kind, false)
+		if err != nil {
+			return nil, err
+		}
+		for _, e := range list {
+			entities[kind][entityKey(kind, e)] = e
+		}
+	}
+	// Targets can only be listed per upstream
+	for _, upstream := range entities[kindUpstreams] {
+		list, err := c.list(ctx, "/upstreams/"+url.PathEscape(fmt.Sprint(upstream["id"]))+"/targets", false)
+		if err != nil {
+			return nil, err
+		}
+		for _, e := range list {
+			entities[kindTargets][entityKey(kindTargets, e)] = e
+		}
+	}
+	for kind, path := range preservedKinds {
+		list, err := c.list(ctx, path, true)
+		if err != nil {
+			return nil, err
+		}
+		for _, e := range list {
+			entities[kind][entityKey(kind, e)] = e
+		}
+	}
+	return entities, nil
+}
+
+// list returns all entities of the given admin API path, following the
+// pagination of the Kong admin API. If optional is set, a path that does not
+// exist has no entities.
+func (c *declarativeConfig) list(ctx context.Context, path string, optional bool) ([]entity, error) {
+	type ResponseBody struct {
+		Data   []entity `json:"data"`
+		Offset *string  `json:"offset"`
+	}
+
+	var entities []entity
+	query := url.Values{"size": {strconv.Itoa(listPageSize)}}
+	for {
+		req, err := http.NewRequestWithContext(ctx, http.MethodGet, c.server+path+"?"+query.Encode(), nil)
+		if err != nil {
+			return nil, err
+		}
+		okStatusCodes := []int{http.StatusOK}
+		if optional {
+			okStatusCodes = append(okStatusCodes, http.StatusNotFound)
+		}
+		body, err := c.do(req, okStatusCodes...)
+		if err != nil {
+			return nil, fmt.Errorf("failed to list %s: %w", path, err)
+		}
+
+		var responseBody ResponseBody
+		if err := json.Unmarshal(body, &responseBody); err != nil {
+			return nil, err
+		}
+		for _, e := range responseBody.Data {
+			entities = append(entities, withoutReadOnlyFields(e))
+		}
+
+		if responseBody.Offset == nil || *responseBody.Offset == "" {
+			return entities, nil
+		}
+		query.Set("offset", *responseBody.Offset)
+	}
+}
+
+// push sends the complete configuration to the /config endpoint and records
+// its result.
+func (c *declarativeConfig) push(ctx context.Context) error {
+	c.pushMutex.Lock()
+	defer c.pushMutex.Unlock()
+
+	err := c.pushOnce(ctx)
+	result := "succeeded"
+	if err != nil {
+		result = "failed"
+	}
+	DeclarativeConfigPushes.WithLabelValues(c.server, result).Inc()
+
+	c.mutex.Lock()
+	c.pushErr = err
+	c.mutex.Unlock()
+	return err
+}
+
+func (c *declarativeConfig) pushOnce(ctx context.Context) error {
+	c.mutex.Lock()
+	body, err := json.Marshal(c.render())
+	c.mutex.Unlock()
+	if err != nil {
+		return fmt.Errorf("failed to render declarative config: %w", err)
+	}
+
+	// check_hash makes Kong skip the reload if the configuration did not change
+	req, err := http.NewRequestWithContext(ctx, http.MethodPost, c.server+"/config?check_hash=1", bytes.NewReader(body))
+	if err != nil {
+		return err
+	}
+	req.Header.Set("Content-Type", "application/json")
+	if _, err := c.do(req, http.StatusOK, http.StatusCreated, http.StatusNoContent); err != nil {
+		return fmt.Errorf("failed to push declarative config: %w", err)
+	}
+	logr.FromContextOrDiscard(ctx).V(1).Info("pushed declarative config", "bytes", len(body))
+	return nil
+}
+
+// pushError returns the error of the last push, or nil if it succeeded.
+func (c *declarativeConfig) pushError() error {
+	c.mutex.Lock()
+	defer c.mutex.Unlock()
+	return c.pushErr
+}
+
+// render returns the configuration in the flat declarative format, with all
+// entities sorted by key and references as ids.
+// Must be called with c.mutex held.
+func (c *declarativeConfig) render() map[string]any {
+	config := map[string]any{
+		"_format_version": declarativeFormatVersion,
+	}
+	for _, kind := range renderedKinds {
+		if _, ok := preservedKinds[kind]; ok && len(c.entities[kind]) == 0 {
+			// Kong rejects the kinds of plugins that are not enabled
+			continue
+		}
+		keys := slices.Sorted(maps.Keys(c.entities[kind]))
+		rendered := make([]entity, 0, len(keys))
+		for _, key := range keys {
+			e := maps.Clone(c.entities[kind][key])
+			for _, field := range foreignKeys {
+				if id := refId(e[field]); id != "" {
+					e[field] = id
+				}
+			}
+			rendered = append(rendered, e)
+		}
+		config[kind] = rendered
+	}
+	return config
+}
+
+func (c *declarativeConfig) do(req *http.Request, okStatusCodes ...int) ([]byte, error) {
+	res, err := c.doer.Do(req)
+	if err != nil {
+		return nil, HandleClientError(err)
+	}
+	defer res.Body.Close() //nolint:errcheck
+	body, err := io.ReadAll(res.Body)
+	if err != nil {
+		return nil, fmt.Errorf("failed to read response body: %w", err)
+	}
+	if err := CheckStatusCode(WrapApiResponse(res), okStatusCodes...); err != nil {
+		return nil, fmt.Errorf("(%d): %s: %w", res.StatusCode, string(body), err)
+	}
+	return body, nil
+}
+
+// entityKey returns the key of an entity loaded from the admin API.
+// Unnamed entities are keyed by id.
+func entityKey(kind string, e entity) string {
+	field := ""
+	switch kind {
+	case kindServices, kindRoutes, kindUpstreams:
+		field = "name"
+	case kindConsumers:
+		field = "username"
+	}
+	if key, ok := e[field].(string); ok && key != "" {
+		return key
+	}
+	return fmt.Sprint(e["id"])
+}
+
+// entityId returns a deterministic id for a new entity, so that its id does
+// not change between restarts of the operator.
+func entityId(kind, key string) string {
+	return uuid.NewSHA1(uuid.NameSpaceURL, []byte("kong:"+kind+"/"+key)).String()
+}
+
+// ref returns a reference to the entity with the given id, as returned by the
+// admin API.
+func ref(id string) map[string]any {
+	return map[string]any{"id": id}
+}
+
+// refId returns the id of a reference, or "" if v is not a reference.
+func refId(v any) string {
+	if r, ok := v.(map[string]any); ok {
+		id, _ := r["id"].(string)
+		return id
+	}
+	return ""
+}
+
+// withoutReadOnlyFields removes the fields that the declarative configuration
+// does not accept: timestamps and unset fields.
+func withoutReadOnlyFields(e entity) entity {
+	delete(e, "created_at")
+	delete(e, "updated_at")
+	maps.DeleteFunc(e, func(_ string, v any) bool { return v == nil })
+	return e
+}
+
+// toEntity converts a request body or config into an entity.
+func toEntity(v any) (entity, error) {
+	raw, err := json.Marshal(v)
+	if err != nil {
+		return nil, err
+	}
+	var e entity
+	if err := json.Unmarshal(raw, &e); err != nil {
+		return nil, err
+	}
+	return e, nil
+}
+
+// fromEntity converts an entity into a response type of the admin API.
+func fromEntity[T any](e entity) (*T, error) {
+	raw, err := json.Marshal(e)
+	if err != nil {
+		return nil, err
+	}
+	var t T
+	if err := json.Unmarshal(raw, &t); err != nil {
+		return nil, err
+	}
+	return &t, nil
+}
+
+// debouncer runs fn once no change was scheduled for delay, but at the latest
+// maxDelay after the first change that was not run yet. This way a burst of
+// changes results in a single push.
+// A failed run is retried after maxDelay. A successful run is repeated after
+// refresh, if set, so that a restarted gateway gets its configuration again.
+type debouncer struct {
+	delay    time.Duration
+	maxDelay time.Duration
+	refresh  time.Duration
+	fn       func(context.Context) error
+
+	mutex sync.Mutex
+	timer *time.Timer
+	// refreshing is set while the timer only repeats the last run.
+	refreshing bool
+	first      time.Time
+	log        logr.Logger
+}
+
+func newDebouncer(delay, maxDelay, refresh time.Duration, fn func(context.Context) error) *debouncer {
+	return &debouncer{
+		delay:    delay,
+		maxDelay: max(delay, maxDelay),
+		refresh:  refresh,
+		fn:       fn,
+	}
+}
+
+// Schedule schedules a run of fn.
+func (d *debouncer) Schedule(log logr.Logger) {
+	d.mutex.Lock()
+	defer d.mutex.Unlock()
+	d.log = log
+	now := time.Now()
+	if d.refreshing {
+		d.timer.Stop()
+		d.timer = nil
+		d.refreshing = false
+	}
+	if d.timer == nil {
+		d.first = now
+		d.timer = time.AfterFunc(d.delay, d.run)
+		return
+	}
+	d.timer.Reset(max(min(d.delay, d.first.Add(d.maxDelay).Sub(now)), 0))
+}
+
+func (d *debouncer) run() {
+	d.mutex.Lock()
+	d.timer = nil
+	d.refreshing = false
+	log := d.log
+	d.mutex.Unlock()
+
+	ctx := logr.NewContext(context.Background(), log)
+	err := d.fn(ctx)
+	if err != nil {
+		log.Error(err, "failed to run, retrying", "delay", d.maxDelay)
+	}
+
+	d.mutex.Lock()
+	defer d.mutex.Unlock()
+	if d.timer != nil {
+		// a change was scheduled meanwhile
+		return
+	}
+	switch {
+	case err != nil:
+		d.first = time.Now()
+		d.timer = time.AfterFunc(d.maxDelay, d.run)
+	case d.refresh > 0:
+		d.refreshing = true
+		d.timer = time.AfterFunc(d.refresh, d.run)
+	}
+}
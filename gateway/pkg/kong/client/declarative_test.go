@@ -0,0 +1,251 @@
+// Copyright 2026 Deutsche Telekom IT GmbH
+//
+// SPDX-License-Identifier: Apache-2.0
+
+package client
+
+import (
+	"context"
+	"fmt"
+	"net/http"
+	"sync/atomic"
+	"time"
+
+	. "github.com/onsi/ginkgo/v2"
+	. "github.com/onsi/gomega"
+	"github.com/prometheus/client_golang/prometheus/testutil"
+	"github.com/telekom/controlplane/common/pkg/util/contextutil"
+
+	kong "github.com/telekom/controlplane/gateway/pkg/kong/api"
+)
+
+var _ = Describe("Declarative client", func() {
+	var (
+		ctx      context.Context
+		admin    *fakeAdmin
+		upstream *CustomUpstream
+		kc       KongClient
+	)
+
+	BeforeEach(func() {
+		ctx = contextutil.WithEnv(context.Background(), "test")
+		admin = newFakeAdmin()
+		DeferCleanup(admin.Close)
+		upstream = &CustomUpstream{Scheme: "http", Host: "upstream.local", Port: 8080, Path: "/api"}
+
+		api, err := kong.NewClientWithResponses(admin.URL)
+		Expect(err).NotTo(HaveOccurred())
+		kc = NewDeclarativeKongClient(api, http.DefaultClient, admin.URL, 50*time.Millisecond, time.Second, 0)
+	})
+
+	routePlugin := func(name, route string) *testPlugin {
+		return &testPlugin{Name: name, Route: &route, Config: map[string]any{"enabled": true}}
+	}
+
+	It("keeps the existing entities of the gateway", func() {
+		admin.AddEntity(kindServices, entity{"id": "service-external", "name": "external"})
+		admin.AddEntity(kindRoutes, entity{"id": "route-external", "name": "external", "service": ref("service-external")})
+		admin.AddPlugin("plugin-external", "acl", BuildTag("env", "test"), BuildTag("route", "external"))
+
+		Expect(kc.CreateOrReplaceRoute(ctx, &testRoute{Name: "route-a"}, upstream)).To(Succeed())
+
+		Eventually(admin.PushCalls).Should(Equal(1))
+		Expect(admin.Config(kindRoutes)).To(ConsistOf("external", "route-a"))
+		Expect(admin.Config(kindPlugins)).To(ConsistOf("plugin-external"))
+		Expect(admin.ConfigEntity(kindRoutes, "external")).To(HaveKeyWithValue("service", "service-external"))
+		Expect(admin.WriteCalls()).To(BeZero())
+	})
+
+	It("keeps the entities of kinds that it does not change", func() {
+		admin.AddEntity("certificates", entity{"id": "certificate-external", "cert": "cert", "key": "key"})
+		admin.AddEntity("snis", entity{"id": "sni-external", "name": "example.com", "certificate": ref("certificate-external")})
+
+		Expect(kc.CreateOrReplaceRoute(ctx, &testRoute{Name: "route-a"}, upstream)).To(Succeed())
+
+		Eventually(admin.PushCalls).Should(Equal(1))
+		Expect(admin.Config("certificates")).To(ConsistOf("certificate-external"))
+		Expect(admin.ConfigEntity("snis", "sni-external")).To(HaveKeyWithValue("certificate", "certificate-external"))
+		Expect(admin.Config("jwt_secrets")).To(BeEmpty())
+	})
+
+	It("pushes a burst of changes at once", func() {
+		for i := range 20 {
+			route := fmt.Sprintf("route-%d", i)
+			Expect(kc.CreateOrReplaceRoute(ctx, &testRoute{Name: route}, upstream)).To(Succeed())
+			_, err := kc.CreateOrReplacePlugin(ctx, routePlugin("acl", route))
+			Expect(err).NotTo(HaveOccurred())
+		}
+
+		Eventually(admin.PushCalls).Should(Equal(1))
+		Consistently(admin.PushCalls, 200*time.Millisecond).Should(Equal(1))
+		Expect(admin.Config(kindRoutes)).To(HaveLen(20))
+		Expect(admin.Config(kindPlugins)).To(HaveLen(20))
+
+		service := admin.ConfigEntity(kindServices, "route-0")
+		Expect(admin.ConfigEntity(kindRoutes, "route-0")).To(HaveKeyWithValue("service", service["id"]))
+	})
+
+	It("replaces plugins instead of adding them", func() {
+		Expect(kc.CreateOrReplaceRoute(ctx, &testRoute{Name: "route-a"}, upstream)).To(Succeed())
+
+		first := routePlugin("acl", "route-a")
+		_, err := kc.CreateOrReplacePlugin(ctx, first)
+		Expect(err).NotTo(HaveOccurred())
+		second := routePlugin("acl", "route-a")
+		second.Config = map[string]any{"enabled": false}
+		_, err = kc.CreateOrReplacePlugin(ctx, second)
+		Expect(err).NotTo(HaveOccurred())
+
+		Expect(second.GetId()).To(Equal(first.GetId()))
+		Eventually(admin.PushCalls).Should(Equal(1))
+		Expect(admin.Config(kindPlugins)).To(ConsistOf(first.GetId()))
+		Expect(admin.ConfigEntity(kindPlugins, first.GetId())).To(HaveKeyWithValue("config", HaveKeyWithValue("enabled", false)))
+	})
+
+	It("fails to create a plugin of an unknown route", func() {
+		_, err := kc.CreateOrReplacePlugin(ctx, routePlugin("acl", "route-a"))
+		Expect(err).To(MatchError(ContainSubstring(`route "route-a" does not exist`)))
+	})
+
+	It("deletes the plugins and upstream of a deleted route", func() {
+		route := &testRoute{Name: "route-a"}
+		Expect(kc.CreateOrReplaceRoute(ctx, route, upstream)).To(Succeed())
+		_, err := kc.CreateOrReplacePlugin(ctx, routePlugin("acl", "route-a"))
+		Expect(err).NotTo(HaveOccurred())
+
+		target := "localhost:8080"
+		_, err = kc.GetKongAdminApi().UpsertUpstreamWithResponse(ctx, "route-a", kong.UpsertUpstreamJSONRequestBody{Name: "route-a"})
+		Expect(err).NotTo(HaveOccurred())
+		_, err = kc.GetKongAdminApi().CreateTargetForUpstreamWithResponse(ctx, "route-a", kong.CreateTargetForUpstreamJSONRequestBody{Target: &target})
+		Expect(err).NotTo(HaveOccurred())
+
+		Expect(kc.DeleteRoute(ctx, route)).To(Succeed())
+
+		Eventually(admin.PushCalls).Should(Equal(1))
+		for _, kind := range declarativeKinds {
+			Expect(admin.Config(kind)).To(BeEmpty(), kind)
+		}
+	})
+
+	It("adds consumers to the group of their name", func() {
+		consumer := &testConsumer{Name: "consumer-a"}
+		_, err := kc.CreateOrReplaceConsumer(ctx, consumer)
+		Expect(err).NotTo(HaveOccurred())
+		_, err = kc.CreateOrReplaceConsumer(ctx, consumer)
+		Expect(err).NotTo(HaveOccurred())
+
+		Eventually(admin.PushCalls).Should(Equal(1))
+		Expect(admin.Config(kindConsumers)).To(ConsistOf("consumer-a"))
+		Expect(admin.Config(kindAcls)).To(HaveLen(1))
+		acl := admin.ConfigEntity(kindAcls, admin.Config(kindAcls)[0])
+		Expect(acl).To(HaveKeyWithValue("consumer", consumer.Id))
+		Expect(acl).To(HaveKeyWithValue("group", "consumer-a"))
+	})
+
+	It("keeps the indexes of plugins and ACLs up to date", func() {
+		admin.AddEntity(kindConsumers, entity{"id": "consumer-external", "username": "external"})
+		admin.AddEntity(kindAcls, entity{"id": "acl-external", "consumer": ref("consumer-external"), "group": "external"})
+		admin.AddPlugin("plugin-external", "acl",
+			BuildTag("env", "test"), BuildTag("plugin", "acl"), BuildTag("route", "route-a"), BuildTag("consumer", "none"))
+
+		route := &testRoute{Name: "route-a"}
+		Expect(kc.CreateOrReplaceRoute(ctx, route, upstream)).To(Succeed())
+		kept := routePlugin("acl", "route-a")
+		_, err := kc.CreateOrReplacePlugin(ctx, kept)
+		Expect(err).NotTo(HaveOccurred())
+		_, err = kc.CreateOrReplacePlugin(ctx, routePlugin("rate-limiting", "route-a"))
+		Expect(err).NotTo(HaveOccurred())
+
+		// The loaded plugin has the same tags and is replaced
+		Expect(kept.GetId()).To(Equal("plugin-external"))
+		Expect(kc.CleanupPlugins(ctx, route, nil, []CustomPlugin{kept})).To(Succeed())
+		_, err = kc.CreateOrReplaceConsumer(ctx, &testConsumer{Name: "external"})
+		Expect(err).NotTo(HaveOccurred())
+
+		Eventually(admin.PushCalls).Should(Equal(1))
+		Expect(admin.Config(kindPlugins)).To(ConsistOf("plugin-external"))
+		Expect(admin.Config(kindAcls)).To(ConsistOf("acl-external"))
+
+		Expect(kc.DeleteRoute(ctx, route)).To(Succeed())
+		Expect(kc.DeleteConsumer(ctx, &testConsumer{Name: "external"})).To(Succeed())
+		config := kc.(*declarativeClient).config
+		Expect(config.pluginsByTag).To(BeEmpty())
+		Expect(config.aclsByConsumer).To(BeEmpty())
+	})
+
+	It("pushes the configuration again periodically", func() {
+		api, err := kong.NewClientWithResponses(admin.URL)
+		Expect(err).NotTo(HaveOccurred())
+		kc = NewDeclarativeKongClient(api, http.DefaultClient, admin.URL, 50*time.Millisecond, time.Second, 100*time.Millisecond)
+
+		Expect(kc.CreateOrReplaceRoute(ctx, &testRoute{Name: "route-a"}, upstream)).To(Succeed())
+
+		Eventually(admin.PushCalls).Should(BeNumerically(">=", 3))
+		Expect(admin.Config(kindRoutes)).To(ConsistOf("route-a"))
+	})
+
+	It("reports failed pushes until a push succeeds", func() {
+		failed := testutil.ToFloat64(DeclarativeConfigPushes.WithLabelValues(admin.URL, "failed"))
+		admin.FailPushes(http.StatusBadRequest)
+
+		Expect(kc.CreateOrReplaceRoute(ctx, &testRoute{Name: "route-a"}, upstream)).To(Succeed())
+
+		Eventually(kc.(PushStatus).PushError).Should(MatchError(ContainSubstring("failed to push declarative config")))
+		Expect(testutil.ToFloat64(DeclarativeConfigPushes.WithLabelValues(admin.URL, "failed"))).To(BeNumerically(">", failed))
+
+		admin.FailPushes(0)
+		Eventually(kc.(PushStatus).PushError, 2*time.Second).Should(Succeed())
+		Expect(admin.Config(kindRoutes)).To(ConsistOf("route-a"))
+	})
+
+	It("creates every target of an upstream once", func() {
+		adminApi := kc.GetKongAdminApi()
+		upstreamResponse, err := adminApi.UpsertUpstreamWithResponse(ctx, "route-a", kong.UpsertUpstreamJSONRequestBody{Name: "route-a"})
+		Expect(err).NotTo(HaveOccurred())
+		Expect(CheckStatusCode(upstreamResponse, 200)).To(Succeed())
+
+		target := "localhost:8080"
+		for range 2 {
+			targetResponse, err := adminApi.CreateTargetForUpstreamWithResponse(ctx, "route-a", kong.CreateTargetForUpstreamJSONRequestBody{Target: &target})
+			Expect(err).NotTo(HaveOccurred())
+			Expect(CheckStatusCode(targetResponse, 200, 201)).To(Succeed())
+			Expect(targetResponse.JSON200.Id).NotTo(BeNil())
+		}
+
+		Eventually(admin.PushCalls).Should(Equal(1))
+		Expect(admin.Config(kindTargets)).To(HaveLen(1))
+		Expect(admin.ConfigEntity(kindTargets, admin.Config(kindTargets)[0])).
+			To(HaveKeyWithValue("upstream", *upstreamResponse.JSON200.Id))
+	})
+})
+
+var _ = Describe("Debouncer", func() {
+	It("repeats a successful run after the refresh interval", func() {
+		var runs atomic.Int32
+		d := newDebouncer(10*time.Millisecond, 50*time.Millisecond, 100*time.Millisecond, func(context.Context) error {
+			runs.Add(1)
+			return nil
+		})
+
+		d.Schedule(GinkgoLogr)
+		Eventually(runs.Load).Should(BeNumerically(">=", 3))
+	})
+
+	It("runs at the latest after the max delay", func() {
+		runs := make(chan time.Time, 10)
+		d := newDebouncer(100*time.Millisecond, 300*time.Millisecond, 0, func(context.Context) error {
+			runs <- time.Now()
+			return nil
+		})
+
+		start := time.Now()
+		for time.Since(start) < 500*time.Millisecond {
+			d.Schedule(GinkgoLogr)
+			time.Sleep(20 * time.Millisecond)
+		}
+
+		var first time.Time
+		Expect(runs).To(Receive(&first))
+		Expect(first.Sub(start)).To(BeNumerically("<", 450*time.Millisecond))
+	})
+})
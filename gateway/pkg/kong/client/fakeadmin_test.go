@@ -0,0 +1,342 @@
+// Copyright 2026 Deutsche Telekom IT GmbH
+//
+// SPDX-License-Identifier: Apache-2.0
+
+package client
+
+import (
+	"encoding/json"
+	"maps"
+	"net/http"
+	"net/http/httptest"
+	"slices"
+	"strconv"
+	"strings"
+	"sync"
+	"sync/atomic"
+	"time"
+
+	kong "github.com/telekom/controlplane/gateway/pkg/kong/api"
+)
+
+// fakeAdmin is a minimal in-memory Kong admin API for the plugin endpoints,
+// the upserts of services, routes and consumers and the /config endpoint.
+type fakeAdmin struct {
+	*httptest.Server
+
+	mutex     sync.Mutex
+	plugins   map[string]kong.Plugin
+	order     []string // plugin ids in creation order, for pagination
+	listCalls int
+
+	// entities maps kind -> name -> entity for all kinds except plugins.
+	entities map[string]map[string]entity
+	// config is the last configuration pushed to /config.
+	config     map[string]any
+	pushCalls  int
+	writeCalls int
+	// pushStatus is the status code of failing pushes, if set.
+	pushStatus int
+
+	// delay is the time every request takes.
+	delay time.Duration
+	// inFlight and maxInFlight count the concurrent requests.
+	inFlight    atomic.Int32
+	maxInFlight atomic.Int32
+}
+
+func newFakeAdmin() *fakeAdmin {
+	f := &fakeAdmin{plugins: make(map[string]kong.Plugin), entities: emptyEntities()}
+	f.Server = httptest.NewServer(http.HandlerFunc(f.serve))
+	return f
+}
+
+func (f *fakeAdmin) ListCalls() int {
+	f.mutex.Lock()
+	defer f.mutex.Unlock()
+	return f.listCalls
+}
+
+// MaxInFlight returns the highest number of concurrent requests.
+func (f *fakeAdmin) MaxInFlight() int {
+	return int(f.maxInFlight.Load())
+}
+
+// PushCalls returns the number of configurations pushed to /config.
+func (f *fakeAdmin) PushCalls() int {
+	f.mutex.Lock()
+	defer f.mutex.Unlock()
+	return f.pushCalls
+}
+
+// FailPushes makes the pushes to /config fail with the given status code,
+// or succeed again if it is 0.
+func (f *fakeAdmin) FailPushes(status int) {
+	f.mutex.Lock()
+	defer f.mutex.Unlock()
+	f.pushStatus = status
+}
+
+// WriteCalls returns the number of entity writes.
+func (f *fakeAdmin) WriteCalls() int {
+	f.mutex.Lock()
+	defer f.mutex.Unlock()
+	return f.writeCalls
+}
+
+// Config returns the names, or ids for unnamed entities, of the given kind
+// in the last pushed configuration.
+func (f *fakeAdmin) Config(kind string) []string {
+	f.mutex.Lock()
+	defer f.mutex.Unlock()
+	entities, _ := f.config[kind].([]any)
+	keys := make([]string, 0, len(entities))
+	for _, e := range entities {
+		keys = append(keys, entityKey(kind, e.(entity)))
+	}
+	return keys
+}
+
+// ConfigEntity returns the entity of kind with the given name or id in the
+// last pushed configuration.
+func (f *fakeAdmin) ConfigEntity(kind, key string) entity {
+	f.mutex.Lock()
+	defer f.mutex.Unlock()
+	entities, _ := f.config[kind].([]any)
+	for _, e := range entities {
+		if entityKey(kind, e.(entity)) == key {
+			return e.(entity)
+		}
+	}
+	return nil
+}
+
+// AddEntity adds an entity of kind as if it was created by someone else.
+func (f *fakeAdmin) AddEntity(kind string, e entity) {
+	f.mutex.Lock()
+	defer f.mutex.Unlock()
+	f.entities[kind][entityKey(kind, e)] = e
+}
+
+func (f *fakeAdmin) Plugins() map[string]kong.Plugin {
+	f.mutex.Lock()
+	defer f.mutex.Unlock()
+	return maps.Clone(f.plugins)
+}
+
+// AddPlugin adds a plugin as if it was created by someone else.
+func (f *fakeAdmin) AddPlugin(id string, name string, tags ...string) {
+	f.mutex.Lock()
+	defer f.mutex.Unlock()
+	f.store(kong.Plugin{Id: &id, Name: &name, Tags: &tags})
+}
+
+func (f *fakeAdmin) store(plugin kong.Plugin) {
+	if _, ok := f.plugins[*plugin.Id]; !ok {
+		f.order = append(f.order, *plugin.Id)
+	}
+	f.plugins[*plugin.Id] = plugin
+}
+
+func (f *fakeAdmin) serve(w http.ResponseWriter, r *http.Request) {
+	inFlight := f.inFlight.Add(1)
+	defer f.inFlight.Add(-1)
+	for current := f.maxInFlight.Load(); inFlight > current; current = f.maxInFlight.Load() {
+		if f.maxInFlight.CompareAndSwap(current, inFlight) {
+			break
+		}
+	}
+	time.Sleep(f.delay)
+
+	f.mutex.Lock()
+	defer f.mutex.Unlock()
+
+	parts := strings.Split(strings.Trim(r.URL.Path, "/"), "/")
+	id := parts[len(parts)-1]
+	switch {
+	case r.Method == http.MethodPost && r.URL.Path == "/config":
+		f.pushCalls++
+		if f.pushStatus != 0 {
+			w.WriteHeader(f.pushStatus)
+			return
+		}
+		if err := json.NewDecoder(r.Body).Decode(&f.config); err != nil {
+			w.WriteHeader(http.StatusBadRequest)
+			return
+		}
+		w.WriteHeader(http.StatusCreated)
+	case r.Method == http.MethodGet && r.URL.Path == "/plugins":
+		f.list(w, r)
+	case r.Method == http.MethodGet && len(parts) == 1:
+		f.listEntities(w, parts[0])
+	case r.Method == http.MethodPut && len(parts) == 2 && parts[0] != "plugins":
+		f.upsertEntity(w, r, parts[0], id)
+	case len(parts) == 3 && parts[0] == kindConsumers && parts[2] == kindAcls:
+		f.consumerAcls(w, r, parts[1])
+	case r.Method == http.MethodGet && len(parts) == 2 && parts[0] == "plugins":
+		plugin, ok := f.plugins[id]
+		if !ok {
+			w.WriteHeader(http.StatusNotFound)
+			return
+		}
+		writeJSON(w, plugin)
+	case r.Method == http.MethodPut && slices.Contains(parts, "plugins"):
+		// The route and consumer references of the request differ from the
+		// ones of the response, so only the relevant fields are decoded.
+		var body struct {
+			Name   *string         `json:"name"`
+			Config *map[string]any `json:"config"`
+			Tags   *[]string       `json:"tags"`
+		}
+		if err := json.NewDecoder(r.Body).Decode(&body); err != nil {
+			w.WriteHeader(http.StatusBadRequest)
+			return
+		}
+		plugin := kong.Plugin{Id: &id, Name: body.Name, Config: body.Config, Tags: body.Tags}
+		f.writeCalls++
+		f.store(plugin)
+		writeJSON(w, plugin)
+	case r.Method == http.MethodDelete && len(parts) == 2 && parts[0] == "plugins":
+		delete(f.plugins, id)
+		f.order = slices.DeleteFunc(f.order, func(other string) bool { return other == id })
+		w.WriteHeader(http.StatusNoContent)
+	default:
+		w.WriteHeader(http.StatusNotImplemented)
+	}
+}
+
+func (f *fakeAdmin) list(w http.ResponseWriter, r *http.Request) {
+	f.listCalls++
+	query := r.URL.Query()
+	size, err := strconv.Atoi(query.Get("size"))
+	if err != nil || size <= 0 {
+		size = 100
+	}
+	offset, _ := strconv.Atoi(query.Get("offset"))
+	var tags []string
+	if t := query.Get("tags"); t != "" {
+		tags = strings.Split(t, ",")
+	}
+
+	var matching []kong.Plugin
+	for _, id := range f.order {
+		if hasAllTags(f.plugins[id], tags) {
+			matching = append(matching, f.plugins[id])
+		}
+	}
+	end := min(offset+size, len(matching))
+	body := map[string]any{"data": matching[min(offset, end):end]}
+	if end < len(matching) {
+		body["offset"] = strconv.Itoa(end)
+	}
+	writeJSON(w, body)
+}
+
+func (f *fakeAdmin) listEntities(w http.ResponseWriter, kind string) {
+	entities, ok := f.entities[kind]
+	if !ok {
+		w.Header().Set("Content-Type", "application/json")
+		w.WriteHeader(http.StatusNotFound)
+		_, _ = w.Write([]byte(`{"message":"Not found"}`))
+		return
+	}
+	data := make([]entity, 0, len(entities))
+	for _, key := range slices.Sorted(maps.Keys(entities)) {
+		data = append(data, entities[key])
+	}
+	writeJSON(w, map[string]any{"data": data})
+}
+
+func (f *fakeAdmin) upsertEntity(w http.ResponseWriter, r *http.Request, kind, name string) {
+	e := entity{}
+	if err := json.NewDecoder(r.Body).Decode(&e); err != nil {
+		w.WriteHeader(http.StatusBadRequest)
+		return
+	}
+	e["id"] = entityId(kind, name)
+	if kind == kindConsumers {
+		e["username"] = name
+	} else {
+		e["name"] = name
+	}
+	f.writeCalls++
+	f.entities[kind][name] = e
+	writeJSON(w, e)
+}
+
+func (f *fakeAdmin) consumerAcls(w http.ResponseWriter, r *http.Request, name string) {
+	consumer, ok := f.entities[kindConsumers][name]
+	if !ok {
+		w.WriteHeader(http.StatusNotFound)
+		return
+	}
+	data := []entity{}
+	for _, acl := range f.entities[kindAcls] {
+		if refId(acl["consumer"]) == consumer["id"] {
+			data = append(data, acl)
+		}
+	}
+	if r.Method == http.MethodGet {
+		writeJSON(w, map[string]any{"data": data})
+		return
+	}
+
+	acl := entity{}
+	if err := json.NewDecoder(r.Body).Decode(&acl); err != nil {
+		w.WriteHeader(http.StatusBadRequest)
+		return
+	}
+	acl["id"] = entityId(kindAcls, name)
+	acl["consumer"] = ref(consumer["id"].(string))
+	f.writeCalls++
+	f.entities[kindAcls][acl["id"].(string)] = acl
+	w.Header().Set("Content-Type", "application/json")
+	w.WriteHeader(http.StatusCreated)
+	_ = json.NewEncoder(w).Encode(acl)
+}
+
+func writeJSON(w http.ResponseWriter, v any) {
+	w.Header().Set("Content-Type", "application/json")
+	_ = json.NewEncoder(w).Encode(v)
+}
+
+// testPlugin is a minimal CustomPlugin.
+type testPlugin struct {
+	Id       string         `json:"id,omitempty"`
+	Name     string         `json:"name"`
+	Route    *string        `json:"-"`
+	Consumer *string        `json:"-"`
+	Config   map[string]any `json:"config"`
+}
+
+func (p *testPlugin) GetId() string             { return p.Id }
+func (p *testPlugin) SetId(id string)           { p.Id = id }
+func (p *testPlugin) GetName() string           { return p.Name }
+func (p *testPlugin) GetRoute() *string         { return p.Route }
+func (p *testPlugin) GetConsumer() *string      { return p.Consumer }
+func (p *testPlugin) GetConfig() map[string]any { return p.Config }
+
+// testConsumer is a minimal CustomConsumer.
+type testConsumer struct {
+	Name string
+	Id   string
+}
+
+func (c *testConsumer) GetConsumerName() string { return c.Name }
+func (c *testConsumer) SetId(id string)         { c.Id = id }
+
+// testRoute is a minimal CustomRoute.
+type testRoute struct {
+	Name string
+}
+
+func (r *testRoute) SetRouteId(string)          {}
+func (r *testRoute) SetServiceId(string)        {}
+func (r *testRoute) SetUpstreamId(string)       {}
+func (r *testRoute) SetTargetsId(string)        {}
+func (r *testRoute) GetTargetsId() string       { return "" }
+func (r *testRoute) GetName() string            { return r.Name }
+func (r *testRoute) GetHostnames() []string     { return nil }
+func (r *testRoute) GetPaths() []string         { return []string{"/" + r.Name} }
+func (r *testRoute) GetRequestBuffering() bool  { return false }
+func (r *testRoute) GetResponseBuffering() bool { return false }
@@ -0,0 +1,21 @@
+// Copyright 2026 Deutsche Telekom IT GmbH
+//
+// SPDX-License-Identifier: Apache-2.0
+
+package client
+
+import (
+	"github.com/prometheus/client_golang/prometheus"
+	"sigs.k8s.io/controller-runtime/pkg/metrics"
+)
+
+// DeclarativeConfigPushes counts the pushes of the declarative configuration
+// of gateways without a database.
+var DeclarativeConfigPushes = prometheus.NewCounterVec(prometheus.CounterOpts{
+	Name: "controlplane_gateway_kong_config_pushes_total",
+	Help: "Declarative configurations pushed to the /config endpoint of DB-less gateways, labelled by the admin API and whether the push succeeded.",
+}, []string{"server", "result"})
+
+func init() {
+	metrics.Registry.MustRegister(DeclarativeConfigPushes)
+}
@@ -0,0 +1,265 @@
+// Copyright 2026 Deutsche Telekom IT GmbH
+//
+// SPDX-License-Identifier: Apache-2.0
+
+package client
+
+import (
+	"context"
+	"encoding/json"
+	"fmt"
+	"slices"
+	"sync"
+	"time"
+
+	kong "github.com/telekom/controlplane/gateway/pkg/kong/api"
+)
+
+// listPageSize is the maximum page size of the Kong admin API.
+const listPageSize = 1000
+
+// pluginMirror is an in-process copy of all plugins of a Kong instance,
+// indexed by tag. It is loaded with a paginated list of all plugins, kept up
+// to date with the writes of this client and reloaded after the refresh
+// interval, which picks up changes made by anyone else.
+type pluginMirror struct {
+	client  KongAdminApi
+	refresh time.Duration
+	now     func() time.Time
+
+	// loadMutex serializes loads, so that concurrent callers wait for the
+	// same load instead of listing all plugins themselves.
+	loadMutex sync.Mutex
+
+	mutex    sync.RWMutex
+	loadedAt time.Time
+	plugins  map[string]kong.Plugin         // id -> plugin
+	byTag    map[string]map[string]struct{} // tag -> ids
+	// journal records the writes made while a load is in progress, so that
+	// they can be applied on top of the loaded plugins.
+	journal []func()
+	loading bool
+}
+
+func newPluginMirror(client KongAdminApi, refresh time.Duration) *pluginMirror {
+	return &pluginMirror{
+		client:  client,
+		refresh: refresh,
+		now:     time.Now,
+		plugins: make(map[string]kong.Plugin),
+		byTag:   make(map[string]map[string]struct{}),
+	}
+}
+
+// Get returns the plugin with the given id, if it exists.
+func (m *pluginMirror) Get(ctx context.Context, id string) (*kong.Plugin, bool, error) {
+	if err := m.ensureLoaded(ctx); err != nil {
+		return nil, false, err
+	}
+	m.mutex.RLock()
+	defer m.mutex.RUnlock()
+	plugin, ok := m.plugins[id]
+	if !ok {
+		return nil, false, nil
+	}
+	return &plugin, true, nil
+}
+
+// Matching returns all plugins that have all of the given tags, like a list
+// request of the Kong admin API with tags concatenated by ','.
+func (m *pluginMirror) Matching(ctx context.Context, tags []string) ([]kong.Plugin, error) {
+	if err := m.ensureLoaded(ctx); err != nil {
+		return nil, err
+	}
+	m.mutex.RLock()
+	defer m.mutex.RUnlock()
+
+	// Only the plugins of the most selective tag need to be checked.
+	var candidates map[string]struct{}
+	for _, tag := range tags {
+		ids := m.byTag[tag]
+		if candidates == nil || len(ids) < len(candidates) {
+			candidates = ids
+		}
+	}
+
+	var plugins []kong.Plugin
+	for id := range candidates {
+		plugin := m.plugins[id]
+		if hasAllTags(plugin, tags) {
+			plugins = append(plugins, plugin)
+		}
+	}
+	return plugins, nil
+}
+
+// Put adds or replaces a plugin that was written by this client.
+func (m *pluginMirror) Put(plugin kong.Plugin) {
+	if plugin.Id == nil {
+		return
+	}
+	m.mutex.Lock()
+	defer m.mutex.Unlock()
+	m.record(func() { m.put(plugin) })
+}
+
+// Remove removes a plugin that was deleted by this client.
+func (m *pluginMirror) Remove(id string) {
+	m.mutex.Lock()
+	defer m.mutex.Unlock()
+	m.record(func() { m.remove(id) })
+}
+
+// RemoveTagged removes all plugins with the given tag. Kong deletes the
+// plugins of a route or consumer together with it.
+func (m *pluginMirror) RemoveTagged(tag string) {
+	m.mutex.Lock()
+	defer m.mutex.Unlock()
+	m.record(func() {
+		for id := range m.byTag[tag] {
+			m.remove(id)
+		}
+	})
+}
+
+// record applies op and journals it if a load is in progress.
+// Must be called with m.mutex held.
+func (m *pluginMirror) record(op func()) {
+	op()
+	if m.loading {
+		m.journal = append(m.journal, op)
+	}
+}
+
+func (m *pluginMirror) put(plugin kong.Plugin) {
+	id := *plugin.Id
+	m.remove(id)
+	m.plugins[id] = plugin
+	if plugin.Tags == nil {
+		return
+	}
+	for _, tag := range *plugin.Tags {
+		ids, ok := m.byTag[tag]
+		if !ok {
+			ids = make(map[string]struct{})
+			m.byTag[tag] = ids
+		}
+		ids[id] = struct{}{}
+	}
+}
+
+func (m *pluginMirror) remove(id string) {
+	plugin, ok := m.plugins[id]
+	if !ok {
+		return
+	}
+	delete(m.plugins, id)
+	if plugin.Tags == nil {
+		return
+	}
+	for _, tag := range *plugin.Tags {
+		delete(m.byTag[tag], id)
+		if len(m.byTag[tag]) == 0 {
+			delete(m.byTag, tag)
+		}
+	}
+}
+
+func (m *pluginMirror) isFresh() bool {
+	m.mutex.RLock()
+	defer m.mutex.RUnlock()
+	return !m.loadedAt.IsZero() && m.now().Sub(m.loadedAt) < m.refresh
+}
+
+// ensureLoaded loads all plugins if they were never loaded or the refresh
+// interval has passed.
+func (m *pluginMirror) ensureLoaded(ctx context.Context) error {
+	if m.isFresh() {
+		return nil
+	}
+	m.loadMutex.Lock()
+	defer m.loadMutex.Unlock()
+	if m.isFresh() {
+		return nil
+	}
+
+	m.mutex.Lock()
+	m.loading = true
+	m.journal = nil
+	m.mutex.Unlock()
+
+	loadedAt := m.now()
+	plugins, err := listPlugins(ctx, m.client, nil)
+
+	m.mutex.Lock()
+	defer m.mutex.Unlock()
+	journal := m.journal
+	m.loading = false
+	m.journal = nil
+	if err != nil {
+		return fmt.Errorf("failed to load plugins: %w", err)
+	}
+
+	m.plugins = make(map[string]kong.Plugin, len(plugins))
+	m.byTag = make(map[string]map[string]struct{})
+	for _, plugin := range plugins {
+		if plugin.Id != nil {
+			m.put(plugin)
+		}
+	}
+	// Writes made during the load may or may not be part of the list.
+	for _, op := range journal {
+		op()
+	}
+	m.loadedAt = loadedAt
+	return nil
+}
+
+// listPlugins lists all plugins with the given tags, following the pagination
+// of the Kong admin API.
+func listPlugins(ctx context.Context, client KongAdminApi, tags *string) ([]kong.Plugin, error) {
+	// ListPluginWithResponse does not return an array of plugins
+	type ResponseBody struct {
+		Data   []kong.Plugin `json:"data"`
+		Offset *string       `json:"offset"`
+	}
+
+	var plugins []kong.Plugin
+	pageSize := listPageSize
+	params := &kong.ListPluginParams{
+		Size: &pageSize,
+		Tags: tags,
+	}
+	for {
+		response, err := client.ListPluginWithResponse(ctx, params)
+		if err != nil {
+			return nil, HandleClientError(err)
+		}
+		if err := CheckStatusCode(response, 200); err != nil {
+			return nil, fmt.Errorf("failed to list plugins (%d): %s: %w", response.StatusCode(), string(response.Body), err)
+		}
+
+		var responseBody ResponseBody
+		if err := json.Unmarshal(response.Body, &responseBody); err != nil {
+			return nil, err
+		}
+		plugins = append(plugins, responseBody.Data...)
+
+		if responseBody.Offset == nil || *responseBody.Offset == "" {
+			return plugins, nil
+		}
+		params.Offset = responseBody.Offset
+	}
+}
+
+func hasAllTags(plugin kong.Plugin, tags []string) bool {
+	if plugin.Tags == nil {
+		return len(tags) == 0
+	}
+	for _, tag := range tags {
+		if !slices.Contains(*plugin.Tags, tag) {
+			return false
+		}
+	}
+	return true
+}
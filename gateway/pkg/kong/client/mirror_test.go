@@ -0,0 +1,126 @@
+// Copyright 2026 Deutsche Telekom IT GmbH
+//
+// SPDX-License-Identifier: Apache-2.0
+
+package client
+
+import (
+	"context"
+	"fmt"
+	"time"
+
+	. "github.com/onsi/ginkgo/v2"
+	. "github.com/onsi/gomega"
+	"github.com/telekom/controlplane/common/pkg/util/contextutil"
+
+	kong "github.com/telekom/controlplane/gateway/pkg/kong/api"
+)
+
+var _ = Describe("Plugin mirror", func() {
+	var (
+		ctx   context.Context
+		admin *fakeAdmin
+		api   *kong.ClientWithResponses
+	)
+
+	BeforeEach(func() {
+		ctx = contextutil.WithEnv(context.Background(), "test")
+		admin = newFakeAdmin()
+		DeferCleanup(admin.Close)
+
+		var err error
+		api, err = kong.NewClientWithResponses(admin.URL)
+		Expect(err).NotTo(HaveOccurred())
+	})
+
+	routePlugin := func(name, route string) *testPlugin {
+		return &testPlugin{Name: name, Route: &route, Config: map[string]any{"enabled": true}}
+	}
+
+	It("loads all plugins page by page", func() {
+		for i := range 2500 {
+			admin.AddPlugin(fmt.Sprintf("id-%d", i), "acl",
+				BuildTag("env", "test"), BuildTag("route", fmt.Sprintf("route-%d", i)))
+		}
+		mirror := newPluginMirror(api, time.Hour)
+
+		plugins, err := mirror.Matching(ctx, []string{BuildTag("route", "route-2499")})
+		Expect(err).NotTo(HaveOccurred())
+		Expect(plugins).To(HaveLen(1))
+		Expect(*plugins[0].Id).To(Equal("id-2499"))
+		Expect(admin.ListCalls()).To(Equal(3))
+	})
+
+	It("looks up plugins without listing them for every upsert", func() {
+		kc := NewMirroredKongClient(api, time.Hour)
+
+		first := routePlugin("acl", "route-a")
+		_, err := kc.CreateOrReplacePlugin(ctx, first)
+		Expect(err).NotTo(HaveOccurred())
+
+		second := routePlugin("acl", "route-a")
+		_, err = kc.CreateOrReplacePlugin(ctx, second)
+		Expect(err).NotTo(HaveOccurred())
+
+		Expect(second.GetId()).To(Equal(first.GetId()))
+		Expect(admin.Plugins()).To(HaveLen(1))
+		Expect(admin.ListCalls()).To(Equal(1))
+	})
+
+	It("cleans up plugins without listing them again", func() {
+		admin.AddPlugin("stale", "rate-limiting",
+			BuildTag("env", "test"), BuildTag("plugin", "rate-limiting"),
+			BuildTag("route", "route-a"), BuildTag("consumer", "none"))
+		kc := NewMirroredKongClient(api, time.Hour)
+
+		acl := routePlugin("acl", "route-a")
+		_, err := kc.CreateOrReplacePlugin(ctx, acl)
+		Expect(err).NotTo(HaveOccurred())
+
+		err = kc.CleanupPlugins(ctx, &testRoute{Name: "route-a"}, nil, []CustomPlugin{acl})
+		Expect(err).NotTo(HaveOccurred())
+
+		Expect(admin.Plugins()).To(HaveKey(acl.GetId()))
+		Expect(admin.Plugins()).NotTo(HaveKey("stale"))
+		Expect(admin.ListCalls()).To(Equal(1))
+
+		// The deleted plugin is gone from the mirror as well.
+		mirror := kc.(*kongClient).plugins
+		_, found, err := mirror.Get(ctx, "stale")
+		Expect(err).NotTo(HaveOccurred())
+		Expect(found).To(BeFalse())
+	})
+
+	It("reloads the plugins after the refresh interval", func() {
+		now := time.Now()
+		mirror := newPluginMirror(api, time.Minute)
+		mirror.now = func() time.Time { return now }
+
+		_, err := mirror.Matching(ctx, []string{BuildTag("route", "route-a")})
+		Expect(err).NotTo(HaveOccurred())
+
+		admin.AddPlugin("external", "acl", BuildTag("env", "test"), BuildTag("route", "route-a"))
+		plugins, err := mirror.Matching(ctx, []string{BuildTag("route", "route-a")})
+		Expect(err).NotTo(HaveOccurred())
+		Expect(plugins).To(BeEmpty())
+
+		now = now.Add(2 * time.Minute)
+		plugins, err = mirror.Matching(ctx, []string{BuildTag("route", "route-a")})
+		Expect(err).NotTo(HaveOccurred())
+		Expect(plugins).To(HaveLen(1))
+		Expect(admin.ListCalls()).To(Equal(2))
+	})
+
+	It("removes the plugins of a deleted route", func() {
+		mirror := newPluginMirror(api, time.Hour)
+		id := "plugin-a"
+		Expect(mirror.Matching(ctx, []string{BuildTag("route", "route-a")})).To(BeEmpty())
+
+		// Writes after the load are applied to the mirror.
+		mirror.Put(kong.Plugin{Id: &id, Tags: &[]string{BuildTag("route", "route-a")}})
+		Expect(mirror.Matching(ctx, []string{BuildTag("route", "route-a")})).To(HaveLen(1))
+
+		mirror.RemoveTagged(BuildTag("route", "route-a"))
+		Expect(mirror.Matching(ctx, []string{BuildTag("route", "route-a")})).To(BeEmpty())
+	})
+})
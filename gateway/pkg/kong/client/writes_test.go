@@ -0,0 +1,72 @@
+// Copyright 2026 Deutsche Telekom IT GmbH
+//
+// SPDX-License-Identifier: Apache-2.0
+
+package client
+
+import (
+	"context"
+	"fmt"
+	"sync"
+	"time"
+
+	. "github.com/onsi/ginkgo/v2"
+	. "github.com/onsi/gomega"
+	"github.com/telekom/controlplane/common/pkg/util/contextutil"
+
+	kong "github.com/telekom/controlplane/gateway/pkg/kong/api"
+)
+
+var _ = Describe("Concurrent plugin writes", func() {
+	var (
+		ctx   context.Context
+		admin *fakeAdmin
+		kc    KongClient
+	)
+
+	BeforeEach(func() {
+		ctx = contextutil.WithEnv(context.Background(), "test")
+		admin = newFakeAdmin()
+		admin.delay = 20 * time.Millisecond
+		DeferCleanup(admin.Close)
+
+		api, err := kong.NewClientWithResponses(admin.URL)
+		Expect(err).NotTo(HaveOccurred())
+
+		maxConcurrentWrites := MaxConcurrentWrites
+		MaxConcurrentWrites = 2
+		DeferCleanup(func() { MaxConcurrentWrites = maxConcurrentWrites })
+		kc = NewKongClient(api)
+	})
+
+	It("bounds the concurrent upserts per admin API", func() {
+		var wg sync.WaitGroup
+		for i := range 10 {
+			wg.Add(1)
+			go func() {
+				defer GinkgoRecover()
+				defer wg.Done()
+				route := fmt.Sprintf("route-%d", i)
+				_, err := kc.CreateOrReplacePlugin(ctx, &testPlugin{Name: "acl", Route: &route})
+				Expect(err).NotTo(HaveOccurred())
+			}()
+		}
+		wg.Wait()
+
+		Expect(admin.Plugins()).To(HaveLen(10))
+		Expect(admin.MaxInFlight()).To(Equal(2))
+	})
+
+	It("deletes all stale plugins concurrently", func() {
+		for i := range 6 {
+			admin.AddPlugin(fmt.Sprintf("stale-%d", i), "acl",
+				BuildTag("env", "test"), BuildTag("route", "route-a"))
+		}
+
+		err := kc.CleanupPlugins(ctx, &testRoute{Name: "route-a"}, nil, nil)
+		Expect(err).NotTo(HaveOccurred())
+
+		Expect(admin.Plugins()).To(BeEmpty())
+		Expect(admin.MaxInFlight()).To(Equal(2))
+	})
+})
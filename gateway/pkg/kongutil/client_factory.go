@@ -7,6 +7,7 @@ package kongutil
 import (
 	"context"
 	"crypto/sha256"
+	stderrors "errors"
 	"fmt"
 	"net/http"
 	"net/url"
@@ -64,6 +65,30 @@ var (
 	rootCtx      = context.Background()
 	tokenUrlPath = "/protocol/openid-connect/token"
 
+	// PluginMirrorRefreshInterval is the interval after which the in-process
+	// mirror of the plugins of a gateway is reloaded from its admin API.
+	// Set to 0 to look up plugins with the admin API instead.
+	PluginMirrorRefreshInterval = 5 * time.Minute
+
+	// AdminRequestTimeout is the timeout of a single request to a gateway admin API.
+	AdminRequestTimeout = 30 * time.Second
+
+	// DeclarativeConfig configures the gateways without a database (DB-less).
+	// Their complete configuration is pushed to the /config endpoint of the
+	// admin API instead of writing every entity.
+	DeclarativeConfig = false
+	// DeclarativeConfigDelay is the time without changes after which the
+	// configuration of a gateway is pushed.
+	DeclarativeConfigDelay = 2 * time.Second
+	// DeclarativeConfigMaxDelay is the time after the first change that was
+	// not pushed yet after which the configuration is pushed in any case.
+	DeclarativeConfigMaxDelay = 10 * time.Second
+	// DeclarativeConfigRefreshInterval is the interval after which the configuration
+	// of a gateway is pushed again, so that a restarted gateway is configured again.
+	// Gateways skip the reload if the configuration did not change. Set to 0 to
+	// only push changes.
+	DeclarativeConfigRefreshInterval = time.Minute
+
 	clientCache      = make(map[string]client.KongClient)
 	urlToKey         = make(map[string]string) // AdminUrl -> current cache key for stale eviction
 	clientCacheMutex sync.Mutex
@@ -90,11 +115,10 @@ var GetClientFor = func(gwCfg GatewayAdminConfig) (client.KongClient, error) {
 		return c, nil
 	}
 
-	apiClient, err := NewClientFor(gwCfg)
+	c, err := newKongClientFor(gwCfg)
 	if err != nil {
 		return nil, err
 	}
-	c := client.NewKongClient(apiClient)
 
 	// Evict stale entry for the same URL (previous credentials).
 	adminUrl := gwCfg.AdminUrl()
@@ -107,12 +131,67 @@ var GetClientFor = func(gwCfg GatewayAdminConfig) (client.KongClient, error) {
 	return c, nil
 }
 
+// CheckDeclarativeConfigs is a readiness check that fails while the last push
+// of the configuration of any gateway failed.
+func CheckDeclarativeConfigs(_ *http.Request) error {
+	clientCacheMutex.Lock()
+	defer clientCacheMutex.Unlock()
+
+	var errs []error
+	for adminUrl, key := range urlToKey {
+		if status, ok := clientCache[key].(client.PushStatus); ok {
+			if err := status.PushError(); err != nil {
+				errs = append(errs, fmt.Errorf("gateway %s: %w", adminUrl, err))
+			}
+		}
+	}
+	return stderrors.Join(errs...)
+}
+
+func newKongClientFor(gwCfg GatewayAdminConfig) (client.KongClient, error) {
+	if DeclarativeConfig {
+		doer, server, err := newAdminDoer(gwCfg)
+		if err != nil {
+			return nil, err
+		}
+		apiClient, err := kong.NewClientWithResponses(server, kong.WithHTTPClient(doer))
+		if err != nil {
+			return nil, errors.Wrap(err, "failed to create kong client")
+		}
+		return client.NewDeclarativeKongClient(apiClient, doer, server,
+			DeclarativeConfigDelay, DeclarativeConfigMaxDelay, DeclarativeConfigRefreshInterval), nil
+	}
+
+	apiClient, err := NewClientFor(gwCfg)
+	if err != nil {
+		return nil, err
+	}
+	if PluginMirrorRefreshInterval > 0 {
+		return client.NewMirroredKongClient(apiClient, PluginMirrorRefreshInterval), nil
+	}
+	return client.NewKongClient(apiClient), nil
+}
+
 var NewClientFor = func(gwCfg GatewayAdminConfig) (kong.ClientWithResponsesInterface, error) {
+	doer, server, err := newAdminDoer(gwCfg)
+	if err != nil {
+		return nil, err
+	}
+
+	apiClient, err := kong.NewClientWithResponses(server, kong.WithHTTPClient(doer))
+	if err != nil {
+		return nil, errors.Wrap(err, "failed to create kong client")
+	}
+
+	return apiClient, nil
+}
+
+// newAdminDoer returns the authenticated HTTP client for the admin API of a
+// gateway and the URL of the admin API.
+func newAdminDoer(gwCfg GatewayAdminConfig) (kong.HttpRequestDoer, string, error) {
 	baseClient := &http.Client{
-		Transport: &http.Transport{
-			MaxIdleConnsPerHost: 100,
-		},
-		Timeout: 10 * time.Second,
+		Transport: newTransport(),
+		Timeout:   10 * time.Second,
 	}
 
 	tokenCfg := clientcredentials.Config{
@@ -125,19 +204,28 @@ var NewClientFor = func(gwCfg GatewayAdminConfig) (kong.ClientWithResponsesInter
 
 	url, err := url.Parse(gwCfg.AdminUrl())
 	if err != nil {
-		return nil, errors.Wrap(err, "failed to parse gateway URL")
+		return nil, "", errors.Wrap(err, "failed to parse gateway URL")
 	}
 
+	// The token client reuses the transport of baseClient for all admin requests.
 	httpClient := tokenCfg.Client(ctx)
+	httpClient.Timeout = AdminRequestTimeout
 	metricsClient := metrics.WithMetrics(httpClient,
 		metrics.WithClientName("gateway"),
 		metrics.WithReplacePatterns(`([^\/]+--[^\/]+--[^\/]+)`, `([^\/]+--[^\/]+)`, metrics.ReplacePatternUID),
 	)
 
-	apiClient, err := kong.NewClientWithResponses(url.String(), kong.WithHTTPClient(metricsClient))
-	if err != nil {
-		return nil, errors.Wrap(err, "failed to create kong client")
-	}
+	return metricsClient, url.String(), nil
+}
 
-	return apiClient, nil
+// newTransport returns the transport that is shared by all requests to a
+// gateway admin API. It is based on the default transport for its proxy,
+// dial and TLS handshake timeouts and keeps the connections of concurrent
+// plugin writes alive between reconciles.
+func newTransport() *http.Transport {
+	transport := http.DefaultTransport.(*http.Transport).Clone()
+	transport.MaxIdleConns = 100
+	transport.MaxIdleConnsPerHost = 100
+	transport.IdleConnTimeout = 90 * time.Second
+	return transport
 }
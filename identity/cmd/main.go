@@ -22,6 +22,7 @@ import (
 
 	identityv1 "github.com/telekom/controlplane/identity/api/v1"
 	"github.com/telekom/controlplane/identity/internal/controller"
+	"github.com/telekom/controlplane/identity/pkg/keycloak"
 	secretmetrics "github.com/telekom/controlplane/secret-manager/api/metrics"
 
 	// Import all Kubernetes client auth plugins (e.g. Azure, GCP, OIDC, etc.)
@@ -146,16 +147,21 @@ func main() {
 		setupLog.Error(err, "unable to create controller", "controller", "IdentityProvider")
 		os.Exit(1)
 	}
+	// The controllers share the services, so that the realm controller
+	// invalidates the clients that are cached for the client controller.
+	keycloakFactory := keycloak.NewServiceFactory()
 	if err = (&controller.ClientReconciler{
-		Client: mgr.GetClient(),
-		Scheme: mgr.GetScheme(),
+		Client:        mgr.GetClient(),
+		Scheme:        mgr.GetScheme(),
+		ClientFactory: keycloakFactory,
 	}).SetupWithManager(mgr); err != nil {
 		setupLog.Error(err, "unable to create controller", "controller", "Client")
 		os.Exit(1)
 	}
 	if err = (&controller.RealmReconciler{
-		Client: mgr.GetClient(),
-		Scheme: mgr.GetScheme(),
+		Client:        mgr.GetClient(),
+		Scheme:        mgr.GetScheme(),
+		ClientFactory: keycloakFactory,
 	}).SetupWithManager(mgr); err != nil {
 		setupLog.Error(err, "unable to create controller", "controller", "Realm")
 		os.Exit(1)
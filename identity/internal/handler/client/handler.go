@@ -92,9 +92,14 @@ func (h *HandlerClient) CreateOrUpdate(ctx context.Context, client *identityv1.C
 		client.SetCondition(identityv1.NewSecretRotationAcceptedCondition())
 	}
 
+	// Clients that are not ready yet or failed before are always looked up
+	// in Keycloak instead of trusting the cached representation.
+	forceRefresh := !meta.IsStatusConditionTrue(client.GetConditions(), condition.ConditionTypeReady)
+
 	err = realmClient.CreateOrReplaceClient(ctx, realm.Name, clientCopy, keycloak.ClientUpdateOptions{
 		SupportsGracefulRotation: supportsRotation,
 		SkipForceRotation:        skipForceRotation,
+		ForceRefresh:             forceRefresh,
 	})
 	if err != nil {
 		return fmt.Errorf("failed to create or update client: %w", err)
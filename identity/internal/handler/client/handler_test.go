@@ -664,6 +664,7 @@ var _ = Describe("HandlerClient", func() {
 			By("verifying ClientUpdateOptions flags")
 			Expect(capturedOpts.SupportsGracefulRotation).To(BeTrue())
 			Expect(capturedOpts.SkipForceRotation).To(BeFalse())
+			Expect(capturedOpts.ForceRefresh).To(BeTrue())
 
 			By("verifying SecretRotation condition was set")
 			cond := meta.FindStatusCondition(cl.GetConditions(), identityv1.SecretRotationConditionType)
@@ -0,0 +1,189 @@
+// Copyright 2026 Deutsche Telekom IT GmbH
+//
+// SPDX-License-Identifier: Apache-2.0
+
+package keycloak
+
+import (
+	"context"
+	"crypto/sha256"
+	"encoding/hex"
+	"fmt"
+	"net/http"
+	"sync"
+	"time"
+
+	"github.com/go-logr/logr"
+	"k8s.io/utils/ptr"
+
+	"github.com/telekom/controlplane/identity/pkg/api"
+)
+
+// ClientCacheMaxAge is the time after which the cached clients of a realm are
+// listed from Keycloak again. This bounds how long changes made to Keycloak
+// by anyone else go unnoticed.
+var ClientCacheMaxAge = 10 * time.Minute
+
+// clientCachePageSize is the number of clients listed per request.
+const clientCachePageSize int32 = 100
+
+// ServiceOption configures a KeycloakService.
+type ServiceOption func(*keycloakService)
+
+// WithClientCache caches the client representations of each realm for up to
+// maxAge. Unchanged clients are then reconciled without calling Keycloak.
+func WithClientCache(maxAge time.Duration) ServiceOption {
+	return func(k *keycloakService) {
+		k.clients = newClientCache(maxAge, k.listClients)
+	}
+}
+
+// clientCache holds the representations of all clients of a realm, keyed by
+// clientId. A realm is loaded with a paginated listing on first use and again
+// once it is older than maxAge. In between, the entries are updated with the
+// results of the writes and lookups of the service.
+// The secrets of the clients are only held as hashes, see withHashedSecret.
+//
+// All methods are safe to call on a nil cache, which caches nothing.
+type clientCache struct {
+	maxAge time.Duration
+	list   func(ctx context.Context, realmName string) (map[string]api.ClientRepresentation, error)
+	now    func() time.Time
+
+	mutex  sync.Mutex
+	realms map[string]*realmClients
+}
+
+type realmClients struct {
+	// mutex serializes the loads of the realm.
+	mutex    sync.Mutex
+	loadedAt time.Time
+	clients  map[string]api.ClientRepresentation
+}
+
+func newClientCache(maxAge time.Duration, list func(context.Context, string) (map[string]api.ClientRepresentation, error)) *clientCache {
+	return &clientCache{
+		maxAge: maxAge,
+		list:   list,
+		now:    time.Now,
+		realms: make(map[string]*realmClients),
+	}
+}
+
+func (c *clientCache) realm(realmName string) *realmClients {
+	c.mutex.Lock()
+	defer c.mutex.Unlock()
+	realm, ok := c.realms[realmName]
+	if !ok {
+		realm = &realmClients{}
+		c.realms[realmName] = realm
+	}
+	return realm
+}
+
+// Get returns the cached representation of the client, loading the realm if
+// it was not loaded yet or is stale. It returns nil if the client is unknown
+// or the realm could not be loaded, in which case the caller asks Keycloak.
+// The secret of the representation is hashed, so it must be compared with a
+// representation passed to withHashedSecret.
+func (c *clientCache) Get(ctx context.Context, realmName, clientId string) *api.ClientRepresentation {
+	if c == nil {
+		return nil
+	}
+	realm := c.realm(realmName)
+	realm.mutex.Lock()
+	defer realm.mutex.Unlock()
+
+	if realm.clients == nil || c.now().Sub(realm.loadedAt) > c.maxAge {
+		clients, err := c.list(ctx, realmName)
+		if err != nil {
+			logr.FromContextOrDiscard(ctx).Error(err, "failed to load clients into cache", "realm", realmName)
+			return nil
+		}
+		realm.clients = clients
+		realm.loadedAt = c.now()
+	}
+
+	rep, ok := realm.clients[clientId]
+	if !ok {
+		return nil
+	}
+	return &rep
+}
+
+// Put stores the current representation of a client of a loaded realm.
+func (c *clientCache) Put(realmName string, rep *api.ClientRepresentation) {
+	if c == nil || rep == nil || rep.ClientId == nil {
+		return
+	}
+	realm := c.realm(realmName)
+	realm.mutex.Lock()
+	defer realm.mutex.Unlock()
+	if realm.clients != nil {
+		realm.clients[*rep.ClientId] = withHashedSecret(*rep)
+	}
+}
+
+// Remove removes a client, so that it is looked up in Keycloak next time.
+func (c *clientCache) Remove(realmName, clientId string) {
+	if c == nil {
+		return
+	}
+	realm := c.realm(realmName)
+	realm.mutex.Lock()
+	defer realm.mutex.Unlock()
+	delete(realm.clients, clientId)
+}
+
+// Invalidate removes all clients of a realm, so that it is loaded again.
+func (c *clientCache) Invalidate(realmName string) {
+	if c == nil {
+		return
+	}
+	c.mutex.Lock()
+	defer c.mutex.Unlock()
+	delete(c.realms, realmName)
+}
+
+// withHashedSecret returns the representation with its secret replaced by
+// a hash, so that cached representations can be compared without holding
+// the plaintext secret.
+func withHashedSecret(rep api.ClientRepresentation) api.ClientRepresentation {
+	if rep.Secret != nil {
+		sum := sha256.Sum256([]byte(*rep.Secret))
+		rep.Secret = ptr.To("sha256:" + hex.EncodeToString(sum[:]))
+	}
+	return rep
+}
+
+// listClients lists all clients of a realm page by page.
+func (k *keycloakService) listClients(ctx context.Context, realmName string) (map[string]api.ClientRepresentation, error) {
+	clients := make(map[string]api.ClientRepresentation)
+	first, pageSize := int32(0), clientCachePageSize
+	for {
+		params := api.GetRealmClientsParams{
+			First: ptr.To(first),
+			Max:   ptr.To(pageSize),
+		}
+		res, err := k.Client.GetRealmClientsWithResponse(ctx, realmName, &params)
+		if err != nil {
+			return nil, fmt.Errorf("unexpected error when listing clients: %w", err)
+		}
+		if responseErr := CheckHTTPStatus(res.StatusCode(), http.StatusOK); responseErr != nil {
+			return nil, fmt.Errorf("listing clients: %w", responseErr)
+		}
+		if res.JSON2XX == nil {
+			return nil, fmt.Errorf("unexpected empty response body when listing clients")
+		}
+
+		for _, rep := range *res.JSON2XX {
+			if rep.ClientId != nil && rep.Id != nil {
+				clients[*rep.ClientId] = withHashedSecret(rep)
+			}
+		}
+		if int32(len(*res.JSON2XX)) < pageSize {
+			return clients, nil
+		}
+		first += pageSize
+	}
+}
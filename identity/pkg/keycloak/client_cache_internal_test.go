@@ -0,0 +1,37 @@
+// Copyright 2026 Deutsche Telekom IT GmbH
+//
+// SPDX-License-Identifier: Apache-2.0
+
+package keycloak
+
+import (
+	"context"
+	"testing"
+	"time"
+
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+	"k8s.io/utils/ptr"
+
+	"github.com/telekom/controlplane/identity/pkg/api"
+)
+
+func TestClientCache_HoldsNoPlaintextSecrets(t *testing.T) {
+	cache := newClientCache(time.Hour, func(context.Context, string) (map[string]api.ClientRepresentation, error) {
+		return map[string]api.ClientRepresentation{}, nil
+	})
+	require.Nil(t, cache.Get(context.Background(), "realm1", "my-app"))
+
+	cache.Put("realm1", &api.ClientRepresentation{ClientId: ptr.To("my-app"), Secret: ptr.To("my-secret")})
+
+	cached := cache.Get(context.Background(), "realm1", "my-app")
+	require.NotNil(t, cached)
+	assert.NotEqual(t, "my-secret", *cached.Secret)
+	assert.Equal(t, withHashedSecret(api.ClientRepresentation{Secret: ptr.To("my-secret")}).Secret, cached.Secret)
+	assert.NotEqual(t, withHashedSecret(api.ClientRepresentation{Secret: ptr.To("other-secret")}).Secret, cached.Secret)
+}
+
+func TestWithHashedSecret_KeepsMissingSecret(t *testing.T) {
+	rep := withHashedSecret(api.ClientRepresentation{ClientId: ptr.To("my-app")})
+	assert.Nil(t, rep.Secret)
+}
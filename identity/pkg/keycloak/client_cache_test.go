@@ -0,0 +1,205 @@
+// Copyright 2026 Deutsche Telekom IT GmbH
+//
+// SPDX-License-Identifier: Apache-2.0
+
+package keycloak_test
+
+import (
+	"context"
+	"fmt"
+	"time"
+
+	"github.com/stretchr/testify/mock"
+	"k8s.io/utils/ptr"
+
+	"github.com/telekom/controlplane/identity/pkg/api"
+	"github.com/telekom/controlplane/identity/pkg/keycloak"
+	"github.com/telekom/controlplane/identity/pkg/keycloak/util"
+	"github.com/telekom/controlplane/identity/test/mocks/keycloakclient"
+
+	. "github.com/onsi/ginkgo/v2"
+	. "github.com/onsi/gomega"
+)
+
+// listPage matches the paginated listing of all clients starting at first.
+func listPage(first int32) any {
+	return mock.MatchedBy(func(params *api.GetRealmClientsParams) bool {
+		return params.ClientId == nil && params.First != nil && *params.First == first
+	})
+}
+
+// searchClient matches the search for a single client by clientId.
+func searchClient(clientId string) any {
+	return mock.MatchedBy(func(params *api.GetRealmClientsParams) bool {
+		return params.ClientId != nil && *params.ClientId == clientId
+	})
+}
+
+func listResponse(clients ...api.ClientRepresentation) *api.GetRealmClientsResponse {
+	return &api.GetRealmClientsResponse{HTTPResponse: httpResp(200), JSON2XX: &clients}
+}
+
+// existingClient returns the representation Keycloak holds for a client that
+// is up to date with the given secret.
+func existingClient(clientId, secret, uid string) api.ClientRepresentation {
+	rep := util.MapToClientRepresentation(newIdentityClient(clientId, secret))
+	rep.Id = ptr.To(uid)
+	return rep
+}
+
+var _ = Describe("KeycloakService with client cache", func() {
+	var (
+		mockClient *keycloakclient.MockKeycloakClient
+		svc        keycloak.KeycloakService
+		ctx        context.Context
+	)
+
+	BeforeEach(func() {
+		mockClient = newMockClient()
+		svc = keycloak.NewKeycloakService(mockClient, keycloak.WithClientCache(time.Hour))
+		ctx = context.Background()
+	})
+
+	It("skips unchanged clients without calling Keycloak", func() {
+		page := make([]api.ClientRepresentation, 0, 100)
+		for i := range 100 {
+			page = append(page, existingClient(fmt.Sprintf("other-%d", i), "secret", fmt.Sprintf("uid-%d", i)))
+		}
+		mockClient.EXPECT().GetRealmClientsWithResponse(mock.Anything, "realm1", listPage(0)).
+			Return(listResponse(page...), nil).Once()
+		mockClient.EXPECT().GetRealmClientsWithResponse(mock.Anything, "realm1", listPage(100)).
+			Return(listResponse(existingClient("my-app", "my-secret", "my-uid")), nil).Once()
+
+		for range 3 {
+			client := newIdentityClient("my-app", "my-secret")
+			err := svc.CreateOrReplaceClient(ctx, "realm1", client, keycloak.ClientUpdateOptions{})
+			Expect(err).ToNot(HaveOccurred())
+			Expect(client.Status.ClientUid).To(Equal("my-uid"))
+		}
+		mockClient.AssertNumberOfCalls(GinkgoT(), "GetRealmClientsWithResponse", 2)
+	})
+
+	It("updates changed clients and caches the result", func() {
+		existing := existingClient("my-app", "old-secret", "my-uid")
+		mockClient.EXPECT().GetRealmClientsWithResponse(mock.Anything, "realm1", listPage(0)).
+			Return(listResponse(existing), nil).Once()
+		mockClient.EXPECT().GetRealmClientsWithResponse(mock.Anything, "realm1", searchClient("my-app")).
+			Return(listResponse(existing), nil).Once()
+		mockClient.EXPECT().PutRealmClientsIdWithResponse(mock.Anything, "realm1", "my-uid", mock.Anything).
+			Return(&api.PutRealmClientsIdResponse{HTTPResponse: httpResp(204)}, nil).Once()
+
+		for range 2 {
+			client := newIdentityClient("my-app", "new-secret")
+			err := svc.CreateOrReplaceClient(ctx, "realm1", client, keycloak.ClientUpdateOptions{})
+			Expect(err).ToNot(HaveOccurred())
+			Expect(client.Status.ClientUid).To(Equal("my-uid"))
+		}
+	})
+
+	It("caches created clients", func() {
+		mockClient.EXPECT().GetRealmClientsWithResponse(mock.Anything, "realm1", listPage(0)).
+			Return(listResponse(), nil).Once()
+		mockClient.EXPECT().GetRealmClientsWithResponse(mock.Anything, "realm1", searchClient("my-app")).
+			Return(listResponse(), nil).Once()
+		mockClient.EXPECT().PostRealmClientsWithResponse(mock.Anything, "realm1", mock.Anything).
+			Return(&api.PostRealmClientsResponse{
+				HTTPResponse: httpRespWithLocation(201, "https://kc/admin/realms/realm1/clients/new-uid"),
+			}, nil).Once()
+
+		for range 2 {
+			client := newIdentityClient("my-app", "my-secret")
+			err := svc.CreateOrReplaceClient(ctx, "realm1", client, keycloak.ClientUpdateOptions{})
+			Expect(err).ToNot(HaveOccurred())
+			Expect(client.Status.ClientUid).To(Equal("new-uid"))
+		}
+	})
+
+	It("looks up the client in Keycloak when a refresh is forced", func() {
+		existing := existingClient("my-app", "my-secret", "my-uid")
+		mockClient.EXPECT().GetRealmClientsIdWithResponse(mock.Anything, "realm1", "my-uid").
+			Return(&api.GetRealmClientsIdResponse{HTTPResponse: httpResp(200), JSON2XX: &existing}, nil).Once()
+
+		client := newIdentityClientWithUID("my-app", "my-secret", "my-uid")
+		err := svc.CreateOrReplaceClient(ctx, "realm1", client, keycloak.ClientUpdateOptions{ForceRefresh: true})
+		Expect(err).ToNot(HaveOccurred())
+		mockClient.AssertNotCalled(GinkgoT(), "GetRealmClientsWithResponse", mock.Anything, mock.Anything, mock.Anything)
+	})
+
+	It("lists the clients again once the cache is stale", func() {
+		svc = keycloak.NewKeycloakService(mockClient, keycloak.WithClientCache(0))
+		mockClient.EXPECT().GetRealmClientsWithResponse(mock.Anything, "realm1", listPage(0)).
+			Return(listResponse(existingClient("my-app", "my-secret", "my-uid")), nil).Twice()
+
+		for range 2 {
+			err := svc.CreateOrReplaceClient(ctx, "realm1", newIdentityClient("my-app", "my-secret"), keycloak.ClientUpdateOptions{})
+			Expect(err).ToNot(HaveOccurred())
+		}
+	})
+
+	It("lists the clients again once the realm was recreated", func() {
+		mockClient.EXPECT().GetRealmClientsWithResponse(mock.Anything, "my-realm", listPage(0)).
+			Return(listResponse(existingClient("my-app", "my-secret", "my-uid")), nil).Twice()
+		mockClient.EXPECT().GetRealmWithResponse(mock.Anything, "my-realm").
+			Return(&api.GetRealmResponse{HTTPResponse: httpResp(404)}, nil).Once()
+		mockClient.EXPECT().PostWithResponse(mock.Anything, mock.Anything).
+			Return(&api.PostResponse{HTTPResponse: httpResp(201)}, nil).Once()
+
+		Expect(svc.CreateOrReplaceClient(ctx, "my-realm", newIdentityClient("my-app", "my-secret"), keycloak.ClientUpdateOptions{})).To(Succeed())
+		Expect(svc.CreateOrReplaceRealm(ctx, newRealm("my-realm"))).To(Succeed())
+		Expect(svc.CreateOrReplaceClient(ctx, "my-realm", newIdentityClient("my-app", "my-secret"), keycloak.ClientUpdateOptions{})).To(Succeed())
+	})
+
+	It("lists the clients again once the realm was not found", func() {
+		mockClient.EXPECT().GetRealmClientsWithResponse(mock.Anything, "realm1", listPage(0)).
+			Return(listResponse(), nil).Once()
+		mockClient.EXPECT().GetRealmClientsWithResponse(mock.Anything, "realm1", searchClient("my-app")).
+			Return(&api.GetRealmClientsResponse{HTTPResponse: httpResp(404)}, nil).Once()
+		mockClient.EXPECT().PostRealmClientsWithResponse(mock.Anything, "realm1", mock.Anything).
+			Return(&api.PostRealmClientsResponse{HTTPResponse: httpResp(404)}, nil).Once()
+		mockClient.EXPECT().GetRealmClientsWithResponse(mock.Anything, "realm1", listPage(0)).
+			Return(listResponse(existingClient("my-app", "my-secret", "my-uid")), nil).Once()
+
+		err := svc.CreateOrReplaceClient(ctx, "realm1", newIdentityClient("my-app", "my-secret"), keycloak.ClientUpdateOptions{})
+		Expect(keycloak.IsNotFound(err)).To(BeTrue())
+
+		client := newIdentityClient("my-app", "my-secret")
+		Expect(svc.CreateOrReplaceClient(ctx, "realm1", client, keycloak.ClientUpdateOptions{})).To(Succeed())
+		Expect(client.Status.ClientUid).To(Equal("my-uid"))
+	})
+
+	It("falls back to the lookup when listing the clients fails", func() {
+		existing := existingClient("my-app", "my-secret", "my-uid")
+		mockClient.EXPECT().GetRealmClientsWithResponse(mock.Anything, "realm1", listPage(0)).
+			Return(nil, fmt.Errorf("timeout")).Once()
+		mockClient.EXPECT().GetRealmClientsWithResponse(mock.Anything, "realm1", searchClient("my-app")).
+			Return(listResponse(existing), nil).Once()
+
+		client := newIdentityClient("my-app", "my-secret")
+		err := svc.CreateOrReplaceClient(ctx, "realm1", client, keycloak.ClientUpdateOptions{})
+		Expect(err).ToNot(HaveOccurred())
+		Expect(client.Status.ClientUid).To(Equal("my-uid"))
+	})
+
+	It("forgets deleted clients", func() {
+		existing := existingClient("my-app", "my-secret", "my-uid")
+		mockClient.EXPECT().GetRealmClientsWithResponse(mock.Anything, "realm1", listPage(0)).
+			Return(listResponse(existing), nil).Once()
+		mockClient.EXPECT().GetRealmClientsIdWithResponse(mock.Anything, "realm1", "my-uid").
+			Return(&api.GetRealmClientsIdResponse{HTTPResponse: httpResp(200), JSON2XX: &existing}, nil).Once()
+		mockClient.EXPECT().DeleteRealmClientsIdWithResponse(mock.Anything, "realm1", "my-uid").
+			Return(&api.DeleteRealmClientsIdResponse{HTTPResponse: httpResp(204)}, nil).Once()
+		mockClient.EXPECT().GetRealmClientsWithResponse(mock.Anything, "realm1", searchClient("my-app")).
+			Return(listResponse(), nil).Once()
+		mockClient.EXPECT().PostRealmClientsWithResponse(mock.Anything, "realm1", mock.Anything).
+			Return(&api.PostRealmClientsResponse{
+				HTTPResponse: httpRespWithLocation(201, "https://kc/admin/realms/realm1/clients/new-uid"),
+			}, nil).Once()
+
+		Expect(svc.CreateOrReplaceClient(ctx, "realm1", newIdentityClient("my-app", "my-secret"), keycloak.ClientUpdateOptions{})).To(Succeed())
+		Expect(svc.DeleteClient(ctx, "realm1", newIdentityClientWithUID("my-app", "my-secret", "my-uid"))).To(Succeed())
+
+		client := newIdentityClient("my-app", "my-secret")
+		Expect(svc.CreateOrReplaceClient(ctx, "realm1", client, keycloak.ClientUpdateOptions{})).To(Succeed())
+		Expect(client.Status.ClientUid).To(Equal("new-uid"))
+	})
+})
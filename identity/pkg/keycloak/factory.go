@@ -144,5 +144,5 @@ func NewKeycloakServiceFor(status *identityv1.RealmStatus) (KeycloakService, err
 	}
 
 	// 5. Domain service.
-	return NewKeycloakService(apiClient), nil
+	return NewKeycloakService(apiClient, WithClientCache(ClientCacheMaxAge)), nil
 }
@@ -102,6 +102,10 @@ type ClientUpdateOptions struct {
 	// SecretRotation condition) to avoid calling forceSecretRotation again,
 	// which would evict the original secret from the rotated slot.
 	SkipForceRotation bool
+
+	// ForceRefresh looks the client up in Keycloak even if the cached
+	// representation matches the desired state.
+	ForceRefresh bool
 }
 
 type KeycloakService interface {
@@ -132,6 +136,9 @@ var _ KeycloakService = (*keycloakService)(nil)
 
 type keycloakService struct {
 	Client KeycloakClient
+
+	// clients is nil if client representations are not cached.
+	clients *clientCache
 }
 
 func (k *keycloakService) getClient(ctx context.Context, realmName string, client *identityv1.Client) (*api.ClientRepresentation, error) {
@@ -185,17 +192,40 @@ func (k *keycloakService) getClient(ctx context.Context, realmName string, clien
 }
 
 // CreateOrReplaceClient implements [KeycloakService].
+//
+// If client representations are cached and the cached one matches the
+// desired state, the client is not looked up in Keycloak at all.
 func (k *keycloakService) CreateOrReplaceClient(ctx context.Context, realmName string, client *identityv1.Client, opts ClientUpdateOptions) error {
-	existing, err := k.getClient(ctx, realmName, client)
-	if err != nil {
-		return fmt.Errorf("error checking for existing client: %w", err)
+	if !opts.ForceRefresh {
+		desired := withHashedSecret(util.MapToClientRepresentation(client))
+		cached := k.clients.Get(ctx, realmName, client.Spec.ClientId)
+		if cached != nil && cached.Id != nil && util.CompareClientRepresentation(cached, &desired) {
+			client.Status.ClientUid = *cached.Id
+			logr.FromContextOrDiscard(ctx).V(1).Info("no changes detected for cached client, skipping update",
+				"clientId", client.Spec.ClientId, "keycloakId", client.Status.ClientUid)
+			return nil
+		}
 	}
 
-	if existing == nil {
-		return k.createClient(ctx, realmName, client)
+	existing, err := k.getClient(ctx, realmName, client)
+	if err == nil {
+		if existing == nil {
+			err = k.createClient(ctx, realmName, client)
+		} else {
+			err = k.updateClient(ctx, realmName, existing, client, opts)
+		}
+	} else {
+		err = fmt.Errorf("error checking for existing client: %w", err)
 	}
-
-	return k.updateClient(ctx, realmName, existing, client, opts)
+	switch {
+	case IsNotFound(err):
+		// The realm may have been deleted, so none of its cached clients exist.
+		k.clients.Invalidate(realmName)
+	case err != nil:
+		// The state in Keycloak is unknown after a failed write.
+		k.clients.Remove(realmName, client.Spec.ClientId)
+	}
+	return err
 }
 
 func (k *keycloakService) createClient(ctx context.Context, realmName string, client *identityv1.Client) error {
@@ -216,6 +246,8 @@ func (k *keycloakService) createClient(ctx context.Context, realmName string, cl
 	}
 
 	client.Status.ClientUid = clientUid
+	body.Id = &clientUid
+	k.clients.Put(realmName, &body)
 	logger.V(1).Info("created client in keycloak", "clientId", client.Spec.ClientId, "uid", client.Status.ClientUid)
 	return nil
 }
@@ -258,6 +290,7 @@ func (k *keycloakService) updateClient(ctx context.Context, realmName string, ex
 	if util.CompareClientRepresentation(existing, &desired) {
 		logger.V(1).Info("no changes detected for client, skipping update",
 			"clientId", client.Spec.ClientId, "keycloakId", clientUUID)
+		k.clients.Put(realmName, existing)
 		return nil
 	}
 
@@ -295,6 +328,7 @@ func (k *keycloakService) updateClient(ctx context.Context, realmName string, ex
 	if responseErr := CheckHTTPStatus(res.StatusCode(), 200, 204); responseErr != nil {
 		return fmt.Errorf("updating client: %w", responseErr)
 	}
+	k.clients.Put(realmName, merged)
 
 	logger.V(1).Info("updated existing client in keycloak",
 		"clientId", client.Spec.ClientId, "keycloakId", clientUUID)
@@ -346,6 +380,8 @@ func (k *keycloakService) CreateOrReplaceRealm(ctx context.Context, realm *ident
 	if responseErr := CheckHTTPStatus(res.StatusCode(), 201); responseErr != nil {
 		return fmt.Errorf("creating realm: %w", responseErr)
 	}
+	// The clients of a previous realm with the same name are gone.
+	k.clients.Invalidate(realm.Name)
 	logger.V(1).Info("created realm in keycloak", "realm", realm.Name)
 	return nil
 }
@@ -359,6 +395,7 @@ func (k *keycloakService) DeleteClient(ctx context.Context, realmName string, cl
 
 	if keycloakClient == nil {
 		// Client does not exist, nothing to do
+		k.clients.Remove(realmName, client.Spec.ClientId)
 		return nil
 	}
 
@@ -369,6 +406,7 @@ func (k *keycloakService) DeleteClient(ctx context.Context, realmName string, cl
 	if responseErr := CheckHTTPStatus(res.StatusCode(), 204); responseErr != nil {
 		return fmt.Errorf("deleting client: %w", responseErr)
 	}
+	k.clients.Remove(realmName, client.Spec.ClientId)
 
 	return nil
 }
@@ -382,12 +420,17 @@ func (k *keycloakService) DeleteRealm(ctx context.Context, realmName string) err
 	if responseErr := CheckHTTPStatus(res.StatusCode(), 204, 404); responseErr != nil {
 		return fmt.Errorf("deleting realm: %w", responseErr)
 	}
+	k.clients.Invalidate(realmName)
 
 	return nil
 }
 
-func NewKeycloakService(client KeycloakClient) KeycloakService {
-	return &keycloakService{
+func NewKeycloakService(client KeycloakClient, opts ...ServiceOption) KeycloakService {
+	k := &keycloakService{
 		Client: client,
 	}
+	for _, opt := range opts {
+		opt(k)
+	}
+	return k
 }
@@ -5,6 +5,8 @@
 package v1
 
 import (
+	"slices"
+
 	"github.com/telekom/controlplane/common/pkg/types"
 	"k8s.io/apimachinery/pkg/api/meta"
 	metav1 "k8s.io/apimachinery/pkg/apis/meta/v1"
@@ -58,6 +60,30 @@ type NotificationChannelSpec struct {
 	// +kubebuilder:validation:MaxItems=100
 	// +listType=set
 	Ignore []string `json:"ignore,omitempty"`
+
+	// Digest aggregates notifications with the same purpose into a single message
+	// +optional
+	Digest *DigestConfig `json:"digest,omitempty"`
+}
+
+// DigestConfig defines which notifications are aggregated into a digest and for how long
+type DigestConfig struct {
+	// Window is the time notifications are collected, starting with the oldest one, before the digest is sent
+	// +kubebuilder:validation:Required
+	Window metav1.Duration `json:"window"`
+
+	// Purposes of the notifications that are aggregated.
+	// Each purpose needs a template for the purpose "<purpose>-digest".
+	// +kubebuilder:validation:Required
+	// +kubebuilder:validation:MinItems=1
+	// +kubebuilder:validation:MaxItems=100
+	// +listType=set
+	Purposes []string `json:"purposes"`
+}
+
+// Includes returns true if notifications of the given purpose are aggregated
+func (d *DigestConfig) Includes(purpose string) bool {
+	return d != nil && slices.Contains(d.Purposes, purpose)
 }
 
 // NotificationChannelStatus defines the observed state of NotificationChannel.
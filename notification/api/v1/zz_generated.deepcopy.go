@@ -54,6 +54,27 @@ func (in *Authentication) DeepCopy() *Authentication {
 	return out
 }
 
+// DeepCopyInto is an autogenerated deepcopy function, copying the receiver, writing into out. in must be non-nil.
+func (in *DigestConfig) DeepCopyInto(out *DigestConfig) {
+	*out = *in
+	out.Window = in.Window
+	if in.Purposes != nil {
+		in, out := &in.Purposes, &out.Purposes
+		*out = make([]string, len(*in))
+		copy(*out, *in)
+	}
+}
+
+// DeepCopy is an autogenerated deepcopy function, copying the receiver, creating a new DigestConfig.
+func (in *DigestConfig) DeepCopy() *DigestConfig {
+	if in == nil {
+		return nil
+	}
+	out := new(DigestConfig)
+	in.DeepCopyInto(out)
+	return out
+}
+
 // DeepCopyInto is an autogenerated deepcopy function, copying the receiver, writing into out. in must be non-nil.
 func (in *EmailConfig) DeepCopyInto(out *EmailConfig) {
 	*out = *in
@@ -228,6 +249,11 @@ func (in *NotificationChannelSpec) DeepCopyInto(out *NotificationChannelSpec) {
 		*out = make([]string, len(*in))
 		copy(*out, *in)
 	}
+	if in.Digest != nil {
+		in, out := &in.Digest, &out.Digest
+		*out = new(DigestConfig)
+		(*in).DeepCopyInto(*out)
+	}
 }
 
 // DeepCopy is an autogenerated deepcopy function, copying the receiver, creating a new NotificationChannelSpec.
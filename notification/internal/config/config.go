@@ -38,6 +38,14 @@ type SMTPSender struct {
 	BatchLoopDelay time.Duration `mapstructure:"batchLoopDelay"`
 	DefaultFrom    string        `mapstructure:"defaultFrom"`
 	DefaultName    string        `mapstructure:"defaultName"`
+	// PoolSize is the maximum number of SMTP connections used at the same time
+	PoolSize int `mapstructure:"poolSize"`
+	// MaxMessagesPerConnection is the number of emails after which an SMTP connection is closed
+	MaxMessagesPerConnection int `mapstructure:"maxMessagesPerConnection"`
+	// IdleTimeout is the time after which an unused SMTP connection is closed, 0 disables reuse
+	IdleTimeout time.Duration `mapstructure:"idleTimeout"`
+	// SendTimeout bounds the time to send an email, including the wait for a free connection
+	SendTimeout time.Duration `mapstructure:"sendTimeout"`
 	// if true, emails will not be sent, just a log message will appear - should be used only for testing, to avoid spamming
 	DryRun bool `mapstructure:"dryRun"`
 }
@@ -81,6 +89,10 @@ func setEmailAdapterConfigDefaults() {
 	viper.SetDefault("smtpSender.defaultFrom", "email@telekom.de")
 	viper.SetDefault("smtpSender.defaultName", "Team Tardis")
 	viper.SetDefault("smtpSender.dryRun", false)
+	viper.SetDefault("smtpSender.poolSize", 4)
+	viper.SetDefault("smtpSender.maxMessagesPerConnection", 100)
+	viper.SetDefault("smtpSender.idleTimeout", "30s")
+	viper.SetDefault("smtpSender.sendTimeout", "30s")
 }
 
 func setHousekeepingConfigDefaults() {
@@ -82,6 +82,7 @@ func (r *NotificationReconciler) SetupWithManager(mgr ctrl.Manager) error {
 	notificationHandler := &notificationhandler.NotificationHandler{
 		NotificationSender: r.NotificationSender,
 		TemplateCache:      r.TemplateCache,
+		StatusUpdater:      r.Client.Status(),
 	}
 
 	r.Controller = cc.NewController(notificationHandler, r.Client, r.Recorder)
@@ -0,0 +1,189 @@
+// Copyright 2026 Deutsche Telekom IT GmbH
+//
+// SPDX-License-Identifier: Apache-2.0
+
+package handler
+
+import (
+	"cmp"
+	"context"
+	"fmt"
+	"slices"
+	"time"
+
+	"github.com/go-logr/logr"
+	"github.com/pkg/errors"
+	"k8s.io/client-go/util/retry"
+	k8sclient "sigs.k8s.io/controller-runtime/pkg/client"
+
+	"github.com/telekom/controlplane/common/pkg/client"
+	"github.com/telekom/controlplane/common/pkg/util/contextutil"
+	notificationv1 "github.com/telekom/controlplane/notification/api/v1"
+	"github.com/telekom/controlplane/notification/internal/rendering"
+	"github.com/telekom/controlplane/notification/internal/templatecache"
+)
+
+// DigestPurposeSuffix is appended to the purpose of aggregated notifications to
+// resolve the template of their digest, e.g. api-subscription-approved-digest--mail
+const DigestPurposeSuffix = "-digest"
+
+// digestFollowerDelay is the time a notification that does not send the digest
+// waits for the one that does
+var digestFollowerDelay = 10 * time.Second
+
+// StatusUpdater updates the status of notifications other than the reconciled one
+type StatusUpdater interface {
+	Update(ctx context.Context, obj k8sclient.Object, opts ...k8sclient.SubResourceUpdateOption) error
+}
+
+// digest holds the unsent notifications of a purpose for a channel, oldest first.
+// The oldest notification sends the digest once the window since its creation
+// has passed, all others wait for it.
+type digest struct {
+	window  time.Duration
+	members []*notificationv1.Notification
+}
+
+func (d *digest) leader() *notificationv1.Notification {
+	return d.members[0]
+}
+
+func (d *digest) sendAt() time.Time {
+	return d.leader().CreationTimestamp.Add(d.window)
+}
+
+// collectDigest lists the notifications that are aggregated with the given one
+func collectDigest(ctx context.Context, channel *notificationv1.NotificationChannel, channelKey string, notification *notificationv1.Notification) (*digest, error) {
+	scopedClient := client.ClientFromContextOrDie(ctx)
+
+	notifications := &notificationv1.NotificationList{}
+	if err := scopedClient.List(ctx, notifications, k8sclient.InNamespace(notification.Namespace)); err != nil {
+		return nil, errors.Wrapf(err, "Failed to list notifications for digest of channel %q", channelKey)
+	}
+
+	// the reconciled notification is always a member and more recent than the listed one
+	members := []*notificationv1.Notification{notification}
+	for i := range notifications.Items {
+		item := &notifications.Items[i]
+		if item.Name == notification.Name || item.Spec.Purpose != notification.Spec.Purpose || item.DeletionTimestamp != nil {
+			continue
+		}
+		if targetsChannel(item, channel) && !alreadySent(channelKey, item) {
+			members = append(members, item)
+		}
+	}
+
+	slices.SortFunc(members, func(a, b *notificationv1.Notification) int {
+		if c := a.CreationTimestamp.Compare(b.CreationTimestamp.Time); c != 0 {
+			return c
+		}
+		return cmp.Compare(a.Name, b.Name)
+	})
+
+	return &digest{window: channel.Spec.Digest.Window.Duration, members: members}, nil
+}
+
+// targetsChannel returns true if the notification is sent to the channel, see findChannelsForNotification
+func targetsChannel(notification *notificationv1.Notification, channel *notificationv1.NotificationChannel) bool {
+	if len(notification.Spec.Channels) == 0 {
+		return notification.Namespace == channel.Namespace
+	}
+	for _, ref := range notification.Spec.Channels {
+		if ref.Name == channel.Name && ref.Namespace == channel.Namespace {
+			return true
+		}
+	}
+	return false
+}
+
+// waitForDigest requeues the notification once the digest is due. It returns
+// false if the notification has to send the digest now.
+func waitForDigest(ctx context.Context, d *digest, notification *notificationv1.Notification) bool {
+	delay := time.Until(d.sendAt())
+	if d.leader() != notification {
+		delay = max(delay, 0) + digestFollowerDelay
+	} else if delay <= 0 {
+		return false
+	}
+
+	// another channel may need the notification to be requeued earlier
+	if hint, ok := contextutil.ReconcileHintFromContext(ctx); ok && hint.RequeueAfter != nil && *hint.RequeueAfter < delay {
+		return true
+	}
+	contextutil.SetRequeueAfter(ctx, delay)
+	return true
+}
+
+// sendDigest renders the digest, sends it and marks all other members as sent
+func (n *NotificationHandler) sendDigest(ctx context.Context, channel *notificationv1.NotificationChannel, channelKey string, templateWrapper *templatecache.TemplateWrapper, d *digest) error {
+	subject, body, attachments, err := renderDigest(templateWrapper, d)
+	if err != nil {
+		return err
+	}
+
+	if err := n.NotificationSender.ProcessNotification(ctx, channel, subject, body, toAdapterAttachments(attachments)); err != nil {
+		return err
+	}
+
+	n.markSentInDigest(ctx, channelKey, d)
+	return nil
+}
+
+// renderDigest renders the digest template with the properties of all members, available as .notifications
+func renderDigest(templateWrapper *templatecache.TemplateWrapper, d *digest) (string, string, []rendering.RenderedAttachment, error) {
+	notifications := make([]map[string]interface{}, 0, len(d.members))
+	for _, member := range d.members {
+		properties := map[string]interface{}{}
+		if len(member.Spec.Properties.Raw) > 0 {
+			var err error
+			if properties, err = rendering.UnmarshalProperties(member.Spec.Properties.Raw); err != nil {
+				return "", "", nil, errors.Wrapf(err, "Failed to read properties of notification %q", member.Name)
+			}
+		}
+		notifications = append(notifications, properties)
+	}
+
+	properties := map[string]interface{}{
+		"purpose":       d.leader().Spec.Purpose,
+		"count":         len(notifications),
+		"notifications": notifications,
+	}
+
+	subject, err := rendering.RenderMessage(templateWrapper.SubjectTemplate, properties)
+	if err != nil {
+		return "", "", nil, err
+	}
+	body, err := rendering.RenderMessage(templateWrapper.BodyTemplate, properties)
+	if err != nil {
+		return "", "", nil, err
+	}
+	attachments, err := rendering.RenderAttachments(templateWrapper.Attachments, properties)
+	if err != nil {
+		return "", "", nil, err
+	}
+	return subject, body, attachments, nil
+}
+
+// markSentInDigest records on all other members that they were sent with the digest.
+// A member that cannot be updated is only logged, it is sent again on its own.
+func (n *NotificationHandler) markSentInDigest(ctx context.Context, channelKey string, d *digest) {
+	logger := logr.FromContextOrDiscard(ctx)
+	scopedClient := client.ClientFromContextOrDie(ctx)
+	message := fmt.Sprintf("Successfully sent in digest %q", d.leader().Name)
+
+	for _, member := range d.members[1:] {
+		err := retry.RetryOnConflict(retry.DefaultRetry, func() error {
+			if err := scopedClient.Get(ctx, k8sclient.ObjectKeyFromObject(member), member); err != nil {
+				return err
+			}
+			if alreadySent(channelKey, member) {
+				return nil
+			}
+			addResultToStatus(member, channelKey, true, message)
+			return n.StatusUpdater.Update(ctx, member)
+		})
+		if err != nil {
+			logger.Error(err, "Failed to mark notification as sent in digest", "notification", member.Name, "channel", channelKey)
+		}
+	}
+}
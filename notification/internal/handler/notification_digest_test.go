@@ -0,0 +1,175 @@
+// Copyright 2026 Deutsche Telekom IT GmbH
+//
+// SPDX-License-Identifier: Apache-2.0
+
+package handler_test
+
+import (
+	"context"
+	"time"
+
+	"github.com/stretchr/testify/mock"
+	"k8s.io/apimachinery/pkg/api/meta"
+	metav1 "k8s.io/apimachinery/pkg/apis/meta/v1"
+	k8stypes "k8s.io/apimachinery/pkg/types"
+	k8sclient "sigs.k8s.io/controller-runtime/pkg/client"
+
+	fakeclient "github.com/telekom/controlplane/common/pkg/client/fake"
+	"github.com/telekom/controlplane/common/pkg/condition"
+	commontypes "github.com/telekom/controlplane/common/pkg/types"
+	"github.com/telekom/controlplane/common/pkg/util/contextutil"
+	notificationv1 "github.com/telekom/controlplane/notification/api/v1"
+	handlers "github.com/telekom/controlplane/notification/internal/handler"
+	"github.com/telekom/controlplane/notification/internal/templatecache"
+
+	. "github.com/onsi/ginkgo/v2"
+	. "github.com/onsi/gomega"
+)
+
+// fakeStatusUpdater records the notifications whose status was updated.
+type fakeStatusUpdater struct {
+	updated []*notificationv1.Notification
+}
+
+func (f *fakeStatusUpdater) Update(_ context.Context, obj k8sclient.Object, _ ...k8sclient.SubResourceUpdateOption) error {
+	f.updated = append(f.updated, obj.(*notificationv1.Notification).DeepCopy())
+	return nil
+}
+
+func newDigestNotification(name string, age time.Duration, properties string) *notificationv1.Notification {
+	n := newNotification("welcome", []commontypes.ObjectRef{channelRef("team--mail")}, properties)
+	n.Name = name
+	n.CreationTimestamp = metav1.NewTime(time.Now().Add(-age))
+	return n
+}
+
+// expectListNotifications sets up a mock for listing the notifications of the namespace.
+func expectListNotifications(fc *fakeclient.MockJanitorClient, items ...*notificationv1.Notification) {
+	fc.EXPECT().
+		List(mock.Anything, mock.AnythingOfType("*v1.NotificationList"), mock.Anything).
+		Run(func(_ context.Context, list k8sclient.ObjectList, _ ...k8sclient.ListOption) {
+			nList := list.(*notificationv1.NotificationList)
+			for _, item := range items {
+				nList.Items = append(nList.Items, *item.DeepCopy())
+			}
+		}).
+		Return(nil).Once()
+}
+
+var _ = Describe("Notification Handler - Digest", func() {
+	var (
+		fakeClient *fakeclient.MockJanitorClient
+		ctx        context.Context
+		hint       *contextutil.ReconcileHint
+		mSender    *mockSender
+		updater    *fakeStatusUpdater
+		cache      *templatecache.TemplateCache
+		handler    *handlers.NotificationHandler
+		channel    *notificationv1.NotificationChannel
+	)
+
+	BeforeEach(func() {
+		fakeClient = fakeclient.NewMockJanitorClient(GinkgoT())
+		hint = &contextutil.ReconcileHint{}
+		ctx = contextutil.WithReconcileHint(setupCtx(fakeClient), hint)
+		mSender = &mockSender{}
+		updater = &fakeStatusUpdater{}
+		cache = templatecache.New()
+		handler = &handlers.NotificationHandler{
+			NotificationSender: mSender,
+			TemplateCache:      cache,
+			StatusUpdater:      updater,
+		}
+
+		channel = newReadyEmailChannel([]string{"a@b.c"})
+		channel.Spec.Digest = &notificationv1.DigestConfig{
+			Window:   metav1.Duration{Duration: time.Hour},
+			Purposes: []string{"welcome"},
+		}
+		cache.Set("welcome-digest--mail", newTemplateWrapper(
+			"{{.count}} new members",
+			"{{range .notifications}}{{.name}};{{end}}",
+		))
+	})
+
+	It("should wait for the window of the oldest notification", func() {
+		notification := newDigestNotification("n1", time.Minute, `{"name":"alice"}`)
+
+		expectGetChannel(fakeClient, channel)
+		expectListNotifications(fakeClient, notification)
+
+		err := handler.CreateOrUpdate(ctx, notification)
+		Expect(err).NotTo(HaveOccurred())
+		Expect(mSender.callCount).To(Equal(0))
+		Expect(notification.Status.States).To(BeEmpty())
+
+		ready := meta.FindStatusCondition(notification.Status.Conditions, condition.ConditionTypeReady)
+		Expect(ready).NotTo(BeNil())
+		Expect(ready.Status).To(Equal(metav1.ConditionFalse))
+		Expect(ready.Reason).To(Equal("WaitingForDigest"))
+		Expect(hint.RequeueAfter).NotTo(BeNil())
+		Expect(*hint.RequeueAfter).To(BeNumerically("~", 59*time.Minute, time.Second))
+	})
+
+	It("should send one digest for all notifications once it is due", func() {
+		leader := newDigestNotification("n1", 2*time.Hour, `{"name":"alice"}`)
+		member := newDigestNotification("n2", time.Hour/2, `{"name":"bob"}`)
+		sent := newDigestNotification("n3", 3*time.Hour, `{"name":"carol"}`)
+		sent.Status.States = map[string]notificationv1.SendState{"default/team--mail": {Sent: true}}
+		other := newDigestNotification("n4", 3*time.Hour, `{"name":"dave"}`)
+		other.Spec.Purpose = "goodbye"
+
+		expectGetChannel(fakeClient, channel)
+		expectListNotifications(fakeClient, leader, member, sent, other)
+		expectGetTemplate(fakeClient, "welcome-digest--mail", newReadyNotificationTemplate("welcome-digest--mail", testEnvironment))
+		fakeClient.EXPECT().
+			Get(mock.Anything, k8stypes.NamespacedName{Name: "n2", Namespace: "default"}, mock.AnythingOfType("*v1.Notification"), mock.Anything).
+			Run(func(_ context.Context, _ k8stypes.NamespacedName, obj k8sclient.Object, _ ...k8sclient.GetOption) {
+				*obj.(*notificationv1.Notification) = *member.DeepCopy()
+			}).
+			Return(nil).Once()
+
+		err := handler.CreateOrUpdate(ctx, leader)
+		Expect(err).NotTo(HaveOccurred())
+		Expect(mSender.callCount).To(Equal(1))
+		Expect(mSender.lastArgs.subject).To(Equal("2 new members"))
+		Expect(mSender.lastArgs.body).To(Equal("alice;bob;"))
+
+		Expect(leader.Status.States["default/team--mail"].Sent).To(BeTrue())
+		Expect(meta.IsStatusConditionTrue(leader.Status.Conditions, condition.ConditionTypeReady)).To(BeTrue())
+
+		Expect(updater.updated).To(HaveLen(1))
+		Expect(updater.updated[0].Name).To(Equal("n2"))
+		Expect(updater.updated[0].Status.States["default/team--mail"].Sent).To(BeTrue())
+		Expect(updater.updated[0].Status.States["default/team--mail"].ErrorMessage).To(ContainSubstring(`"n1"`))
+	})
+
+	It("should wait for the oldest notification to send the digest", func() {
+		leader := newDigestNotification("n1", 2*time.Hour, `{"name":"alice"}`)
+		member := newDigestNotification("n2", time.Hour/2, `{"name":"bob"}`)
+
+		expectGetChannel(fakeClient, channel)
+		expectListNotifications(fakeClient, leader, member)
+
+		err := handler.CreateOrUpdate(ctx, member)
+		Expect(err).NotTo(HaveOccurred())
+		Expect(mSender.callCount).To(Equal(0))
+		Expect(updater.updated).To(BeEmpty())
+		Expect(meta.IsStatusConditionTrue(member.Status.Conditions, condition.ConditionTypeReady)).To(BeFalse())
+		Expect(hint.RequeueAfter).NotTo(BeNil())
+		Expect(*hint.RequeueAfter).To(BeNumerically(">", 0))
+	})
+
+	It("should send notifications of other purposes on their own", func() {
+		notification := newNotification("goodbye", []commontypes.ObjectRef{channelRef("team--mail")}, `{"name":"alice"}`)
+		cache.Set("goodbye--mail", newTemplateWrapper("Bye", "{{.name}}"))
+
+		expectGetChannel(fakeClient, channel)
+		expectGetTemplate(fakeClient, "goodbye--mail", newReadyNotificationTemplate("goodbye--mail", testEnvironment))
+
+		err := handler.CreateOrUpdate(ctx, notification)
+		Expect(err).NotTo(HaveOccurred())
+		Expect(mSender.callCount).To(Equal(1))
+		Expect(mSender.lastArgs.body).To(Equal("alice"))
+	})
+})
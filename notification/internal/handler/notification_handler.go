@@ -35,10 +35,14 @@ type NotificationHandler struct {
 	NotificationSender sender.NotificationSender
 
 	TemplateCache *templatecache.TemplateCache
+
+	// StatusUpdater marks the notifications that were sent with a digest of another one
+	StatusUpdater StatusUpdater
 }
 
 func (n *NotificationHandler) CreateOrUpdate(ctx context.Context, notification *notificationv1.Notification) error {
 	shouldBlock := false
+	waitingForDigest := false
 
 	channels := notification.Spec.Channels
 	// if there are no channels in the notification, we will use all channels form the notifications namespace
@@ -64,6 +68,37 @@ func (n *NotificationHandler) CreateOrUpdate(ctx context.Context, notification *
 			continue
 		}
 
+		// aggregate the notification with others of the same purpose, if the channel asks for it
+		if channel.Spec.Digest.Includes(notification.Spec.Purpose) {
+			d, err := collectDigest(ctx, channel, channelKey, notification)
+			if err != nil {
+				addResultToStatus(notification, channelKey, false, err.Error())
+				continue
+			}
+
+			// only the oldest notification sends the digest, once it is due
+			if waitForDigest(ctx, d, notification) {
+				waitingForDigest = true
+				continue
+			}
+
+			templateWrapper, err := n.resolveTemplate(ctx, channel, notification.Spec.Purpose+DigestPurposeSuffix)
+			if err != nil {
+				shouldBlock = true
+				addResultToStatus(notification, channelKey, false, err.Error())
+				continue
+			}
+
+			err = n.sendDigest(ctx, channel, channelKey, templateWrapper, d)
+			if err != nil {
+				addResultToStatus(notification, channelKey, false, err.Error())
+				continue
+			}
+
+			addResultToStatus(notification, channelKey, true, "Successfully sent")
+			continue
+		}
+
 		// resolve the template
 		templateWrapper, err := n.resolveTemplate(ctx, channel, notification.Spec.Purpose)
 		if err != nil {
@@ -119,6 +154,9 @@ func (n *NotificationHandler) CreateOrUpdate(ctx context.Context, notification *
 	if hasFailedSendAttempt(notification.Status.States) {
 		notification.SetCondition(condition.NewProcessingCondition("Retrying", "Retrying failed notifications"))
 		notification.SetCondition(condition.NewNotReadyCondition("Retrying", "Some notifications were not sent"))
+	} else if waitingForDigest {
+		notification.SetCondition(condition.NewProcessingCondition("WaitingForDigest", "Waiting for the digest to be sent"))
+		notification.SetCondition(condition.NewNotReadyCondition("WaitingForDigest", "Some notifications are waiting for the digest to be sent"))
 	} else {
 		notification.SetCondition(condition.NewReadyCondition(condition.ReasonProvisioned, "Notification is provisioned"))
 		notification.SetCondition(condition.NewDoneProcessingCondition("Notification is done processing"))
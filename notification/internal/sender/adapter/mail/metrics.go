@@ -0,0 +1,48 @@
+// Copyright 2026 Deutsche Telekom IT GmbH
+//
+// SPDX-License-Identifier: Apache-2.0
+
+package mail
+
+import (
+	"github.com/prometheus/client_golang/prometheus"
+	"sigs.k8s.io/controller-runtime/pkg/metrics"
+)
+
+// Results of sending an email, used as the "result" label.
+const (
+	SendSucceeded = "success"
+	SendFailed    = "error"
+)
+
+// States of pooled SMTP connections, used as the "state" label.
+const (
+	ConnectionsOpen = "open" // all connections, idle or in use
+	ConnectionsIdle = "idle"
+)
+
+var (
+	// MailSendDuration observes the time it takes to send an email, including
+	// the wait for a free SMTP connection.
+	MailSendDuration = prometheus.NewHistogramVec(prometheus.HistogramOpts{
+		Name:    "controlplane_notification_mail_send_duration_seconds",
+		Help:    "Time it takes to send an email via SMTP, labelled by result.",
+		Buckets: prometheus.DefBuckets,
+	}, []string{"result"})
+
+	// MailPoolConnections is the number of pooled SMTP connections.
+	MailPoolConnections = prometheus.NewGaugeVec(prometheus.GaugeOpts{
+		Name: "controlplane_notification_mail_pool_connections",
+		Help: "SMTP connections of the mail adapter, labelled by whether they are open or idle.",
+	}, []string{"state"})
+
+	// MailPoolDials counts the connections opened to the SMTP server.
+	MailPoolDials = prometheus.NewCounter(prometheus.CounterOpts{
+		Name: "controlplane_notification_mail_pool_dials_total",
+		Help: "Connections opened to the SMTP server by the mail adapter.",
+	})
+)
+
+func init() {
+	metrics.Registry.MustRegister(MailSendDuration, MailPoolConnections, MailPoolDials)
+}
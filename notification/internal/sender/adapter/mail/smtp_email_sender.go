@@ -10,6 +10,7 @@ import (
 	"crypto/tls"
 	"fmt"
 	"io"
+	"sync"
 	"time"
 
 	"github.com/go-logr/logr"
@@ -28,24 +29,46 @@ type EmailSender interface {
 
 type SMTPEmailSender struct {
 	config *config.EmailAdapterConfig
+	pool   *smtpPool
 }
 
+// defaultSendTimeout is used if the config does not set a send timeout.
+const defaultSendTimeout = 30 * time.Second
+
+// pools holds the connection pool of each adapter config, as a sender is
+// created for every email.
+var pools sync.Map // map[*config.EmailAdapterConfig]*smtpPool
+
 var NewSMTPSender = func(config *config.EmailAdapterConfig) EmailSender {
-	return &SMTPEmailSender{config: config}
+	return &SMTPEmailSender{config: config, pool: poolFor(config)}
+}
+
+func poolFor(config *config.EmailAdapterConfig) *smtpPool {
+	if pool, ok := pools.Load(config); ok {
+		return pool.(*smtpPool)
+	}
+
+	d := gomail.NewDialer(config.SMTPConnection.Host, config.SMTPConnection.Port, config.SMTPConnection.User, config.SMTPConnection.Password)
+
+	// we are aware that the InsecureSkipVerify is set to true. communication is within cluster and this is currently acceptable
+	d.TLSConfig = &tls.Config{ServerName: config.SMTPConnection.Host, InsecureSkipVerify: true} //nolint:gosec // G402: intra-cluster communication, acceptable risk
+
+	pool := newSMTPPool(d, config.SMTPSender.PoolSize, config.SMTPSender.MaxMessagesPerConnection, config.SMTPSender.IdleTimeout)
+	actual, _ := pools.LoadOrStore(config, pool)
+	return actual.(*smtpPool)
 }
 
 // Send delivers an email via SMTP with optional file attachments.
 func (s SMTPEmailSender) Send(ctx context.Context, from, senderName string, bcc []string, subject, body string, attachments []adapter.Attachment) error {
 	log := logr.FromContextOrDiscard(ctx)
 
-	_, cancel := context.WithTimeout(ctx, 30*time.Second)
+	timeout := s.config.SMTPSender.SendTimeout
+	if timeout <= 0 {
+		timeout = defaultSendTimeout
+	}
+	ctx, cancel := context.WithTimeout(ctx, timeout)
 	defer cancel()
 
-	d := gomail.NewDialer(s.config.SMTPConnection.Host, s.config.SMTPConnection.Port, s.config.SMTPConnection.User, s.config.SMTPConnection.Password)
-
-	// we are aware that the InsecureSkipVerify is set to true. communication is within cluster and this is currently acceptable
-	d.TLSConfig = &tls.Config{ServerName: s.config.SMTPConnection.Host, InsecureSkipVerify: true} //nolint:gosec // G402: intra-cluster communication, acceptable risk
-
 	m := gomail.NewMessage()
 	m.SetHeader("From", fmt.Sprintf("%s <%s>", senderName, from))
 	m.SetHeader("Bcc", bcc...)
@@ -65,9 +88,12 @@ func (s SMTPEmailSender) Send(ctx context.Context, from, senderName string, bcc
 		)
 	}
 
-	if err := d.DialAndSend(m); err != nil {
+	start := time.Now()
+	if err := s.pool.Send(ctx, m); err != nil {
+		MailSendDuration.WithLabelValues(SendFailed).Observe(time.Since(start).Seconds())
 		return errors.Wrap(err, "Failed to send email")
 	}
+	MailSendDuration.WithLabelValues(SendSucceeded).Observe(time.Since(start).Seconds())
 
 	log.Info("Email sent successfully", "bcc", bcc)
 	return nil
@@ -0,0 +1,185 @@
+// Copyright 2026 Deutsche Telekom IT GmbH
+//
+// SPDX-License-Identifier: Apache-2.0
+
+package mail
+
+import (
+	"context"
+	"sync"
+	"time"
+
+	"github.com/pkg/errors"
+	"gopkg.in/gomail.v2"
+)
+
+// smtpDialer opens an authenticated connection to the SMTP server.
+type smtpDialer interface {
+	Dial() (gomail.SendCloser, error)
+}
+
+// smtpPool keeps authenticated SMTP connections open between emails, so that
+// a burst of notifications does not pay the TCP, TLS and AUTH handshake for
+// every email.
+//
+// At most maxConns connections are in use at a time. A connection is closed
+// after maxMessages emails or once it was idle for idleTimeout.
+type smtpPool struct {
+	dialer      smtpDialer
+	maxMessages int
+	idleTimeout time.Duration
+	now         func() time.Time
+
+	// slots bounds the number of connections in use.
+	slots chan struct{}
+
+	mutex  sync.Mutex
+	idle   []*smtpConn // most recently used last
+	reaper *time.Timer
+}
+
+type smtpConn struct {
+	gomail.SendCloser
+	sent     int
+	lastUsed time.Time
+}
+
+func newSMTPPool(dialer smtpDialer, maxConns, maxMessages int, idleTimeout time.Duration) *smtpPool {
+	return &smtpPool{
+		dialer:      dialer,
+		maxMessages: maxMessages,
+		idleTimeout: idleTimeout,
+		now:         time.Now,
+		slots:       make(chan struct{}, max(maxConns, 1)),
+	}
+}
+
+// Send sends the message over a pooled connection. It waits for a free
+// connection until ctx is done. If ctx is done while the message is sent,
+// Send returns and the connection is discarded once the send finished.
+func (p *smtpPool) Send(ctx context.Context, m *gomail.Message) error {
+	select {
+	case p.slots <- struct{}{}:
+	case <-ctx.Done():
+		return errors.Wrap(ctx.Err(), "Timed out waiting for an SMTP connection")
+	}
+
+	done := make(chan error, 1)
+	go func() {
+		defer func() { <-p.slots }()
+		done <- p.send(ctx, m)
+	}()
+
+	select {
+	case err := <-done:
+		return err
+	case <-ctx.Done():
+		return errors.Wrap(ctx.Err(), "Timed out sending email")
+	}
+}
+
+// send sends the message with the slot of the caller held. A failed send
+// over a reused connection is retried once over a new one, since the server
+// may have closed it while it was idle.
+func (p *smtpPool) send(ctx context.Context, m *gomail.Message) error {
+	conn, reused := p.take()
+	for {
+		if conn == nil {
+			if err := ctx.Err(); err != nil {
+				return err
+			}
+			sc, err := p.dialer.Dial()
+			MailPoolDials.Inc()
+			if err != nil {
+				return errors.Wrap(err, "Failed to connect to SMTP server")
+			}
+			conn = &smtpConn{SendCloser: sc}
+			MailPoolConnections.WithLabelValues(ConnectionsOpen).Inc()
+		}
+
+		err := gomail.Send(conn, m)
+		if err == nil {
+			conn.sent++
+			p.release(conn, ctx.Err() == nil)
+			return nil
+		}
+		p.discard(conn)
+		if !reused {
+			return err
+		}
+		conn, reused = nil, false
+	}
+}
+
+// take returns the most recently used idle connection, if any.
+func (p *smtpPool) take() (*smtpConn, bool) {
+	var stale []*smtpConn
+	defer func() {
+		for _, conn := range stale {
+			p.discard(conn)
+		}
+	}()
+
+	p.mutex.Lock()
+	defer p.mutex.Unlock()
+	for len(p.idle) > 0 {
+		conn := p.idle[len(p.idle)-1]
+		p.idle[len(p.idle)-1] = nil
+		p.idle = p.idle[:len(p.idle)-1]
+		MailPoolConnections.WithLabelValues(ConnectionsIdle).Dec()
+		if p.now().Sub(conn.lastUsed) < p.idleTimeout {
+			return conn, true
+		}
+		stale = append(stale, conn)
+	}
+	return nil, false
+}
+
+// release returns a connection to the pool, or closes it if it may not be
+// used anymore.
+func (p *smtpPool) release(conn *smtpConn, reusable bool) {
+	if !reusable || conn.sent >= p.maxMessages || p.idleTimeout <= 0 {
+		p.discard(conn)
+		return
+	}
+	conn.lastUsed = p.now()
+
+	p.mutex.Lock()
+	defer p.mutex.Unlock()
+	p.idle = append(p.idle, conn)
+	MailPoolConnections.WithLabelValues(ConnectionsIdle).Inc()
+	if p.reaper == nil {
+		p.reaper = time.AfterFunc(p.idleTimeout, p.reap)
+	}
+}
+
+// reap closes the connections that were idle for idleTimeout.
+func (p *smtpPool) reap() {
+	p.mutex.Lock()
+	p.reaper = nil
+	now := p.now()
+	var stale, kept []*smtpConn
+	for _, conn := range p.idle {
+		if now.Sub(conn.lastUsed) < p.idleTimeout {
+			kept = append(kept, conn)
+			continue
+		}
+		MailPoolConnections.WithLabelValues(ConnectionsIdle).Dec()
+		stale = append(stale, conn)
+	}
+	p.idle = kept
+	if len(p.idle) > 0 {
+		// The oldest idle connection is the first one.
+		p.reaper = time.AfterFunc(p.idleTimeout-now.Sub(p.idle[0].lastUsed), p.reap)
+	}
+	p.mutex.Unlock()
+
+	for _, conn := range stale {
+		p.discard(conn)
+	}
+}
+
+func (p *smtpPool) discard(conn *smtpConn) {
+	_ = conn.Close()
+	MailPoolConnections.WithLabelValues(ConnectionsOpen).Dec()
+}
@@ -0,0 +1,207 @@
+// Copyright 2026 Deutsche Telekom IT GmbH
+//
+// SPDX-License-Identifier: Apache-2.0
+
+package mail
+
+import (
+	"context"
+	"errors"
+	"io"
+	"sync"
+	"sync/atomic"
+	"testing"
+	"time"
+
+	"gopkg.in/gomail.v2"
+)
+
+type fakeDialer struct {
+	dials atomic.Int32
+	block chan struct{}
+
+	mutex  sync.Mutex
+	conns  []*fakeConn
+	active int
+	peak   int
+}
+
+func (d *fakeDialer) sends() (active, peak int) {
+	d.mutex.Lock()
+	defer d.mutex.Unlock()
+	return d.active, d.peak
+}
+
+func (d *fakeDialer) Dial() (gomail.SendCloser, error) {
+	d.dials.Add(1)
+	conn := &fakeConn{dialer: d}
+	d.mutex.Lock()
+	d.conns = append(d.conns, conn)
+	d.mutex.Unlock()
+	return conn, nil
+}
+
+type fakeConn struct {
+	dialer *fakeDialer
+	sent   atomic.Int32
+	closed atomic.Bool
+	fail   atomic.Bool
+}
+
+func (c *fakeConn) Send(_ string, _ []string, msg io.WriterTo) error {
+	c.dialer.mutex.Lock()
+	c.dialer.active++
+	c.dialer.peak = max(c.dialer.peak, c.dialer.active)
+	c.dialer.mutex.Unlock()
+	defer func() {
+		c.dialer.mutex.Lock()
+		c.dialer.active--
+		c.dialer.mutex.Unlock()
+	}()
+	if c.dialer.block != nil {
+		<-c.dialer.block
+	}
+	if c.closed.Load() || c.fail.Load() {
+		return errors.New("connection closed")
+	}
+	c.sent.Add(1)
+	_, err := msg.WriteTo(io.Discard)
+	return err
+}
+
+func (c *fakeConn) Close() error {
+	c.closed.Store(true)
+	return nil
+}
+
+func newTestMessage() *gomail.Message {
+	m := gomail.NewMessage()
+	m.SetHeader("From", "sender@example.com")
+	m.SetHeader("Bcc", "recipient@example.com")
+	m.SetBody("text/html", "body")
+	return m
+}
+
+func TestSMTPPool_ReusesConnection(t *testing.T) {
+	dialer := &fakeDialer{}
+	pool := newSMTPPool(dialer, 2, 100, time.Minute)
+
+	for range 5 {
+		if err := pool.Send(context.Background(), newTestMessage()); err != nil {
+			t.Fatalf("Send() error = %v", err)
+		}
+	}
+
+	if dials := dialer.dials.Load(); dials != 1 {
+		t.Errorf("Expected 1 dial, got %d", dials)
+	}
+	if sent := dialer.conns[0].sent.Load(); sent != 5 {
+		t.Errorf("Expected 5 emails on the connection, got %d", sent)
+	}
+}
+
+func TestSMTPPool_MaxMessagesPerConnection(t *testing.T) {
+	dialer := &fakeDialer{}
+	pool := newSMTPPool(dialer, 1, 2, time.Minute)
+
+	for range 5 {
+		if err := pool.Send(context.Background(), newTestMessage()); err != nil {
+			t.Fatalf("Send() error = %v", err)
+		}
+	}
+
+	if dials := dialer.dials.Load(); dials != 3 {
+		t.Errorf("Expected 3 dials, got %d", dials)
+	}
+	for i, conn := range dialer.conns[:2] {
+		if !conn.closed.Load() {
+			t.Errorf("Expected connection %d to be closed", i)
+		}
+	}
+}
+
+func TestSMTPPool_IdleTimeout(t *testing.T) {
+	dialer := &fakeDialer{}
+	pool := newSMTPPool(dialer, 1, 100, time.Minute)
+	now := time.Now()
+	pool.now = func() time.Time { return now }
+
+	if err := pool.Send(context.Background(), newTestMessage()); err != nil {
+		t.Fatalf("Send() error = %v", err)
+	}
+	now = now.Add(2 * time.Minute)
+	if err := pool.Send(context.Background(), newTestMessage()); err != nil {
+		t.Fatalf("Send() error = %v", err)
+	}
+
+	if dials := dialer.dials.Load(); dials != 2 {
+		t.Errorf("Expected 2 dials, got %d", dials)
+	}
+	if !dialer.conns[0].closed.Load() {
+		t.Error("Expected the idle connection to be closed")
+	}
+}
+
+func TestSMTPPool_RetriesBrokenConnection(t *testing.T) {
+	dialer := &fakeDialer{}
+	pool := newSMTPPool(dialer, 1, 100, time.Minute)
+
+	if err := pool.Send(context.Background(), newTestMessage()); err != nil {
+		t.Fatalf("Send() error = %v", err)
+	}
+	dialer.conns[0].fail.Store(true)
+	if err := pool.Send(context.Background(), newTestMessage()); err != nil {
+		t.Fatalf("Send() error = %v", err)
+	}
+
+	if dials := dialer.dials.Load(); dials != 2 {
+		t.Errorf("Expected 2 dials, got %d", dials)
+	}
+	if sent := dialer.conns[1].sent.Load(); sent != 1 {
+		t.Errorf("Expected the email on the new connection, got %d", sent)
+	}
+}
+
+func TestSMTPPool_LimitsConcurrency(t *testing.T) {
+	dialer := &fakeDialer{block: make(chan struct{})}
+	pool := newSMTPPool(dialer, 2, 100, time.Minute)
+
+	var wg sync.WaitGroup
+	for range 6 {
+		wg.Go(func() {
+			if err := pool.Send(context.Background(), newTestMessage()); err != nil {
+				t.Errorf("Send() error = %v", err)
+			}
+		})
+	}
+	for active, _ := dialer.sends(); active < 2; active, _ = dialer.sends() {
+		time.Sleep(time.Millisecond)
+	}
+	close(dialer.block)
+	wg.Wait()
+
+	if _, peak := dialer.sends(); peak != 2 {
+		t.Errorf("Expected 2 concurrent sends, got %d", peak)
+	}
+	if dials := dialer.dials.Load(); dials != 2 {
+		t.Errorf("Expected 2 dials, got %d", dials)
+	}
+}
+
+func TestSMTPPool_ContextDone(t *testing.T) {
+	dialer := &fakeDialer{block: make(chan struct{})}
+	defer close(dialer.block)
+	pool := newSMTPPool(dialer, 1, 100, time.Minute)
+
+	ctx, cancel := context.WithTimeout(context.Background(), 20*time.Millisecond)
+	defer cancel()
+
+	// The first email holds the only connection until it times out.
+	if err := pool.Send(ctx, newTestMessage()); !errors.Is(err, context.DeadlineExceeded) {
+		t.Errorf("Expected deadline exceeded, got %v", err)
+	}
+	// The second email times out waiting for the connection.
+	if err := pool.Send(ctx, newTestMessage()); !errors.Is(err, context.DeadlineExceeded) {
+		t.Errorf("Expected deadline exceeded, got %v", err)
+	}
+}
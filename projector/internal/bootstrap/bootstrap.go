@@ -54,6 +54,7 @@ import (
 	"github.com/telekom/controlplane/projector/internal/domain/zone"
 	"github.com/telekom/controlplane/projector/internal/infrastructure"
 	"github.com/telekom/controlplane/projector/internal/module"
+	projectorruntime "github.com/telekom/controlplane/projector/internal/runtime"
 )
 
 var (
@@ -116,6 +117,9 @@ func Run() error {
 		"maxConcurrentReconciles", cfg.MaxConcurrentReconciles,
 		"periodicResync", cfg.PeriodicResync,
 		"leaderElection", cfg.LeaderElection,
+		"bootstrapEnabled", cfg.BootstrapEnabled,
+		"edgeCacheWarm", cfg.EdgeCacheWarm,
+		"schedulerEnabled", cfg.SchedulerEnabled,
 	)
 
 	// --- Database ---
@@ -156,6 +160,7 @@ func Run() error {
 	idResolver := infrastructure.NewIDResolver(entClient, edgeCache,
 		infrastructure.WithNegativeCacheTTL(cfg.IDResolverNegTTL),
 		infrastructure.WithSingleflight(cfg.IDResolverSingleflight),
+		infrastructure.WithCompleteMode(cfg.EdgeCacheWarm && cfg.IDResolverComplete),
 	)
 
 	deps := module.ModuleDeps{
@@ -165,6 +170,20 @@ func Run() error {
 		IDResolver:  idResolver,
 		Config:      cfg,
 	}
+	if cfg.BootstrapEnabled || cfg.EdgeCacheWarm {
+		deps.BootstrapGate = infrastructure.NewBootstrapGate()
+	}
+	if cfg.FingerprintCacheMaxEntries > 0 {
+		fingerprints, err := infrastructure.NewFingerprintCache(cfg.FingerprintCacheMaxEntries, cfg.FingerprintCacheTTL)
+		if err != nil {
+			return fmt.Errorf("creating fingerprint cache: %w", err)
+		}
+		defer fingerprints.Close()
+		deps.Fingerprints = fingerprints
+	}
+	if cfg.SchedulerEnabled {
+		deps.Scheduler = projectorruntime.NewScheduler(cfg.MaxOpenConns, tierIndex(modules), cfg.SchedulerAging)
+	}
 
 	// --- Controller Manager ---
 	mgr, err := ctrl.NewManager(ctrl.GetConfigOrDie(), ctrl.Options{
@@ -196,6 +215,18 @@ func Run() error {
 		setupLog.Info("module registered", "module", m.Name())
 	}
 
+	// --- Bootstrap Load and EdgeCache Warm-up ---
+	if deps.BootstrapGate != nil {
+		if err = mgr.Add(&loader{
+			cache:   mgr.GetCache(),
+			scheme:  mgr.GetScheme(),
+			modules: modules,
+			deps:    deps,
+		}); err != nil {
+			return fmt.Errorf("adding bootstrap loader: %w", err)
+		}
+	}
+
 	// --- Start ---
 	setupLog.Info("starting manager", "modules", len(modules))
 	return mgr.Start(ctrl.SetupSignalHandler())
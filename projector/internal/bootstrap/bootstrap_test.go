@@ -9,9 +9,12 @@ import (
 
 	. "github.com/onsi/ginkgo/v2"
 	. "github.com/onsi/gomega"
+	corev1 "k8s.io/api/core/v1"
 	"k8s.io/apimachinery/pkg/runtime"
 
 	cconfig "github.com/telekom/controlplane/common/pkg/config"
+	"github.com/telekom/controlplane/projector/internal/domain/application"
+	"github.com/telekom/controlplane/projector/internal/domain/approval"
 	"github.com/telekom/controlplane/projector/internal/domain/eventtype"
 	"github.com/telekom/controlplane/projector/internal/domain/group"
 	"github.com/telekom/controlplane/projector/internal/domain/permissionset"
@@ -102,3 +105,42 @@ var _ = Describe("registerSchemesAndModules", func() {
 		Entry("both enabled", true, true),
 	)
 })
+
+var _ = Describe("tiersOf", func() {
+	tierNames := func(tiers [][]module.Module) [][]string {
+		names := make([][]string, len(tiers))
+		for i, tier := range tiers {
+			names[i] = moduleNames(tier)
+		}
+		return names
+	}
+
+	It("should order the modules by their dependencies", func() {
+		mods := []module.Module{approval.Module, application.Module, team.Module, zone.Module, group.Module}
+
+		Expect(tierNames(tiersOf(mods))).To(Equal([][]string{
+			{"zone", "group"},
+			{"team"},
+			{"application"},
+			{"approval"},
+		}))
+	})
+
+	It("should load unknown modules last", func() {
+		unknown := &module.TypedModule[*corev1.ConfigMap, any, string]{ModuleName: "unknown"}
+		mods := []module.Module{unknown, team.Module}
+
+		Expect(tierNames(tiersOf(mods))).To(Equal([][]string{
+			{"team"},
+			{"unknown"},
+		}))
+	})
+
+	It("should place every registered module in a tier", func() {
+		var placed []string
+		for _, tier := range tiersOf(modules) {
+			placed = append(placed, moduleNames(tier)...)
+		}
+		Expect(placed).To(ConsistOf(moduleNames(modules)))
+	})
+})
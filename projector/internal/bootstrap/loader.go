@@ -0,0 +1,158 @@
+// Copyright 2026 Deutsche Telekom IT GmbH
+//
+// SPDX-License-Identifier: Apache-2.0
+
+package bootstrap
+
+import (
+	"context"
+	"fmt"
+	"strconv"
+	"time"
+
+	"entgo.io/ent/privacy"
+	"golang.org/x/sync/errgroup"
+	"k8s.io/apimachinery/pkg/runtime"
+	"sigs.k8s.io/controller-runtime/pkg/cache"
+	"sigs.k8s.io/controller-runtime/pkg/manager"
+
+	"github.com/telekom/controlplane/projector/internal/metrics"
+	"github.com/telekom/controlplane/projector/internal/module"
+)
+
+// loadOrder lists the module names by dependency tier. Modules of a tier
+// only depend on modules of earlier tiers and are loaded concurrently.
+var loadOrder = [][]string{
+	{"zone", "group"},
+	{"team"},
+	{"application"},
+	{"api", "eventtype", "permissionset"},
+	{"apiexposure", "eventexposure"},
+	{"apisubscription", "eventsubscription"},
+	{"approval", "approvalrequest"},
+}
+
+// tiersOf groups the given modules by loadOrder. Modules that are not part of
+// loadOrder are loaded in a final tier.
+func tiersOf(mods []module.Module) [][]module.Module {
+	byName := make(map[string]module.Module, len(mods))
+	for _, m := range mods {
+		byName[m.Name()] = m
+	}
+
+	var tiers [][]module.Module
+	for _, names := range loadOrder {
+		var tier []module.Module
+		for _, name := range names {
+			if m, ok := byName[name]; ok {
+				tier = append(tier, m)
+				delete(byName, name)
+			}
+		}
+		if len(tier) > 0 {
+			tiers = append(tiers, tier)
+		}
+	}
+
+	var rest []module.Module
+	for _, m := range mods {
+		if _, ok := byName[m.Name()]; ok {
+			rest = append(rest, m)
+		}
+	}
+	if len(rest) > 0 {
+		tiers = append(tiers, rest)
+	}
+	return tiers
+}
+
+// tierIndex maps the names of the given modules to their tier in tiersOf.
+func tierIndex(mods []module.Module) map[string]int {
+	index := make(map[string]int, len(mods))
+	for i, tier := range tiersOf(mods) {
+		for _, m := range tier {
+			index[m.Name()] = i
+		}
+	}
+	return index
+}
+
+// loader is a manager.Runnable that warms the EdgeCache from the database
+// and loads all CRs tier by tier from the informer cache once it is synced.
+// Afterwards it opens the bootstrap gate so that the regular reconciles
+// start. If a step fails, the gate is opened anyway and the remaining
+// objects are synced by the reconciles.
+type loader struct {
+	cache   cache.Cache
+	scheme  *runtime.Scheme
+	modules []module.Module
+	deps    module.ModuleDeps
+}
+
+var _ manager.LeaderElectionRunnable = &loader{}
+
+// NeedLeaderElection returns true, as only the leader writes to the database.
+func (l *loader) NeedLeaderElection() bool {
+	return true
+}
+
+// Start runs the bootstrap load. It never returns an error, so that a failed
+// load does not stop the manager.
+func (l *loader) Start(ctx context.Context) error {
+	defer l.deps.BootstrapGate.Open()
+
+	if l.deps.Config.EdgeCacheWarm {
+		start := time.Now()
+		if err := l.deps.IDResolver.Warm(privacy.DecisionContext(ctx, privacy.Allow)); err != nil {
+			setupLog.Error(err, "edge cache warm-up failed, continuing with lazy lookups")
+		} else {
+			setupLog.Info("edge cache warmed", "duration", time.Since(start).String())
+		}
+	}
+	if !l.deps.Config.BootstrapEnabled {
+		return nil
+	}
+
+	if !l.cache.WaitForCacheSync(ctx) {
+		setupLog.Info("bootstrap load skipped, informer cache not synced")
+		return nil
+	}
+
+	start := time.Now()
+	if err := l.load(ctx); err != nil {
+		setupLog.Error(err, "bootstrap load failed, continuing with regular reconciles")
+		return nil
+	}
+	setupLog.Info("bootstrap load completed", "duration", time.Since(start).String())
+	return nil
+}
+
+func (l *loader) load(ctx context.Context) error {
+	for i, tier := range tiersOf(l.modules) {
+		start := time.Now()
+
+		names := make([]string, 0, len(tier))
+		g, gctx := errgroup.WithContext(ctx)
+		for _, m := range tier {
+			names = append(names, m.Name())
+			g.Go(func() error {
+				if err := m.Preload(gctx, l.cache, l.scheme, l.deps); err != nil {
+					return fmt.Errorf("preload %s: %w", m.Name(), err)
+				}
+				return nil
+			})
+		}
+		if err := g.Wait(); err != nil {
+			return err
+		}
+		// The EdgeCache applies writes asynchronously. Wait for them, so
+		// that the next tier resolves its dependencies from the cache.
+		l.deps.EdgeCache.Wait()
+
+		duration := time.Since(start)
+		metrics.BootstrapTierDuration.WithLabelValues(strconv.Itoa(i)).Set(duration.Seconds())
+		setupLog.Info("bootstrap tier loaded", "tier", i,
+			"modules", names, "duration", duration.String())
+	}
+	return nil
+}
@@ -48,6 +48,27 @@ type Config struct {
 	// Env: RECONCILE_TIMEOUT
 	ReconcileTimeout time.Duration `mapstructure:"reconcile_timeout" validate:"gte=0"`
 
+	// SchedulerEnabled admits the reconciles of all modules by a shared
+	// scheduler, which allows MaxOpenConns of them at once and prefers lower
+	// dependency tiers. MaxConcurrentReconciles and its per-module overrides
+	// are ignored while enabled.
+	// Env: SCHEDULER_ENABLED
+	SchedulerEnabled bool `mapstructure:"scheduler_enabled"`
+
+	// SchedulerAdmissionTimeout is the maximum time a reconcile waits for
+	// admission by the shared scheduler. A reconcile that is not admitted in
+	// time is requeued without an error, which leaves the rest of
+	// ReconcileTimeout to its database work. Set to 0 to wait until
+	// ReconcileTimeout ends.
+	// Env: SCHEDULER_ADMISSION_TIMEOUT
+	SchedulerAdmissionTimeout time.Duration `mapstructure:"scheduler_admission_timeout" validate:"gte=0"`
+
+	// SchedulerAging is the wait after which the shared scheduler prefers a
+	// reconcile like one of the next lower dependency tier, so that higher
+	// tiers are not starved. Set to 0 to admit strictly by tier.
+	// Env: SCHEDULER_AGING
+	SchedulerAging time.Duration `mapstructure:"scheduler_aging" validate:"gte=0"`
+
 	// --- Resync ---
 
 	// PeriodicResync is the interval at which successful reconciles are
@@ -56,6 +77,18 @@ type Config struct {
 	// Env: PERIODIC_RESYNC
 	PeriodicResync time.Duration `mapstructure:"periodic_resync" validate:"gte=0"`
 
+	// FingerprintCacheMaxEntries is the maximum number of fingerprints of
+	// written DTOs that are kept to skip unchanged writes, e.g. on a periodic
+	// resync. Set to 0 to disable.
+	// Env: FINGERPRINT_CACHE_MAX_ENTRIES
+	FingerprintCacheMaxEntries int64 `mapstructure:"fingerprint_cache_max_entries" validate:"gte=0"`
+
+	// FingerprintCacheTTL is the time after which an unchanged DTO is
+	// written again, which repairs rows that were changed outside of the
+	// projector.
+	// Env: FINGERPRINT_CACHE_TTL
+	FingerprintCacheTTL time.Duration `mapstructure:"fingerprint_cache_ttl" validate:"gt=0"`
+
 	// --- Error Policy ---
 
 	// DependencyDelay is the base requeue delay when a dependency is missing.
@@ -72,6 +105,30 @@ type Config struct {
 	// Env: SKIP_REQUEUE
 	SkipRequeue time.Duration `mapstructure:"skip_requeue" validate:"required,gt=0"`
 
+	// --- Upsert Batching ---
+
+	// UpsertBatchWindow is the maximum time an upsert waits for concurrent
+	// upserts of the same entity type, so that they are written with a single
+	// bulk statement. Only repositories that support batching are affected.
+	// Set to 0 to disable batching.
+	// Env: UPSERT_BATCH_WINDOW
+	UpsertBatchWindow time.Duration `mapstructure:"upsert_batch_window" validate:"gte=0"`
+
+	// UpsertBatchSize is the maximum number of upserts written in one batch.
+	// The effective batch size is also bounded by the number of concurrent
+	// reconciles of the module.
+	// Env: UPSERT_BATCH_SIZE
+	UpsertBatchSize int `mapstructure:"upsert_batch_size" validate:"required,gt=0"`
+
+	// --- Bootstrap ---
+
+	// BootstrapEnabled loads all CRs in dependency order (zone → group →
+	// team → application → ...) before the regular reconciles start. This
+	// avoids the dependency-missing requeues of a simultaneous start of all
+	// modules, e.g. on a fresh database.
+	// Env: BOOTSTRAP_ENABLED
+	BootstrapEnabled bool `mapstructure:"bootstrap_enabled"`
+
 	// --- Rate Limiter ---
 
 	// RateLimiterBaseDelay is the initial delay for the exponential backoff
@@ -106,6 +163,12 @@ type Config struct {
 	// Env: EDGE_CACHE_BUFFER_ITEMS
 	EdgeCacheBufferItems int64 `mapstructure:"edge_cache_buffer_items" validate:"required,gt=0"`
 
+	// EdgeCacheWarm loads all Zones, Groups, Teams, and Applications into the
+	// EdgeCache before the reconciles start. Their entries are exempt from
+	// Ristretto's admission policy and eviction.
+	// Env: EDGE_CACHE_WARM
+	EdgeCacheWarm bool `mapstructure:"edge_cache_warm"`
+
 	// --- IDResolver ---
 
 	// IDResolverNegTTL is the TTL for negative cache entries (entity not
@@ -118,6 +181,12 @@ type Config struct {
 	// Env: IDR_SINGLEFLIGHT_ENABLED
 	IDResolverSingleflight bool `mapstructure:"idr_singleflight_enabled"`
 
+	// IDResolverComplete answers lookups of entities that are not in the
+	// warmed EdgeCache as not found without a DB query. Requires
+	// EdgeCacheWarm. Only enable if the projector is the only writer.
+	// Env: IDR_COMPLETE_ENABLED
+	IDResolverComplete bool `mapstructure:"idr_complete_enabled"`
+
 	// --- Manager ---
 
 	// MetricsBindAddress is the address to bind the metrics endpoint.
@@ -188,15 +257,27 @@ func setDefaults(v *viper.Viper) {
 	// Concurrency
 	v.SetDefault("max_concurrent_reconciles", 10)
 	v.SetDefault("reconcile_timeout", "7s")
+	v.SetDefault("scheduler_enabled", false)
+	v.SetDefault("scheduler_admission_timeout", "3s")
+	v.SetDefault("scheduler_aging", "250ms")
 
 	// Resync
 	v.SetDefault("periodic_resync", "0s")
+	v.SetDefault("fingerprint_cache_max_entries", int64(100_000))
+	v.SetDefault("fingerprint_cache_ttl", "1h")
 
 	// Error Policy
 	v.SetDefault("dependency_delay", "2s")
 	v.SetDefault("dependency_delay_jitter", "3s")
 	v.SetDefault("skip_requeue", "5m")
 
+	// Upsert Batching
+	v.SetDefault("upsert_batch_window", "10ms")
+	v.SetDefault("upsert_batch_size", 100)
+
+	// Bootstrap
+	v.SetDefault("bootstrap_enabled", true)
+
 	// Rate Limiter
 	v.SetDefault("rate_limiter_base_delay", "5ms")
 	v.SetDefault("rate_limiter_max_delay", "1000s")
@@ -207,10 +288,12 @@ func setDefaults(v *viper.Viper) {
 	v.SetDefault("edge_cache_num_counters", int64(1_000_000))
 	v.SetDefault("edge_cache_max_cost", int64(104_857_600))
 	v.SetDefault("edge_cache_buffer_items", int64(64))
+	v.SetDefault("edge_cache_warm", true)
 
 	// IDResolver
 	v.SetDefault("idr_neg_ttl", "5s")
 	v.SetDefault("idr_singleflight_enabled", true)
+	v.SetDefault("idr_complete_enabled", false)
 
 	// Manager
 	v.SetDefault("metrics_bind_address", ":8090")
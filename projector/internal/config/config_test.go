@@ -32,15 +32,27 @@ var _ = Describe("Load", func() {
 		// Concurrency
 		Expect(cfg.MaxConcurrentReconciles).To(Equal(10))
 		Expect(cfg.ReconcileTimeout).To(Equal(7 * time.Second))
+		Expect(cfg.SchedulerEnabled).To(BeFalse())
+		Expect(cfg.SchedulerAdmissionTimeout).To(Equal(3 * time.Second))
+		Expect(cfg.SchedulerAging).To(Equal(250 * time.Millisecond))
 
 		// Resync
 		Expect(cfg.PeriodicResync).To(Equal(time.Duration(0)))
+		Expect(cfg.FingerprintCacheMaxEntries).To(Equal(int64(100_000)))
+		Expect(cfg.FingerprintCacheTTL).To(Equal(time.Hour))
 
 		// Error Policy
 		Expect(cfg.DependencyDelay).To(Equal(2 * time.Second))
 		Expect(cfg.DependencyDelayJitter).To(Equal(3 * time.Second))
 		Expect(cfg.SkipRequeue).To(Equal(5 * time.Minute))
 
+		// Upsert Batching
+		Expect(cfg.UpsertBatchWindow).To(Equal(10 * time.Millisecond))
+		Expect(cfg.UpsertBatchSize).To(Equal(100))
+
+		// Bootstrap
+		Expect(cfg.BootstrapEnabled).To(BeTrue())
+
 		// Rate Limiter
 		Expect(cfg.RateLimiterBaseDelay).To(Equal(5 * time.Millisecond))
 		Expect(cfg.RateLimiterMaxDelay).To(Equal(1000 * time.Second))
@@ -51,10 +63,12 @@ var _ = Describe("Load", func() {
 		Expect(cfg.EdgeCacheNumCounters).To(Equal(int64(1_000_000)))
 		Expect(cfg.EdgeCacheMaxCost).To(Equal(int64(104_857_600)))
 		Expect(cfg.EdgeCacheBufferItems).To(Equal(int64(64)))
+		Expect(cfg.EdgeCacheWarm).To(BeTrue())
 
 		// IDResolver
 		Expect(cfg.IDResolverNegTTL).To(Equal(5 * time.Second))
 		Expect(cfg.IDResolverSingleflight).To(BeTrue())
+		Expect(cfg.IDResolverComplete).To(BeFalse())
 
 		// Manager
 		Expect(cfg.MetricsBindAddress).To(Equal(":8090"))
@@ -203,6 +217,14 @@ var _ = Describe("Load", func() {
 		Expect(err).NotTo(HaveOccurred())
 		Expect(cfg.DependencyDelayJitter).To(Equal(time.Duration(0)))
 	})
+
+	It("accepts UpsertBatchWindow of zero (batching disabled)", func() {
+		GinkgoT().Setenv("UPSERT_BATCH_WINDOW", "0s")
+
+		cfg, err := Load()
+		Expect(err).NotTo(HaveOccurred())
+		Expect(cfg.UpsertBatchWindow).To(Equal(time.Duration(0)))
+	})
 })
 
 var _ = Describe("ConcurrencyFor", func() {
@@ -23,7 +23,7 @@ import (
 const entityType = "api"
 
 // Repository performs typed persistence operations for Api catalogue entities.
-// It implements runtime.Repository[ApiKey, *ApiData].
+// It implements runtime.BatchRepository[ApiKey, *ApiData].
 //
 // Api has a required FK dependency on Team. If the owner Team is missing,
 // Upsert returns ErrDependencyMissing.
@@ -34,7 +34,7 @@ type Repository struct {
 }
 
 // compile-time interface check.
-var _ runtime.Repository[ApiKey, *ApiData] = (*Repository)(nil)
+var _ runtime.BatchRepository[ApiKey, *ApiData] = (*Repository)(nil)
 
 // NewRepository creates an Api repository wired with the given ent client,
 // edge cache, and dependency resolver.
@@ -55,34 +55,12 @@ func (r *Repository) Upsert(ctx context.Context, data *ApiData) error {
 		metrics.DBOperationDuration.WithLabelValues(entityType, metrics.OperationUpsert).Observe(time.Since(start).Seconds())
 	}()
 
-	teamID, err := r.deps.FindTeamID(ctx, data.TeamName)
+	teamID, err := r.resolveTeam(ctx, data)
 	if err != nil {
-		if errors.Is(err, infrastructure.ErrEntityNotFound) {
-			return runtime.WrapDependencyMissing("team", data.TeamName)
-		}
-		return fmt.Errorf("find team %q: %w", data.TeamName, err)
-	}
-
-	create := r.client.Api.Create().
-		SetBasePath(data.BasePath).
-		SetVersion(data.Version).
-		SetActive(data.Active).
-		SetStatusPhase(entapi.StatusPhase(data.StatusPhase)).
-		SetStatusMessage(data.StatusMessage).
-		SetNamespace(data.Meta.Namespace).
-		SetXVendor(data.XVendor).
-		SetOauth2Scopes(data.Oauth2Scopes).
-		SetOwnerID(teamID)
-
-	if data.Category != "" {
-		create.SetCategory(data.Category)
-	}
-
-	if data.Specification != "" {
-		create.SetSpecification(data.Specification)
+		return err
 	}
 
-	apiID, upsertErr := create.
+	apiID, upsertErr := newCreate(r.client.Api, data, teamID).
 		OnConflictColumns(entapi.FieldBasePath, entapi.OwnerColumn).
 		UpdateNewValues().
 		ID(ctx)
@@ -91,6 +69,146 @@ func (r *Repository) Upsert(ctx context.Context, data *ApiData) error {
 			data.BasePath, data.TeamName, upsertErr)
 	}
 
+	r.cacheWritten(data, apiID)
+	return nil
+}
+
+// UpsertBatch upserts many Api catalogue entities with one bulk statement
+// per shape (see apiShape) inside a single transaction. The owner Team is
+// resolved per item, so a missing Team only fails the affected items with
+// ErrDependencyMissing. Items with the same key are written once with the
+// data of the last item. If the transaction fails, every item is retried
+// with Upsert, so that errors are reported per item.
+func (r *Repository) UpsertBatch(ctx context.Context, items []*ApiData) []error {
+	start := time.Now()
+	defer func() {
+		metrics.DBOperationDuration.WithLabelValues(entityType, metrics.OperationUpsertBatch).Observe(time.Since(start).Seconds())
+		metrics.DBBatchSize.WithLabelValues(entityType).Observe(float64(len(items)))
+	}()
+
+	errs := make([]error, len(items))
+
+	// latest maps each key to the index of the last item with that key.
+	latest := make(map[ApiKey]int, len(items))
+	for i, data := range items {
+		latest[keyOf(data)] = i
+	}
+
+	shapes := make(map[apiShape][]resolvedApi)
+	written := make(map[ApiKey]*ApiData, len(latest))
+	for i, data := range items {
+		if latest[keyOf(data)] != i {
+			continue
+		}
+		teamID, err := r.resolveTeam(ctx, data)
+		if err != nil {
+			errs[i] = err
+			continue
+		}
+		shape := shapeOf(data)
+		shapes[shape] = append(shapes[shape], resolvedApi{data: data, teamID: teamID})
+		written[keyOf(data)] = data
+	}
+
+	if len(written) > 0 {
+		if err := r.upsertBulk(ctx, shapes, written); err != nil {
+			for key := range written {
+				i := latest[key]
+				errs[i] = r.Upsert(ctx, items[i])
+			}
+		}
+	}
+
+	// Fan the result of each written item back to the items it replaced.
+	for i, data := range items {
+		errs[i] = errs[latest[keyOf(data)]]
+	}
+	return errs
+}
+
+// resolvedApi is an Api whose owner Team FK has been resolved.
+type resolvedApi struct {
+	data   *ApiData
+	teamID int
+}
+
+// upsertBulk writes the Apis with one bulk statement per shape in a single
+// transaction and caches the IDs of the written Apis.
+func (r *Repository) upsertBulk(ctx context.Context, shapes map[apiShape][]resolvedApi, written map[ApiKey]*ApiData) error {
+	var apis []*ent.Api
+	err := r.withTx(ctx, func(tx *ent.Tx) error {
+		var basePaths, teamNames []string
+		for _, resolved := range shapes {
+			creates := make([]*ent.APICreate, len(resolved))
+			for i, api := range resolved {
+				creates[i] = newCreate(tx.Api, api.data, api.teamID)
+				basePaths = append(basePaths, api.data.BasePath)
+				teamNames = append(teamNames, api.data.TeamName)
+			}
+			if err := tx.Api.CreateBulk(creates...).
+				OnConflictColumns(entapi.FieldBasePath, entapi.OwnerColumn).
+				UpdateNewValues().
+				Exec(ctx); err != nil {
+				return fmt.Errorf("bulk upsert of %d apis: %w", len(creates), err)
+			}
+		}
+
+		// Bulk upserts do not return the IDs of updated rows, so they are queried.
+		var err error
+		apis, err = tx.Api.Query().
+			Where(
+				entapi.BasePathIn(basePaths...),
+				entapi.HasOwnerWith(team.NameIn(teamNames...)),
+			).
+			WithOwner(func(q *ent.TeamQuery) { q.Select(team.FieldName) }).
+			All(ctx)
+		if err != nil {
+			return fmt.Errorf("query upserted apis: %w", err)
+		}
+		return nil
+	})
+	if err != nil {
+		return err
+	}
+
+	for _, api := range apis {
+		// The query may return Apis of other combinations of base path and team.
+		if data, ok := written[ApiKey{BasePath: api.BasePath, TeamName: api.Edges.Owner.Name}]; ok {
+			r.cacheWritten(data, api.ID)
+		}
+	}
+	return nil
+}
+
+// withTx runs fn inside a database transaction, handling commit/rollback.
+func (r *Repository) withTx(ctx context.Context, fn func(tx *ent.Tx) error) error {
+	tx, err := r.client.Tx(ctx)
+	if err != nil {
+		return fmt.Errorf("starting transaction: %w", err)
+	}
+	if err := fn(tx); err != nil {
+		if rbErr := tx.Rollback(); rbErr != nil {
+			return fmt.Errorf("rollback failed: %w (original: %w)", rbErr, err)
+		}
+		return err
+	}
+	return tx.Commit()
+}
+
+// resolveTeam resolves the required owner Team FK of an Api.
+func (r *Repository) resolveTeam(ctx context.Context, data *ApiData) (int, error) {
+	teamID, err := r.deps.FindTeamID(ctx, data.TeamName)
+	if err != nil {
+		if errors.Is(err, infrastructure.ErrEntityNotFound) {
+			return 0, runtime.WrapDependencyMissing("team", data.TeamName)
+		}
+		return 0, fmt.Errorf("find team %q: %w", data.TeamName, err)
+	}
+	return teamID, nil
+}
+
+// cacheWritten caches the ID of a written Api.
+func (r *Repository) cacheWritten(data *ApiData, apiID int) {
 	et, lk := cachekeys.Api(data.BasePath, data.TeamName)
 	r.cache.Set(et, lk, apiID)
 
@@ -106,7 +224,49 @@ func (r *Repository) Upsert(ctx context.Context, data *ApiData) error {
 		aet, alk := cachekeys.ActiveApi(data.BasePath)
 		r.cache.Del(aet, alk)
 	}
-	return nil
+}
+
+func keyOf(data *ApiData) ApiKey {
+	return ApiKey{BasePath: data.BasePath, TeamName: data.TeamName}
+}
+
+// newCreate builds the create statement for an Api with a resolved owner.
+func newCreate(client *ent.APIClient, data *ApiData, teamID int) *ent.APICreate {
+	create := client.Create().
+		SetBasePath(data.BasePath).
+		SetVersion(data.Version).
+		SetActive(data.Active).
+		SetStatusPhase(entapi.StatusPhase(data.StatusPhase)).
+		SetStatusMessage(data.StatusMessage).
+		SetNamespace(data.Meta.Namespace).
+		SetXVendor(data.XVendor).
+		SetOauth2Scopes(data.Oauth2Scopes).
+		SetOwnerID(teamID)
+
+	if data.Category != "" {
+		create.SetCategory(data.Category)
+	}
+
+	if data.Specification != "" {
+		create.SetSpecification(data.Specification)
+	}
+	return create
+}
+
+// apiShape records which optional fields of an Api are set. The conflict
+// clause updates exactly the inserted columns, so only Apis of the same
+// shape can be written together without overwriting the unset fields of
+// the others.
+type apiShape struct {
+	category      bool
+	specification bool
+}
+
+func shapeOf(data *ApiData) apiShape {
+	return apiShape{
+		category:      data.Category != "",
+		specification: data.Specification != "",
+	}
 }
 
 // Delete removes an Api catalogue entity from the database by base path and
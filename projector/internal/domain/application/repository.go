@@ -25,7 +25,7 @@ import (
 const entityType = "application"
 
 // Repository performs typed persistence operations for Application entities.
-// It implements runtime.Repository[ApplicationKey, *ApplicationData].
+// It implements runtime.BatchRepository[ApplicationKey, *ApplicationData].
 //
 // Application has required FK dependencies on both Team and Zone. If either
 // dependency is missing, Upsert returns ErrDependencyMissing. Delete cascades
@@ -37,7 +37,7 @@ type Repository struct {
 }
 
 // compile-time interface check.
-var _ runtime.Repository[ApplicationKey, *ApplicationData] = (*Repository)(nil)
+var _ runtime.BatchRepository[ApplicationKey, *ApplicationData] = (*Repository)(nil)
 
 // NewRepository creates an Application repository wired with the given
 // ent client, edge cache, and dependency resolver.
@@ -62,23 +62,167 @@ func (r *Repository) Upsert(ctx context.Context, data *ApplicationData) error {
 		metrics.DBOperationDuration.WithLabelValues(entityType, metrics.OperationUpsert).Observe(time.Since(start).Seconds())
 	}()
 
-	teamID, err := r.deps.FindTeamID(ctx, data.TeamName)
+	teamID, zoneID, err := r.resolveDeps(ctx, data)
+	if err != nil {
+		return err
+	}
+
+	appID, upsertErr := newCreate(r.client.Application, data, teamID, zoneID).
+		OnConflictColumns(application.FieldName, application.OwnerTeamColumn).
+		Update(shapeOf(data).update).
+		ID(ctx)
+	if upsertErr != nil {
+		return fmt.Errorf("upsert application %q (team %q): %w", data.Name, data.TeamName, upsertErr)
+	}
+
+	et, lk := cachekeys.Application(data.Name, data.TeamName)
+	r.cache.Set(et, lk, appID)
+	return nil
+}
+
+// UpsertBatch upserts many Application entities with one bulk statement per
+// shape (see applicationShape) inside a single transaction. FKs are resolved
+// per item, so a missing Team or Zone only fails the affected items with
+// ErrDependencyMissing. Items with the same (name, team) are written once
+// with the data of the last item. If the transaction fails, every item is
+// retried with Upsert, so that errors are reported per item.
+func (r *Repository) UpsertBatch(ctx context.Context, items []*ApplicationData) []error {
+	start := time.Now()
+	defer func() {
+		metrics.DBOperationDuration.WithLabelValues(entityType, metrics.OperationUpsertBatch).Observe(time.Since(start).Seconds())
+		metrics.DBBatchSize.WithLabelValues(entityType).Observe(float64(len(items)))
+	}()
+
+	errs := make([]error, len(items))
+
+	// latest maps each key to the index of the last item with that key.
+	latest := make(map[ApplicationKey]int, len(items))
+	for i, data := range items {
+		latest[ApplicationKey{Name: data.Name, TeamName: data.TeamName}] = i
+	}
+
+	shapes := make(map[applicationShape][]resolvedApplication)
+	written := make([]int, 0, len(latest))
+	for i, data := range items {
+		if latest[ApplicationKey{Name: data.Name, TeamName: data.TeamName}] != i {
+			continue
+		}
+		teamID, zoneID, err := r.resolveDeps(ctx, data)
+		if err != nil {
+			errs[i] = err
+			continue
+		}
+		shape := shapeOf(data)
+		shapes[shape] = append(shapes[shape], resolvedApplication{data: data, teamID: teamID, zoneID: zoneID})
+		written = append(written, i)
+	}
+
+	if len(written) > 0 {
+		if err := r.upsertBulk(ctx, shapes); err != nil {
+			for _, i := range written {
+				errs[i] = r.Upsert(ctx, items[i])
+			}
+		}
+	}
+
+	// Fan the result of each written item back to the items it replaced.
+	for i, data := range items {
+		errs[i] = errs[latest[ApplicationKey{Name: data.Name, TeamName: data.TeamName}]]
+	}
+	return errs
+}
+
+// resolvedApplication is an Application whose FKs have been resolved.
+type resolvedApplication struct {
+	data   *ApplicationData
+	teamID int
+	zoneID int
+}
+
+// upsertBulk writes the Applications with one bulk statement per shape in a
+// single transaction and caches the IDs of the written Applications.
+func (r *Repository) upsertBulk(ctx context.Context, shapes map[applicationShape][]resolvedApplication) error {
+	var apps []*ent.Application
+	err := r.withTx(ctx, func(tx *ent.Tx) error {
+		var names, teamNames []string
+		for shape, resolved := range shapes {
+			creates := make([]*ent.ApplicationCreate, len(resolved))
+			for i, app := range resolved {
+				creates[i] = newCreate(tx.Application, app.data, app.teamID, app.zoneID)
+				names = append(names, app.data.Name)
+				teamNames = append(teamNames, app.data.TeamName)
+			}
+			if err := tx.Application.CreateBulk(creates...).
+				OnConflictColumns(application.FieldName, application.OwnerTeamColumn).
+				Update(shape.update).
+				Exec(ctx); err != nil {
+				return fmt.Errorf("bulk upsert of %d applications: %w", len(creates), err)
+			}
+		}
+
+		// Bulk upserts do not return the IDs of updated rows, so they are queried.
+		var err error
+		apps, err = tx.Application.Query().
+			Where(
+				application.NameIn(names...),
+				application.HasOwnerTeamWith(team.NameIn(teamNames...)),
+			).
+			WithOwnerTeam(func(q *ent.TeamQuery) { q.Select(team.FieldName) }).
+			All(ctx)
+		if err != nil {
+			return fmt.Errorf("query upserted applications: %w", err)
+		}
+		return nil
+	})
+	if err != nil {
+		return err
+	}
+
+	for _, app := range apps {
+		et, lk := cachekeys.Application(app.Name, app.Edges.OwnerTeam.Name)
+		r.cache.Set(et, lk, app.ID)
+	}
+	return nil
+}
+
+// withTx runs fn inside a database transaction, handling commit/rollback.
+func (r *Repository) withTx(ctx context.Context, fn func(tx *ent.Tx) error) error {
+	tx, err := r.client.Tx(ctx)
+	if err != nil {
+		return fmt.Errorf("starting transaction: %w", err)
+	}
+	if err := fn(tx); err != nil {
+		if rbErr := tx.Rollback(); rbErr != nil {
+			return fmt.Errorf("rollback failed: %w (original: %w)", rbErr, err)
+		}
+		return err
+	}
+	return tx.Commit()
+}
+
+// resolveDeps resolves the required Team and Zone FKs of an Application.
+func (r *Repository) resolveDeps(ctx context.Context, data *ApplicationData) (teamID, zoneID int, err error) {
+	teamID, err = r.deps.FindTeamID(ctx, data.TeamName)
 	if err != nil {
 		if errors.Is(err, infrastructure.ErrEntityNotFound) {
-			return runtime.WrapDependencyMissing("team", data.TeamName)
+			return 0, 0, runtime.WrapDependencyMissing("team", data.TeamName)
 		}
-		return fmt.Errorf("find team %q: %w", data.TeamName, err)
+		return 0, 0, fmt.Errorf("find team %q: %w", data.TeamName, err)
 	}
 
-	zoneID, err := r.deps.FindZoneID(ctx, data.ZoneName)
+	zoneID, err = r.deps.FindZoneID(ctx, data.ZoneName)
 	if err != nil {
 		if errors.Is(err, infrastructure.ErrEntityNotFound) {
-			return runtime.WrapDependencyMissing("zone", data.ZoneName)
+			return 0, 0, runtime.WrapDependencyMissing("zone", data.ZoneName)
 		}
-		return fmt.Errorf("find zone %q: %w", data.ZoneName, err)
+		return 0, 0, fmt.Errorf("find zone %q: %w", data.ZoneName, err)
 	}
+	return teamID, zoneID, nil
+}
 
-	create := r.client.Application.Create().
+// newCreate builds the create statement for an Application with resolved FKs.
+func newCreate(client *ent.ApplicationClient, data *ApplicationData, teamID, zoneID int) *ent.ApplicationCreate {
+	create := client.Create().
 		SetName(data.Name).
 		SetStatusPhase(application.StatusPhase(data.StatusPhase)).
 		SetStatusMessage(data.StatusMessage).
@@ -112,60 +256,81 @@ func (r *Repository) Upsert(ctx context.Context, data *ApplicationData) error {
 	if len(data.ExternalIds) > 0 {
 		create.SetExternalIds(data.ExternalIds)
 	}
+	return create
+}
 
-	appID, upsertErr := create.
-		OnConflictColumns(application.FieldName, application.OwnerTeamColumn).
-		Update(func(u *ent.ApplicationUpsert) {
-			u.SetStatusPhase(application.StatusPhase(data.StatusPhase))
-			u.SetStatusMessage(data.StatusMessage)
-			u.SetEnvironment(data.Meta.Environment)
-			u.SetNamespace(data.Meta.Namespace)
-			u.SetSecretRotationPhase(application.SecretRotationPhase(data.SecretRotationPhase))
-			if data.ClientID != nil {
-				u.SetClientID(*data.ClientID)
-			}
-			if data.ClientSecret != nil {
-				u.SetClientSecret(*data.ClientSecret)
-			}
-			if data.RotatedClientSecret != nil {
-				u.SetRotatedClientSecret(*data.RotatedClientSecret)
-			} else {
-				u.ClearRotatedClientSecret()
-			}
-			if data.RotatedExpiresAt != nil {
-				u.SetRotatedExpiresAt(*data.RotatedExpiresAt)
-			} else {
-				u.ClearRotatedExpiresAt()
-			}
-			if data.CurrentExpiresAt != nil {
-				u.SetCurrentExpiresAt(*data.CurrentExpiresAt)
-			} else {
-				u.ClearCurrentExpiresAt()
-			}
-			if data.SecretRotationMessage != nil {
-				u.SetSecretRotationMessage(*data.SecretRotationMessage)
-			} else {
-				u.ClearSecretRotationMessage()
-			}
-			if len(data.IpRestrictions.Allow) > 0 || len(data.IpRestrictions.Deny) > 0 {
-				u.UpdateIPRestrictions()
-			} else {
-				u.ClearIPRestrictions()
-			}
-			if len(data.ExternalIds) > 0 {
-				u.UpdateExternalIds()
-			} else {
-				u.ClearExternalIds()
-			}
-		}).
-		ID(ctx)
-	if upsertErr != nil {
-		return fmt.Errorf("upsert application %q (team %q): %w", data.Name, data.TeamName, upsertErr)
+// applicationShape records which optional fields of an Application are set.
+// All rows of a bulk upsert share one conflict clause, so only Applications
+// of the same shape can be written together.
+type applicationShape struct {
+	clientID              bool
+	clientSecret          bool
+	rotatedClientSecret   bool
+	rotatedExpiresAt      bool
+	currentExpiresAt      bool
+	secretRotationMessage bool
+	ipRestrictions        bool
+	externalIds           bool
+}
+
+func shapeOf(data *ApplicationData) applicationShape {
+	return applicationShape{
+		clientID:              data.ClientID != nil,
+		clientSecret:          data.ClientSecret != nil,
+		rotatedClientSecret:   data.RotatedClientSecret != nil,
+		rotatedExpiresAt:      data.RotatedExpiresAt != nil,
+		currentExpiresAt:      data.CurrentExpiresAt != nil,
+		secretRotationMessage: data.SecretRotationMessage != nil,
+		ipRestrictions:        len(data.IpRestrictions.Allow) > 0 || len(data.IpRestrictions.Deny) > 0,
+		externalIds:           len(data.ExternalIds) > 0,
 	}
+}
 
-	et, lk := cachekeys.Application(data.Name, data.TeamName)
-	r.cache.Set(et, lk, appID)
-	return nil
+// update sets the conflict clause for Applications of this shape. Set fields
+// are updated to the inserted values; unset fields are cleared, except
+// ClientID and ClientSecret, which are kept.
+func (s applicationShape) update(u *ent.ApplicationUpsert) {
+	u.UpdateStatusPhase()
+	u.UpdateStatusMessage()
+	u.UpdateEnvironment()
+	u.UpdateNamespace()
+	u.UpdateSecretRotationPhase()
+	if s.clientID {
+		u.UpdateClientID()
+	}
+	if s.clientSecret {
+		u.UpdateClientSecret()
+	}
+	if s.rotatedClientSecret {
+		u.UpdateRotatedClientSecret()
+	} else {
+		u.ClearRotatedClientSecret()
+	}
+	if s.rotatedExpiresAt {
+		u.UpdateRotatedExpiresAt()
+	} else {
+		u.ClearRotatedExpiresAt()
+	}
+	if s.currentExpiresAt {
+		u.UpdateCurrentExpiresAt()
+	} else {
+		u.ClearCurrentExpiresAt()
+	}
+	if s.secretRotationMessage {
+		u.UpdateSecretRotationMessage()
+	} else {
+		u.ClearSecretRotationMessage()
+	}
+	if s.ipRestrictions {
+		u.UpdateIPRestrictions()
+	} else {
+		u.ClearIPRestrictions()
+	}
+	if s.externalIds {
+		u.UpdateExternalIds()
+	} else {
+		u.ClearExternalIds()
+	}
 }
 
 // Delete removes an Application entity from the database by name and team.
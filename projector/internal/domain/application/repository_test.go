@@ -288,6 +288,87 @@ var _ = Describe("Application Repository", func() {
 		})
 	})
 
+	Describe("UpsertBatch", func() {
+		newData := func(name, teamName string) *application.ApplicationData {
+			return &application.ApplicationData{
+				Meta:                shared.NewMetadata("prod--"+teamName, name, nil),
+				StatusPhase:         "READY",
+				StatusMessage:       "",
+				Name:                name,
+				TeamName:            teamName,
+				ZoneName:            "caas",
+				SecretRotationPhase: "DONE",
+			}
+		}
+
+		It("should create and update applications of different shapes", func() {
+			Expect(repo.Upsert(ctx, &application.ApplicationData{
+				Meta:                shared.NewMetadata("prod--platform--narvi", "batch-a", nil),
+				StatusPhase:         "PENDING",
+				Name:                "batch-a",
+				ClientID:            strPtr("client-a"),
+				TeamName:            "platform--narvi",
+				ZoneName:            "caas",
+				SecretRotationPhase: "DONE",
+			})).To(Succeed())
+
+			first := newData("batch-a", "platform--narvi")
+			second := newData("batch-b", "platform--narvi")
+			second.ClientID = strPtr("client-b")
+			second.ExternalIds = []model.ExternalId{{Id: "abc", Scheme: "schema1"}}
+
+			errs := repo.UpsertBatch(ctx, []*application.ApplicationData{first, second})
+			Expect(errs).To(Equal([]error{nil, nil}))
+
+			appA, err := client.Application.Query().Where(entapp.NameEQ("batch-a")).Only(ctx)
+			Expect(err).NotTo(HaveOccurred())
+			Expect(appA.StatusPhase.String()).To(Equal("READY"))
+			// ClientID is kept if not set.
+			Expect(appA.ClientID).ToNot(BeNil())
+			Expect(*appA.ClientID).To(Equal("client-a"))
+
+			appB, err := client.Application.Query().Where(entapp.NameEQ("batch-b")).Only(ctx)
+			Expect(err).NotTo(HaveOccurred())
+			Expect(*appB.ClientID).To(Equal("client-b"))
+			Expect(appB.ExternalIds).To(ConsistOf(model.ExternalId{Id: "abc", Scheme: "schema1"}))
+
+			cache.Wait()
+			id, found := cache.Get("application", "batch-a:platform--narvi")
+			Expect(found).To(BeTrue())
+			Expect(id).To(Equal(appA.ID))
+			id, found = cache.Get("application", "batch-b:platform--narvi")
+			Expect(found).To(BeTrue())
+			Expect(id).To(Equal(appB.ID))
+		})
+
+		It("should only fail items with missing dependencies", func() {
+			errs := repo.UpsertBatch(ctx, []*application.ApplicationData{
+				newData("ok-app", "platform--narvi"),
+				newData("fail-app", "unknown--team-a"),
+			})
+			Expect(errs).To(HaveLen(2))
+			Expect(errs[0]).NotTo(HaveOccurred())
+			Expect(runtime.IsDependencyMissing(errs[1])).To(BeTrue())
+
+			Expect(client.Application.Query().Where(entapp.NameEQ("ok-app")).Exist(ctx)).To(BeTrue())
+			Expect(client.Application.Query().Where(entapp.NameEQ("fail-app")).Exist(ctx)).To(BeFalse())
+		})
+
+		It("should write duplicate keys once with the last item", func() {
+			first := newData("dup-app", "platform--narvi")
+			first.StatusMessage = "v1"
+			second := newData("dup-app", "platform--narvi")
+			second.StatusMessage = "v2"
+
+			errs := repo.UpsertBatch(ctx, []*application.ApplicationData{first, second})
+			Expect(errs).To(Equal([]error{nil, nil}))
+
+			app, err := client.Application.Query().Where(entapp.NameEQ("dup-app")).Only(ctx)
+			Expect(err).NotTo(HaveOccurred())
+			Expect(*app.StatusMessage).To(Equal("v2"))
+		})
+	})
+
 	Describe("Delete", func() {
 		It("should delete application and cascade to children", func() {
 			// Create an application first.
@@ -23,7 +23,7 @@ import (
 const entityType = "eventtype"
 
 // Repository performs typed persistence operations for EventType catalogue entities.
-// It implements runtime.Repository[EventTypeKey, *EventTypeData].
+// It implements runtime.BatchRepository[EventTypeKey, *EventTypeData].
 //
 // EventType has a required FK dependency on Team. If the owner Team is missing,
 // Upsert returns ErrDependencyMissing.
@@ -34,7 +34,7 @@ type Repository struct {
 }
 
 // compile-time interface check.
-var _ runtime.Repository[EventTypeKey, *EventTypeData] = (*Repository)(nil)
+var _ runtime.BatchRepository[EventTypeKey, *EventTypeData] = (*Repository)(nil)
 
 // NewRepository creates an EventType repository wired with the given ent client,
 // edge cache, and dependency resolver.
@@ -55,15 +55,181 @@ func (r *Repository) Upsert(ctx context.Context, data *EventTypeData) error {
 		metrics.DBOperationDuration.WithLabelValues(entityType, metrics.OperationUpsert).Observe(time.Since(start).Seconds())
 	}()
 
+	teamID, err := r.resolveTeam(ctx, data)
+	if err != nil {
+		return err
+	}
+
+	eventTypeID, upsertErr := newCreate(r.client.EventType, data, teamID).
+		OnConflictColumns(enteventtype.FieldEventType, enteventtype.OwnerColumn).
+		UpdateNewValues().
+		ID(ctx)
+	if upsertErr != nil {
+		return fmt.Errorf("upsert event_type %q (team %q): %w",
+			data.EventType, data.TeamName, upsertErr)
+	}
+
+	r.cacheWritten(data, eventTypeID)
+	return nil
+}
+
+// UpsertBatch upserts many EventType entities with one bulk statement per
+// shape (see eventTypeShape) inside a single transaction. The owner Team is
+// resolved per item, so a missing Team only fails the affected items with
+// ErrDependencyMissing. Items with the same key are written once with the
+// data of the last item. If the transaction fails, every item is retried
+// with Upsert, so that errors are reported per item.
+func (r *Repository) UpsertBatch(ctx context.Context, items []*EventTypeData) []error {
+	start := time.Now()
+	defer func() {
+		metrics.DBOperationDuration.WithLabelValues(entityType, metrics.OperationUpsertBatch).Observe(time.Since(start).Seconds())
+		metrics.DBBatchSize.WithLabelValues(entityType).Observe(float64(len(items)))
+	}()
+
+	errs := make([]error, len(items))
+
+	// latest maps each key to the index of the last item with that key.
+	latest := make(map[EventTypeKey]int, len(items))
+	for i, data := range items {
+		latest[keyOf(data)] = i
+	}
+
+	shapes := make(map[eventTypeShape][]resolvedEventType)
+	written := make(map[EventTypeKey]*EventTypeData, len(latest))
+	for i, data := range items {
+		if latest[keyOf(data)] != i {
+			continue
+		}
+		teamID, err := r.resolveTeam(ctx, data)
+		if err != nil {
+			errs[i] = err
+			continue
+		}
+		shape := shapeOf(data)
+		shapes[shape] = append(shapes[shape], resolvedEventType{data: data, teamID: teamID})
+		written[keyOf(data)] = data
+	}
+
+	if len(written) > 0 {
+		if err := r.upsertBulk(ctx, shapes, written); err != nil {
+			for key := range written {
+				i := latest[key]
+				errs[i] = r.Upsert(ctx, items[i])
+			}
+		}
+	}
+
+	// Fan the result of each written item back to the items it replaced.
+	for i, data := range items {
+		errs[i] = errs[latest[keyOf(data)]]
+	}
+	return errs
+}
+
+// resolvedEventType is an EventType whose owner Team FK has been resolved.
+type resolvedEventType struct {
+	data   *EventTypeData
+	teamID int
+}
+
+// upsertBulk writes the EventTypes with one bulk statement per shape in a
+// single transaction and caches the IDs of the written EventTypes.
+func (r *Repository) upsertBulk(ctx context.Context, shapes map[eventTypeShape][]resolvedEventType, written map[EventTypeKey]*EventTypeData) error {
+	var eventTypes []*ent.EventType
+	err := r.withTx(ctx, func(tx *ent.Tx) error {
+		var types, teamNames []string
+		for _, resolved := range shapes {
+			creates := make([]*ent.EventTypeCreate, len(resolved))
+			for i, et := range resolved {
+				creates[i] = newCreate(tx.EventType, et.data, et.teamID)
+				types = append(types, et.data.EventType)
+				teamNames = append(teamNames, et.data.TeamName)
+			}
+			if err := tx.EventType.CreateBulk(creates...).
+				OnConflictColumns(enteventtype.FieldEventType, enteventtype.OwnerColumn).
+				UpdateNewValues().
+				Exec(ctx); err != nil {
+				return fmt.Errorf("bulk upsert of %d event_types: %w", len(creates), err)
+			}
+		}
+
+		// Bulk upserts do not return the IDs of updated rows, so they are queried.
+		var err error
+		eventTypes, err = tx.EventType.Query().
+			Where(
+				enteventtype.EventTypeIn(types...),
+				enteventtype.HasOwnerWith(team.NameIn(teamNames...)),
+			).
+			WithOwner(func(q *ent.TeamQuery) { q.Select(team.FieldName) }).
+			All(ctx)
+		if err != nil {
+			return fmt.Errorf("query upserted event_types: %w", err)
+		}
+		return nil
+	})
+	if err != nil {
+		return err
+	}
+
+	for _, et := range eventTypes {
+		// The query may return EventTypes of other combinations of type and team.
+		if data, ok := written[EventTypeKey{EventType: et.EventType, TeamName: et.Edges.Owner.Name}]; ok {
+			r.cacheWritten(data, et.ID)
+		}
+	}
+	return nil
+}
+
+// withTx runs fn inside a database transaction, handling commit/rollback.
+func (r *Repository) withTx(ctx context.Context, fn func(tx *ent.Tx) error) error {
+	tx, err := r.client.Tx(ctx)
+	if err != nil {
+		return fmt.Errorf("starting transaction: %w", err)
+	}
+	if err := fn(tx); err != nil {
+		if rbErr := tx.Rollback(); rbErr != nil {
+			return fmt.Errorf("rollback failed: %w (original: %w)", rbErr, err)
+		}
+		return err
+	}
+	return tx.Commit()
+}
+
+// resolveTeam resolves the required owner Team FK of an EventType.
+func (r *Repository) resolveTeam(ctx context.Context, data *EventTypeData) (int, error) {
 	teamID, err := r.deps.FindTeamID(ctx, data.TeamName)
 	if err != nil {
 		if errors.Is(err, infrastructure.ErrEntityNotFound) {
-			return runtime.WrapDependencyMissing("team", data.TeamName)
+			return 0, runtime.WrapDependencyMissing("team", data.TeamName)
 		}
-		return fmt.Errorf("find team %q: %w", data.TeamName, err)
+		return 0, fmt.Errorf("find team %q: %w", data.TeamName, err)
+	}
+	return teamID, nil
+}
+
+// cacheWritten caches the ID of a written EventType.
+func (r *Repository) cacheWritten(data *EventTypeData, eventTypeID int) {
+	et, lk := cachekeys.EventTypeDef(data.EventType, data.TeamName)
+	r.cache.Set(et, lk, eventTypeID)
+
+	// Update the active-eventtype cache entry so that EventExposure FK resolution
+	// can find the active EventType by type string alone.
+	if data.Active {
+		aet, alk := cachekeys.ActiveEventType(data.EventType)
+		r.cache.Set(aet, alk, eventTypeID)
+	} else {
+		aet, alk := cachekeys.ActiveEventType(data.EventType)
+		r.cache.Del(aet, alk)
 	}
+}
+
+func keyOf(data *EventTypeData) EventTypeKey {
+	return EventTypeKey{EventType: data.EventType, TeamName: data.TeamName}
+}
 
-	create := r.client.EventType.Create().
+// newCreate builds the create statement for an EventType with a resolved owner.
+func newCreate(client *ent.EventTypeClient, data *EventTypeData, teamID int) *ent.EventTypeCreate {
+	create := client.Create().
 		SetEventType(data.EventType).
 		SetVersion(data.Version).
 		SetActive(data.Active).
@@ -79,29 +245,23 @@ func (r *Repository) Upsert(ctx context.Context, data *EventTypeData) error {
 	if data.Specification != "" {
 		create.SetSpecification(data.Specification)
 	}
+	return create
+}
 
-	eventTypeID, upsertErr := create.
-		OnConflictColumns(enteventtype.FieldEventType, enteventtype.OwnerColumn).
-		UpdateNewValues().
-		ID(ctx)
-	if upsertErr != nil {
-		return fmt.Errorf("upsert event_type %q (team %q): %w",
-			data.EventType, data.TeamName, upsertErr)
-	}
-
-	et, lk := cachekeys.EventTypeDef(data.EventType, data.TeamName)
-	r.cache.Set(et, lk, eventTypeID)
+// eventTypeShape records which optional fields of an EventType are set.
+// The conflict clause updates exactly the inserted columns, so only
+// EventTypes of the same shape can be written together without overwriting
+// the unset fields of the others.
+type eventTypeShape struct {
+	description   bool
+	specification bool
+}
 
-	// Update the active-eventtype cache entry so that EventExposure FK resolution
-	// can find the active EventType by type string alone.
-	if data.Active {
-		aet, alk := cachekeys.ActiveEventType(data.EventType)
-		r.cache.Set(aet, alk, eventTypeID)
-	} else {
-		aet, alk := cachekeys.ActiveEventType(data.EventType)
-		r.cache.Del(aet, alk)
+func shapeOf(data *EventTypeData) eventTypeShape {
+	return eventTypeShape{
+		description:   data.Description != "",
+		specification: data.Specification != "",
 	}
-	return nil
 }
 
 // Delete removes an EventType catalogue entity from the database by event type
@@ -21,14 +21,14 @@ import (
 const entityType = "group"
 
 // Repository performs typed persistence operations for Group entities.
-// It implements runtime.Repository[GroupKey, *GroupData].
+// It implements runtime.BatchRepository[GroupKey, *GroupData].
 type Repository struct {
 	client *ent.Client
 	cache  *infrastructure.EdgeCache
 }
 
 // compile-time interface check.
-var _ runtime.Repository[GroupKey, *GroupData] = (*Repository)(nil)
+var _ runtime.BatchRepository[GroupKey, *GroupData] = (*Repository)(nil)
 
 // NewRepository creates a Group repository wired with the given ent client and edge cache.
 func NewRepository(client *ent.Client, cache *infrastructure.EdgeCache) *Repository {
@@ -46,19 +46,9 @@ func (r *Repository) Upsert(ctx context.Context, data *GroupData) error {
 		metrics.DBOperationDuration.WithLabelValues(entityType, metrics.OperationUpsert).Observe(time.Since(start).Seconds())
 	}()
 
-	id, err := r.client.Group.Create().
-		SetName(data.Name).
-		SetDisplayName(data.DisplayName).
-		SetDescription(data.Description).
-		SetEnvironment(data.Meta.Environment).
-		SetNamespace(data.Meta.Namespace).
+	id, err := newCreate(r.client.Group, data).
 		OnConflictColumns(entgroup.FieldName).
-		Update(func(u *ent.GroupUpsert) {
-			u.SetDisplayName(data.DisplayName)
-			u.SetDescription(data.Description)
-			u.SetEnvironment(data.Meta.Environment)
-			u.SetNamespace(data.Meta.Namespace)
-		}).
+		Update(update).
 		ID(ctx)
 	if err != nil {
 		return fmt.Errorf("upsert group %q: %w", data.Name, err)
@@ -69,6 +59,88 @@ func (r *Repository) Upsert(ctx context.Context, data *GroupData) error {
 	return nil
 }
 
+// UpsertBatch upserts many Group entities with a single bulk statement.
+// Items with the same name are written once with the data of the last item.
+// If the statement fails, every item is retried with Upsert, so that errors
+// are reported per item.
+func (r *Repository) UpsertBatch(ctx context.Context, items []*GroupData) []error {
+	start := time.Now()
+	defer func() {
+		metrics.DBOperationDuration.WithLabelValues(entityType, metrics.OperationUpsertBatch).Observe(time.Since(start).Seconds())
+		metrics.DBBatchSize.WithLabelValues(entityType).Observe(float64(len(items)))
+	}()
+
+	// latest maps each name to the index of the last item with that name.
+	latest := make(map[string]int, len(items))
+	for i, data := range items {
+		latest[data.Name] = i
+	}
+
+	creates := make([]*ent.GroupCreate, 0, len(latest))
+	names := make([]string, 0, len(latest))
+	for i, data := range items {
+		if latest[data.Name] == i {
+			creates = append(creates, newCreate(r.client.Group, data))
+			names = append(names, data.Name)
+		}
+	}
+
+	errs := make([]error, len(items))
+	if err := r.upsertBulk(ctx, creates, names); err != nil {
+		for _, i := range latest {
+			errs[i] = r.Upsert(ctx, items[i])
+		}
+	}
+
+	// Fan the result of each written item back to the items it replaced.
+	for i, data := range items {
+		errs[i] = errs[latest[data.Name]]
+	}
+	return errs
+}
+
+// upsertBulk writes the Groups with one bulk statement and caches their IDs.
+// Bulk upserts do not return the IDs of updated rows, so they are queried.
+func (r *Repository) upsertBulk(ctx context.Context, creates []*ent.GroupCreate, names []string) error {
+	if err := r.client.Group.CreateBulk(creates...).
+		OnConflictColumns(entgroup.FieldName).
+		Update(update).
+		Exec(ctx); err != nil {
+		return fmt.Errorf("bulk upsert of %d groups: %w", len(creates), err)
+	}
+
+	groups, err := r.client.Group.Query().
+		Where(entgroup.NameIn(names...)).
+		Select(entgroup.FieldID, entgroup.FieldName).
+		All(ctx)
+	if err != nil {
+		return fmt.Errorf("query upserted groups: %w", err)
+	}
+	for _, g := range groups {
+		et, lk := cachekeys.Group(g.Name)
+		r.cache.Set(et, lk, g.ID)
+	}
+	return nil
+}
+
+// newCreate builds the create statement for a Group.
+func newCreate(client *ent.GroupClient, data *GroupData) *ent.GroupCreate {
+	return client.Create().
+		SetName(data.Name).
+		SetDisplayName(data.DisplayName).
+		SetDescription(data.Description).
+		SetEnvironment(data.Meta.Environment).
+		SetNamespace(data.Meta.Namespace)
+}
+
+// update sets the conflict clause of a Group upsert.
+func update(u *ent.GroupUpsert) {
+	u.UpdateDisplayName()
+	u.UpdateDescription()
+	u.UpdateEnvironment()
+	u.UpdateNamespace()
+}
+
 // Delete removes a Group entity from the database by name.
 // Returns nil if the entity does not exist (idempotent delete).
 func (r *Repository) Delete(ctx context.Context, key GroupKey) error {
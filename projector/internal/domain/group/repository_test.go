@@ -14,6 +14,7 @@ import (
 	_ "github.com/mattn/go-sqlite3"
 	"github.com/telekom/controlplane/controlplane-api/ent"
 	"github.com/telekom/controlplane/controlplane-api/ent/enttest"
+	entgroup "github.com/telekom/controlplane/controlplane-api/ent/group"
 	_ "github.com/telekom/controlplane/controlplane-api/ent/runtime"
 
 	"github.com/telekom/controlplane/projector/internal/domain/group"
@@ -112,6 +113,50 @@ var _ = Describe("Group Repository", func() {
 		})
 	})
 
+	Describe("UpsertBatch", func() {
+		It("should create and update groups in one batch", func() {
+			Expect(repo.Upsert(ctx, &group.GroupData{
+				Meta:        shared.NewMetadata("org", "batch-a", nil),
+				Name:        "batch-a",
+				DisplayName: "Old Name",
+			})).To(Succeed())
+
+			errs := repo.UpsertBatch(ctx, []*group.GroupData{
+				{Meta: shared.NewMetadata("org", "batch-a", nil), Name: "batch-a", DisplayName: "New Name"},
+				{Meta: shared.NewMetadata("org", "batch-b", nil), Name: "batch-b", DisplayName: "Group B", Description: "Second"},
+			})
+			Expect(errs).To(Equal([]error{nil, nil}))
+
+			groupA, err := client.Group.Query().Where(entgroup.NameEQ("batch-a")).Only(ctx)
+			Expect(err).NotTo(HaveOccurred())
+			Expect(groupA.DisplayName).To(Equal("New Name"))
+
+			groupB, err := client.Group.Query().Where(entgroup.NameEQ("batch-b")).Only(ctx)
+			Expect(err).NotTo(HaveOccurred())
+			Expect(groupB.Description).To(Equal("Second"))
+
+			cache.Wait()
+			id, found := cache.Get("group", "batch-a")
+			Expect(found).To(BeTrue())
+			Expect(id).To(Equal(groupA.ID))
+			id, found = cache.Get("group", "batch-b")
+			Expect(found).To(BeTrue())
+			Expect(id).To(Equal(groupB.ID))
+		})
+
+		It("should report an error per item if the batch cannot be written", func() {
+			Expect(client.Close()).To(Succeed())
+
+			errs := repo.UpsertBatch(ctx, []*group.GroupData{
+				{Meta: shared.NewMetadata("org", "group-a", nil), Name: "group-a"},
+				{Meta: shared.NewMetadata("org", "group-a", nil), Name: "group-a"},
+			})
+			Expect(errs).To(HaveLen(2))
+			Expect(errs[0]).To(MatchError(ContainSubstring(`upsert group "group-a"`)))
+			Expect(errs[1]).To(Equal(errs[0]))
+		})
+	})
+
 	Describe("Delete", func() {
 		It("should delete an existing group", func() {
 			data := &group.GroupData{
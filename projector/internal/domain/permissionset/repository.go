@@ -24,7 +24,7 @@ import (
 const entityType = "permissionset"
 
 // Repository performs typed persistence operations for PermissionSet entities.
-// It implements runtime.Repository[PermissionSetKey, *PermissionSetData].
+// It implements runtime.BatchRepository[PermissionSetKey, *PermissionSetData].
 //
 // PermissionSet has a required FK dependency on Application. If the owner
 // Application is missing, Upsert returns ErrDependencyMissing.
@@ -36,7 +36,7 @@ type Repository struct {
 }
 
 // compile-time interface check.
-var _ runtime.Repository[PermissionSetKey, *PermissionSetData] = (*Repository)(nil)
+var _ runtime.BatchRepository[PermissionSetKey, *PermissionSetData] = (*Repository)(nil)
 
 // NewRepository creates a PermissionSet repository wired with the given
 // ent client, edge cache, and dependency resolver.
@@ -60,23 +60,12 @@ func (r *Repository) Upsert(ctx context.Context, data *PermissionSetData) error
 		metrics.DBOperationDuration.WithLabelValues(entityType, metrics.OperationUpsert).Observe(time.Since(start).Seconds())
 	}()
 
-	appID, err := r.deps.FindApplicationID(ctx, data.AppName, data.TeamName)
+	appID, err := r.resolveApplication(ctx, data)
 	if err != nil {
-		if errors.Is(err, infrastructure.ErrEntityNotFound) {
-			return runtime.WrapDependencyMissing("application", data.AppName)
-		}
-		return fmt.Errorf("find application %q (team %q): %w", data.AppName, data.TeamName, err)
+		return err
 	}
 
-	create := r.client.PermissionSet.Create().
-		SetPermissions(data.Permissions).
-		SetStatusPhase(permissionset.StatusPhase(data.StatusPhase)).
-		SetStatusMessage(data.StatusMessage).
-		SetEnvironment(data.Meta.Environment).
-		SetNamespace(data.Meta.Namespace).
-		SetOwnerApplicationID(appID)
-
-	permissionSetID, upsertErr := create.
+	permissionSetID, upsertErr := newCreate(r.client.PermissionSet, data, appID).
 		OnConflictColumns(permissionset.OwnerApplicationColumn).
 		UpdateNewValues().
 		ID(ctx)
@@ -90,6 +79,116 @@ func (r *Repository) Upsert(ctx context.Context, data *PermissionSetData) error
 	return nil
 }
 
+// UpsertBatch upserts many PermissionSet entities with a single bulk
+// statement. The owner Application is resolved per item, so a missing
+// Application only fails the affected items with ErrDependencyMissing.
+// Items with the same key are written once with the data of the last item.
+// If the statement fails, every item is retried with Upsert, so that errors
+// are reported per item.
+func (r *Repository) UpsertBatch(ctx context.Context, items []*PermissionSetData) []error {
+	start := time.Now()
+	defer func() {
+		metrics.DBOperationDuration.WithLabelValues(entityType, metrics.OperationUpsertBatch).Observe(time.Since(start).Seconds())
+		metrics.DBBatchSize.WithLabelValues(entityType).Observe(float64(len(items)))
+	}()
+
+	errs := make([]error, len(items))
+
+	// latest maps each key to the index of the last item with that key.
+	latest := make(map[PermissionSetKey]int, len(items))
+	for i, data := range items {
+		latest[keyOf(data)] = i
+	}
+
+	var creates []*ent.PermissionSetCreate
+	// written maps the ID of each owner Application to its item.
+	written := make(map[int]*PermissionSetData, len(latest))
+	for i, data := range items {
+		if latest[keyOf(data)] != i {
+			continue
+		}
+		appID, err := r.resolveApplication(ctx, data)
+		if err != nil {
+			errs[i] = err
+			continue
+		}
+		creates = append(creates, newCreate(r.client.PermissionSet, data, appID))
+		written[appID] = data
+	}
+
+	if len(written) > 0 {
+		if err := r.upsertBulk(ctx, creates, written); err != nil {
+			for _, data := range written {
+				i := latest[keyOf(data)]
+				errs[i] = r.Upsert(ctx, items[i])
+			}
+		}
+	}
+
+	// Fan the result of each written item back to the items it replaced.
+	for i, data := range items {
+		errs[i] = errs[latest[keyOf(data)]]
+	}
+	return errs
+}
+
+// upsertBulk writes the PermissionSets with one bulk statement and caches
+// their IDs. Bulk upserts do not return the IDs of updated rows, so they are
+// queried by their owner Applications.
+func (r *Repository) upsertBulk(ctx context.Context, creates []*ent.PermissionSetCreate, written map[int]*PermissionSetData) error {
+	if err := r.client.PermissionSet.CreateBulk(creates...).
+		OnConflictColumns(permissionset.OwnerApplicationColumn).
+		UpdateNewValues().
+		Exec(ctx); err != nil {
+		return fmt.Errorf("bulk upsert of %d permission_sets: %w", len(creates), err)
+	}
+
+	appIDs := make([]int, 0, len(written))
+	for appID := range written {
+		appIDs = append(appIDs, appID)
+	}
+	permissionSets, err := r.client.PermissionSet.Query().
+		Where(permissionset.HasOwnerApplicationWith(application.IDIn(appIDs...))).
+		WithOwnerApplication(func(q *ent.ApplicationQuery) { q.Select(application.FieldID) }).
+		All(ctx)
+	if err != nil {
+		return fmt.Errorf("query upserted permission_sets: %w", err)
+	}
+	for _, ps := range permissionSets {
+		data := written[ps.Edges.OwnerApplication.ID]
+		et, lk := cachekeys.PermissionSet(data.AppName, data.TeamName)
+		r.cache.Set(et, lk, ps.ID)
+	}
+	return nil
+}
+
+// resolveApplication resolves the required owner Application FK of a PermissionSet.
+func (r *Repository) resolveApplication(ctx context.Context, data *PermissionSetData) (int, error) {
+	appID, err := r.deps.FindApplicationID(ctx, data.AppName, data.TeamName)
+	if err != nil {
+		if errors.Is(err, infrastructure.ErrEntityNotFound) {
+			return 0, runtime.WrapDependencyMissing("application", data.AppName)
+		}
+		return 0, fmt.Errorf("find application %q (team %q): %w", data.AppName, data.TeamName, err)
+	}
+	return appID, nil
+}
+
+func keyOf(data *PermissionSetData) PermissionSetKey {
+	return PermissionSetKey{AppName: data.AppName, TeamName: data.TeamName}
+}
+
+// newCreate builds the create statement for a PermissionSet with a resolved owner.
+func newCreate(client *ent.PermissionSetClient, data *PermissionSetData, appID int) *ent.PermissionSetCreate {
+	return client.Create().
+		SetPermissions(data.Permissions).
+		SetStatusPhase(permissionset.StatusPhase(data.StatusPhase)).
+		SetStatusMessage(data.StatusMessage).
+		SetEnvironment(data.Meta.Environment).
+		SetNamespace(data.Meta.Namespace).
+		SetOwnerApplicationID(appID)
+}
+
 // Delete removes a PermissionSet entity from the database by owning
 // application name and team name. Returns nil if the entity does not exist
 // (idempotent delete).
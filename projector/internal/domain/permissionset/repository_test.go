@@ -52,6 +52,8 @@ var _ = Describe("PermissionSet Repository", func() {
 		repo   *permissionset.Repository
 		ctx    context.Context
 		appID  int
+		teamID int
+		zoneID int
 	)
 
 	BeforeEach(func() {
@@ -83,6 +85,8 @@ var _ = Describe("PermissionSet Repository", func() {
 			Save(ctx)
 		Expect(err).NotTo(HaveOccurred())
 		appID = app.ID
+		teamID = t.ID
+		zoneID = z.ID
 
 		deps = &mockPermissionSetDeps{
 			appIDs: map[string]int{"my-app:platform--narvi": appID},
@@ -226,6 +230,62 @@ var _ = Describe("PermissionSet Repository", func() {
 		})
 	})
 
+	Describe("UpsertBatch", func() {
+		newData := func(appName, statusPhase string) *permissionset.PermissionSetData {
+			return &permissionset.PermissionSetData{
+				Meta:        shared.NewMetadata("prod--platform--narvi", appName, nil),
+				StatusPhase: statusPhase,
+				Permissions: []model.Permission{
+					{Role: "admin", Resource: "orders", Actions: []string{"read"}},
+				},
+				AppName:  appName,
+				TeamName: "platform--narvi",
+			}
+		}
+
+		It("should write the permission sets and fail only items with missing dependencies", func() {
+			errs := repo.UpsertBatch(ctx, []*permissionset.PermissionSetData{
+				newData("my-app", "PENDING"),
+				newData("missing-app", "READY"),
+				newData("my-app", "READY"),
+			})
+			Expect(errs).To(HaveLen(3))
+			Expect(errs[0]).NotTo(HaveOccurred())
+			Expect(runtime.IsDependencyMissing(errs[1])).To(BeTrue())
+			Expect(errs[2]).NotTo(HaveOccurred())
+
+			ps, err := client.PermissionSet.Query().Only(ctx)
+			Expect(err).NotTo(HaveOccurred())
+			Expect(ps.StatusPhase).To(Equal(entpermissionset.StatusPhaseReady))
+
+			cache.Wait()
+			id, found := cache.Get("permissionset", "my-app:platform--narvi")
+			Expect(found).To(BeTrue())
+			Expect(id).To(Equal(ps.ID))
+		})
+
+		It("should retry the items one by one if the batch cannot be written", func() {
+			other, err := client.Application.Create().
+				SetName("other-app").
+				SetNamespace("platform--narvi").
+				SetOwnerTeamID(teamID).
+				SetZoneID(zoneID).
+				Save(ctx)
+			Expect(err).NotTo(HaveOccurred())
+			deps.appIDs["other-app:platform--narvi"] = other.ID
+
+			errs := repo.UpsertBatch(ctx, []*permissionset.PermissionSetData{
+				newData("my-app", "READY"),
+				newData("other-app", "BOGUS"),
+			})
+			Expect(errs).To(HaveLen(2))
+			Expect(errs[0]).NotTo(HaveOccurred())
+			Expect(errs[1]).To(MatchError(ContainSubstring("status_phase")))
+
+			Expect(client.PermissionSet.Query().Count(ctx)).To(Equal(1))
+		})
+	})
+
 	Describe("Delete", func() {
 		It("should delete an existing permission set", func() {
 			data := &permissionset.PermissionSetData{
@@ -21,14 +21,14 @@ import (
 const entityType = "zone"
 
 // Repository performs typed persistence operations for Zone entities.
-// It implements runtime.Repository[ZoneKey, *ZoneData].
+// It implements runtime.BatchRepository[ZoneKey, *ZoneData].
 type Repository struct {
 	client *ent.Client
 	cache  *infrastructure.EdgeCache
 }
 
 // compile-time interface check.
-var _ runtime.Repository[ZoneKey, *ZoneData] = (*Repository)(nil)
+var _ runtime.BatchRepository[ZoneKey, *ZoneData] = (*Repository)(nil)
 
 // NewRepository creates a Zone repository wired with the given ent client and edge cache.
 func NewRepository(client *ent.Client, cache *infrastructure.EdgeCache) *Repository {
@@ -47,7 +47,86 @@ func (r *Repository) Upsert(ctx context.Context, data *ZoneData) error {
 		metrics.DBOperationDuration.WithLabelValues(entityType, metrics.OperationUpsert).Observe(time.Since(start).Seconds())
 	}()
 
-	create := r.client.Zone.Create().
+	id, err := newCreate(r.client.Zone, data).
+		OnConflictColumns(zone.FieldName).
+		Update(update).
+		ID(ctx)
+	if err != nil {
+		return fmt.Errorf("upsert zone %q: %w", data.Name, err)
+	}
+
+	et, lk := cachekeys.Zone(data.Name)
+	r.cache.Set(et, lk, id)
+	return nil
+}
+
+// UpsertBatch upserts many Zone entities with a single bulk statement.
+// Items with the same name are written once with the data of the last item.
+// If the statement fails, every item is retried with Upsert, so that errors
+// are reported per item.
+func (r *Repository) UpsertBatch(ctx context.Context, items []*ZoneData) []error {
+	start := time.Now()
+	defer func() {
+		metrics.DBOperationDuration.WithLabelValues(entityType, metrics.OperationUpsertBatch).Observe(time.Since(start).Seconds())
+		metrics.DBBatchSize.WithLabelValues(entityType).Observe(float64(len(items)))
+	}()
+
+	// latest maps each name to the index of the last item with that name.
+	latest := make(map[string]int, len(items))
+	for i, data := range items {
+		latest[data.Name] = i
+	}
+
+	creates := make([]*ent.ZoneCreate, 0, len(latest))
+	names := make([]string, 0, len(latest))
+	for i, data := range items {
+		if latest[data.Name] == i {
+			creates = append(creates, newCreate(r.client.Zone, data))
+			names = append(names, data.Name)
+		}
+	}
+
+	errs := make([]error, len(items))
+	if err := r.upsertBulk(ctx, creates, names); err != nil {
+		for _, i := range latest {
+			errs[i] = r.Upsert(ctx, items[i])
+		}
+	}
+
+	// Fan the result of each written item back to the items it replaced.
+	for i, data := range items {
+		errs[i] = errs[latest[data.Name]]
+	}
+	return errs
+}
+
+// upsertBulk writes the Zones with one bulk statement and caches their IDs.
+// Bulk upserts do not return the IDs of updated rows, so they are queried.
+func (r *Repository) upsertBulk(ctx context.Context, creates []*ent.ZoneCreate, names []string) error {
+	if err := r.client.Zone.CreateBulk(creates...).
+		OnConflictColumns(zone.FieldName).
+		Update(update).
+		Exec(ctx); err != nil {
+		return fmt.Errorf("bulk upsert of %d zones: %w", len(creates), err)
+	}
+
+	zones, err := r.client.Zone.Query().
+		Where(zone.NameIn(names...)).
+		Select(zone.FieldID, zone.FieldName).
+		All(ctx)
+	if err != nil {
+		return fmt.Errorf("query upserted zones: %w", err)
+	}
+	for _, z := range zones {
+		et, lk := cachekeys.Zone(z.Name)
+		r.cache.Set(et, lk, z.ID)
+	}
+	return nil
+}
+
+// newCreate builds the create statement for a Zone.
+func newCreate(client *ent.ZoneClient, data *ZoneData) *ent.ZoneCreate {
+	create := client.Create().
 		SetName(data.Name).
 		SetVisibility(zone.Visibility(data.Visibility)).
 		SetEnvironment(data.Meta.Environment)
@@ -58,31 +137,16 @@ func (r *Repository) Upsert(ctx context.Context, data *ZoneData) error {
 	if data.IssuerURL != nil {
 		create = create.SetIssuerURL(*data.IssuerURL)
 	}
+	return create
+}
 
-	id, err := create.
-		OnConflictColumns(zone.FieldName).
-		Update(func(u *ent.ZoneUpsert) {
-			u.SetVisibility(zone.Visibility(data.Visibility))
-			u.SetEnvironment(data.Meta.Environment)
-			if data.GatewayURL != nil {
-				u.SetGatewayURL(*data.GatewayURL)
-			} else {
-				u.ClearGatewayURL()
-			}
-			if data.IssuerURL != nil {
-				u.SetIssuerURL(*data.IssuerURL)
-			} else {
-				u.ClearIssuerURL()
-			}
-		}).
-		ID(ctx)
-	if err != nil {
-		return fmt.Errorf("upsert zone %q: %w", data.Name, err)
-	}
-
-	et, lk := cachekeys.Zone(data.Name)
-	r.cache.Set(et, lk, id)
-	return nil
+// update sets the conflict clause of a Zone upsert. Every field is updated to
+// the inserted value, so that a nil GatewayURL or IssuerURL clears the field.
+func update(u *ent.ZoneUpsert) {
+	u.UpdateVisibility()
+	u.UpdateEnvironment()
+	u.UpdateGatewayURL()
+	u.UpdateIssuerURL()
 }
 
 // Delete removes a Zone entity from the database by name.
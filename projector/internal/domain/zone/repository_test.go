@@ -15,6 +15,7 @@ import (
 	"github.com/telekom/controlplane/controlplane-api/ent"
 	"github.com/telekom/controlplane/controlplane-api/ent/enttest"
 	_ "github.com/telekom/controlplane/controlplane-api/ent/runtime"
+	entzone "github.com/telekom/controlplane/controlplane-api/ent/zone"
 
 	"github.com/telekom/controlplane/projector/internal/domain/shared"
 	"github.com/telekom/controlplane/projector/internal/domain/zone"
@@ -168,6 +169,65 @@ var _ = Describe("Zone Repository", func() {
 		})
 	})
 
+	Describe("UpsertBatch", func() {
+		It("should create and update zones in one batch", func() {
+			Expect(repo.Upsert(ctx, &zone.ZoneData{
+				Meta:       shared.NewMetadata("admin", "batch-a", nil),
+				Name:       "batch-a",
+				GatewayURL: strPtr("https://gw.example.com"),
+				Visibility: "WORLD",
+			})).To(Succeed())
+
+			errs := repo.UpsertBatch(ctx, []*zone.ZoneData{
+				{Meta: shared.NewMetadata("admin", "batch-a", nil), Name: "batch-a", Visibility: "ENTERPRISE"},
+				{Meta: shared.NewMetadata("admin", "batch-b", nil), Name: "batch-b", IssuerURL: strPtr("https://iris.example.com"), Visibility: "WORLD"},
+			})
+			Expect(errs).To(Equal([]error{nil, nil}))
+
+			zoneA, err := client.Zone.Query().Where(entzone.NameEQ("batch-a")).Only(ctx)
+			Expect(err).NotTo(HaveOccurred())
+			Expect(string(zoneA.Visibility)).To(Equal("ENTERPRISE"))
+			// A nil GatewayURL clears the field, like Upsert.
+			Expect(zoneA.GatewayURL).To(BeNil())
+
+			zoneB, err := client.Zone.Query().Where(entzone.NameEQ("batch-b")).Only(ctx)
+			Expect(err).NotTo(HaveOccurred())
+			Expect(*zoneB.IssuerURL).To(Equal("https://iris.example.com"))
+
+			cache.Wait()
+			id, found := cache.Get("zone", "batch-a")
+			Expect(found).To(BeTrue())
+			Expect(id).To(Equal(zoneA.ID))
+			id, found = cache.Get("zone", "batch-b")
+			Expect(found).To(BeTrue())
+			Expect(id).To(Equal(zoneB.ID))
+		})
+
+		It("should write duplicate names once with the last item", func() {
+			errs := repo.UpsertBatch(ctx, []*zone.ZoneData{
+				{Meta: shared.NewMetadata("admin", "dup-zone", nil), Name: "dup-zone", Visibility: "WORLD"},
+				{Meta: shared.NewMetadata("admin", "dup-zone", nil), Name: "dup-zone", Visibility: "ENTERPRISE"},
+			})
+			Expect(errs).To(Equal([]error{nil, nil}))
+
+			z, err := client.Zone.Query().Only(ctx)
+			Expect(err).NotTo(HaveOccurred())
+			Expect(string(z.Visibility)).To(Equal("ENTERPRISE"))
+		})
+
+		It("should report an error per item if the batch cannot be written", func() {
+			Expect(client.Close()).To(Succeed())
+
+			errs := repo.UpsertBatch(ctx, []*zone.ZoneData{
+				{Meta: shared.NewMetadata("admin", "zone-a", nil), Name: "zone-a", Visibility: "WORLD"},
+				{Meta: shared.NewMetadata("admin", "zone-b", nil), Name: "zone-b", Visibility: "WORLD"},
+			})
+			Expect(errs).To(HaveLen(2))
+			Expect(errs[0]).To(MatchError(ContainSubstring(`upsert zone "zone-a"`)))
+			Expect(errs[1]).To(MatchError(ContainSubstring(`upsert zone "zone-b"`)))
+		})
+	})
+
 	Describe("Delete", func() {
 		It("should delete an existing zone", func() {
 			data := &zone.ZoneData{
@@ -22,8 +22,10 @@ import (
 	"github.com/telekom/controlplane/controlplane-api/ent/enttest"
 	_ "github.com/telekom/controlplane/controlplane-api/ent/runtime"
 
+	"github.com/telekom/controlplane/projector/internal/config"
 	"github.com/telekom/controlplane/projector/internal/domain/zone"
 	"github.com/telekom/controlplane/projector/internal/infrastructure"
+	"github.com/telekom/controlplane/projector/internal/module"
 	runtime "github.com/telekom/controlplane/projector/internal/runtime"
 )
 
@@ -215,4 +217,44 @@ var _ = Describe("Zone Integration", func() {
 			Expect(result.RequeueAfter).To(BeZero())
 		})
 	})
+
+	Describe("Preload", func() {
+		It("should load all Zones and skip their first reconcile", func() {
+			zoneObj := &adminv1.Zone{
+				ObjectMeta: metav1.ObjectMeta{
+					Name:      "preload-zone",
+					Namespace: "admin",
+				},
+				Spec: adminv1.ZoneSpec{
+					Visibility: adminv1.ZoneVisibilityWorld,
+				},
+			}
+			fakeClient := fake.NewClientBuilder().
+				WithScheme(scheme).
+				WithRuntimeObjects(zoneObj).
+				Build()
+			gate := infrastructure.NewBootstrapGate()
+			cfg := &config.Config{UpsertBatchSize: 10, MaxConcurrentReconciles: 1}
+
+			Expect(zone.Module.Preload(ctx, fakeClient, scheme, module.ModuleDeps{
+				EntClient:     entClient,
+				EdgeCache:     edgeCache,
+				Config:        cfg,
+				BootstrapGate: gate,
+			})).To(Succeed())
+
+			z, err := entClient.Zone.Query().Only(ctx)
+			Expect(err).NotTo(HaveOccurred())
+			Expect(z.Name).To(Equal("preload-zone"))
+
+			edgeCache.Wait()
+			id, found := edgeCache.Get("zone", "preload-zone")
+			Expect(found).To(BeTrue())
+			Expect(id).To(Equal(z.ID))
+
+			stored := &adminv1.Zone{}
+			Expect(fakeClient.Get(ctx, types.NamespacedName{Name: "preload-zone", Namespace: "admin"}, stored)).To(Succeed())
+			Expect(gate.ConsumeLoaded("zone", types.NamespacedName{Name: "preload-zone", Namespace: "admin"}, stored.ResourceVersion)).To(BeTrue())
+		})
+	})
 })
@@ -0,0 +1,82 @@
+// Copyright 2026 Deutsche Telekom IT GmbH
+//
+// SPDX-License-Identifier: Apache-2.0
+
+package infrastructure
+
+import (
+	"sync"
+
+	"k8s.io/apimachinery/pkg/types"
+)
+
+type loadedKey struct {
+	module string
+	key    types.NamespacedName
+}
+
+// BootstrapGate holds reconciles back until the bootstrap load completed.
+// It also remembers the resourceVersion of every object written by the
+// bootstrap, so that the first reconcile of an unchanged object can be
+// skipped.
+type BootstrapGate struct {
+	done chan struct{}
+	once sync.Once
+
+	mutex  sync.Mutex
+	loaded map[loadedKey]string
+}
+
+// NewBootstrapGate creates a closed BootstrapGate.
+func NewBootstrapGate() *BootstrapGate {
+	return &BootstrapGate{
+		done:   make(chan struct{}),
+		loaded: make(map[loadedKey]string),
+	}
+}
+
+// Open releases the reconciles. It is safe to call Open more than once.
+func (g *BootstrapGate) Open() {
+	g.once.Do(func() { close(g.done) })
+}
+
+// IsOpen reports whether the bootstrap load completed.
+func (g *BootstrapGate) IsOpen() bool {
+	select {
+	case <-g.done:
+		return true
+	default:
+		return false
+	}
+}
+
+// Done returns a channel that is closed when the gate is opened.
+func (g *BootstrapGate) Done() <-chan struct{} {
+	return g.done
+}
+
+// MarkLoaded records that the object with the given key was written by the
+// bootstrap at the given resourceVersion.
+func (g *BootstrapGate) MarkLoaded(module string, key types.NamespacedName, resourceVersion string) {
+	if g == nil || resourceVersion == "" {
+		return
+	}
+	g.mutex.Lock()
+	defer g.mutex.Unlock()
+	g.loaded[loadedKey{module: module, key: key}] = resourceVersion
+}
+
+// ConsumeLoaded reports whether the object with the given key was written by
+// the bootstrap at the given resourceVersion. The record is removed, so every
+// object is only reported once.
+func (g *BootstrapGate) ConsumeLoaded(module string, key types.NamespacedName, resourceVersion string) bool {
+	g.mutex.Lock()
+	defer g.mutex.Unlock()
+	lk := loadedKey{module: module, key: key}
+	loadedVersion, ok := g.loaded[lk]
+	if !ok {
+		return false
+	}
+	delete(g.loaded, lk)
+	return loadedVersion == resourceVersion
+}
@@ -0,0 +1,48 @@
+// Copyright 2026 Deutsche Telekom IT GmbH
+//
+// SPDX-License-Identifier: Apache-2.0
+
+package infrastructure_test
+
+import (
+	"github.com/telekom/controlplane/projector/internal/infrastructure"
+
+	. "github.com/onsi/ginkgo/v2"
+	. "github.com/onsi/gomega"
+	"k8s.io/apimachinery/pkg/types"
+)
+
+var _ = Describe("BootstrapGate", func() {
+	var gate *infrastructure.BootstrapGate
+	key := types.NamespacedName{Namespace: "ns-1", Name: "obj-1"}
+
+	BeforeEach(func() {
+		gate = infrastructure.NewBootstrapGate()
+	})
+
+	It("is closed until opened", func() {
+		Expect(gate.IsOpen()).To(BeFalse())
+		Expect(gate.Done()).NotTo(BeClosed())
+
+		gate.Open()
+		gate.Open()
+
+		Expect(gate.IsOpen()).To(BeTrue())
+		Expect(gate.Done()).To(BeClosed())
+	})
+
+	It("reports a loaded object only once", func() {
+		gate.MarkLoaded("zone", key, "42")
+
+		Expect(gate.ConsumeLoaded("team", key, "42")).To(BeFalse())
+		Expect(gate.ConsumeLoaded("zone", key, "42")).To(BeTrue())
+		Expect(gate.ConsumeLoaded("zone", key, "42")).To(BeFalse())
+	})
+
+	It("does not report an object that changed after it was loaded", func() {
+		gate.MarkLoaded("zone", key, "42")
+
+		Expect(gate.ConsumeLoaded("zone", key, "43")).To(BeFalse())
+		Expect(gate.ConsumeLoaded("zone", key, "42")).To(BeFalse())
+	})
+})
@@ -6,15 +6,26 @@ package infrastructure
 
 import (
 	"fmt"
+	"sync"
 
 	"github.com/dgraph-io/ristretto/v2"
+
+	"github.com/telekom/controlplane/projector/internal/metrics"
 )
 
 // EdgeCache is a Ristretto-based cache for FK lookups. It maps
 // (entityType, lookupKey) -> database primary key (int), avoiding repeated
 // DB queries when resolving edges during upsert operations.
+//
+// Entity types can be pinned with all their entries (see Pin). Entries of
+// pinned types are kept in a plain map instead of Ristretto, so they are
+// never refused by the admission policy or evicted. As long as all writes of
+// a pinned type go through Set and Del, the cache is authoritative for it.
 type EdgeCache struct {
 	cache *ristretto.Cache[string, int]
+
+	mutex  sync.RWMutex
+	pinned map[string]map[string]int // entityType -> lookupKey -> pk
 }
 
 // NewEdgeCache creates an EdgeCache with the given Ristretto configuration.
@@ -27,11 +38,17 @@ func NewEdgeCache(numCounters, maxCost, bufferItems int64) (*EdgeCache, error) {
 		NumCounters: numCounters,
 		MaxCost:     maxCost,
 		BufferItems: bufferItems,
+		OnReject: func(*ristretto.Item[int]) {
+			metrics.EdgeCacheRejectedSets.WithLabelValues(metrics.RejectReasonAdmission).Inc()
+		},
 	})
 	if err != nil {
 		return nil, fmt.Errorf("creating edge cache: %w", err)
 	}
-	return &EdgeCache{cache: cache}, nil
+	return &EdgeCache{
+		cache:  cache,
+		pinned: make(map[string]map[string]int),
+	}, nil
 }
 
 // cacheKey builds a composite key from entity type and lookup key.
@@ -42,21 +59,75 @@ func cacheKey(entityType, lookupKey string) string {
 // Get retrieves the cached primary key for the given entity type and lookup key.
 // Returns the primary key and true on hit, or 0 and false on miss.
 func (c *EdgeCache) Get(entityType, lookupKey string) (int, bool) {
-	val, found := c.cache.Get(cacheKey(entityType, lookupKey))
+	val, found, pinned := c.getPinned(entityType, lookupKey)
+	if !pinned {
+		val, found = c.cache.Get(cacheKey(entityType, lookupKey))
+	}
+	if found {
+		metrics.EdgeCacheLookups.WithLabelValues(entityType, metrics.ResultHit).Inc()
+	} else {
+		metrics.EdgeCacheLookups.WithLabelValues(entityType, metrics.ResultMiss).Inc()
+	}
 	return val, found
 }
 
+func (c *EdgeCache) getPinned(entityType, lookupKey string) (val int, found, pinned bool) {
+	c.mutex.RLock()
+	defer c.mutex.RUnlock()
+	entries, pinned := c.pinned[entityType]
+	if !pinned {
+		return 0, false, false
+	}
+	val, found = entries[lookupKey]
+	return val, found, true
+}
+
 // Set stores the primary key for the given entity type and lookup key.
 // Cost is set to 1 (each entry counts equally toward the budget).
+// Entries of pinned entity types are stored synchronously.
 func (c *EdgeCache) Set(entityType, lookupKey string, pk int) {
-	c.cache.Set(cacheKey(entityType, lookupKey), pk, 1)
+	c.mutex.Lock()
+	if entries, ok := c.pinned[entityType]; ok {
+		entries[lookupKey] = pk
+		c.mutex.Unlock()
+		return
+	}
+	c.mutex.Unlock()
+
+	if !c.cache.Set(cacheKey(entityType, lookupKey), pk, 1) {
+		metrics.EdgeCacheRejectedSets.WithLabelValues(metrics.RejectReasonDropped).Inc()
+	}
 }
 
 // Del removes the cached entry for the given entity type and lookup key.
 func (c *EdgeCache) Del(entityType, lookupKey string) {
+	c.mutex.Lock()
+	if entries, ok := c.pinned[entityType]; ok {
+		delete(entries, lookupKey)
+	}
+	c.mutex.Unlock()
+
 	c.cache.Del(cacheKey(entityType, lookupKey))
 }
 
+// Pin replaces the entries of the given entity type with entries and keeps
+// them outside of Ristretto from now on. The caller must pass all entities
+// of the type, e.g. loaded from the database, so that a miss means that the
+// entity does not exist.
+func (c *EdgeCache) Pin(entityType string, entries map[string]int) {
+	c.mutex.Lock()
+	defer c.mutex.Unlock()
+	c.pinned[entityType] = entries
+}
+
+// IsPinned reports whether the given entity type is pinned.
+func (c *EdgeCache) IsPinned(entityType string) bool {
+	c.mutex.RLock()
+	defer c.mutex.RUnlock()
+	_, ok := c.pinned[entityType]
+	return ok
+}
+
 // Close stops the cache's internal goroutines and releases resources.
 func (c *EdgeCache) Close() {
 	c.cache.Close()
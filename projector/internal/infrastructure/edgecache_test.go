@@ -75,6 +75,41 @@ var _ = Describe("EdgeCache", func() {
 		Expect(val).To(Equal(20))
 	})
 
+	Describe("Pin", func() {
+		It("serves pinned entries without waiting for the buffer", func() {
+			cache.Pin("zone", map[string]int{"zone-a": 1, "zone-b": 2})
+
+			Expect(cache.IsPinned("zone")).To(BeTrue())
+			Expect(cache.IsPinned("group")).To(BeFalse())
+			val, found := cache.Get("zone", "zone-b")
+			Expect(found).To(BeTrue())
+			Expect(val).To(Equal(2))
+		})
+
+		It("applies Set and Del of pinned types synchronously", func() {
+			cache.Pin("zone", map[string]int{"zone-a": 1})
+
+			cache.Set("zone", "zone-c", 3)
+			val, found := cache.Get("zone", "zone-c")
+			Expect(found).To(BeTrue())
+			Expect(val).To(Equal(3))
+
+			cache.Del("zone", "zone-a")
+			_, found = cache.Get("zone", "zone-a")
+			Expect(found).To(BeFalse())
+		})
+
+		It("replaces entries that were cached before", func() {
+			cache.Set("zone", "zone-a", 1)
+			cache.Wait()
+
+			cache.Pin("zone", map[string]int{"zone-b": 2})
+
+			_, found := cache.Get("zone", "zone-a")
+			Expect(found).To(BeFalse())
+		})
+	})
+
 	Describe("NewEdgeCache", func() {
 		It("succeeds with valid configuration", func() {
 			c, err := infrastructure.NewEdgeCache(100_000, 10<<20, 64)
@@ -0,0 +1,98 @@
+// Copyright 2026 Deutsche Telekom IT GmbH
+//
+// SPDX-License-Identifier: Apache-2.0
+
+package infrastructure
+
+import (
+	"fmt"
+	"sync/atomic"
+	"time"
+
+	"github.com/dgraph-io/ristretto/v2"
+)
+
+// fingerprintEntry is the fingerprint of the last written DTO of a key and
+// the generation in which it was written.
+type fingerprintEntry struct {
+	fingerprint uint64
+	generation  uint64
+}
+
+// FingerprintCache is a bounded Ristretto-based cache of the fingerprints of
+// the DTOs that were last written per module and identity key. It is shared
+// by all modules; use For to get the store of a single module.
+//
+// Deleting an entity may cascade to entities of other modules, so every
+// delete starts a new generation, which invalidates all fingerprints at once.
+// Entries expire after the configured TTL, so that an unchanged DTO is still
+// written from time to time.
+type FingerprintCache struct {
+	cache      *ristretto.Cache[string, fingerprintEntry]
+	ttl        time.Duration
+	generation atomic.Uint64
+}
+
+// NewFingerprintCache creates a FingerprintCache that holds up to maxEntries
+// fingerprints for the given TTL.
+func NewFingerprintCache(maxEntries int64, ttl time.Duration) (*FingerprintCache, error) {
+	cache, err := ristretto.NewCache(&ristretto.Config[string, fingerprintEntry]{
+		NumCounters: 10 * maxEntries,
+		MaxCost:     maxEntries,
+		BufferItems: 64,
+	})
+	if err != nil {
+		return nil, fmt.Errorf("creating fingerprint cache: %w", err)
+	}
+	return &FingerprintCache{cache: cache, ttl: ttl}, nil
+}
+
+// For returns the fingerprints of the given module. It implements
+// runtime.FingerprintStore.
+func (c *FingerprintCache) For(module string) *ModuleFingerprints {
+	return &ModuleFingerprints{cache: c, prefix: module + ":"}
+}
+
+// Close stops the cache's internal goroutines and releases resources.
+func (c *FingerprintCache) Close() {
+	c.cache.Close()
+}
+
+// Wait blocks until all buffered writes have been applied. Use in tests
+// after Store to ensure the value is visible to subsequent Matches calls.
+func (c *FingerprintCache) Wait() {
+	c.cache.Wait()
+}
+
+// ModuleFingerprints is the view of a FingerprintCache for a single module.
+type ModuleFingerprints struct {
+	cache  *FingerprintCache
+	prefix string
+}
+
+// Generation returns the current generation of the cache.
+func (m *ModuleFingerprints) Generation() uint64 {
+	return m.cache.generation.Load()
+}
+
+// Matches reports whether fingerprint was stored for key in the current
+// generation.
+func (m *ModuleFingerprints) Matches(key string, fingerprint uint64) bool {
+	entry, found := m.cache.cache.Get(m.prefix + key)
+	return found && entry.fingerprint == fingerprint && entry.generation == m.Generation()
+}
+
+// Store records fingerprint for key. Cost is set to 1 (each entry counts
+// equally toward the budget).
+func (m *ModuleFingerprints) Store(key string, fingerprint, generation uint64) {
+	m.cache.cache.SetWithTTL(m.prefix+key, fingerprintEntry{
+		fingerprint: fingerprint,
+		generation:  generation,
+	}, 1, m.cache.ttl)
+}
+
+// Invalidate removes the fingerprint of key and starts a new generation.
+func (m *ModuleFingerprints) Invalidate(key string) {
+	m.cache.cache.Del(m.prefix + key)
+	m.cache.generation.Add(1)
+}
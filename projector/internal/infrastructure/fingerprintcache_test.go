@@ -0,0 +1,68 @@
+// Copyright 2026 Deutsche Telekom IT GmbH
+//
+// SPDX-License-Identifier: Apache-2.0
+
+package infrastructure_test
+
+import (
+	"time"
+
+	"github.com/telekom/controlplane/projector/internal/infrastructure"
+
+	. "github.com/onsi/ginkgo/v2"
+	. "github.com/onsi/gomega"
+)
+
+var _ = Describe("FingerprintCache", func() {
+	var cache *infrastructure.FingerprintCache
+
+	BeforeEach(func() {
+		var err error
+		cache, err = infrastructure.NewFingerprintCache(1000, time.Hour)
+		Expect(err).NotTo(HaveOccurred())
+	})
+
+	AfterEach(func() {
+		cache.Close()
+	})
+
+	It("matches a stored fingerprint", func() {
+		zones := cache.For("zone")
+		zones.Store("zone-a", 42, zones.Generation())
+		cache.Wait()
+
+		Expect(zones.Matches("zone-a", 42)).To(BeTrue())
+		Expect(zones.Matches("zone-a", 43)).To(BeFalse())
+		Expect(zones.Matches("zone-b", 42)).To(BeFalse())
+	})
+
+	It("isolates different modules", func() {
+		cache.For("zone").Store("shared-name", 42, 0)
+		cache.Wait()
+
+		Expect(cache.For("group").Matches("shared-name", 42)).To(BeFalse())
+	})
+
+	It("invalidates all fingerprints on delete", func() {
+		zones := cache.For("zone")
+		teams := cache.For("team")
+		zones.Store("zone-a", 1, zones.Generation())
+		teams.Store("team-a", 2, teams.Generation())
+		cache.Wait()
+
+		zones.Invalidate("zone-b")
+
+		Expect(zones.Matches("zone-a", 1)).To(BeFalse())
+		Expect(teams.Matches("team-a", 2)).To(BeFalse())
+	})
+
+	It("ignores fingerprints of writes that raced with a delete", func() {
+		teams := cache.For("team")
+		generation := teams.Generation()
+		cache.For("zone").Invalidate("zone-a")
+		teams.Store("team-a", 2, generation)
+		cache.Wait()
+
+		Expect(teams.Matches("team-a", 2)).To(BeFalse())
+	})
+})
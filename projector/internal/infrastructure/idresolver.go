@@ -44,6 +44,14 @@ func WithSingleflight(enabled bool) IDResolverOption {
 	return func(r *IDResolver) { r.sfEnabled = enabled }
 }
 
+// WithCompleteMode enables or disables answering cache misses of warmed
+// entity types as not found without a DB query. Only safe if the edge cache
+// was warmed with [IDResolver.Warm] and all writes go through the
+// repositories of this process. Default: false (disabled).
+func WithCompleteMode(enabled bool) IDResolverOption {
+	return func(r *IDResolver) { r.complete = enabled }
+}
+
 // WithNowFunc overrides the clock used by the negative cache.
 // This is primarily useful in tests to control time-based expiry.
 func WithNowFunc(fn func() time.Time) IDResolverOption {
@@ -63,11 +71,16 @@ func WithNowFunc(fn func() time.Time) IDResolverOption {
 //   - Negative caching (sync.Map with expiry): caches "entity not found"
 //     results for a configurable TTL so that repeated lookups for a missing
 //     dependency return immediately without touching the DB.
+//
+// With [IDResolver.Warm], the edge cache is loaded with all entities of the
+// most referenced types at startup. In complete mode, misses of these types
+// are answered as not found without touching the DB.
 type IDResolver struct {
 	client    *ent.Client
 	cache     *EdgeCache
 	sf        singleflight.Group
 	sfEnabled bool
+	complete  bool
 	negCache  sync.Map // map[string]time.Time (expiry timestamp)
 	negTTL    time.Duration
 	nowFunc   func() time.Time
@@ -123,7 +136,8 @@ func (r *IDResolver) clearNegCache(key string) {
 // Flow:
 //  1. Edge cache hit → clear any stale neg entry, return cached ID.
 //  2. Negative cache hit (not expired) → return ErrEntityNotFound immediately.
-//  3. Cache miss → execute dbQuery, optionally wrapped in singleflight.
+//  3. Complete mode and warmed entity type → return ErrEntityNotFound immediately.
+//  4. Cache miss → execute dbQuery, optionally wrapped in singleflight.
 //
 // The edge cache is checked first because it represents positive evidence
 // ("entity exists") populated by repository Upsert calls. This takes priority
@@ -155,7 +169,13 @@ func (r *IDResolver) resolve(ctx context.Context, et, lk, label string, dbQuery
 		return 0, fmt.Errorf("%s: %w", label, ErrEntityNotFound)
 	}
 
-	// Step 3: DB query (with optional singleflight)
+	// Step 3: complete mode (the edge cache holds every entity of a warmed type)
+	if r.complete && r.cache.IsPinned(et) {
+		metrics.IDResolverLookups.WithLabelValues(et, metrics.ResultCompleteMiss).Inc()
+		return 0, fmt.Errorf("%s: %w", label, ErrEntityNotFound)
+	}
+
+	// Step 4: DB query (with optional singleflight)
 	if r.sfEnabled {
 		ch := r.sf.DoChan(fullKey, func() (any, error) {
 			return dbQuery()
@@ -797,6 +797,106 @@ var _ = Describe("IDResolver Hardening", func() {
 	})
 })
 
+// ── IDResolver Warm & complete mode ────────────────────────────────────────
+
+var _ = Describe("IDResolver Warm", func() {
+	var (
+		client *ent.Client
+		cache  *infrastructure.EdgeCache
+		ctx    context.Context
+		appID  int
+	)
+
+	BeforeEach(func() {
+		ctx = privacy.DecisionContext(context.Background(), privacy.Allow)
+		var err error
+		cache, err = infrastructure.NewEdgeCache(100_000, 10<<20, 64)
+		Expect(err).NotTo(HaveOccurred())
+		client = enttest.Open(GinkgoT(), "sqlite3", "file:ent?mode=memory&_fk=1")
+
+		z, err := client.Zone.Create().
+			SetName("warm-zone").
+			SetVisibility(zone.VisibilityEnterprise).
+			Save(ctx)
+		Expect(err).NotTo(HaveOccurred())
+		t, err := client.Team.Create().
+			SetName("warm-team").
+			SetEmail("warm@example.com").
+			SetNamespace("warm-team").
+			Save(ctx)
+		Expect(err).NotTo(HaveOccurred())
+		app, err := client.Application.Create().
+			SetName("warm-app").
+			SetNamespace("warm-team").
+			SetOwnerTeamID(t.ID).
+			SetZoneID(z.ID).
+			Save(ctx)
+		Expect(err).NotTo(HaveOccurred())
+		appID = app.ID
+	})
+
+	AfterEach(func() {
+		_ = client.Close()
+		cache.Close()
+	})
+
+	It("should pin all zones, groups, teams, and applications", func() {
+		resolver := infrastructure.NewIDResolver(client, cache)
+		Expect(resolver.Warm(ctx)).To(Succeed())
+
+		for _, et := range []string{"zone", "group", "team", "application"} {
+			Expect(cache.IsPinned(et)).To(BeTrue(), et)
+		}
+		Expect(cache.IsPinned("api")).To(BeFalse())
+
+		id, found := cache.Get("application", "warm-app:warm-team")
+		Expect(found).To(BeTrue())
+		Expect(id).To(Equal(appID))
+	})
+
+	It("should answer misses of pinned types without a DB query in complete mode", func() {
+		resolver := infrastructure.NewIDResolver(client, cache,
+			infrastructure.WithNegativeCacheTTL(0),
+			infrastructure.WithCompleteMode(true),
+		)
+		Expect(resolver.Warm(ctx)).To(Succeed())
+
+		// Created behind the resolver's back, so only a DB query would find it.
+		_, err := client.Zone.Create().
+			SetName("unseen-zone").
+			SetVisibility(zone.VisibilityEnterprise).
+			Save(ctx)
+		Expect(err).NotTo(HaveOccurred())
+
+		before := testutil.ToFloat64(
+			metrics.IDResolverLookups.WithLabelValues("zone", metrics.ResultCompleteMiss),
+		)
+		_, err = resolver.FindZoneID(ctx, "unseen-zone")
+		Expect(errors.Is(err, infrastructure.ErrEntityNotFound)).To(BeTrue())
+		after := testutil.ToFloat64(
+			metrics.IDResolverLookups.WithLabelValues("zone", metrics.ResultCompleteMiss),
+		)
+		Expect(after - before).To(Equal(1.0))
+	})
+
+	It("should still query the DB on misses without complete mode", func() {
+		resolver := infrastructure.NewIDResolver(client, cache,
+			infrastructure.WithNegativeCacheTTL(0),
+		)
+		Expect(resolver.Warm(ctx)).To(Succeed())
+
+		z, err := client.Zone.Create().
+			SetName("unseen-zone").
+			SetVisibility(zone.VisibilityEnterprise).
+			Save(ctx)
+		Expect(err).NotTo(HaveOccurred())
+
+		id, err := resolver.FindZoneID(ctx, "unseen-zone")
+		Expect(err).NotTo(HaveOccurred())
+		Expect(id).To(Equal(z.ID))
+	})
+})
+
 // capitalize returns s with the first letter upper-cased (ASCII only).
 func capitalize(s string) string {
 	if len(s) == 0 {
@@ -0,0 +1,90 @@
+// Copyright 2026 Deutsche Telekom IT GmbH
+//
+// SPDX-License-Identifier: Apache-2.0
+
+package infrastructure
+
+import (
+	"context"
+	"fmt"
+
+	"github.com/telekom/controlplane/controlplane-api/ent"
+	"github.com/telekom/controlplane/controlplane-api/ent/application"
+	entgroup "github.com/telekom/controlplane/controlplane-api/ent/group"
+	"github.com/telekom/controlplane/controlplane-api/ent/team"
+	"github.com/telekom/controlplane/controlplane-api/ent/zone"
+	"github.com/telekom/controlplane/projector/internal/infrastructure/cachekeys"
+)
+
+// Warm loads the primary keys of all Zones, Groups, Teams, and Applications
+// into the edge cache with one query per entity type and pins these types
+// (see [EdgeCache.Pin]). These are the FK targets of most lookups. Other
+// entity types are still cached on demand.
+//
+// Warm must run before any repository writes, otherwise concurrent writes
+// may be overwritten with the state of the query.
+func (r *IDResolver) Warm(ctx context.Context) error {
+	// The entity type of a cache key does not depend on the lookup key.
+	var et string
+
+	zones, err := r.client.Zone.Query().
+		Select(zone.FieldID, zone.FieldName).
+		All(ctx)
+	if err != nil {
+		return fmt.Errorf("warm zones: %w", err)
+	}
+	et, _ = cachekeys.Zone("")
+	pin(r.cache, et, zones, func(z *ent.Zone) (string, int) {
+		_, lk := cachekeys.Zone(z.Name)
+		return lk, z.ID
+	})
+
+	groups, err := r.client.Group.Query().
+		Select(entgroup.FieldID, entgroup.FieldName).
+		All(ctx)
+	if err != nil {
+		return fmt.Errorf("warm groups: %w", err)
+	}
+	et, _ = cachekeys.Group("")
+	pin(r.cache, et, groups, func(g *ent.Group) (string, int) {
+		_, lk := cachekeys.Group(g.Name)
+		return lk, g.ID
+	})
+
+	teams, err := r.client.Team.Query().
+		Select(team.FieldID, team.FieldName).
+		All(ctx)
+	if err != nil {
+		return fmt.Errorf("warm teams: %w", err)
+	}
+	et, _ = cachekeys.Team("")
+	pin(r.cache, et, teams, func(t *ent.Team) (string, int) {
+		_, lk := cachekeys.Team(t.Name)
+		return lk, t.ID
+	})
+
+	apps, err := r.client.Application.Query().
+		Select(application.FieldID, application.FieldName).
+		WithOwnerTeam(func(q *ent.TeamQuery) { q.Select(team.FieldName) }).
+		All(ctx)
+	if err != nil {
+		return fmt.Errorf("warm applications: %w", err)
+	}
+	et, _ = cachekeys.Application("", "")
+	pin(r.cache, et, apps, func(a *ent.Application) (string, int) {
+		_, lk := cachekeys.Application(a.Name, a.Edges.OwnerTeam.Name)
+		return lk, a.ID
+	})
+
+	return nil
+}
+
+// pin pins entityType with one entry per row.
+func pin[T any](cache *EdgeCache, entityType string, rows []T, keyOf func(T) (lookupKey string, pk int)) {
+	entries := make(map[string]int, len(rows))
+	for _, row := range rows {
+		lk, pk := keyOf(row)
+		entries[lk] = pk
+	}
+	cache.Pin(entityType, entries)
+}
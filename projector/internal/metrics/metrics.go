@@ -25,6 +25,10 @@ const (
 	OutcomeDeleteKeyLost     = "delete_key_lost"
 	OutcomeDeleteSuccess     = "delete_success"
 	OutcomeError             = "error"
+	OutcomeBootstrapPending  = "bootstrap_pending"
+	OutcomeBootstrapped      = "bootstrapped"
+	OutcomeUnchanged         = "unchanged"
+	OutcomeAdmissionTimeout  = "admission_timeout"
 )
 
 // IDResolver lookup result labels. These classify the cache/DB decision point
@@ -34,12 +38,41 @@ const (
 	ResultNegCacheHit = "neg_cache_hit"
 	ResultDBHit       = "db_hit"
 	ResultDBMiss      = "db_miss"
+	// ResultCompleteMiss is a miss for a fully warmed entity type, answered
+	// as not found without a DB query.
+	ResultCompleteMiss = "complete_miss"
+)
+
+// Bootstrap object result labels. These classify the result of loading a
+// single object during the bootstrap and are used as the "result" label on
+// BootstrapObjects.
+const (
+	BootstrapResultLoaded = "loaded"
+	BootstrapResultSkip   = "skip"
+	BootstrapResultFailed = "failed"
+)
+
+// EdgeCache lookup result labels, used as the "result" label on
+// EdgeCacheLookups.
+const (
+	ResultHit  = "hit"
+	ResultMiss = "miss"
+)
+
+// EdgeCache reject reason labels, used as the "reason" label on
+// EdgeCacheRejectedSets.
+const (
+	// RejectReasonAdmission means Ristretto's admission policy refused the entry.
+	RejectReasonAdmission = "admission"
+	// RejectReasonDropped means Ristretto dropped the entry under contention.
+	RejectReasonDropped = "dropped"
 )
 
 // DB operation labels.
 const (
-	OperationUpsert = "upsert"
-	OperationDelete = "delete"
+	OperationUpsert      = "upsert"
+	OperationUpsertBatch = "upsert_batch"
+	OperationDelete      = "delete"
 )
 
 var (
@@ -94,6 +127,29 @@ var (
 		[]string{"entity_type", "shared"},
 	)
 
+	// EdgeCacheLookups counts EdgeCache lookups by entity type and result
+	// (hit, miss). The hit ratio of an entity type is hit / (hit + miss).
+	EdgeCacheLookups = prometheus.NewCounterVec(
+		prometheus.CounterOpts{
+			Namespace: "projector",
+			Name:      "edgecache_lookups_total",
+			Help:      "Total EdgeCache lookups by entity type and result.",
+		},
+		[]string{"entity_type", "result"},
+	)
+
+	// EdgeCacheRejectedSets counts EdgeCache entries that Ristretto did not
+	// store, by reason (admission, dropped). Entries of pinned entity types
+	// are never rejected.
+	EdgeCacheRejectedSets = prometheus.NewCounterVec(
+		prometheus.CounterOpts{
+			Namespace: "projector",
+			Name:      "edgecache_rejected_sets_total",
+			Help:      "Total EdgeCache entries not stored by reason.",
+		},
+		[]string{"reason"},
+	)
+
 	// DBOperationDuration observes the latency distribution of database
 	// operations (upsert, delete) per module.
 	DBOperationDuration = prometheus.NewHistogramVec(
@@ -105,6 +161,64 @@ var (
 		},
 		[]string{"module", "operation"},
 	)
+
+	// DBBatchSize observes the number of entities written per batched
+	// upsert, per module.
+	DBBatchSize = prometheus.NewHistogramVec(
+		prometheus.HistogramOpts{
+			Namespace: "projector",
+			Name:      "db_batch_size",
+			Help:      "Number of entities per batched database upsert by module.",
+			Buckets:   []float64{1, 2, 5, 10, 25, 50, 100, 250},
+		},
+		[]string{"module"},
+	)
+
+	// BootstrapTierDuration records how long the bootstrap load of each
+	// dependency tier took. Tiers are numbered in load order, starting at 0.
+	BootstrapTierDuration = prometheus.NewGaugeVec(
+		prometheus.GaugeOpts{
+			Namespace: "projector",
+			Name:      "bootstrap_tier_duration_seconds",
+			Help:      "Duration of the bootstrap load by dependency tier.",
+		},
+		[]string{"tier"},
+	)
+
+	// BootstrapObjects counts the objects handled by the bootstrap load,
+	// broken down by module and result (loaded, skip, failed). Failed objects
+	// are synced by the regular reconciles afterwards.
+	BootstrapObjects = prometheus.NewCounterVec(
+		prometheus.CounterOpts{
+			Namespace: "projector",
+			Name:      "bootstrap_objects_total",
+			Help:      "Total objects handled by the bootstrap load by module and result.",
+		},
+		[]string{"module", "result"},
+	)
+
+	// SchedulerQueueDepth tracks the number of reconciles waiting for
+	// admission by the shared scheduler, by dependency tier.
+	SchedulerQueueDepth = prometheus.NewGaugeVec(
+		prometheus.GaugeOpts{
+			Namespace: "projector",
+			Name:      "scheduler_queue_depth",
+			Help:      "Number of reconciles waiting for admission by dependency tier.",
+		},
+		[]string{"tier"},
+	)
+
+	// SchedulerWaitDuration records how long reconciles waited for admission
+	// by the shared scheduler, by dependency tier.
+	SchedulerWaitDuration = prometheus.NewHistogramVec(
+		prometheus.HistogramOpts{
+			Namespace: "projector",
+			Name:      "scheduler_wait_duration_seconds",
+			Help:      "Time reconciles waited for admission by dependency tier.",
+			Buckets:   prometheus.DefBuckets,
+		},
+		[]string{"tier"},
+	)
 )
 
 func init() {
@@ -113,6 +227,13 @@ func init() {
 		ReconcileDuration,
 		IDResolverLookups,
 		IDResolverSingleflight,
+		EdgeCacheLookups,
+		EdgeCacheRejectedSets,
 		DBOperationDuration,
+		DBBatchSize,
+		BootstrapTierDuration,
+		BootstrapObjects,
+		SchedulerQueueDepth,
+		SchedulerWaitDuration,
 	)
 }
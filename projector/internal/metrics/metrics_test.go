@@ -46,6 +46,41 @@ var _ = Describe("Metrics", func() {
 			name := fullyQualifiedName(metrics.DBOperationDuration)
 			Expect(name).To(Equal("projector_db_operation_duration_seconds"))
 		})
+
+		It("registers DBBatchSize as projector_db_batch_size", func() {
+			name := fullyQualifiedName(metrics.DBBatchSize)
+			Expect(name).To(Equal("projector_db_batch_size"))
+		})
+
+		It("registers BootstrapTierDuration as projector_bootstrap_tier_duration_seconds", func() {
+			name := fullyQualifiedName(metrics.BootstrapTierDuration)
+			Expect(name).To(Equal("projector_bootstrap_tier_duration_seconds"))
+		})
+
+		It("registers BootstrapObjects as projector_bootstrap_objects_total", func() {
+			name := fullyQualifiedName(metrics.BootstrapObjects)
+			Expect(name).To(Equal("projector_bootstrap_objects_total"))
+		})
+
+		It("registers EdgeCacheLookups as projector_edgecache_lookups_total", func() {
+			name := fullyQualifiedName(metrics.EdgeCacheLookups)
+			Expect(name).To(Equal("projector_edgecache_lookups_total"))
+		})
+
+		It("registers EdgeCacheRejectedSets as projector_edgecache_rejected_sets_total", func() {
+			name := fullyQualifiedName(metrics.EdgeCacheRejectedSets)
+			Expect(name).To(Equal("projector_edgecache_rejected_sets_total"))
+		})
+
+		It("registers SchedulerQueueDepth as projector_scheduler_queue_depth", func() {
+			name := fullyQualifiedName(metrics.SchedulerQueueDepth)
+			Expect(name).To(Equal("projector_scheduler_queue_depth"))
+		})
+
+		It("registers SchedulerWaitDuration as projector_scheduler_wait_duration_seconds", func() {
+			name := fullyQualifiedName(metrics.SchedulerWaitDuration)
+			Expect(name).To(Equal("projector_scheduler_wait_duration_seconds"))
+		})
 	})
 
 	// ---------------------------------------------------------------
@@ -132,6 +167,7 @@ var _ = Describe("Metrics", func() {
 			Expect(metrics.OutcomeDeleteKeyLost).To(Equal("delete_key_lost"))
 			Expect(metrics.OutcomeDeleteSuccess).To(Equal("delete_success"))
 			Expect(metrics.OutcomeError).To(Equal("error"))
+			Expect(metrics.OutcomeAdmissionTimeout).To(Equal("admission_timeout"))
 		})
 
 		It("defines all IDResolver result labels", func() {
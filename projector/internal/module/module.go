@@ -8,12 +8,15 @@
 package module
 
 import (
+	"context"
+
 	cc "github.com/telekom/controlplane/common/pkg/controller"
 	"github.com/telekom/controlplane/controlplane-api/ent"
 	"github.com/telekom/controlplane/projector/internal/config"
 	"github.com/telekom/controlplane/projector/internal/infrastructure"
 	"github.com/telekom/controlplane/projector/internal/runtime"
 	"golang.org/x/time/rate"
+	k8sruntime "k8s.io/apimachinery/pkg/runtime"
 	"k8s.io/client-go/util/workqueue"
 	ctrl "sigs.k8s.io/controller-runtime"
 	"sigs.k8s.io/controller-runtime/pkg/builder"
@@ -30,6 +33,7 @@ import (
 type Module interface {
 	Name() string
 	Register(mgr ctrl.Manager, deps ModuleDeps) error
+	Preload(ctx context.Context, reader client.Reader, scheme *k8sruntime.Scheme, deps ModuleDeps) error
 }
 
 // ModuleDeps carries shared infrastructure injected into every module at
@@ -41,6 +45,15 @@ type ModuleDeps struct {
 	EdgeCache   *infrastructure.EdgeCache
 	IDResolver  *infrastructure.IDResolver
 	Config      *config.Config
+
+	// BootstrapGate is nil if the bootstrap load is disabled.
+	BootstrapGate *infrastructure.BootstrapGate
+
+	// Fingerprints is nil if skipping unchanged writes is disabled.
+	Fingerprints *infrastructure.FingerprintCache
+
+	// Scheduler is nil if the shared scheduler is disabled.
+	Scheduler *runtime.Scheduler
 }
 
 // TypedModule is the generic module implementation. Type parameters are
@@ -67,8 +80,10 @@ func (m *TypedModule[T, D, K]) Name() string { return m.ModuleName }
 // Register creates the full processing pipeline and wires it into the
 // controller-runtime manager:
 //  1. Creates the repository via RepoFactory
-//  2. Builds the generic Processor
-//  3. Builds the ReadOnlyReconciler with ErrorPolicy from config
+//  2. Builds the generic Processor, batching upserts if the repository supports it
+//     and skipping unchanged writes if the fingerprint cache is enabled
+//  3. Builds the ReadOnlyReconciler with ErrorPolicy from config, gated by
+//     the bootstrap load and admitted by the shared scheduler if enabled
 //  4. Registers a named controller with Watches, RateLimiter, and concurrency
 func (m *TypedModule[T, D, K]) Register(mgr ctrl.Manager, deps ModuleDeps) error {
 	cfg := deps.Config
@@ -76,7 +91,23 @@ func (m *TypedModule[T, D, K]) Register(mgr ctrl.Manager, deps ModuleDeps) error
 	policy := runtime.NewErrorPolicyFromConfig(cfg)
 
 	repo := m.RepoFactory(deps)
-	proc := runtime.NewProcessor(m.Translator, repo)
+	procOpts := []runtime.ProcessorOption{
+		runtime.WithUpsertBatching(runtime.NewBatchPolicyFromConfig(cfg)),
+	}
+	if deps.Fingerprints != nil {
+		procOpts = append(procOpts, runtime.WithFingerprints(deps.Fingerprints.For(m.ModuleName)))
+	}
+	proc := runtime.NewProcessor(m.Translator, repo, procOpts...)
+	var recOpts []runtime.ReconcilerOption
+	if deps.BootstrapGate != nil {
+		recOpts = append(recOpts, runtime.WithBootstrapGate(deps.BootstrapGate))
+	}
+	concurrency := cfg.ConcurrencyFor(m.ModuleName)
+	if deps.Scheduler != nil {
+		recOpts = append(recOpts, runtime.WithScheduler(deps.Scheduler))
+		// The scheduler limits the reconciles of all modules together.
+		concurrency = deps.Scheduler.Capacity()
+	}
 	rec := runtime.NewReadOnlyReconciler(
 		mgr.GetClient(),
 		proc,
@@ -84,10 +115,11 @@ func (m *TypedModule[T, D, K]) Register(mgr ctrl.Manager, deps ModuleDeps) error
 		m.ModuleName,
 		m.NewObj,
 		policy,
+		recOpts...,
 	)
 
 	ctrlOpts := controller.Options{
-		MaxConcurrentReconciles: cfg.ConcurrencyFor(m.ModuleName),
+		MaxConcurrentReconciles: concurrency,
 		RateLimiter:             newRateLimiter(cfg),
 		ReconciliationTimeout:   cfg.ReconcileTimeout,
 	}
@@ -0,0 +1,152 @@
+// Copyright 2026 Deutsche Telekom IT GmbH
+//
+// SPDX-License-Identifier: Apache-2.0
+
+package module
+
+import (
+	"context"
+	"fmt"
+	"slices"
+
+	"entgo.io/ent/privacy"
+	"golang.org/x/sync/errgroup"
+	"k8s.io/apimachinery/pkg/api/meta"
+	k8sruntime "k8s.io/apimachinery/pkg/runtime"
+	"sigs.k8s.io/controller-runtime/pkg/client"
+	"sigs.k8s.io/controller-runtime/pkg/client/apiutil"
+	"sigs.k8s.io/controller-runtime/pkg/log"
+
+	"github.com/telekom/controlplane/projector/internal/metrics"
+	"github.com/telekom/controlplane/projector/internal/runtime"
+)
+
+// Preload lists all objects of the module from the reader and writes them to
+// the database, in batches if the repository supports it. Writing an object
+// also caches its primary key in the EdgeCache, so that later modules resolve
+// it without a query.
+//
+// The written objects are recorded in deps.BootstrapGate, so that their first
+// reconcile does not write them again, and their fingerprints are stored in
+// deps.Fingerprints, so that later resyncs do not either. Objects that are
+// skipped or cannot be written are left to the regular reconciles.
+func (m *TypedModule[T, D, K]) Preload(ctx context.Context, reader client.Reader, scheme *k8sruntime.Scheme, deps ModuleDeps) error {
+	logger := log.FromContext(ctx).WithValues("module", m.ModuleName)
+	ctx = privacy.DecisionContext(ctx, privacy.Allow)
+
+	objs, err := m.list(ctx, reader, scheme)
+	if err != nil {
+		return fmt.Errorf("list %s objects: %w", m.ModuleName, err)
+	}
+
+	translated := make([]T, 0, len(objs))
+	items := make([]D, 0, len(objs))
+	var skipped, failed int
+	for _, obj := range objs {
+		if skip, _ := m.Translator.ShouldSkip(obj); skip {
+			skipped++
+			continue
+		}
+		data, err := m.Translator.Translate(ctx, obj)
+		if err != nil {
+			logger.V(1).Info("translate failed, leaving object to reconcile",
+				"key", client.ObjectKeyFromObject(obj), "reason", err.Error())
+			failed++
+			continue
+		}
+		translated = append(translated, obj)
+		items = append(items, data)
+	}
+
+	var fingerprints runtime.FingerprintStore
+	var generation uint64
+	if deps.Fingerprints != nil {
+		fingerprints = deps.Fingerprints.For(m.ModuleName)
+		generation = fingerprints.Generation()
+	}
+
+	var loaded int
+	errs := m.upsertAll(ctx, m.RepoFactory(deps), items, deps)
+	for i, err := range errs {
+		if err != nil {
+			logger.V(1).Info("upsert failed, leaving object to reconcile",
+				"key", client.ObjectKeyFromObject(translated[i]), "reason", err.Error())
+			failed++
+			continue
+		}
+		deps.BootstrapGate.MarkLoaded(m.ModuleName, client.ObjectKeyFromObject(translated[i]), translated[i].GetResourceVersion())
+		if fingerprints != nil {
+			if fingerprint, err := runtime.Fingerprint(items[i]); err == nil {
+				fingerprints.Store(runtime.FingerprintKey(m.Translator.KeyFromObject(translated[i])), fingerprint, generation)
+			}
+		}
+		loaded++
+	}
+
+	metrics.BootstrapObjects.WithLabelValues(m.ModuleName, metrics.BootstrapResultLoaded).Add(float64(loaded))
+	metrics.BootstrapObjects.WithLabelValues(m.ModuleName, metrics.BootstrapResultSkip).Add(float64(skipped))
+	metrics.BootstrapObjects.WithLabelValues(m.ModuleName, metrics.BootstrapResultFailed).Add(float64(failed))
+	logger.Info("module preloaded", "loaded", loaded, "skipped", skipped, "failed", failed)
+	return nil
+}
+
+// list returns all objects of the module's type. The list type is derived
+// from the scheme, e.g. ZoneList for Zone.
+func (m *TypedModule[T, D, K]) list(ctx context.Context, reader client.Reader, scheme *k8sruntime.Scheme) ([]T, error) {
+	gvk, err := apiutil.GVKForObject(m.NewObj(), scheme)
+	if err != nil {
+		return nil, err
+	}
+	listObj, err := scheme.New(gvk.GroupVersion().WithKind(gvk.Kind + "List"))
+	if err != nil {
+		return nil, err
+	}
+	list, ok := listObj.(client.ObjectList)
+	if !ok {
+		return nil, fmt.Errorf("%T is not a list", listObj)
+	}
+	if err := reader.List(ctx, list); err != nil {
+		return nil, err
+	}
+
+	items, err := meta.ExtractList(list)
+	if err != nil {
+		return nil, err
+	}
+	objs := make([]T, 0, len(items))
+	for _, item := range items {
+		obj, ok := item.(T)
+		if !ok {
+			return nil, fmt.Errorf("unexpected list item type %T", item)
+		}
+		objs = append(objs, obj)
+	}
+	return objs, nil
+}
+
+// upsertAll writes all items and returns one error per item. Batch
+// repositories write UpsertBatchSize items per call; other repositories
+// write the items with the module's reconcile concurrency.
+func (m *TypedModule[T, D, K]) upsertAll(ctx context.Context, repo runtime.Repository[K, D], items []D, deps ModuleDeps) []error {
+	errs := make([]error, len(items))
+
+	if batchRepo, ok := repo.(runtime.BatchRepository[K, D]); ok {
+		offset := 0
+		for chunk := range slices.Chunk(items, deps.Config.UpsertBatchSize) {
+			copy(errs[offset:], batchRepo.UpsertBatch(ctx, chunk))
+			offset += len(chunk)
+		}
+		return errs
+	}
+
+	var g errgroup.Group
+	g.SetLimit(deps.Config.ConcurrencyFor(m.ModuleName))
+	for i, data := range items {
+		g.Go(func() error {
+			errs[i] = repo.Upsert(ctx, data)
+			return nil
+		})
+	}
+	_ = g.Wait()
+	return errs
+}
@@ -0,0 +1,103 @@
+// Copyright 2026 Deutsche Telekom IT GmbH
+//
+// SPDX-License-Identifier: Apache-2.0
+
+package runtime
+
+import (
+	"context"
+	"sync"
+	"time"
+)
+
+type batchItem[D any] struct {
+	ctx  context.Context
+	data D
+	done chan error
+}
+
+// batcher collects concurrent upserts of a single entity type and writes them
+// with one UpsertBatch call. A batch is written when it is full or when the
+// window of its first item elapsed. Every caller blocks until its own item
+// was written and receives only the error of its own item.
+type batcher[D any] struct {
+	upsert func(ctx context.Context, items []D) []error
+	policy BatchPolicy
+
+	mutex   sync.Mutex
+	pending []*batchItem[D]
+	timer   *time.Timer
+}
+
+func newBatcher[D any](policy BatchPolicy, upsert func(ctx context.Context, items []D) []error) *batcher[D] {
+	return &batcher[D]{
+		upsert: upsert,
+		policy: policy,
+	}
+}
+
+// Submit adds data to the current batch and waits until it was written.
+// If ctx is done before, ctx.Err() is returned; the item is still written
+// with its batch.
+func (b *batcher[D]) Submit(ctx context.Context, data D) error {
+	item := &batchItem[D]{ctx: ctx, data: data, done: make(chan error, 1)}
+
+	b.mutex.Lock()
+	b.pending = append(b.pending, item)
+	var full []*batchItem[D]
+	switch {
+	case len(b.pending) >= b.policy.Size:
+		full = b.take()
+	case len(b.pending) == 1:
+		b.timer = time.AfterFunc(b.policy.Window, b.flushPending)
+	}
+	b.mutex.Unlock()
+
+	if full != nil {
+		b.flush(full)
+	}
+
+	select {
+	case err := <-item.done:
+		return err
+	case <-ctx.Done():
+		return ctx.Err()
+	}
+}
+
+// take removes and returns the pending items. The caller must hold the mutex.
+func (b *batcher[D]) take() []*batchItem[D] {
+	items := b.pending
+	b.pending = nil
+	if b.timer != nil {
+		b.timer.Stop()
+		b.timer = nil
+	}
+	return items
+}
+
+func (b *batcher[D]) flushPending() {
+	b.mutex.Lock()
+	items := b.take()
+	b.mutex.Unlock()
+
+	if len(items) > 0 {
+		b.flush(items)
+	}
+}
+
+// flush writes the items and fans the per-item errors back to their callers.
+// The batch inherits the values of the first item's context (e.g. the privacy
+// decision), but not its cancellation, so that a single timed-out reconcile
+// does not fail the whole batch.
+func (b *batcher[D]) flush(items []*batchItem[D]) {
+	data := make([]D, len(items))
+	for i, item := range items {
+		data[i] = item.data
+	}
+
+	errs := b.upsert(context.WithoutCancel(items[0].ctx), data)
+	for i, item := range items {
+		item.done <- errs[i]
+	}
+}
@@ -49,6 +49,19 @@ type Repository[K any, D any] interface {
 	Delete(ctx context.Context, key K) error
 }
 
+// BatchRepository is implemented by repositories that can upsert many
+// entities of their type at once, e.g. with a single bulk statement.
+// The Processor uses it when upsert batching is enabled.
+type BatchRepository[K any, D any] interface {
+	Repository[K, D]
+
+	// UpsertBatch upserts all items and returns one error per item, in the
+	// same order as items. A nil error means the item was written. Errors
+	// must be classified like Upsert errors (e.g. ErrDependencyMissing), so
+	// that the reconciler only requeues the affected keys.
+	UpsertBatch(ctx context.Context, items []D) []error
+}
+
 // SyncProcessor defines the operations that the reconciler depends on.
 // The generic Processor[T, D, K] implements this interface, providing type
 // erasure at the reconciler boundary.
@@ -26,6 +26,11 @@ var (
 	// and the key cannot be derived from conventions alone.
 	// The reconciler emits a metric and logs a warning.
 	ErrDeleteKeyLost = errors.New("cannot derive delete key without cached object")
+
+	// ErrUnchanged is returned when the translated DTO has the same
+	// fingerprint as the last one written. The reconciler treats this as a
+	// success without a database write.
+	ErrUnchanged = errors.New("translated data unchanged since last write")
 )
 
 // WrapDependencyMissing adds entity context to ErrDependencyMissing.
@@ -45,6 +50,12 @@ func IsDependencyMissing(err error) bool {
 	return errors.Is(err, ErrDependencyMissing)
 }
 
+// IsUnchanged reports whether err (or any error in its chain) matches
+// ErrUnchanged.
+func IsUnchanged(err error) bool {
+	return errors.Is(err, ErrUnchanged)
+}
+
 // IsDeleteKeyLost reports whether err (or any error in its chain) matches
 // ErrDeleteKeyLost.
 func IsDeleteKeyLost(err error) bool {
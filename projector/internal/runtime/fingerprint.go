@@ -0,0 +1,50 @@
+// Copyright 2026 Deutsche Telekom IT GmbH
+//
+// SPDX-License-Identifier: Apache-2.0
+
+package runtime
+
+import (
+	"encoding/json"
+	"fmt"
+	"hash/fnv"
+)
+
+// FingerprintStore remembers the fingerprint of the DTO that was last written
+// for each identity key, so that the Processor can skip writing a DTO that did
+// not change. Implemented by infrastructure.FingerprintCache.
+type FingerprintStore interface {
+	// Generation returns the current generation of the store. It must be
+	// read before the write whose fingerprint is stored.
+	Generation() uint64
+
+	// Matches reports whether fingerprint is the last one stored for key
+	// in the current generation.
+	Matches(key string, fingerprint uint64) bool
+
+	// Store records fingerprint for key. It is ignored by Matches if the
+	// store was invalidated after generation.
+	Store(key string, fingerprint, generation uint64)
+
+	// Invalidate forgets the fingerprint of key and starts a new generation,
+	// because a delete may cascade to rows of other keys and modules.
+	Invalidate(key string)
+}
+
+// Fingerprint returns a stable 64-bit FNV-1a hash of the JSON encoding of a
+// DTO. DTOs only carry exported fields, and map keys are encoded in sorted
+// order, so equal DTOs always have the same fingerprint.
+func Fingerprint(data any) (uint64, error) {
+	b, err := json.Marshal(data)
+	if err != nil {
+		return 0, fmt.Errorf("fingerprint %T: %w", data, err)
+	}
+	h := fnv.New64a()
+	_, _ = h.Write(b)
+	return h.Sum64(), nil
+}
+
+// FingerprintKey returns the FingerprintStore key of an identity key.
+func FingerprintKey(key any) string {
+	return fmt.Sprintf("%+v", key)
+}
@@ -30,6 +30,12 @@ type ErrorPolicy struct {
 	// PeriodicResync is the success requeue interval. Set to 0 for
 	// event-driven operation (no periodic requeue after success).
 	PeriodicResync time.Duration
+
+	// AdmissionTimeout is the maximum wait for admission by the shared
+	// Scheduler. A reconcile that is not admitted in time is requeued with
+	// DependencyDelay + jitter. Set to 0 to wait as long as the reconcile
+	// context allows.
+	AdmissionTimeout time.Duration
 }
 
 // DefaultErrorPolicy returns production defaults for the error policy.
@@ -40,6 +46,7 @@ func DefaultErrorPolicy() ErrorPolicy {
 		DependencyDelay:  1 * time.Second,
 		DependencyJitter: 0,
 		PeriodicResync:   5 * time.Minute,
+		AdmissionTimeout: 3 * time.Second,
 	}
 }
 
@@ -50,5 +57,31 @@ func NewErrorPolicyFromConfig(cfg *config.Config) ErrorPolicy {
 		DependencyDelay:  cfg.DependencyDelay,
 		DependencyJitter: cfg.DependencyDelayJitter,
 		PeriodicResync:   cfg.PeriodicResync,
+		AdmissionTimeout: cfg.SchedulerAdmissionTimeout,
+	}
+}
+
+// BatchPolicy configures the upsert batching stage of a Processor.
+type BatchPolicy struct {
+	// Window is the maximum time an upsert waits for other upserts of the
+	// same entity type before the batch is written. Set to 0 to disable
+	// batching.
+	Window time.Duration
+
+	// Size is the maximum number of upserts per batch. A full batch is
+	// written immediately.
+	Size int
+}
+
+// Enabled reports whether upsert batching is enabled.
+func (p BatchPolicy) Enabled() bool {
+	return p.Window > 0 && p.Size > 1
+}
+
+// NewBatchPolicyFromConfig constructs a BatchPolicy from the operator config.
+func NewBatchPolicyFromConfig(cfg *config.Config) BatchPolicy {
+	return BatchPolicy{
+		Window: cfg.UpsertBatchWindow,
+		Size:   cfg.UpsertBatchSize,
 	}
 }
@@ -52,6 +52,8 @@ var _ = Describe("ErrorPolicy", func() {
 				DependencyDelay:       3 * time.Second,
 				DependencyDelayJitter: 5 * time.Second,
 				PeriodicResync:        30 * time.Second,
+
+				SchedulerAdmissionTimeout: 2 * time.Second,
 			}
 
 			policy := runtime.NewErrorPolicyFromConfig(cfg)
@@ -60,6 +62,7 @@ var _ = Describe("ErrorPolicy", func() {
 			Expect(policy.DependencyDelay).To(Equal(3 * time.Second))
 			Expect(policy.DependencyJitter).To(Equal(5 * time.Second))
 			Expect(policy.PeriodicResync).To(Equal(30 * time.Second))
+			Expect(policy.AdmissionTimeout).To(Equal(2 * time.Second))
 		})
 
 		It("preserves zero PeriodicResync (event-driven)", func() {
@@ -21,20 +21,64 @@ import (
 type Processor[T client.Object, D any, K any] struct {
 	translator Translator[T, D, K]
 	repository Repository[K, D]
+	batcher    *batcher[D]
+
+	// fingerprints is nil if skipping unchanged writes is disabled.
+	fingerprints FingerprintStore
+}
+
+// ProcessorOption configures optional behavior of a Processor.
+type ProcessorOption func(*processorOptions)
+
+type processorOptions struct {
+	batchPolicy  BatchPolicy
+	fingerprints FingerprintStore
+}
+
+// WithUpsertBatching enables batching of concurrent upserts according to
+// the given policy. It only takes effect if the repository implements
+// BatchRepository and the policy is enabled.
+func WithUpsertBatching(policy BatchPolicy) ProcessorOption {
+	return func(o *processorOptions) {
+		o.batchPolicy = policy
+	}
+}
+
+// WithFingerprints skips writing DTOs whose fingerprint matches the one
+// stored for their key after the last write. A nil store disables it.
+func WithFingerprints(store FingerprintStore) ProcessorOption {
+	return func(o *processorOptions) {
+		o.fingerprints = store
+	}
 }
 
 // NewProcessor creates a Processor wired with the given translator and repository.
 func NewProcessor[T client.Object, D any, K any](
 	translator Translator[T, D, K],
 	repository Repository[K, D],
+	opts ...ProcessorOption,
 ) *Processor[T, D, K] {
-	return &Processor[T, D, K]{
-		translator: translator,
-		repository: repository,
+	var options processorOptions
+	for _, opt := range opts {
+		opt(&options)
+	}
+
+	p := &Processor[T, D, K]{
+		translator:   translator,
+		repository:   repository,
+		fingerprints: options.fingerprints,
 	}
+	if batchRepo, ok := repository.(BatchRepository[K, D]); ok && options.batchPolicy.Enabled() {
+		p.batcher = newBatcher(options.batchPolicy, batchRepo.UpsertBatch)
+	}
+	return p
 }
 
 // Upsert runs the sync pipeline for a live object: ShouldSkip → Translate → Repository.Upsert.
+// With upsert batching enabled, the write is deferred to BatchRepository.UpsertBatch
+// together with the concurrent upserts of other objects.
+// With fingerprints enabled, ErrUnchanged is returned instead of writing a DTO
+// that equals the last one written for the same key.
 func (p *Processor[T, D, K]) Upsert(ctx context.Context, obj T) error {
 	if skip, reason := p.translator.ShouldSkip(obj); skip {
 		return fmt.Errorf("%s: %w", reason, ErrSkipSync)
@@ -43,6 +87,31 @@ func (p *Processor[T, D, K]) Upsert(ctx context.Context, obj T) error {
 	if err != nil {
 		return fmt.Errorf("translate: %w", err)
 	}
+	if p.fingerprints == nil {
+		return p.write(ctx, data)
+	}
+
+	key := FingerprintKey(p.translator.KeyFromObject(obj))
+	fingerprint, err := Fingerprint(data)
+	if err != nil {
+		// Not fatal, the DTO is just written every time.
+		return p.write(ctx, data)
+	}
+	if p.fingerprints.Matches(key, fingerprint) {
+		return ErrUnchanged
+	}
+	generation := p.fingerprints.Generation()
+	if err := p.write(ctx, data); err != nil {
+		return err
+	}
+	p.fingerprints.Store(key, fingerprint, generation)
+	return nil
+}
+
+func (p *Processor[T, D, K]) write(ctx context.Context, data D) error {
+	if p.batcher != nil {
+		return p.batcher.Submit(ctx, data)
+	}
 	return p.repository.Upsert(ctx, data)
 }
 
@@ -52,5 +121,11 @@ func (p *Processor[T, D, K]) Delete(ctx context.Context, req types.NamespacedNam
 	if err != nil {
 		return fmt.Errorf("derive delete key: %w", err)
 	}
-	return p.repository.Delete(ctx, key)
+	if err := p.repository.Delete(ctx, key); err != nil {
+		return err
+	}
+	if p.fingerprints != nil {
+		p.fingerprints.Invalidate(FingerprintKey(key))
+	}
+	return nil
 }
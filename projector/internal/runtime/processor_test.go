@@ -7,6 +7,8 @@ package runtime_test
 import (
 	"context"
 	"errors"
+	"sync"
+	"time"
 
 	"github.com/telekom/controlplane/projector/internal/runtime"
 
@@ -85,6 +87,42 @@ func (m *mockRepository) Delete(_ context.Context, key testKey) error {
 	return m.deleteErr
 }
 
+// mockBatchRepository implements runtime.BatchRepository for testing.
+type mockBatchRepository struct {
+	mockRepository
+
+	mutex   sync.Mutex
+	batches [][]*testData
+	// itemErrs maps item names to the error returned for that item.
+	itemErrs map[string]error
+}
+
+func (m *mockBatchRepository) UpsertBatch(_ context.Context, items []*testData) []error {
+	m.mutex.Lock()
+	defer m.mutex.Unlock()
+	m.batches = append(m.batches, items)
+	errs := make([]error, len(items))
+	for i, item := range items {
+		errs[i] = m.itemErrs[item.Name]
+	}
+	return errs
+}
+
+func (m *mockBatchRepository) Batches() [][]*testData {
+	m.mutex.Lock()
+	defer m.mutex.Unlock()
+	return m.batches
+}
+
+// sequenceTranslator translates each object into testData named like the object.
+type sequenceTranslator struct {
+	mockTranslator
+}
+
+func (m *sequenceTranslator) Translate(_ context.Context, obj *corev1.ConfigMap) (*testData, error) {
+	return &testData{Name: obj.Name}, nil
+}
+
 // --- tests ---
 
 var _ = Describe("Processor", func() {
@@ -207,3 +245,209 @@ var _ = Describe("Processor", func() {
 		})
 	})
 })
+
+var _ = Describe("Processor with upsert batching", func() {
+	var (
+		ctx        context.Context
+		translator *sequenceTranslator
+		repo       *mockBatchRepository
+	)
+
+	newObj := func(name string) *corev1.ConfigMap {
+		return &corev1.ConfigMap{ObjectMeta: metav1.ObjectMeta{Name: name, Namespace: "default"}}
+	}
+
+	upsertConcurrently := func(proc *runtime.Processor[*corev1.ConfigMap, *testData, testKey], names ...string) map[string]error {
+		var (
+			wg    sync.WaitGroup
+			mutex sync.Mutex
+			errs  = make(map[string]error, len(names))
+		)
+		for _, name := range names {
+			wg.Add(1)
+			go func() {
+				defer wg.Done()
+				err := proc.Upsert(ctx, newObj(name))
+				mutex.Lock()
+				errs[name] = err
+				mutex.Unlock()
+			}()
+		}
+		wg.Wait()
+		return errs
+	}
+
+	BeforeEach(func() {
+		ctx = context.Background()
+		translator = &sequenceTranslator{}
+		repo = &mockBatchRepository{itemErrs: map[string]error{}}
+	})
+
+	It("writes concurrent upserts within the window as one batch", func() {
+		proc := runtime.NewProcessor[*corev1.ConfigMap, *testData, testKey](translator, repo,
+			runtime.WithUpsertBatching(runtime.BatchPolicy{Window: 50 * time.Millisecond, Size: 100}))
+
+		errs := upsertConcurrently(proc, "a", "b", "c")
+		Expect(errs).To(HaveLen(3))
+		for _, err := range errs {
+			Expect(err).NotTo(HaveOccurred())
+		}
+
+		Expect(repo.Batches()).To(HaveLen(1))
+		Expect(repo.Batches()[0]).To(ConsistOf(&testData{Name: "a"}, &testData{Name: "b"}, &testData{Name: "c"}))
+		Expect(repo.upsertCalled).To(BeFalse())
+	})
+
+	It("writes a full batch without waiting for the window", func() {
+		proc := runtime.NewProcessor[*corev1.ConfigMap, *testData, testKey](translator, repo,
+			runtime.WithUpsertBatching(runtime.BatchPolicy{Window: time.Hour, Size: 2}))
+
+		errs := upsertConcurrently(proc, "a", "b")
+		Expect(errs).To(HaveKeyWithValue("a", BeNil()))
+		Expect(errs).To(HaveKeyWithValue("b", BeNil()))
+		Expect(repo.Batches()).To(HaveLen(1))
+	})
+
+	It("returns only the error of the own item", func() {
+		proc := runtime.NewProcessor[*corev1.ConfigMap, *testData, testKey](translator, repo,
+			runtime.WithUpsertBatching(runtime.BatchPolicy{Window: 50 * time.Millisecond, Size: 100}))
+		repo.itemErrs["b"] = runtime.WrapDependencyMissing("team", "missing")
+
+		errs := upsertConcurrently(proc, "a", "b", "c")
+		Expect(errs["a"]).NotTo(HaveOccurred())
+		Expect(runtime.IsDependencyMissing(errs["b"])).To(BeTrue())
+		Expect(errs["c"]).NotTo(HaveOccurred())
+	})
+
+	It("returns when the context of the caller is done", func() {
+		proc := runtime.NewProcessor[*corev1.ConfigMap, *testData, testKey](translator, repo,
+			runtime.WithUpsertBatching(runtime.BatchPolicy{Window: 100 * time.Millisecond, Size: 100}))
+		timeoutCtx, cancel := context.WithTimeout(ctx, 10*time.Millisecond)
+		defer cancel()
+
+		err := proc.Upsert(timeoutCtx, newObj("a"))
+		Expect(errors.Is(err, context.DeadlineExceeded)).To(BeTrue())
+		Eventually(repo.Batches).Should(HaveLen(1))
+	})
+
+	It("uses Upsert if batching is disabled", func() {
+		proc := runtime.NewProcessor[*corev1.ConfigMap, *testData, testKey](translator, repo,
+			runtime.WithUpsertBatching(runtime.BatchPolicy{Window: 0, Size: 100}))
+
+		Expect(proc.Upsert(ctx, newObj("a"))).To(Succeed())
+		Expect(repo.upsertCalled).To(BeTrue())
+		Expect(repo.Batches()).To(BeEmpty())
+	})
+
+	It("uses Upsert if the repository cannot upsert batches", func() {
+		plainRepo := &mockRepository{}
+		proc := runtime.NewProcessor[*corev1.ConfigMap, *testData, testKey](translator, plainRepo,
+			runtime.WithUpsertBatching(runtime.BatchPolicy{Window: time.Hour, Size: 100}))
+
+		Expect(proc.Upsert(ctx, newObj("a"))).To(Succeed())
+		Expect(plainRepo.upsertCalled).To(BeTrue())
+		Expect(plainRepo.upsertData).To(Equal(&testData{Name: "a"}))
+	})
+})
+
+// mapFingerprintStore implements runtime.FingerprintStore with a plain map.
+type mapFingerprintStore struct {
+	generation   uint64
+	fingerprints map[string]uint64
+	generations  map[string]uint64
+}
+
+func newMapFingerprintStore() *mapFingerprintStore {
+	return &mapFingerprintStore{
+		fingerprints: map[string]uint64{},
+		generations:  map[string]uint64{},
+	}
+}
+
+func (m *mapFingerprintStore) Generation() uint64 { return m.generation }
+
+func (m *mapFingerprintStore) Matches(key string, fingerprint uint64) bool {
+	fp, ok := m.fingerprints[key]
+	return ok && fp == fingerprint && m.generations[key] == m.generation
+}
+
+func (m *mapFingerprintStore) Store(key string, fingerprint, generation uint64) {
+	m.fingerprints[key] = fingerprint
+	m.generations[key] = generation
+}
+
+func (m *mapFingerprintStore) Invalidate(key string) {
+	delete(m.fingerprints, key)
+	m.generation++
+}
+
+var _ = Describe("Processor with fingerprints", func() {
+	var (
+		ctx        context.Context
+		translator *mockTranslator
+		repo       *mockRepository
+		store      *mapFingerprintStore
+		proc       *runtime.Processor[*corev1.ConfigMap, *testData, testKey]
+		obj        *corev1.ConfigMap
+	)
+
+	BeforeEach(func() {
+		ctx = context.Background()
+		translator = &mockTranslator{
+			translateData: &testData{Name: "a"},
+			keyFromObj:    "a",
+			keyFromDel:    "b",
+		}
+		repo = &mockRepository{}
+		store = newMapFingerprintStore()
+		proc = runtime.NewProcessor[*corev1.ConfigMap, *testData, testKey](translator, repo,
+			runtime.WithFingerprints(store))
+		obj = &corev1.ConfigMap{ObjectMeta: metav1.ObjectMeta{Name: "a", Namespace: "default"}}
+	})
+
+	It("returns ErrUnchanged instead of writing the same data again", func() {
+		Expect(proc.Upsert(ctx, obj)).To(Succeed())
+		Expect(repo.upsertCalled).To(BeTrue())
+
+		repo.upsertCalled = false
+		err := proc.Upsert(ctx, obj)
+		Expect(runtime.IsUnchanged(err)).To(BeTrue())
+		Expect(repo.upsertCalled).To(BeFalse())
+	})
+
+	It("writes changed data", func() {
+		Expect(proc.Upsert(ctx, obj)).To(Succeed())
+
+		repo.upsertCalled = false
+		translator.translateData = &testData{Name: "changed"}
+		Expect(proc.Upsert(ctx, obj)).To(Succeed())
+		Expect(repo.upsertCalled).To(BeTrue())
+	})
+
+	It("does not store the fingerprint of a failed write", func() {
+		repo.upsertErr = errors.New("db down")
+		Expect(proc.Upsert(ctx, obj)).NotTo(Succeed())
+
+		repo.upsertErr = nil
+		Expect(proc.Upsert(ctx, obj)).To(Succeed())
+		Expect(repo.upsertCalled).To(BeTrue())
+	})
+
+	It("writes all data again after a delete", func() {
+		Expect(proc.Upsert(ctx, obj)).To(Succeed())
+		Expect(proc.Delete(ctx, types.NamespacedName{Name: "b", Namespace: "default"}, nil)).To(Succeed())
+
+		repo.upsertCalled = false
+		Expect(proc.Upsert(ctx, obj)).To(Succeed())
+		Expect(repo.upsertCalled).To(BeTrue())
+	})
+})
+
+var _ = Describe("Fingerprint", func() {
+	It("is equal for equal data and differs for different data", func() {
+		a, err := runtime.Fingerprint(&testData{Name: "a"})
+		Expect(err).NotTo(HaveOccurred())
+		Expect(runtime.Fingerprint(&testData{Name: "a"})).To(Equal(a))
+		Expect(runtime.Fingerprint(&testData{Name: "b"})).NotTo(Equal(a))
+	})
+})
@@ -6,6 +6,7 @@ package runtime
 
 import (
 	"context"
+	"errors"
 	"fmt"
 	"math/rand/v2"
 	"time"
@@ -29,13 +30,17 @@ import (
 //   - privacy.DecisionContext wrapping (centralized, not per-handler)
 //   - Error classification and requeue policy
 //   - Delete cache lookup
+//   - Holding reconciles back until the bootstrap load completed
+//   - Admission by the shared Scheduler
 type ReadOnlyReconciler[T client.Object] struct {
-	client      client.Reader
-	processor   SyncProcessor[T]
-	deleteCache DeleteCacheReader
-	policy      ErrorPolicy
-	newObj      func() T
-	moduleName  string
+	client        client.Reader
+	processor     SyncProcessor[T]
+	deleteCache   DeleteCacheReader
+	bootstrapGate BootstrapGateReader
+	scheduler     *Scheduler
+	policy        ErrorPolicy
+	newObj        func() T
+	moduleName    string
 
 	// randFloat64 returns a random float64 in [0.0, 1.0). Exposed for
 	// deterministic testing; defaults to rand.Float64.
@@ -48,6 +53,38 @@ type DeleteCacheReader interface {
 	LoadAndDelete(key client.ObjectKey) client.Object
 }
 
+// BootstrapGateReader is the subset of BootstrapGate that the reconciler needs.
+// This avoids importing the infrastructure package directly.
+type BootstrapGateReader interface {
+	IsOpen() bool
+	ConsumeLoaded(module string, key client.ObjectKey, resourceVersion string) bool
+}
+
+// ReconcilerOption configures optional behavior of a ReadOnlyReconciler.
+type ReconcilerOption func(*reconcilerOptions)
+
+type reconcilerOptions struct {
+	bootstrapGate BootstrapGateReader
+	scheduler     *Scheduler
+}
+
+// WithBootstrapGate holds reconciles back until the gate is open. Objects
+// that the bootstrap already wrote at their current resourceVersion are not
+// upserted again.
+func WithBootstrapGate(gate BootstrapGateReader) ReconcilerOption {
+	return func(o *reconcilerOptions) {
+		o.bootstrapGate = gate
+	}
+}
+
+// WithScheduler lets each reconcile wait for admission by the given shared
+// Scheduler before it reads the object and writes it to the database.
+func WithScheduler(scheduler *Scheduler) ReconcilerOption {
+	return func(o *reconcilerOptions) {
+		o.scheduler = scheduler
+	}
+}
+
 // NewReadOnlyReconciler creates a ReadOnlyReconciler wired to the given
 // SyncProcessor and DeleteCache. The ErrorPolicy controls requeue behavior
 // for each error class and periodic resync.
@@ -58,15 +95,23 @@ func NewReadOnlyReconciler[T client.Object](
 	moduleName string,
 	newObj func() T,
 	policy ErrorPolicy,
+	opts ...ReconcilerOption,
 ) *ReadOnlyReconciler[T] {
+	var options reconcilerOptions
+	for _, opt := range opts {
+		opt(&options)
+	}
+
 	return &ReadOnlyReconciler[T]{
-		client:      reader,
-		processor:   processor,
-		deleteCache: deleteCache,
-		policy:      policy,
-		newObj:      newObj,
-		moduleName:  moduleName,
-		randFloat64: rand.Float64,
+		client:        reader,
+		processor:     processor,
+		deleteCache:   deleteCache,
+		bootstrapGate: options.bootstrapGate,
+		scheduler:     options.scheduler,
+		policy:        policy,
+		newObj:        newObj,
+		moduleName:    moduleName,
+		randFloat64:   rand.Float64,
 	}
 }
 
@@ -74,8 +119,11 @@ func NewReadOnlyReconciler[T client.Object](
 //   - Object exists -> processor.Upsert()
 //   - Object NotFound -> processor.Delete() with delete-cache lookup
 //   - ErrSkipSync -> log and requeue at SkipRequeue interval
+//   - ErrUnchanged -> success without a database write
 //   - ErrDependencyMissing -> requeue with DependencyDelay + jitter
 //   - ErrDeleteKeyLost -> log warning, do not requeue
+//   - Bootstrap pending -> requeue with DependencyDelay + jitter
+//   - Admission timeout -> requeue with DependencyDelay + jitter
 func (r *ReadOnlyReconciler[T]) Reconcile(ctx context.Context, req ctrl.Request) (ctrl.Result, error) {
 	logger := log.FromContext(ctx)
 	start := time.Now()
@@ -95,6 +143,23 @@ func (r *ReadOnlyReconciler[T]) Reconcile(ctx context.Context, req ctrl.Request)
 // reconcileInner performs the actual reconciliation logic and returns the
 // result, classified outcome label, and error.
 func (r *ReadOnlyReconciler[T]) reconcileInner(ctx context.Context, req ctrl.Request, logger logr.Logger) (ctrl.Result, string, error) {
+	if r.bootstrapGate != nil && !r.bootstrapGate.IsOpen() {
+		logger.V(1).Info("bootstrap load in progress, requeuing")
+		return ctrl.Result{RequeueAfter: r.dependencyRequeue()}, metrics.OutcomeBootstrapPending, nil
+	}
+
+	if r.scheduler != nil {
+		release, err := r.acquire(ctx)
+		if errors.Is(err, context.DeadlineExceeded) {
+			logger.V(1).Info("not admitted in time, requeuing")
+			return ctrl.Result{RequeueAfter: r.dependencyRequeue()}, metrics.OutcomeAdmissionTimeout, nil
+		}
+		if err != nil {
+			return ctrl.Result{}, metrics.OutcomeError, fmt.Errorf("waiting for admission: %w", err)
+		}
+		defer release()
+	}
+
 	obj := r.newObj()
 
 	err := r.client.Get(ctx, req.NamespacedName, obj)
@@ -135,7 +200,16 @@ func (r *ReadOnlyReconciler[T]) reconcileInner(ctx context.Context, req ctrl.Req
 		return ctrl.Result{}, metrics.OutcomeError, err
 	}
 
+	if r.bootstrapGate != nil && r.bootstrapGate.ConsumeLoaded(r.moduleName, req.NamespacedName, obj.GetResourceVersion()) {
+		logger.V(1).Info("object unchanged since bootstrap load, skipping upsert")
+		return r.successResult(), metrics.OutcomeBootstrapped, nil
+	}
+
 	if upsertErr := r.processor.Upsert(ctx, obj); upsertErr != nil {
+		if IsUnchanged(upsertErr) {
+			logger.V(1).Info("translated data unchanged, skipping upsert")
+			return r.successResult(), metrics.OutcomeUnchanged, nil
+		}
 		if IsSkipSync(upsertErr) {
 			logger.V(1).Info("CR lacks required data, skipping sync",
 				"key", req.NamespacedName,
@@ -158,6 +232,17 @@ func (r *ReadOnlyReconciler[T]) reconcileInner(ctx context.Context, req ctrl.Req
 	return r.successResult(), metrics.OutcomeSuccess, nil
 }
 
+// acquire waits for admission by the scheduler for at most AdmissionTimeout,
+// so that a long wait does not use up the time of the database work.
+func (r *ReadOnlyReconciler[T]) acquire(ctx context.Context) (func(), error) {
+	if r.policy.AdmissionTimeout > 0 {
+		var cancel context.CancelFunc
+		ctx, cancel = context.WithTimeout(ctx, r.policy.AdmissionTimeout)
+		defer cancel()
+	}
+	return r.scheduler.Acquire(ctx, r.moduleName)
+}
+
 // dependencyRequeue returns DependencyDelay plus a random jitter in
 // [0, DependencyJitter). When DependencyJitter is 0, no jitter is applied.
 func (r *ReadOnlyReconciler[T]) dependencyRequeue() time.Duration {
@@ -8,6 +8,7 @@ import (
 	"context"
 	"time"
 
+	"github.com/telekom/controlplane/projector/internal/infrastructure"
 	"github.com/telekom/controlplane/projector/internal/runtime"
 
 	. "github.com/onsi/ginkgo/v2"
@@ -290,6 +291,22 @@ var _ = Describe("ReadOnlyReconciler", func() {
 		})
 	})
 
+	Describe("unchanged data", func() {
+		It("treats ErrUnchanged as success and schedules the periodic resync", func() {
+			fc := newFakeClient(newConfigMap("test-cm", "default"))
+			proc.upsertErr = runtime.ErrUnchanged
+			randVal := 0.5
+			rec := buildReconciler(fc, proc, runtime.ErrorPolicy{
+				DependencyDelay: 2 * time.Second,
+				PeriodicResync:  10 * time.Minute,
+			}, &randVal)
+
+			result, err := rec.Reconcile(ctx, req)
+			Expect(err).NotTo(HaveOccurred())
+			Expect(result.RequeueAfter).To(Equal(10 * time.Minute))
+		})
+	})
+
 	Describe("ErrorPolicy wiring", func() {
 		It("uses the provided policy, not DefaultErrorPolicy", func() {
 			cm := newConfigMap("test-cm", "default")
@@ -309,4 +326,111 @@ var _ = Describe("ReadOnlyReconciler", func() {
 			Expect(result.RequeueAfter).To(Equal(42 * time.Second))
 		})
 	})
+
+	Describe("bootstrap gate", func() {
+		var gate *infrastructure.BootstrapGate
+
+		BeforeEach(func() {
+			gate = infrastructure.NewBootstrapGate()
+		})
+
+		buildGatedReconciler := func(fc client.Reader, randVal *float64) *runtime.ReadOnlyReconciler[*corev1.ConfigMap] {
+			rec := runtime.NewReadOnlyReconciler(
+				fc,
+				proc,
+				&mockDeleteCache{},
+				"test",
+				func() *corev1.ConfigMap { return &corev1.ConfigMap{} },
+				runtime.ErrorPolicy{DependencyDelay: 2 * time.Second},
+				runtime.WithBootstrapGate(gate),
+			)
+			rec.SetRandFloat64(func() float64 { return *randVal })
+			return rec
+		}
+
+		It("requeues without processing while the gate is closed", func() {
+			randVal := 0.0
+			rec := buildGatedReconciler(newFakeClient(newConfigMap("test-cm", "default")), &randVal)
+
+			result, err := rec.Reconcile(ctx, req)
+			Expect(err).NotTo(HaveOccurred())
+			Expect(result.RequeueAfter).To(Equal(2 * time.Second))
+			Expect(proc.upsertCalled).To(BeFalse())
+		})
+
+		It("skips the upsert of objects loaded by the bootstrap", func() {
+			fc := newFakeClient(newConfigMap("test-cm", "default"))
+			cm := &corev1.ConfigMap{}
+			Expect(fc.Get(ctx, req.NamespacedName, cm)).To(Succeed())
+			gate.MarkLoaded("test", req.NamespacedName, cm.GetResourceVersion())
+			gate.Open()
+			randVal := 0.0
+			rec := buildGatedReconciler(fc, &randVal)
+
+			_, err := rec.Reconcile(ctx, req)
+			Expect(err).NotTo(HaveOccurred())
+			Expect(proc.upsertCalled).To(BeFalse())
+
+			// Later reconciles of the same object are processed.
+			_, err = rec.Reconcile(ctx, req)
+			Expect(err).NotTo(HaveOccurred())
+			Expect(proc.upsertCalled).To(BeTrue())
+		})
+
+		It("upserts objects that changed since the bootstrap load", func() {
+			gate.MarkLoaded("test", req.NamespacedName, "1")
+			gate.Open()
+			randVal := 0.0
+			rec := buildGatedReconciler(newFakeClient(newConfigMap("test-cm", "default")), &randVal)
+
+			_, err := rec.Reconcile(ctx, req)
+			Expect(err).NotTo(HaveOccurred())
+			Expect(proc.upsertCalled).To(BeTrue())
+		})
+	})
+
+	Describe("scheduler admission", func() {
+		var scheduler *runtime.Scheduler
+
+		BeforeEach(func() {
+			scheduler = runtime.NewScheduler(1, map[string]int{"test": 0}, 0)
+		})
+
+		buildScheduledReconciler := func(policy runtime.ErrorPolicy) *runtime.ReadOnlyReconciler[*corev1.ConfigMap] {
+			rec := runtime.NewReadOnlyReconciler(
+				newFakeClient(newConfigMap("test-cm", "default")),
+				proc,
+				&mockDeleteCache{},
+				"test",
+				func() *corev1.ConfigMap { return &corev1.ConfigMap{} },
+				policy,
+				runtime.WithScheduler(scheduler),
+			)
+			rec.SetRandFloat64(func() float64 { return 0 })
+			return rec
+		}
+
+		It("upserts once admitted", func() {
+			rec := buildScheduledReconciler(runtime.ErrorPolicy{AdmissionTimeout: time.Second})
+
+			_, err := rec.Reconcile(ctx, req)
+			Expect(err).NotTo(HaveOccurred())
+			Expect(proc.upsertCalled).To(BeTrue())
+		})
+
+		It("requeues without an error if it is not admitted in time", func() {
+			release, err := scheduler.Acquire(ctx, "test")
+			Expect(err).NotTo(HaveOccurred())
+			defer release()
+			rec := buildScheduledReconciler(runtime.ErrorPolicy{
+				DependencyDelay:  2 * time.Second,
+				AdmissionTimeout: 10 * time.Millisecond,
+			})
+
+			result, err := rec.Reconcile(ctx, req)
+			Expect(err).NotTo(HaveOccurred())
+			Expect(result.RequeueAfter).To(Equal(2 * time.Second))
+			Expect(proc.upsertCalled).To(BeFalse())
+		})
+	})
 })
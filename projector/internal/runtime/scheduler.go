@@ -0,0 +1,167 @@
+// Copyright 2026 Deutsche Telekom IT GmbH
+//
+// SPDX-License-Identifier: Apache-2.0
+
+package runtime
+
+import (
+	"context"
+	"slices"
+	"strconv"
+	"sync"
+	"time"
+
+	"github.com/telekom/controlplane/projector/internal/metrics"
+)
+
+// Scheduler admits the reconciles of all modules into their database phase
+// under a single concurrency budget. When the budget is exhausted, waiting
+// reconciles are admitted by dependency tier, lower tiers first and in
+// arrival order within a tier. This way a burst of e.g. Application updates
+// is written before the ApiExposures and ApiSubscriptions that resolve their
+// IDs, which then find them in the EdgeCache.
+//
+// So that a steady load of lower tiers cannot starve the higher ones, a
+// waiting reconcile is treated as one tier lower for every aging interval it
+// waited. A reconcile of tier n thus competes like a new reconcile of tier 0
+// after n aging intervals.
+//
+// The controller-runtime work queues still deduplicate pending keys per
+// module. Since a reconcile reads its object only after it was admitted, all
+// events that arrive while it waits are coalesced into a single write.
+type Scheduler struct {
+	capacity int
+	tiers    map[string]int
+	// lastTier is the tier of modules that are not part of tiers.
+	lastTier int
+	// aging is the wait after which a reconcile is preferred like one of the
+	// next lower tier. Zero admits strictly by tier.
+	aging time.Duration
+
+	mutex    sync.Mutex
+	inFlight int
+	waiting  [][]*schedulerWaiter // tier -> FIFO of waiting reconciles
+}
+
+type schedulerWaiter struct {
+	since    time.Time
+	admitted chan struct{}
+}
+
+// NewScheduler creates a Scheduler that admits up to capacity reconciles at
+// once. tiers maps module names to their dependency tier, starting at 0.
+// Modules without a tier are admitted last. aging is the wait after which a
+// reconcile is preferred like one of the next lower tier.
+func NewScheduler(capacity int, tiers map[string]int, aging time.Duration) *Scheduler {
+	lastTier := 0
+	for _, tier := range tiers {
+		lastTier = max(lastTier, tier+1)
+	}
+	return &Scheduler{
+		capacity: max(capacity, 1),
+		tiers:    tiers,
+		lastTier: lastTier,
+		aging:    max(aging, 0),
+		waiting:  make([][]*schedulerWaiter, lastTier+1),
+	}
+}
+
+// Capacity returns the number of reconciles that are admitted at once.
+func (s *Scheduler) Capacity() int {
+	return s.capacity
+}
+
+// Acquire blocks until a reconcile of the given module is admitted or ctx is
+// done. On success, the returned release function must be called once the
+// reconcile finished its database work.
+func (s *Scheduler) Acquire(ctx context.Context, module string) (release func(), err error) {
+	tier := s.tierOf(module)
+	label := strconv.Itoa(tier)
+	start := time.Now()
+
+	s.mutex.Lock()
+	if s.inFlight < s.capacity && !s.hasWaiting() {
+		s.inFlight++
+		s.mutex.Unlock()
+		metrics.SchedulerWaitDuration.WithLabelValues(label).Observe(0)
+		return s.release, nil
+	}
+	w := &schedulerWaiter{since: start, admitted: make(chan struct{})}
+	s.waiting[tier] = append(s.waiting[tier], w)
+	metrics.SchedulerQueueDepth.WithLabelValues(label).Inc()
+	s.mutex.Unlock()
+
+	select {
+	case <-w.admitted:
+		metrics.SchedulerWaitDuration.WithLabelValues(label).Observe(time.Since(start).Seconds())
+		return s.release, nil
+	case <-ctx.Done():
+	}
+
+	s.mutex.Lock()
+	select {
+	case <-w.admitted:
+		// Admitted concurrently with the cancellation: hand the slot on.
+		s.mutex.Unlock()
+		s.release()
+	default:
+		s.waiting[tier] = slices.DeleteFunc(s.waiting[tier], func(other *schedulerWaiter) bool { return other == w })
+		metrics.SchedulerQueueDepth.WithLabelValues(label).Dec()
+		s.mutex.Unlock()
+	}
+	return nil, ctx.Err()
+}
+
+// release passes the slot of a finished reconcile to the waiting reconcile
+// with the lowest aged tier, or frees it if none is waiting.
+func (s *Scheduler) release() {
+	s.mutex.Lock()
+	defer s.mutex.Unlock()
+	tier := s.next(time.Now())
+	if tier < 0 {
+		s.inFlight--
+		return
+	}
+	w := s.waiting[tier][0]
+	s.waiting[tier] = s.waiting[tier][1:]
+	metrics.SchedulerQueueDepth.WithLabelValues(strconv.Itoa(tier)).Dec()
+	close(w.admitted)
+}
+
+// next returns the tier whose oldest waiting reconcile is admitted next, or
+// -1 if none is waiting. It compares the tiers reduced by the number of aging
+// intervals waited; on a tie, the reconcile that waited longer is admitted.
+// The mutex must be held.
+func (s *Scheduler) next(now time.Time) int {
+	next, nextPriority := -1, 0
+	for tier, queue := range s.waiting {
+		if len(queue) == 0 {
+			continue
+		}
+		priority := tier
+		if s.aging > 0 {
+			priority -= int(now.Sub(queue[0].since) / s.aging)
+		}
+		if next < 0 || priority < nextPriority ||
+			(priority == nextPriority && queue[0].since.Before(s.waiting[next][0].since)) {
+			next, nextPriority = tier, priority
+		}
+	}
+	return next
+}
+
+func (s *Scheduler) hasWaiting() bool {
+	for _, queue := range s.waiting {
+		if len(queue) > 0 {
+			return true
+		}
+	}
+	return false
+}
+
+func (s *Scheduler) tierOf(module string) int {
+	if tier, ok := s.tiers[module]; ok {
+		return tier
+	}
+	return s.lastTier
+}
@@ -0,0 +1,118 @@
+// Copyright 2026 Deutsche Telekom IT GmbH
+//
+// SPDX-License-Identifier: Apache-2.0
+
+package runtime_test
+
+import (
+	"context"
+	"sync"
+	"time"
+
+	"github.com/prometheus/client_golang/prometheus/testutil"
+
+	"github.com/telekom/controlplane/projector/internal/metrics"
+	"github.com/telekom/controlplane/projector/internal/runtime"
+
+	. "github.com/onsi/ginkgo/v2"
+	. "github.com/onsi/gomega"
+)
+
+var _ = Describe("Scheduler", func() {
+	var (
+		ctx       context.Context
+		scheduler *runtime.Scheduler
+	)
+
+	BeforeEach(func() {
+		ctx = context.Background()
+		scheduler = runtime.NewScheduler(1, map[string]int{"zone": 0, "team": 1, "application": 2}, 0)
+	})
+
+	// acquireAsync acquires a slot for module in the background and sends
+	// the module name on admitted once it was admitted.
+	acquireAsync := func(module string, admitted chan<- string, releases *sync.WaitGroup) {
+		releases.Add(1)
+		go func() {
+			defer GinkgoRecover()
+			release, err := scheduler.Acquire(ctx, module)
+			Expect(err).NotTo(HaveOccurred())
+			admitted <- module
+			release()
+			releases.Done()
+		}()
+	}
+
+	It("admits reconciles immediately while below capacity", func() {
+		release, err := scheduler.Acquire(ctx, "team")
+		Expect(err).NotTo(HaveOccurred())
+		release()
+
+		release, err = scheduler.Acquire(ctx, "team")
+		Expect(err).NotTo(HaveOccurred())
+		release()
+	})
+
+	It("admits waiting reconciles of lower tiers first", func() {
+		release, err := scheduler.Acquire(ctx, "zone")
+		Expect(err).NotTo(HaveOccurred())
+
+		admitted := make(chan string, 3)
+		var releases sync.WaitGroup
+		acquireAsync("application", admitted, &releases)
+		Eventually(func() float64 {
+			return testutil.ToFloat64(metrics.SchedulerQueueDepth.WithLabelValues("2"))
+		}).Should(BeNumerically(">=", 1))
+		acquireAsync("unknown", admitted, &releases)
+		acquireAsync("team", admitted, &releases)
+		Eventually(func() float64 {
+			return testutil.ToFloat64(metrics.SchedulerQueueDepth.WithLabelValues("1"))
+		}).Should(BeNumerically(">=", 1))
+		Eventually(func() float64 {
+			return testutil.ToFloat64(metrics.SchedulerQueueDepth.WithLabelValues("3"))
+		}).Should(BeNumerically(">=", 1))
+
+		release()
+		releases.Wait()
+		Expect([]string{<-admitted, <-admitted, <-admitted}).To(Equal([]string{"team", "application", "unknown"}))
+	})
+
+	It("admits reconciles of higher tiers that waited long enough first", func() {
+		scheduler = runtime.NewScheduler(1, map[string]int{"zone": 0, "team": 1, "application": 2}, 20*time.Millisecond)
+		release, err := scheduler.Acquire(ctx, "zone")
+		Expect(err).NotTo(HaveOccurred())
+
+		admitted := make(chan string, 2)
+		var releases sync.WaitGroup
+		acquireAsync("application", admitted, &releases)
+		Eventually(func() float64 {
+			return testutil.ToFloat64(metrics.SchedulerQueueDepth.WithLabelValues("2"))
+		}).Should(BeNumerically(">=", 1))
+		// After more than two aging intervals, application is preferred like tier 0.
+		time.Sleep(100 * time.Millisecond)
+		acquireAsync("zone", admitted, &releases)
+		Eventually(func() float64 {
+			return testutil.ToFloat64(metrics.SchedulerQueueDepth.WithLabelValues("0"))
+		}).Should(BeNumerically(">=", 1))
+
+		release()
+		releases.Wait()
+		Expect([]string{<-admitted, <-admitted}).To(Equal([]string{"application", "zone"}))
+	})
+
+	It("returns when the context is done while waiting", func() {
+		release, err := scheduler.Acquire(ctx, "zone")
+		Expect(err).NotTo(HaveOccurred())
+
+		waitCtx, cancel := context.WithTimeout(ctx, 10*time.Millisecond)
+		defer cancel()
+		_, err = scheduler.Acquire(waitCtx, "team")
+		Expect(err).To(MatchError(context.DeadlineExceeded))
+
+		// The abandoned wait does not take the slot.
+		release()
+		release, err = scheduler.Acquire(ctx, "team")
+		Expect(err).NotTo(HaveOccurred())
+		release()
+	})
+})
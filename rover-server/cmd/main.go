@@ -39,7 +39,13 @@ func main() {
 	rootCtx := logr.NewContext(context.Background(), log.Log)
 
 	stores := store.NewStores(rootCtx, kconfig.GetConfigOrDie(),
-		inmemory.DatabaseOpts{Filepath: cfg.Database.Filepath, ReduceMemory: cfg.Database.ReduceMemory},
+		inmemory.DatabaseOpts{
+			Filepath:        cfg.Database.Filepath,
+			ReduceMemory:    cfg.Database.ReduceMemory,
+			DecodeCacheSize: cfg.Database.DecodeCacheSize,
+			BatchWindow:     cfg.Database.BatchWindow,
+			StaleReady:      cfg.Database.StaleReady,
+		},
 		inmemory.InformerOpts{DisableCache: cfg.Informer.DisableCache},
 	)
 
@@ -27,6 +27,12 @@ type DatabaseConfig struct {
 	Filepath string `mapstructure:"filepath"`
 	// ReduceMemory trades memory for CPU; see common-server docs.
 	ReduceMemory bool `mapstructure:"reduceMemory"`
+	// DecodeCacheSize is the number of decoded objects cached per store; 0 disables the cache.
+	DecodeCacheSize int `mapstructure:"decodeCacheSize"`
+	// BatchWindow buffers informer events and writes them in batches; 0 writes every event directly.
+	BatchWindow time.Duration `mapstructure:"batchWindow"`
+	// StaleReady serves the on-disk data of the previous run at startup; requires Filepath.
+	StaleReady bool `mapstructure:"staleReady"`
 }
 
 type InformerConfig struct {
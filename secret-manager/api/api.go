@@ -8,11 +8,15 @@ import (
 	"context"
 	"encoding/json"
 	"fmt"
+	"maps"
 	"net/http"
+	"slices"
 	"strings"
+	"sync"
 
 	"github.com/telekom/controlplane/common-server/pkg/client"
 	"github.com/telekom/controlplane/secret-manager/api/gen"
+	"golang.org/x/sync/errgroup"
 )
 
 const (
@@ -27,6 +31,11 @@ const (
 
 	// KeywordRotate is a special keyword to indicate that the secret should be rotated.
 	KeywordRotate = "rotate"
+
+	// maxSecretsPerRequest is the maximum number of secrets the secret manager returns for a single list request.
+	maxSecretsPerRequest = 10
+	// maxParallelRequests is the maximum number of list requests GetMany sends in parallel.
+	maxParallelRequests = 4
 )
 
 var (
@@ -77,6 +86,9 @@ func WithReplaceStrategy() OnboardingOption {
 
 type SecretsApi interface {
 	Get(ctx context.Context, secretID string) (value string, err error)
+	// GetMany returns the values of all given secrets keyed by the secretID as it was passed in.
+	// It fails if any of the secrets cannot be found.
+	GetMany(ctx context.Context, secretIDs []string) (values map[string]string, err error)
 	Set(ctx context.Context, secretID string, secretValue string) (newID string, err error)
 	Rotate(ctx context.Context, secretID string) (newID string, err error)
 }
@@ -127,6 +139,65 @@ func (s *secretManagerAPI) Get(ctx context.Context, secretID string) (value stri
 		return "", handleError(res.StatusCode(), string(res.Body))
 	}
 }
+
+func (s *secretManagerAPI) GetMany(ctx context.Context, secretIDs []string) (values map[string]string, err error) {
+	secretIDs = slices.Compact(slices.Sorted(slices.Values(secretIDs)))
+	values = make(map[string]string, len(secretIDs))
+	if len(secretIDs) == 0 {
+		return values, nil
+	}
+
+	var mutex sync.Mutex
+	g, gctx := errgroup.WithContext(ctx)
+	g.SetLimit(maxParallelRequests)
+	for chunk := range slices.Chunk(secretIDs, maxSecretsPerRequest) {
+		g.Go(func() error {
+			chunkValues, err := s.getChunk(gctx, chunk)
+			if err != nil {
+				return err
+			}
+			mutex.Lock()
+			maps.Copy(values, chunkValues)
+			mutex.Unlock()
+			return nil
+		})
+	}
+	if err := g.Wait(); err != nil {
+		return nil, err
+	}
+	return values, nil
+}
+
+// getChunk fetches at most maxSecretsPerRequest secrets with a single request.
+// The secret manager returns the secrets in the same order as they were requested.
+func (s *secretManagerAPI) getChunk(ctx context.Context, secretIDs []string) (map[string]string, error) {
+	ids := make(gen.QuerySecretId, len(secretIDs))
+	for i, secretID := range secretIDs {
+		ids[i], _ = FromRef(secretID)
+	}
+	res, err := s.client.ListSecretsWithResponse(ctx, &gen.ListSecretsParams{SecretId: &ids})
+	if err != nil {
+		return nil, fmt.Errorf("secret-manager request failed for %d secrets: %w", len(ids), client.RetryableErrorf("network error: %s", err))
+	}
+	switch res.StatusCode() {
+	case http.StatusOK:
+		if len(res.JSON200.Items) != len(secretIDs) {
+			return nil, client.BlockedErrorf("unexpected number of secrets: requested %d, got %d", len(secretIDs), len(res.JSON200.Items))
+		}
+		values := make(map[string]string, len(secretIDs))
+		for i, secretID := range secretIDs {
+			values[secretID] = res.JSON200.Items[i].Value
+		}
+		return values, nil
+	case http.StatusNotFound:
+		return nil, ErrNotFound
+	case http.StatusUnauthorized:
+		return nil, client.BlockedErrorf("unauthorized (%d): %s", res.StatusCode(), string(res.Body))
+	default:
+		return nil, handleError(res.StatusCode(), string(res.Body))
+	}
+}
+
 func (s *secretManagerAPI) Set(ctx context.Context, secretID string, secretValue string) (newID string, err error) {
 	// Remove the tags from the secret ID if it is a placeholder.
 	// If it is not a placeholder, we just assume that it is a valid secret ID.
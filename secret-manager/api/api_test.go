@@ -6,7 +6,9 @@ package api_test
 
 import (
 	"context"
+	"fmt"
 	"net/http"
+	"sync"
 
 	. "github.com/onsi/ginkgo/v2"
 	. "github.com/onsi/gomega"
@@ -164,4 +166,61 @@ var _ = Describe("API Wrapper", func() {
 			Expect(capturedBody.Strategy).To(BeNil())
 		})
 	})
+
+	Describe("GetMany", func() {
+		echoSecrets := func(_ context.Context, params *gen.ListSecretsParams, _ ...gen.RequestEditorFn) (*gen.ListSecretsResponse, error) {
+			items := make([]gen.Secret, 0, len(*params.SecretId))
+			for _, id := range *params.SecretId {
+				items = append(items, gen.Secret{Id: id, Value: "value-of-" + id})
+			}
+			return &gen.ListSecretsResponse{
+				HTTPResponse: &http.Response{StatusCode: 200},
+				JSON200:      &gen.SecretListReponse{Items: items},
+			}, nil
+		}
+
+		It("should fetch the secrets in chunks", func() {
+			var mutex sync.Mutex
+			var requested [][]string
+			mockClient.EXPECT().
+				ListSecretsWithResponse(mock.Anything, mock.Anything).
+				Run(func(_ context.Context, params *gen.ListSecretsParams, _ ...gen.RequestEditorFn) {
+					mutex.Lock()
+					defer mutex.Unlock()
+					requested = append(requested, *params.SecretId)
+				}).
+				RunAndReturn(echoSecrets).
+				Times(2)
+
+			secretIDs := []string{}
+			for i := range 12 {
+				secretIDs = append(secretIDs, api.ToRef(fmt.Sprintf("env:team:app:secret%02d:", i)))
+			}
+			secretIDs = append(secretIDs, secretIDs[0])
+
+			values, err := sut.GetMany(ctx, secretIDs)
+			Expect(err).ToNot(HaveOccurred())
+			Expect(values).To(HaveLen(12))
+			Expect(values).To(HaveKeyWithValue("$<env:team:app:secret00:>", "value-of-env:team:app:secret00:"))
+			Expect(values).To(HaveKeyWithValue("$<env:team:app:secret11:>", "value-of-env:team:app:secret11:"))
+			Expect(requested).To(ConsistOf(HaveLen(10), HaveLen(2)))
+		})
+
+		It("should not send a request without secrets", func() {
+			values, err := sut.GetMany(ctx, nil)
+			Expect(err).ToNot(HaveOccurred())
+			Expect(values).To(BeEmpty())
+		})
+
+		It("should return ErrNotFound if a secret does not exist", func() {
+			mockClient.EXPECT().
+				ListSecretsWithResponse(mock.Anything, mock.Anything).
+				Return(&gen.ListSecretsResponse{
+					HTTPResponse: &http.Response{StatusCode: 404},
+				}, nil)
+
+			_, err := sut.GetMany(ctx, []string{"env:team:app:foo:", "env:team:app:bar:"})
+			Expect(err).To(Equal(api.ErrNotFound))
+		})
+	})
 })
@@ -0,0 +1,310 @@
+// Copyright 2025 Deutsche Telekom IT GmbH
+//
+// SPDX-License-Identifier: Apache-2.0
+
+package api
+
+import (
+	"container/list"
+	"context"
+	"strings"
+	"sync"
+	"time"
+
+	"github.com/telekom/controlplane/secret-manager/api/metrics"
+	"golang.org/x/sync/singleflight"
+)
+
+// checksumSeparator separates the checksum, which is always the last part of a secret ID.
+const checksumSeparator = ":"
+
+type CacheOptions struct {
+	TTL      time.Duration
+	MaxBytes int64
+}
+
+type CacheOption func(*CacheOptions)
+
+// WithCacheTTL sets the time-to-live for cached secret values.
+func WithCacheTTL(ttl time.Duration) CacheOption {
+	return func(o *CacheOptions) {
+		o.TTL = ttl
+	}
+}
+
+// WithCacheMaxBytes sets the maximum size of the cache in bytes.
+// The size of each entry is the size of the secret value plus the size of its ID.
+func WithCacheMaxBytes(maxBytes int64) CacheOption {
+	return func(o *CacheOptions) {
+		o.MaxBytes = maxBytes
+	}
+}
+
+func defaultCacheOptions() *CacheOptions {
+	return &CacheOptions{
+		TTL:      5 * time.Minute,
+		MaxBytes: 10 << 20, // 10MB
+	}
+}
+
+var _ SecretManager = (*cachedSecretManager)(nil)
+
+// cachedSecretManager caches the secret values returned by the wrapped SecretManager in-process.
+// Entries are keyed by the secret ID without its checksum. If a secret is requested with a
+// different checksum than the cached one, the cached value is discarded and fetched again.
+type cachedSecretManager struct {
+	SecretManager
+	cache *secretCache
+	group singleflight.Group
+}
+
+// NewCachedSecretManager wraps the given SecretManager with an in-process cache for secret values.
+// Concurrent requests for the same secret are deduplicated.
+// Writes through this SecretManager invalidate the affected cache entries.
+func NewCachedSecretManager(api SecretManager, opts ...CacheOption) SecretManager {
+	options := defaultCacheOptions()
+	for _, opt := range opts {
+		opt(options)
+	}
+	return &cachedSecretManager{
+		SecretManager: api,
+		cache:         newSecretCache(options.TTL, options.MaxBytes),
+	}
+}
+
+func (c *cachedSecretManager) Get(ctx context.Context, secretID string) (value string, err error) {
+	secretID, _ = FromRef(secretID)
+	if value, ok := c.cache.Get(secretID); ok {
+		return value, nil
+	}
+
+	// Use context.WithoutCancel so that if the first caller's context is
+	// cancelled, other callers sharing this singleflight call are not affected.
+	result, err, shared := c.group.Do(secretID, func() (any, error) {
+		value, err := c.SecretManager.Get(context.WithoutCancel(ctx), secretID)
+		if err != nil {
+			return nil, err
+		}
+		c.cache.Put(secretID, value)
+		return value, nil
+	})
+	if err != nil {
+		return "", err
+	}
+	if shared {
+		metrics.RecordSingleflightDedup("get")
+	}
+	return result.(string), nil
+}
+
+func (c *cachedSecretManager) GetMany(ctx context.Context, secretIDs []string) (values map[string]string, err error) {
+	values = make(map[string]string, len(secretIDs))
+	var missing []string
+	for _, secretID := range secretIDs {
+		id, _ := FromRef(secretID)
+		if value, ok := c.cache.Get(id); ok {
+			values[secretID] = value
+			continue
+		}
+		missing = append(missing, secretID)
+	}
+	if len(missing) == 0 {
+		return values, nil
+	}
+
+	fetched, err := c.SecretManager.GetMany(ctx, missing)
+	if err != nil {
+		return nil, err
+	}
+	for secretID, value := range fetched {
+		id, _ := FromRef(secretID)
+		c.cache.Put(id, value)
+		values[secretID] = value
+	}
+	return values, nil
+}
+
+func (c *cachedSecretManager) Set(ctx context.Context, secretID string, secretValue string) (newID string, err error) {
+	id, _ := FromRef(secretID)
+	defer c.cache.InvalidateRelated(secretKey(id))
+	return c.SecretManager.Set(ctx, secretID, secretValue)
+}
+
+func (c *cachedSecretManager) Rotate(ctx context.Context, secretID string) (newID string, err error) {
+	id, _ := FromRef(secretID)
+	defer c.cache.InvalidateRelated(secretKey(id))
+	return c.SecretManager.Rotate(ctx, secretID)
+}
+
+func (c *cachedSecretManager) UpsertEnvironment(ctx context.Context, envID string, opts ...OnboardingOption) (availableSecrets map[string]string, err error) {
+	defer c.cache.InvalidatePrefix(envID + checksumSeparator)
+	return c.SecretManager.UpsertEnvironment(ctx, envID, opts...)
+}
+
+func (c *cachedSecretManager) UpsertTeam(ctx context.Context, envID, teamID string, opts ...OnboardingOption) (availableSecrets map[string]string, err error) {
+	defer c.cache.InvalidatePrefix(envID + checksumSeparator + teamID + checksumSeparator)
+	return c.SecretManager.UpsertTeam(ctx, envID, teamID, opts...)
+}
+
+func (c *cachedSecretManager) UpsertApplication(ctx context.Context, envID, teamID, appID string, opts ...OnboardingOption) (availableSecrets map[string]string, err error) {
+	defer c.cache.InvalidatePrefix(envID + checksumSeparator + teamID + checksumSeparator + appID + checksumSeparator)
+	return c.SecretManager.UpsertApplication(ctx, envID, teamID, appID, opts...)
+}
+
+func (c *cachedSecretManager) DeleteEnvironment(ctx context.Context, envID string) (err error) {
+	defer c.cache.InvalidatePrefix(envID + checksumSeparator)
+	return c.SecretManager.DeleteEnvironment(ctx, envID)
+}
+
+func (c *cachedSecretManager) DeleteTeam(ctx context.Context, envID, teamID string) (err error) {
+	defer c.cache.InvalidatePrefix(envID + checksumSeparator + teamID + checksumSeparator)
+	return c.SecretManager.DeleteTeam(ctx, envID, teamID)
+}
+
+func (c *cachedSecretManager) DeleteApplication(ctx context.Context, envID, teamID, appID string) (err error) {
+	defer c.cache.InvalidatePrefix(envID + checksumSeparator + teamID + checksumSeparator + appID + checksumSeparator)
+	return c.SecretManager.DeleteApplication(ctx, envID, teamID, appID)
+}
+
+// secretKey returns the secret ID without its checksum.
+func secretKey(secretID string) string {
+	key, _ := splitChecksum(secretID)
+	return key
+}
+
+func splitChecksum(secretID string) (key, checksum string) {
+	idx := strings.LastIndex(secretID, checksumSeparator)
+	if idx < 0 {
+		return secretID, ""
+	}
+	return secretID[:idx], secretID[idx+1:]
+}
+
+type secretCacheEntry struct {
+	key       string
+	checksum  string
+	value     []byte
+	expiresAt time.Time
+}
+
+func (e *secretCacheEntry) size() int64 {
+	return int64(len(e.key) + len(e.checksum) + len(e.value))
+}
+
+// secretCache is a LRU cache of secret values that is bounded by bytes.
+// Values are stored as byte slices so that they can be zeroed when they are evicted.
+type secretCache struct {
+	ttl      time.Duration
+	maxBytes int64
+
+	mutex   sync.Mutex
+	size    int64
+	entries map[string]*list.Element
+	lru     *list.List
+}
+
+func newSecretCache(ttl time.Duration, maxBytes int64) *secretCache {
+	return &secretCache{
+		ttl:      ttl,
+		maxBytes: maxBytes,
+		entries:  make(map[string]*list.Element),
+		lru:      list.New(),
+	}
+}
+
+// Get returns the cached value of the given secret ID.
+// Entries with a different checksum or an expired TTL are evicted.
+func (c *secretCache) Get(secretID string) (string, bool) {
+	key, checksum := splitChecksum(secretID)
+
+	c.mutex.Lock()
+	defer c.mutex.Unlock()
+
+	elem, ok := c.entries[key]
+	if !ok {
+		metrics.RecordCacheMiss("not_found")
+		return "", false
+	}
+	entry := elem.Value.(*secretCacheEntry)
+	if entry.checksum != checksum {
+		c.removeElement(elem, "checksum_mismatch")
+		metrics.RecordCacheMiss("checksum_mismatch")
+		return "", false
+	}
+	if time.Now().After(entry.expiresAt) {
+		c.removeElement(elem, "expired")
+		metrics.RecordCacheMiss("expired")
+		return "", false
+	}
+	c.lru.MoveToFront(elem)
+	metrics.RecordCacheHit()
+	return string(entry.value), true
+}
+
+// Put stores the value of the given secret ID and evicts the least recently used
+// entries until the cache fits into its size limit. Empty values are not cached.
+func (c *secretCache) Put(secretID, value string) {
+	if value == "" {
+		return
+	}
+	key, checksum := splitChecksum(secretID)
+	entry := &secretCacheEntry{
+		key:       key,
+		checksum:  checksum,
+		value:     []byte(value),
+		expiresAt: time.Now().Add(c.ttl),
+	}
+	if entry.size() > c.maxBytes {
+		return
+	}
+
+	c.mutex.Lock()
+	defer c.mutex.Unlock()
+
+	if elem, ok := c.entries[key]; ok {
+		c.removeElement(elem, "replaced")
+	}
+	c.entries[key] = c.lru.PushFront(entry)
+	c.size += entry.size()
+	for c.size > c.maxBytes {
+		c.removeElement(c.lru.Back(), "size")
+	}
+	metrics.SetCacheSize(float64(c.size))
+}
+
+// InvalidateRelated evicts the entry of the given key as well as all entries of its
+// parent and sub-secrets, which share a common prefix with the key.
+func (c *secretCache) InvalidateRelated(key string) {
+	c.invalidate(func(entryKey string) bool {
+		return strings.HasPrefix(entryKey, key) || strings.HasPrefix(key, entryKey)
+	})
+}
+
+// InvalidatePrefix evicts all entries whose key starts with the given prefix.
+func (c *secretCache) InvalidatePrefix(prefix string) {
+	c.invalidate(func(entryKey string) bool {
+		return strings.HasPrefix(entryKey, prefix)
+	})
+}
+
+func (c *secretCache) invalidate(match func(key string) bool) {
+	c.mutex.Lock()
+	defer c.mutex.Unlock()
+
+	for key, elem := range c.entries {
+		if match(key) {
+			c.removeElement(elem, "invalidated")
+		}
+	}
+	metrics.SetCacheSize(float64(c.size))
+}
+
+// removeElement removes the entry and zeroes its value.
+func (c *secretCache) removeElement(elem *list.Element, reason string) {
+	entry := elem.Value.(*secretCacheEntry)
+	c.lru.Remove(elem)
+	delete(c.entries, entry.key)
+	c.size -= entry.size()
+	clear(entry.value)
+	metrics.RecordCacheEviction(reason)
+}
@@ -0,0 +1,133 @@
+// Copyright 2025 Deutsche Telekom IT GmbH
+//
+// SPDX-License-Identifier: Apache-2.0
+
+package api_test
+
+import (
+	"context"
+	"sync"
+	"time"
+
+	. "github.com/onsi/ginkgo/v2"
+	. "github.com/onsi/gomega"
+	"github.com/stretchr/testify/mock"
+	"github.com/telekom/controlplane/secret-manager/api"
+	"github.com/telekom/controlplane/secret-manager/api/fake"
+)
+
+var _ = Describe("Cached SecretManager", func() {
+	var (
+		mockSecretManager *fake.MockSecretManager
+		sut               api.SecretManager
+		ctx               context.Context
+	)
+
+	BeforeEach(func() {
+		mockSecretManager = fake.NewMockSecretManager(GinkgoT())
+		sut = api.NewCachedSecretManager(mockSecretManager)
+		ctx = context.Background()
+	})
+
+	It("should only fetch a secret once", func() {
+		mockSecretManager.EXPECT().Get(mock.Anything, "env:team:app:clientSecret:abc").Return("value", nil).Times(1)
+
+		for range 3 {
+			value, err := sut.Get(ctx, "$<env:team:app:clientSecret:abc>")
+			Expect(err).ToNot(HaveOccurred())
+			Expect(value).To(Equal("value"))
+		}
+	})
+
+	It("should fetch the secret again if the checksum changed", func() {
+		mockSecretManager.EXPECT().Get(mock.Anything, "env:team:app:clientSecret:abc").Return("old", nil).Times(1)
+		mockSecretManager.EXPECT().Get(mock.Anything, "env:team:app:clientSecret:def").Return("new", nil).Times(1)
+
+		Expect(sut.Get(ctx, "env:team:app:clientSecret:abc")).To(Equal("old"))
+		Expect(sut.Get(ctx, "env:team:app:clientSecret:def")).To(Equal("new"))
+		Expect(sut.Get(ctx, "env:team:app:clientSecret:def")).To(Equal("new"))
+	})
+
+	It("should fetch the secret again after the TTL expired", func() {
+		sut = api.NewCachedSecretManager(mockSecretManager, api.WithCacheTTL(10*time.Millisecond))
+		mockSecretManager.EXPECT().Get(mock.Anything, "env:team:app:clientSecret:abc").Return("value", nil).Times(2)
+
+		Expect(sut.Get(ctx, "env:team:app:clientSecret:abc")).To(Equal("value"))
+		time.Sleep(20 * time.Millisecond)
+		Expect(sut.Get(ctx, "env:team:app:clientSecret:abc")).To(Equal("value"))
+	})
+
+	It("should evict the least recently used secrets when the cache is full", func() {
+		// Each entry needs 26 bytes, so only two of them fit into the cache.
+		sut = api.NewCachedSecretManager(mockSecretManager, api.WithCacheMaxBytes(60))
+		mockSecretManager.EXPECT().Get(mock.Anything, "env:team:app:first:abc").Return("value", nil).Times(1)
+		mockSecretManager.EXPECT().Get(mock.Anything, "env:team:app:secnd:abc").Return("value", nil).Times(2)
+		mockSecretManager.EXPECT().Get(mock.Anything, "env:team:app:third:abc").Return("value", nil).Times(1)
+
+		Expect(sut.Get(ctx, "env:team:app:first:abc")).To(Equal("value"))
+		Expect(sut.Get(ctx, "env:team:app:secnd:abc")).To(Equal("value"))
+		Expect(sut.Get(ctx, "env:team:app:first:abc")).To(Equal("value"))
+		Expect(sut.Get(ctx, "env:team:app:third:abc")).To(Equal("value"))
+		Expect(sut.Get(ctx, "env:team:app:first:abc")).To(Equal("value"))
+		Expect(sut.Get(ctx, "env:team:app:secnd:abc")).To(Equal("value"))
+	})
+
+	It("should deduplicate concurrent requests", func() {
+		release := make(chan struct{})
+		mockSecretManager.EXPECT().Get(mock.Anything, "env:team:app:clientSecret:abc").
+			RunAndReturn(func(context.Context, string) (string, error) {
+				<-release
+				return "value", nil
+			}).Times(1)
+
+		var wg sync.WaitGroup
+		for range 5 {
+			wg.Add(1)
+			go func() {
+				defer GinkgoRecover()
+				defer wg.Done()
+				Expect(sut.Get(ctx, "env:team:app:clientSecret:abc")).To(Equal("value"))
+			}()
+		}
+		time.Sleep(10 * time.Millisecond)
+		close(release)
+		wg.Wait()
+	})
+
+	It("should only fetch missing secrets with GetMany", func() {
+		mockSecretManager.EXPECT().Get(mock.Anything, "env:team:app:first:abc").Return("first", nil).Times(1)
+		mockSecretManager.EXPECT().GetMany(mock.Anything, []string{"$<env:team:app:secnd:abc>"}).
+			Return(map[string]string{"$<env:team:app:secnd:abc>": "second"}, nil).Times(1)
+
+		Expect(sut.Get(ctx, "env:team:app:first:abc")).To(Equal("first"))
+		values, err := sut.GetMany(ctx, []string{"$<env:team:app:first:abc>", "$<env:team:app:secnd:abc>"})
+		Expect(err).ToNot(HaveOccurred())
+		Expect(values).To(Equal(map[string]string{
+			"$<env:team:app:first:abc>": "first",
+			"$<env:team:app:secnd:abc>": "second",
+		}))
+		Expect(sut.Get(ctx, "env:team:app:secnd:abc")).To(Equal("second"))
+	})
+
+	It("should invalidate a secret when it is written", func() {
+		mockSecretManager.EXPECT().Get(mock.Anything, "env:team:app:clientSecret:abc").Return("value", nil).Times(2)
+		mockSecretManager.EXPECT().Set(mock.Anything, "env:team:app:clientSecret:abc", "value").Return("$<env:team:app:clientSecret:abc>", nil).Times(1)
+
+		Expect(sut.Get(ctx, "env:team:app:clientSecret:abc")).To(Equal("value"))
+		Expect(sut.Set(ctx, "env:team:app:clientSecret:abc", "value")).To(Equal("$<env:team:app:clientSecret:abc>"))
+		Expect(sut.Get(ctx, "env:team:app:clientSecret:abc")).To(Equal("value"))
+	})
+
+	It("should invalidate all secrets of a team when it is onboarded", func() {
+		mockSecretManager.EXPECT().Get(mock.Anything, "env:team:app:clientSecret:abc").Return("value", nil).Times(2)
+		mockSecretManager.EXPECT().Get(mock.Anything, "env:other:app:clientSecret:abc").Return("value", nil).Times(1)
+		mockSecretManager.EXPECT().UpsertTeam(mock.Anything, "env", "team").Return(nil, nil).Times(1)
+
+		Expect(sut.Get(ctx, "env:team:app:clientSecret:abc")).To(Equal("value"))
+		Expect(sut.Get(ctx, "env:other:app:clientSecret:abc")).To(Equal("value"))
+		_, err := sut.UpsertTeam(ctx, "env", "team")
+		Expect(err).ToNot(HaveOccurred())
+		Expect(sut.Get(ctx, "env:team:app:clientSecret:abc")).To(Equal("value"))
+		Expect(sut.Get(ctx, "env:other:app:clientSecret:abc")).To(Equal("value"))
+	})
+})
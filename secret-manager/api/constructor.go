@@ -23,6 +23,8 @@ type Options struct {
 	URL           string
 	Token         accesstoken.AccessToken
 	SkipTLSVerify bool
+	// Cache enables the in-process cache for secret values if set.
+	Cache *CacheOptions
 }
 
 func (o *Options) accessTokenReqEditor(ctx context.Context, req *http.Request) error {
@@ -73,6 +75,17 @@ func WithSkipTLSVerify() Option {
 	}
 }
 
+// WithCache enables an in-process cache for secret values.
+// See NewCachedSecretManager for details.
+func WithCache(opts ...CacheOption) Option {
+	return func(o *Options) {
+		o.Cache = defaultCacheOptions()
+		for _, opt := range opts {
+			opt(o.Cache)
+		}
+	}
+}
+
 func NewOnboarding(opts ...Option) OnboardingApi {
 	return New(opts...)
 }
@@ -105,7 +118,11 @@ func New(opts ...Option) SecretManager {
 	if err != nil {
 		log.Fatalf("Failed to create HTTP client: %v", err)
 	}
-	return &secretManagerAPI{
+	var secretManager SecretManager = &secretManagerAPI{
 		client: httpClient,
 	}
+	if options.Cache != nil {
+		secretManager = NewCachedSecretManager(secretManager, WithCacheTTL(options.Cache.TTL), WithCacheMaxBytes(options.Cache.MaxBytes))
+	}
+	return secretManager
 }
@@ -228,6 +228,65 @@ func (_c *MockSecretManager_Get_Call) RunAndReturn(run func(context.Context, str
 	return _c
 }
 
+// GetMany provides a mock function with given fields: ctx, secretIDs
+func (_m *MockSecretManager) GetMany(ctx context.Context, secretIDs []string) (map[string]string, error) {
+	ret := _m.Called(ctx, secretIDs)
+
+	if len(ret) == 0 {
+		panic("no return value specified for GetMany")
+	}
+
+	var r0 map[string]string
+	var r1 error
+	if rf, ok := ret.Get(0).(func(context.Context, []string) (map[string]string, error)); ok {
+		return rf(ctx, secretIDs)
+	}
+	if rf, ok := ret.Get(0).(func(context.Context, []string) map[string]string); ok {
+		r0 = rf(ctx, secretIDs)
+	} else {
+		if ret.Get(0) != nil {
+			r0 = ret.Get(0).(map[string]string)
+		}
+	}
+
+	if rf, ok := ret.Get(1).(func(context.Context, []string) error); ok {
+		r1 = rf(ctx, secretIDs)
+	} else {
+		r1 = ret.Error(1)
+	}
+
+	return r0, r1
+}
+
+// MockSecretManager_GetMany_Call is a *mock.Call that shadows Run/Return methods with type explicit version for method 'GetMany'
+type MockSecretManager_GetMany_Call struct {
+	*mock.Call
+}
+
+// GetMany is a helper method to define mock.On call
+//   - ctx context.Context
+//   - secretIDs []string
+func (_e *MockSecretManager_Expecter) GetMany(ctx interface{}, secretIDs interface{}) *MockSecretManager_GetMany_Call {
+	return &MockSecretManager_GetMany_Call{Call: _e.mock.On("GetMany", ctx, secretIDs)}
+}
+
+func (_c *MockSecretManager_GetMany_Call) Run(run func(ctx context.Context, secretIDs []string)) *MockSecretManager_GetMany_Call {
+	_c.Call.Run(func(args mock.Arguments) {
+		run(args[0].(context.Context), args[1].([]string))
+	})
+	return _c
+}
+
+func (_c *MockSecretManager_GetMany_Call) Return(values map[string]string, err error) *MockSecretManager_GetMany_Call {
+	_c.Call.Return(values, err)
+	return _c
+}
+
+func (_c *MockSecretManager_GetMany_Call) RunAndReturn(run func(context.Context, []string) (map[string]string, error)) *MockSecretManager_GetMany_Call {
+	_c.Call.Return(run)
+	return _c
+}
+
 // Rotate provides a mock function with given fields: ctx, secretID
 func (_m *MockSecretManager) Rotate(ctx context.Context, secretID string) (string, error) {
 	ret := _m.Called(ctx, secretID)
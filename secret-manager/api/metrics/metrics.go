@@ -4,6 +4,81 @@
 
 package metrics
 
-import "github.com/telekom/controlplane/common-server/pkg/client/metrics"
+import (
+	"sync"
 
-var RegisterPrometheusMetrics = metrics.Register
+	"github.com/prometheus/client_golang/prometheus"
+	"github.com/telekom/controlplane/common-server/pkg/client/metrics"
+)
+
+var (
+	registerOnce = sync.Once{}
+
+	// Client-side cache metrics
+	cacheAccess = prometheus.NewCounterVec(
+		prometheus.CounterOpts{
+			Name: "secret_manager_client_cache_access_total",
+			Help: "Total number of secret-manager client cache access attempts",
+		},
+		[]string{"result", "reason"},
+	)
+
+	cacheEvictions = prometheus.NewCounterVec(
+		prometheus.CounterOpts{
+			Name: "secret_manager_client_cache_evictions_total",
+			Help: "Total number of evicted secret-manager client cache entries",
+		},
+		[]string{"reason"},
+	)
+
+	cacheSize = prometheus.NewGauge(
+		prometheus.GaugeOpts{
+			Name: "secret_manager_client_cache_size_bytes",
+			Help: "Current size of the secret-manager client cache in bytes",
+		},
+	)
+
+	singleflightDedup = prometheus.NewCounterVec(
+		prometheus.CounterOpts{
+			Name: "secret_manager_client_singleflight_dedup_total",
+			Help: "Total number of secret-manager client requests deduplicated via singleflight",
+		},
+		[]string{"method"},
+	)
+)
+
+// RegisterPrometheusMetrics registers the HTTP client and client-side cache metrics with Prometheus
+func RegisterPrometheusMetrics(reg prometheus.Registerer) {
+	metrics.Register(reg)
+	registerOnce.Do(func() {
+		reg.MustRegister(cacheAccess)
+		reg.MustRegister(cacheEvictions)
+		reg.MustRegister(cacheSize)
+		reg.MustRegister(singleflightDedup)
+	})
+}
+
+// RecordCacheHit increments the counter for a successful cache hit
+func RecordCacheHit() {
+	cacheAccess.WithLabelValues("hit", "").Inc()
+}
+
+// RecordCacheMiss increments the counter for a cache miss with the specified reason like "expired" or "not_found"
+func RecordCacheMiss(reason string) {
+	cacheAccess.WithLabelValues("miss", reason).Inc()
+}
+
+// RecordCacheEviction increments the counter for an evicted cache entry with the specified reason like "size" or "expired"
+func RecordCacheEviction(reason string) {
+	cacheEvictions.WithLabelValues(reason).Inc()
+}
+
+// SetCacheSize sets the current size of the cache in bytes
+func SetCacheSize(bytes float64) {
+	cacheSize.Set(bytes)
+}
+
+// RecordSingleflightDedup increments the counter when a request was deduplicated via singleflight
+func RecordSingleflightDedup(method string) {
+	singleflightDedup.WithLabelValues(method).Inc()
+}
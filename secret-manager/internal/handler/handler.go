@@ -6,11 +6,13 @@ package handler
 
 import (
 	"context"
+	"fmt"
 
-	"github.com/go-logr/logr"
+	"github.com/gofiber/fiber/v2"
 	"github.com/telekom/controlplane/secret-manager/internal/api"
 	"github.com/telekom/controlplane/secret-manager/pkg/backend"
 	"github.com/telekom/controlplane/secret-manager/pkg/controller"
+	"golang.org/x/sync/errgroup"
 )
 
 var _ api.StrictServerInterface = &Handler{}
@@ -40,16 +42,41 @@ func (h *Handler) GetSecret(ctx context.Context, req api.GetSecretRequestObject)
 	return okRes, nil
 }
 
+// maxListSecrets is the maximum number of secrets that can be requested with a single ListSecrets request.
+const maxListSecrets = 10
+
 func (h *Handler) ListSecrets(ctx context.Context, req api.ListSecretsRequestObject) (api.ListSecretsResponseObject, error) {
-	logr.FromContextOrDiscard(ctx).Info("ListSecrets", "request", req)
+	if req.Params.SecretId == nil || len(*req.Params.SecretId) == 0 {
+		return listSecretsBadRequest("at least one secretId is required"), nil
+	}
+	secretIds := *req.Params.SecretId
+	if len(secretIds) > maxListSecrets {
+		return listSecretsBadRequest(fmt.Sprintf("at most %d secretIds are allowed, got %d", maxListSecrets, len(secretIds))), nil
+	}
+
+	// The items are returned in the same order as the requested secretIds.
+	items := make([]api.Secret, len(secretIds))
+	g, gctx := errgroup.WithContext(ctx)
+	for i, secretId := range secretIds {
+		g.Go(func() error {
+			secret, err := h.ctrl.GetSecret(gctx, secretId)
+			if err != nil {
+				return err
+			}
+			items[i] = api.Secret{
+				Id:    secret.Id,
+				Value: secret.Value,
+			}
+			return nil
+		})
+	}
+	if err := g.Wait(); err != nil {
+		return nil, err
+	}
+
 	return api.ListSecrets200JSONResponse{
 		SecretListReponseJSONResponse: api.SecretListReponseJSONResponse{
-			Items: []api.Secret{
-				{
-					Id:    "123",
-					Value: "123",
-				},
-			},
+			Items: items,
 		},
 	}, nil
 }
@@ -172,3 +199,14 @@ func onboardOpts(strategy *api.WriteStrategy, secrets []api.NamedSecret) []contr
 	}
 	return opts
 }
+
+func listSecretsBadRequest(detail string) api.ListSecrets400ApplicationProblemPlusJSONResponse {
+	return api.ListSecrets400ApplicationProblemPlusJSONResponse{
+		ErrorResponseApplicationProblemPlusJSONResponse: api.ErrorResponseApplicationProblemPlusJSONResponse{
+			Type:   "BadRequest",
+			Status: fiber.StatusBadRequest,
+			Title:  "Bad Request",
+			Detail: detail,
+		},
+	}
+}